@@ -1,22 +1,95 @@
 import asyncio
 import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 
 from healthchecker.domain.models.health_check import HealthCheck
 from healthchecker.domain.models.alert import Alert
 from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url_status import UrlStatus
 from healthchecker.domain.repositories.url_repository import UrlRepository
 from healthchecker.domain.repositories.health_check_repository import (
     HealthCheckRepository,
 )
 from healthchecker.domain.repositories.alert_repository import AlertRepository
+from healthchecker.domain.repositories.url_status_repository import (
+    UrlStatusRepository,
+)
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
 from healthchecker.domain.services.health_check_service import HealthCheckService
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.ssl_expiry_timeline import SslExpiryTimeline
+from healthchecker.domain.services.url_status_store import UrlStatusStore
 from healthchecker.infrastructure.checker.http_checker import HttpHealthChecker
 from healthchecker.infrastructure.checker.ssl_checker import SslChecker
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CheckRunStats:
+    urls_count: int
+    duration_ms: float
+    avg_queue_wait_ms: float
+    max_queue_wait_ms: float
+    avg_probe_ms: float
+    max_probe_ms: float
+
+
+def host_of(url: Url) -> str:
+    """Host the per-host concurrency cap applies to."""
+    return (urlparse(url.url).hostname or url.url).lower()
+
+
+class _HostQueue:
+    """Hands out URLs round-robin across hosts, never exceeding the per-host cap."""
+
+    def __init__(self, urls: list[Url], per_host_limit: int):
+        self._per_host_limit = per_host_limit
+        self._pending: dict[str, deque[Url]] = {}
+        for url in urls:
+            self._pending.setdefault(host_of(url), deque()).append(url)
+        self._ready: deque[str] = deque(self._pending)
+        self._queued = set(self._pending)
+        self._in_flight: dict[str, int] = dict.fromkeys(self._pending, 0)
+        self._remaining = len(urls)
+        self._changed = asyncio.Condition()
+
+    async def get(self) -> Url | None:
+        async with self._changed:
+            while not self._ready:
+                if self._remaining == 0:
+                    return None
+                await self._changed.wait()
+            host = self._ready.popleft()
+            self._queued.discard(host)
+            url = self._pending[host].popleft()
+            self._remaining -= 1
+            self._in_flight[host] += 1
+            self._requeue(host)
+            return url
+
+    async def done(self, url: Url) -> None:
+        async with self._changed:
+            host = host_of(url)
+            self._in_flight[host] -= 1
+            self._requeue(host)
+            self._changed.notify_all()
+
+    def _requeue(self, host: str) -> None:
+        has_capacity = (
+            not self._per_host_limit or self._in_flight[host] < self._per_host_limit
+        )
+        if self._pending[host] and has_capacity and host not in self._queued:
+            self._ready.append(host)
+            self._queued.add(host)
+
+
 class CheckAllUrlsUseCase:
     def __init__(
         self,
@@ -25,60 +98,196 @@ class CheckAllUrlsUseCase:
         alert_repo: AlertRepository,
         http_checker: HttpHealthChecker,
         ssl_checker: SslChecker,
+        max_concurrency: int = 0,
+        per_host_concurrency: int = 0,
+        url_statuses: UrlStatusStore | None = None,
+        url_registry: ActiveUrlRegistry | None = None,
+        daily_aggregator: DailyAggregator | None = None,
+        recent_checks: RecentChecks | None = None,
+        url_status_repo: UrlStatusRepository | None = None,
+        ssl_timeline: SslExpiryTimeline | None = None,
     ):
         self._url_repo = url_repo
         self._health_check_repo = health_check_repo
         self._alert_repo = alert_repo
         self._http_checker = http_checker
         self._ssl_checker = ssl_checker
+        self._max_concurrency = max_concurrency
+        self._per_host_concurrency = per_host_concurrency
+        self._ssl_timeline = ssl_timeline or SslExpiryTimeline()
+        self._url_statuses = url_statuses or UrlStatusStore()
+        self._url_registry = url_registry
+        self._daily_aggregator = daily_aggregator
+        self._recent_checks = recent_checks
+        self._url_status_repo = url_status_repo
+        self.last_stats: CheckRunStats | None = None
 
     async def execute(self) -> list[Alert]:
-        urls = await self._url_repo.get_all_active()
+        """Checks every active URL at once and records the run in ``last_stats``."""
+        urls = await self.list_active()
+        alerts, self.last_stats = await self._check_timed(urls)
+        logger.debug(
+            "Checked %d URLs in %.0fms (queue wait avg %.0fms max %.0fms, "
+            "probe avg %.0fms max %.0fms)",
+            self.last_stats.urls_count,
+            self.last_stats.duration_ms,
+            self.last_stats.avg_queue_wait_ms,
+            self.last_stats.max_queue_wait_ms,
+            self.last_stats.avg_probe_ms,
+            self.last_stats.max_probe_ms,
+        )
+        return alerts
+
+    async def list_active(self) -> list[Url]:
+        if self._url_registry is not None:
+            return await self._url_registry.get_all()
+        return await self._url_repo.get_all_active()
+
+    async def check_urls(self, urls: list[Url]) -> list[Alert]:
+        alerts, _ = await self._check_timed(urls)
+        return alerts
+
+    async def _check_timed(self, urls: list[Url]) -> tuple[list[Alert], CheckRunStats]:
         logger.debug("Running health checks for %d URLs", len(urls))
-        results = await asyncio.gather(*[self._check_one(url) for url in urls])
-        return [alert for batch in results for alert in batch]
+        if not self._url_statuses.loaded:
+            self._url_statuses.load(await self._load_statuses())
+        started = time.monotonic()
+        queue_waits: list[float] = []
+        probe_times: list[float] = []
+
+        async def timed_check(url: Url) -> list[Alert]:
+            dequeued = time.monotonic()
+            queue_waits.append(dequeued - started)
+            try:
+                return await self._check_one(url)
+            finally:
+                probe_times.append(time.monotonic() - dequeued)
+
+        if self._max_concurrency > 0:
+            results = await self._run_worker_pool(urls, timed_check)
+        else:
+            results = await asyncio.gather(*[timed_check(url) for url in urls])
+
+        stats = self._build_stats(
+            len(urls), time.monotonic() - started, queue_waits, probe_times
+        )
+        return [alert for batch in results for alert in batch], stats
+
+    async def _load_statuses(self) -> list[UrlStatus]:
+        statuses = []
+        if self._url_status_repo is not None:
+            statuses = await self._url_status_repo.get_all()
+        # URLs without a status row yet (e.g. right after the upgrade) start
+        # from their latest check.
+        known = {s.url_id for s in statuses}
+        statuses.extend(
+            UrlStatus.from_check(check)
+            for check in await self._health_check_repo.get_latest_for_all()
+            if check.url_id not in known
+        )
+        return statuses
+
+    async def _run_worker_pool(
+        self, urls: list[Url], check: Callable[[Url], Awaitable[list[Alert]]]
+    ) -> list[list[Alert]]:
+        queue = _HostQueue(urls, self._per_host_concurrency)
+        results: list[list[Alert]] = []
+
+        async def worker():
+            while (url := await queue.get()) is not None:
+                try:
+                    results.append(await check(url))
+                finally:
+                    await queue.done(url)
+
+        workers = min(self._max_concurrency, len(urls))
+        await asyncio.gather(*[worker() for _ in range(workers)])
+        return results
+
+    @staticmethod
+    def _build_stats(
+        urls_count: int,
+        duration: float,
+        queue_waits: list[float],
+        probe_times: list[float],
+    ) -> CheckRunStats:
+        def avg(values):
+            return sum(values) / len(values) * 1000 if values else 0.0
+
+        return CheckRunStats(
+            urls_count=urls_count,
+            duration_ms=duration * 1000,
+            avg_queue_wait_ms=avg(queue_waits),
+            max_queue_wait_ms=max(queue_waits, default=0.0) * 1000,
+            avg_probe_ms=avg(probe_times),
+            max_probe_ms=max(probe_times, default=0.0) * 1000,
+        )
 
     async def _check_one(self, url: Url) -> list[Alert]:
         try:
-            previous_check = await self._health_check_repo.get_latest_by_url_id(url.id)
+            previous = self._url_statuses.get(url.id)
 
-            http_status, ttfb_ms, error = await self._http_checker.check(url.url)
+            result = await self._http_checker.check(
+                url.url,
+                fresh_connection=url.fresh_connection,
+                probe_mode=url.probe_mode,
+                max_bytes=url.probe_max_bytes,
+                body_assertion=url.body_assertion,
+            )
 
-            ssl_info = None
-            if url.url.startswith("https"):
-                ssl_info = await self._ssl_checker.check(url.url)
+            ssl_info = result.ssl_info
+            if ssl_info is None and url.url.startswith("https"):
+                ssl_info = await self._ssl_checker.check(
+                    url.url, alert_before_days=url.alert_before_days
+                )
 
             ssl_expiry = ssl_info.expiration_date if ssl_info else None
             ssl_days = ssl_info.days_remaining if ssl_info else None
-            is_healthy = error is None and (
-                http_status is not None and 200 <= http_status < 400
+            is_healthy = result.error is None and (
+                result.http_status is not None and 200 <= result.http_status < 400
             )
 
             check = HealthCheck(
                 id=None,
                 url_id=url.id,
-                http_status=http_status,
-                ttfb_ms=ttfb_ms,
+                http_status=result.http_status,
+                ttfb_ms=result.ttfb_ms,
                 ssl_expiration_date=ssl_expiry,
                 ssl_days_remaining=ssl_days,
                 is_healthy=is_healthy,
-                error_message=error,
+                error_message=result.error,
                 checked_at=datetime.now(timezone.utc),
+                dns_ms=result.dns_ms,
+                connect_ms=result.connect_ms,
+                tls_ms=result.tls_ms,
+                total_ms=result.total_ms,
+                bytes_received=result.bytes_received,
+                tls_version=ssl_info.tls_version if ssl_info else None,
+                tls_cipher=ssl_info.cipher if ssl_info else None,
             )
 
             await self._health_check_repo.save(check)
+            self._url_statuses.record(check)
+            if self._daily_aggregator is not None:
+                self._daily_aggregator.record(check)
+            if self._recent_checks is not None:
+                self._recent_checks.record(check)
 
             alerts: list[Alert] = []
 
-            if ssl_days is not None and HealthCheckService.should_alert_ssl(
-                ssl_days, url.alert_before_days
-            ):
-                previous_ssl_ok = (
-                    previous_check is None
-                    or previous_check.ssl_days_remaining is None
-                    or previous_check.ssl_days_remaining > url.alert_before_days
+            if ssl_info is not None:
+                was_below_threshold = (
+                    previous is not None
+                    and previous.ssl_days_remaining is not None
+                    and previous.ssl_days_remaining <= url.alert_before_days
                 )
-                if previous_ssl_ok:
+                if self._ssl_timeline.crossed(
+                    url.id,
+                    ssl_expiry,
+                    ssl_days,
+                    url.alert_before_days,
+                    was_below_threshold,
+                ):
                     alert = HealthCheckService.build_ssl_alert(
                         url.id,
                         url.name,
@@ -90,26 +299,24 @@ class CheckAllUrlsUseCase:
                     alerts.append(alert)
 
             if not is_healthy:
-                was_healthy = previous_check is None or previous_check.is_healthy
+                was_healthy = previous is None or previous.is_healthy
                 if was_healthy:
                     alert = HealthCheckService.build_http_down_alert(
                         url.id,
                         url.name,
-                        http_status,
-                        error,
+                        result.http_status,
+                        result.error,
                     )
                     await self._alert_repo.save(alert)
                     alerts.append(alert)
             else:
-                was_unhealthy = (
-                    previous_check is not None and not previous_check.is_healthy
-                )
+                was_unhealthy = previous is not None and not previous.is_healthy
                 if was_unhealthy:
                     alert = HealthCheckService.build_http_up_alert(
                         url.id,
                         url.name,
-                        http_status,
-                        ttfb_ms,
+                        result.http_status,
+                        result.ttfb_ms,
                     )
                     await self._alert_repo.save(alert)
                     alerts.append(alert)
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from healthchecker.domain.models.rollup import Resolution, Rollup, roll_up
+from healthchecker.domain.repositories.health_check_repository import (
+    HealthCheckRepository,
+)
+from healthchecker.domain.repositories.rollup_repository import RollupRepository
+
+logger = logging.getLogger(__name__)
+
+# A bucket is rolled up once it ended this long ago plus the write buffer's
+# flush interval: a check can wait up to one interval in the buffer before
+# it reaches the database, and the tier's watermark never goes back.
+SETTLE_DELAY = timedelta(minutes=1)
+
+
+class ConsolidateRollupsUseCase:
+    def __init__(
+        self,
+        health_check_repo: HealthCheckRepository,
+        rollup_repo: RollupRepository,
+        five_minute_retention: timedelta = timedelta(days=2),
+        hourly_retention: timedelta = timedelta(days=30),
+        flush_interval: timedelta = timedelta(0),
+    ):
+        self._health_check_repo = health_check_repo
+        self._rollup_repo = rollup_repo
+        self._settle_delay = SETTLE_DELAY + flush_interval
+        self.retention = {
+            Resolution.FIVE_MINUTES: five_minute_retention,
+            Resolution.HOUR: hourly_retention,
+        }
+
+    async def execute(self, now: datetime | None = None) -> int:
+        """Rolls up every complete bucket after the latest stored one.
+
+        5-minute rollups are aggregated from raw checks by the database, an
+        hour at a time, and hourly rollups from the 5-minute ones, a day at a
+        time. Each tier then drops the buckets past its retention.
+        """
+        settled = (now or datetime.now(timezone.utc)) - self._settle_delay
+        created = await self._fill(
+            Resolution.FIVE_MINUTES, settled, timedelta(hours=1), self._read_checks
+        )
+        created += await self._fill(
+            Resolution.HOUR, settled, timedelta(days=1), self._read_five_minutes
+        )
+        purged = 0
+        for resolution, retention in self.retention.items():
+            purged += await self._rollup_repo.purge_older_than(
+                resolution, settled - retention
+            )
+        if created or purged:
+            logger.info("Created %d rollups, purged %d old ones", created, purged)
+        return created
+
+    async def _fill(
+        self,
+        resolution: Resolution,
+        settled: datetime,
+        window: timedelta,
+        read: Callable[[datetime, datetime], Awaitable[list[Rollup]]],
+    ) -> int:
+        end = resolution.floor(settled)
+        oldest = end - self.retention[resolution]
+        # The latest stored bucket doubles as the watermark of the tier.
+        latest = await self._rollup_repo.get_latest_bucket_start(resolution)
+        start = max(latest + resolution.delta, oldest) if latest else oldest
+
+        created = 0
+        while start < end:
+            window_end = min(start + window, end)
+            rollups = roll_up(await read(start, window_end), resolution)
+            await self._rollup_repo.save_many(rollups)
+            created += len(rollups)
+            start = window_end
+            # Let the probes run between windows.
+            await asyncio.sleep(0)
+        return created
+
+    async def _read_checks(self, start: datetime, end: datetime) -> list[Rollup]:
+        return await self._health_check_repo.aggregate_rollups(
+            Resolution.FIVE_MINUTES, start, end
+        )
+
+    async def _read_five_minutes(self, start: datetime, end: datetime) -> list[Rollup]:
+        return await self._rollup_repo.get_range(Resolution.FIVE_MINUTES, start, end)
@@ -1,6 +1,11 @@
+import asyncio
 import logging
-from datetime import date, datetime, timezone
+import time
+from datetime import date, timedelta
 
+from healthchecker.application.use_cases.purge_health_checks import (
+    PurgeHealthChecksUseCase,
+)
 from healthchecker.domain.models.daily_summary import DailySummary
 from healthchecker.domain.repositories.health_check_repository import (
     HealthCheckRepository,
@@ -18,80 +23,89 @@ class ConsolidateDailySummariesUseCase:
         health_check_repo: HealthCheckRepository,
         summary_repo: DailySummaryRepository,
         retention_days: int = 7,
+        incremental: bool = False,
+        purge: PurgeHealthChecksUseCase | None = None,
     ):
         self._health_check_repo = health_check_repo
         self._summary_repo = summary_repo
         self._retention_days = retention_days
+        self._incremental = incremental
+        self._purge = purge or PurgeHealthChecksUseCase(health_check_repo)
+        self.last_run_complete = False
+
+    async def execute(self, time_budget_sec: float | None = None) -> int:
+        """Summarises every complete day after the consolidation watermark.
 
-    async def execute(self) -> int:
+        Each day is aggregated by the database in one query and the watermark
+        is moved past it once its summaries are saved, so an interrupted run
+        resumes where it stopped. With ``incremental`` summaries, only the
+        URLs whose running summary does not match the raw checks are
+        rewritten, so a summary left partial (e.g. by a restart that lost
+        in-memory totals) is repaired before those checks are purged.
+        """
+        started = time.monotonic()
+        self.last_run_complete = False
         cutoff = date.today()
-        pending = await self._health_check_repo.get_dates_needing_consolidation(cutoff)
-        if not pending:
+        watermark = await self._summary_repo.get_consolidation_watermark()
+        if watermark is not None:
+            day = watermark + timedelta(days=1)
+        else:
+            day = await self._health_check_repo.get_first_check_date()
+        if day is None or day >= cutoff:
             logger.info("No data to consolidate")
+            self.last_run_complete = True
             return 0
 
         consolidated_count = 0
-        for url_id, check_date in pending:
-            try:
-                raw = await self._health_check_repo.get_raw_for_date(url_id, check_date)
-                if not raw:
-                    continue
-
-                ttfb_values = [c.ttfb_ms for c in raw if c.ttfb_ms is not None]
-                ssl_days = [
-                    c.ssl_days_remaining
-                    for c in raw
-                    if c.ssl_days_remaining is not None
-                ]
-
-                summary = DailySummary(
-                    id=None,
-                    url_id=url_id,
-                    summary_date=check_date,
-                    checks_count=len(raw),
-                    avg_ttfb_ms=sum(ttfb_values) / len(ttfb_values)
-                    if ttfb_values
-                    else None,
-                    min_ttfb_ms=min(ttfb_values) if ttfb_values else None,
-                    max_ttfb_ms=max(ttfb_values) if ttfb_values else None,
-                    min_ssl_days_remaining=min(ssl_days) if ssl_days else None,
-                    healthy_count=sum(1 for c in raw if c.is_healthy),
-                    unhealthy_count=sum(1 for c in raw if not c.is_healthy),
-                    last_http_status=raw[-1].http_status,
-                    last_ssl_expiration_date=raw[-1].ssl_expiration_date,
-                    last_checked_at=raw[-1].checked_at,
-                    created_at=datetime.now(timezone.utc),
-                )
-
-                await self._summary_repo.save(summary)
-                consolidated_count += 1
-                logger.debug(
-                    "Consolidated %d checks for url_id=%s on %s",
-                    len(raw),
-                    url_id,
-                    check_date,
-                )
-            except Exception as e:
-                logger.error(
-                    "Error consolidating url_id=%s date=%s: %s",
-                    url_id,
-                    check_date,
-                    e,
-                    exc_info=True,
+        while day < cutoff:
+            if (
+                time_budget_sec is not None
+                and time.monotonic() - started >= time_budget_sec
+            ):
+                logger.info(
+                    "Consolidation budget of %.0fs used up, %d days left "
+                    "for the next run; skipping purge",
+                    time_budget_sec,
+                    (cutoff - day).days,
                 )
+                return consolidated_count
+            # Let the probes run between days.
+            await asyncio.sleep(0)
+            summaries = await self._health_check_repo.aggregate_day(day)
+            if self._incremental:
+                summaries = await self._stale(day, summaries)
+            await self._summary_repo.save_many(summaries)
+            await self._summary_repo.set_consolidation_watermark(day)
+            consolidated_count += len(summaries)
+            logger.debug("Consolidated %d URLs on %s", len(summaries), day)
+            day += timedelta(days=1)
 
         cutoff.replace(day=1)  # keep current month at minimum
         if self._retention_days == 0:
-            purged = await self._health_check_repo.purge_older_than(cutoff)
+            # Today is not consolidated yet, keep its raw checks.
+            purged = await self._purge.execute(cutoff - timedelta(days=1))
         else:
-            from datetime import timedelta
-
             purge_date = cutoff - timedelta(days=self._retention_days)
-            purged = await self._health_check_repo.purge_older_than(purge_date)
+            purged = await self._purge.execute(purge_date)
 
         logger.info(
-            "Consolidated %d days, purged %d old health checks",
+            "Consolidated %d daily summaries, purged %d old health checks",
             consolidated_count,
             purged,
         )
+        self.last_run_complete = True
         return consolidated_count
+
+    async def _stale(
+        self, day: date, summaries: list[DailySummary]
+    ) -> list[DailySummary]:
+        """The aggregated summaries whose stored running summary differs."""
+        stored = {
+            s.url_id: (s.checks_count, s.healthy_count)
+            for s in await self._summary_repo.get_for_date(day)
+        }
+        return [
+            s
+            for s in summaries
+            if stored.get(s.url_id) != (s.checks_count, s.healthy_count)
+        ]
@@ -0,0 +1,64 @@
+import logging
+from datetime import datetime, timezone
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.repositories.daily_summary_repository import (
+    DailySummaryRepository,
+)
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+
+logger = logging.getLogger(__name__)
+
+
+class FlushDailyAggregatesUseCase:
+    def __init__(
+        self, aggregator: DailyAggregator, summary_repo: DailySummaryRepository
+    ):
+        self._aggregator = aggregator
+        self._summary_repo = summary_repo
+
+    async def execute(self) -> int:
+        unseeded = self._aggregator.unseeded()
+        # One query per day (today, and yesterday around midnight), not per URL.
+        for day in sorted({day for _, day in unseeded}):
+            stored = {s.url_id: s for s in await self._summary_repo.get_for_date(day)}
+            for url_id, key_day in unseeded:
+                if key_day == day:
+                    self._aggregator.seed((url_id, day), stored.get(url_id))
+
+        dirty = self._aggregator.take_dirty()
+        try:
+            await self._summary_repo.save_many(dirty)
+            written = len(dirty)
+        except Exception:
+            written = await self._save_one_by_one(dirty)
+        self._aggregator.evict_before(datetime.now(timezone.utc).date())
+        if written:
+            logger.debug("Wrote %d running daily summaries", written)
+        return written
+
+    async def _save_one_by_one(self, summaries: list[DailySummary]) -> int:
+        """Saves what it can after a failed batch.
+
+        If no summary can be written the database is likely down: all of
+        them are kept for the next flush and the error is raised. Otherwise
+        the ones that failed (e.g. of a URL deleted meanwhile) are dropped,
+        so they cannot block the others on every later flush.
+        """
+        failed: list[DailySummary] = []
+        error: Exception | None = None
+        for summary in summaries:
+            try:
+                await self._summary_repo.save_many([summary])
+            except Exception as e:
+                failed.append(summary)
+                error = e
+        if error is not None and len(failed) == len(summaries):
+            self._aggregator.mark_dirty(failed)
+            raise error
+        for summary in failed:
+            logger.warning(
+                "Dropped running daily summary of URL %d: %s", summary.url_id, error
+            )
+            self._aggregator.forget(summary.url_id)
+        return len(summaries) - len(failed)
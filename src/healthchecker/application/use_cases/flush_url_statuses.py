@@ -0,0 +1,51 @@
+import logging
+
+from healthchecker.domain.models.url_status import UrlStatus
+from healthchecker.domain.repositories.url_status_repository import (
+    UrlStatusRepository,
+)
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+
+logger = logging.getLogger(__name__)
+
+
+class FlushUrlStatusesUseCase:
+    def __init__(
+        self, url_statuses: UrlStatusStore, url_status_repo: UrlStatusRepository
+    ):
+        self._url_statuses = url_statuses
+        self._url_status_repo = url_status_repo
+
+    async def execute(self) -> int:
+        dirty = self._url_statuses.take_dirty()
+        if not dirty:
+            return 0
+        try:
+            await self._url_status_repo.save_many(dirty)
+            written = len(dirty)
+        except Exception:
+            written = await self._save_one_by_one(dirty)
+        logger.debug("Wrote %d URL statuses", written)
+        return written
+
+    async def _save_one_by_one(self, statuses: list[UrlStatus]) -> int:
+        """Saves what it can after a failed batch.
+
+        If nothing can be written the error is raised and every status is
+        kept for the next flush; otherwise the ones that failed (e.g. of a
+        URL deleted meanwhile) are dropped.
+        """
+        failed: list[UrlStatus] = []
+        error: Exception | None = None
+        for status in statuses:
+            try:
+                await self._url_status_repo.save_many([status])
+            except Exception as e:
+                failed.append(status)
+                error = e
+        if error is not None and len(failed) == len(statuses):
+            self._url_statuses.mark_dirty(failed)
+            raise error
+        for status in failed:
+            logger.warning("Dropped status of URL %d: %s", status.url_id, error)
+        return len(statuses) - len(failed)
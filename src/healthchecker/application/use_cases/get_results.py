@@ -1,14 +1,132 @@
+from datetime import datetime, timedelta, timezone
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.rollup import Resolution, Rollup
+from healthchecker.domain.models.url_status import UrlStatus
+from healthchecker.domain.repositories.daily_summary_repository import (
+    DailySummaryRepository,
+)
 from healthchecker.domain.repositories.health_check_repository import (
     HealthCheckRepository,
 )
+from healthchecker.domain.repositories.rollup_repository import RollupRepository
+from healthchecker.domain.repositories.url_status_repository import (
+    UrlStatusRepository,
+)
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.url_status_store import UrlStatusStore
 
 
 class GetResultsUseCase:
-    def __init__(self, health_check_repo: HealthCheckRepository):
+    def __init__(
+        self,
+        health_check_repo: HealthCheckRepository,
+        rollup_repo: RollupRepository | None = None,
+        summary_repo: DailySummaryRepository | None = None,
+        rollup_retention: dict[Resolution, timedelta] | None = None,
+        recent_checks: RecentChecks | None = None,
+        url_status_repo: UrlStatusRepository | None = None,
+        url_statuses: UrlStatusStore | None = None,
+    ):
         self._health_check_repo = health_check_repo
+        self._rollup_repo = rollup_repo
+        self._summary_repo = summary_repo
+        self._rollup_retention = rollup_retention or {}
+        self._recent_checks = recent_checks
+        self._url_status_repo = url_status_repo
+        self._url_statuses = url_statuses
 
     async def get_latest(self, url_id: int):
+        if self._recent_checks is not None:
+            latest = self._recent_checks.latest(url_id)
+            if latest is not None:
+                return latest
         return await self._health_check_repo.get_latest_by_url_id(url_id)
 
+    async def get_latest_for_urls(self, url_ids: list[int]) -> dict[int, HealthCheck]:
+        """Latest check of each URL that has one, keyed by URL id."""
+        latest: dict[int, HealthCheck] = {}
+        missing = []
+        for url_id in url_ids:
+            check = (
+                self._recent_checks.latest(url_id)
+                if self._recent_checks is not None
+                else None
+            )
+            if check is not None:
+                latest[url_id] = check
+            else:
+                missing.append(url_id)
+        if missing:
+            for check in await self._health_check_repo.get_latest_for_urls(missing):
+                latest[check.url_id] = check
+        return latest
+
+    async def get_statuses(self, url_ids: list[int]) -> dict[int, UrlStatus]:
+        """Current state of each URL that has been checked, keyed by URL id."""
+        statuses: dict[int, UrlStatus] = {}
+        # The in-memory statuses are ahead of the table, which is written
+        # in batches.
+        if self._url_statuses is not None:
+            for url_id in url_ids:
+                if (status := self._url_statuses.get(url_id)) is not None:
+                    statuses[url_id] = status
+        unknown = [url_id for url_id in url_ids if url_id not in statuses]
+        if self._url_status_repo is not None and unknown:
+            for status in await self._url_status_repo.get_for_urls(unknown):
+                statuses[status.url_id] = status
+        # URLs without a status row yet (e.g. right after the upgrade) fall
+        # back to their latest check.
+        missing = [url_id for url_id in url_ids if url_id not in statuses]
+        if missing:
+            for url_id, check in (await self.get_latest_for_urls(missing)).items():
+                statuses[url_id] = UrlStatus.from_check(check)
+        return statuses
+
     async def get_history(self, url_id: int, limit: int = 5):
-        return await self._health_check_repo.get_by_url_id(url_id, limit=limit)
+        if self._recent_checks is None:
+            return await self._health_check_repo.get_by_url_id(url_id, limit=limit)
+        checks = self._recent_checks.get(url_id, limit)
+        if checks is not None:
+            return checks
+        # Only past the buffer's depth, or before it has seen enough of this
+        # URL's checks, does the database answer.
+        checks = await self._health_check_repo.get_by_url_id(url_id, limit=limit)
+        if limit <= self._recent_checks.depth:
+            self._recent_checks.prime(url_id, checks, complete=len(checks) < limit)
+        return checks
+
+    async def get_series(
+        self, url_id: int, start: datetime, end: datetime, resolution: Resolution
+    ) -> list[Rollup]:
+        """Buckets of ``url_id`` from ``start`` to ``end``, oldest first.
+
+        Answered by the finest tier that is at least as coarse as
+        ``resolution`` and still keeps ``start``; daily summaries keep
+        everything.
+        """
+        now = datetime.now(timezone.utc)
+        for tier in Resolution:
+            if tier < resolution:
+                continue
+            if tier is Resolution.DAY:
+                return await self._daily_series(url_id, start, end)
+            retention = self._rollup_retention.get(tier)
+            if self._rollup_repo is None or retention is None:
+                continue
+            if tier.floor(start) >= now - retention:
+                return await self._rollup_repo.get_range_for_url(
+                    tier, url_id, tier.floor(start), end
+                )
+        return []
+
+    async def _daily_series(
+        self, url_id: int, start: datetime, end: datetime
+    ) -> list[Rollup]:
+        if self._summary_repo is None:
+            return []
+        last_day = (end - timedelta(microseconds=1)).date()
+        summaries = await self._summary_repo.get_range_for_url(
+            url_id, start.date(), last_day + timedelta(days=1)
+        )
+        return [Rollup.from_daily_summary(s) for s in summaries]
@@ -1,22 +1,96 @@
-from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url import (
+    DEFAULT_PROBE_MAX_BYTES,
+    BodyAssertion,
+    ProbeMode,
+    Url,
+)
 from healthchecker.domain.repositories.url_repository import UrlRepository
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.ssl_expiry_timeline import SslExpiryTimeline
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+from healthchecker.infrastructure.checker.ssl_checker import SslChecker
+from healthchecker.infrastructure.persistence.buffered_health_check_repository import (
+    BufferedHealthCheckRepository,
+)
 
 
 class ManageUrlsUseCase:
-    def __init__(self, url_repo: UrlRepository):
+    def __init__(
+        self,
+        url_repo: UrlRepository,
+        url_statuses: UrlStatusStore | None = None,
+        url_registry: ActiveUrlRegistry | None = None,
+        recent_checks: RecentChecks | None = None,
+        ssl_timeline: SslExpiryTimeline | None = None,
+        ssl_checker: SslChecker | None = None,
+        health_check_buffer: BufferedHealthCheckRepository | None = None,
+        daily_aggregator: DailyAggregator | None = None,
+    ):
         self._url_repo = url_repo
+        self._url_statuses = url_statuses
+        self._url_registry = url_registry
+        self._recent_checks = recent_checks
+        self._ssl_timeline = ssl_timeline
+        self._ssl_checker = ssl_checker
+        self._health_check_buffer = health_check_buffer
+        self._daily_aggregator = daily_aggregator
 
     async def add(
-        self, url: str, name: str | None = None, alert_before_days: int = 30
+        self,
+        url: str,
+        name: str | None = None,
+        alert_before_days: int = 30,
+        fresh_connection: bool = False,
+        probe_mode: ProbeMode = ProbeMode.HEAD,
+        probe_max_bytes: int = DEFAULT_PROBE_MAX_BYTES,
+        body_assertion: BodyAssertion | None = None,
+        check_interval_sec: int | None = None,
     ) -> Url:
-        domain_url = Url.create(url=url, name=name, alert_before_days=alert_before_days)
-        return await self._url_repo.add(domain_url)
+        domain_url = Url.create(
+            url=url,
+            name=name,
+            alert_before_days=alert_before_days,
+            fresh_connection=fresh_connection,
+            probe_mode=probe_mode,
+            probe_max_bytes=probe_max_bytes,
+            body_assertion=body_assertion,
+            check_interval_sec=check_interval_sec,
+        )
+        created = await self._url_repo.add(domain_url)
+        if self._url_registry is not None:
+            self._url_registry.url_added(created)
+        if self._recent_checks is not None:
+            self._recent_checks.track_new(created.id)
+        return created
 
     async def list_all(self) -> list[Url]:
+        if self._url_registry is not None:
+            return await self._url_registry.get_all()
         return await self._url_repo.get_all_active()
 
     async def delete(self, url_id: int) -> None:
+        url = await self.get_by_id(url_id) if self._ssl_checker is not None else None
         await self._url_repo.delete(url_id)
+        if self._url_registry is not None:
+            self._url_registry.url_removed(url_id)
+        if self._url_statuses is not None:
+            self._url_statuses.forget(url_id)
+        if self._recent_checks is not None:
+            self._recent_checks.forget(url_id)
+        if self._ssl_timeline is not None:
+            self._ssl_timeline.forget(url_id)
+        if self._ssl_checker is not None and url is not None:
+            self._ssl_checker.forget(url.url)
+        if self._health_check_buffer is not None:
+            self._health_check_buffer.discard_url(url_id)
+        if self._daily_aggregator is not None:
+            self._daily_aggregator.forget(url_id)
 
     async def get_by_id(self, url_id: int) -> Url | None:
+        if self._url_registry is not None:
+            url = await self._url_registry.get(url_id)
+            if url is not None:
+                return url
         return await self._url_repo.get_by_id(url_id)
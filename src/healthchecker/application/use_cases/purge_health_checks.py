@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from datetime import date
+
+from healthchecker.domain.repositories.health_check_repository import (
+    HealthCheckRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeHealthChecksUseCase:
+    def __init__(
+        self,
+        health_check_repo: HealthCheckRepository,
+        chunk_size: int = 5000,
+        pause_sec: float = 0.1,
+    ):
+        self._health_check_repo = health_check_repo
+        self._chunk_size = max(chunk_size, 1)
+        self._pause_sec = pause_sec
+
+    async def execute(self, cutoff_date: date) -> int:
+        """Deletes the checks taken on or before ``cutoff_date``.
+
+        Rows go in primary key slices of ``chunk_size`` ids, each its own
+        short DELETE, with a pause in between so the probes' inserts are
+        never stuck behind one long transaction.
+        """
+        id_range = await self._health_check_repo.get_purge_id_range(cutoff_date)
+        if id_range is None:
+            return 0
+
+        first_id, last_id = id_range
+        total_ids = last_id - first_id + 1
+        purged = 0
+        start_id = first_id
+        while start_id <= last_id:
+            end_id = min(start_id + self._chunk_size - 1, last_id)
+            purged += await self._health_check_repo.purge_older_than(
+                cutoff_date, start_id, end_id
+            )
+            logger.debug(
+                "Purged %d health checks through %s (%.0f%% of ids %d-%d)",
+                purged,
+                cutoff_date,
+                (end_id - first_id + 1) * 100 / total_ids,
+                first_id,
+                last_id,
+            )
+            start_id = end_id + 1
+            if start_id <= last_id:
+                await asyncio.sleep(self._pause_sec)
+        return purged
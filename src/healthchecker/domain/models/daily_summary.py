@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 from datetime import date, datetime
 
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.merging import max_of, merge_sketch_pair, min_of
+
 
 @dataclass
 class DailySummary:
@@ -18,3 +22,76 @@ class DailySummary:
     last_ssl_expiration_date: datetime | None
     last_checked_at: datetime | None
     created_at: datetime | None
+    # Number of checks that measured a TTFB, the weight of avg_ttfb_ms.
+    ttfb_count: int = 0
+    ttfb_sketch: LatencySketch | None = None
+
+    def ttfb_percentile(self, q: float) -> float | None:
+        return self.ttfb_sketch.quantile(q) if self.ttfb_sketch else None
+
+    @classmethod
+    def from_check(cls, check: HealthCheck) -> DailySummary:
+        return cls(
+            id=None,
+            url_id=check.url_id,
+            summary_date=check.checked_at.date(),
+            checks_count=1,
+            avg_ttfb_ms=check.ttfb_ms,
+            min_ttfb_ms=check.ttfb_ms,
+            max_ttfb_ms=check.ttfb_ms,
+            min_ssl_days_remaining=check.ssl_days_remaining,
+            healthy_count=1 if check.is_healthy else 0,
+            unhealthy_count=0 if check.is_healthy else 1,
+            last_http_status=check.http_status,
+            last_ssl_expiration_date=check.ssl_expiration_date,
+            last_checked_at=check.checked_at,
+            created_at=None,
+            ttfb_count=1 if check.ttfb_ms is not None else 0,
+            ttfb_sketch=(
+                LatencySketch.of(check.ttfb_ms) if check.ttfb_ms is not None else None
+            ),
+        )
+
+    def merged(self, other: DailySummary) -> DailySummary:
+        """Summary of both summaries' checks, for the same URL and day."""
+        ttfb_count = self.ttfb_count + other.ttfb_count
+        avg_ttfb_ms = None
+        if ttfb_count:
+            avg_ttfb_ms = (
+                (self.avg_ttfb_ms or 0.0) * self.ttfb_count
+                + (other.avg_ttfb_ms or 0.0) * other.ttfb_count
+            ) / ttfb_count
+        latest = self
+        if other.last_checked_at is not None and (
+            self.last_checked_at is None
+            or other.last_checked_at >= self.last_checked_at
+        ):
+            latest = other
+        return DailySummary(
+            id=self.id if self.id is not None else other.id,
+            url_id=self.url_id,
+            summary_date=self.summary_date,
+            checks_count=self.checks_count + other.checks_count,
+            avg_ttfb_ms=avg_ttfb_ms,
+            min_ttfb_ms=min_of(self.min_ttfb_ms, other.min_ttfb_ms),
+            max_ttfb_ms=max_of(self.max_ttfb_ms, other.max_ttfb_ms),
+            min_ssl_days_remaining=min_of(
+                self.min_ssl_days_remaining, other.min_ssl_days_remaining
+            ),
+            healthy_count=self.healthy_count + other.healthy_count,
+            unhealthy_count=self.unhealthy_count + other.unhealthy_count,
+            last_http_status=latest.last_http_status,
+            last_ssl_expiration_date=latest.last_ssl_expiration_date,
+            last_checked_at=latest.last_checked_at,
+            created_at=self.created_at or other.created_at,
+            ttfb_count=ttfb_count,
+            ttfb_sketch=merge_sketch_pair(self.ttfb_sketch, other.ttfb_sketch),
+        )
+
+
+def merge_sketches(summaries: list[DailySummary]) -> LatencySketch | None:
+    """TTFB sketch of all the given summaries, e.g. for a week."""
+    sketch = None
+    for summary in summaries:
+        sketch = merge_sketch_pair(sketch, summary.ttfb_sketch)
+    return sketch
@@ -13,3 +13,10 @@ class HealthCheck:
     is_healthy: bool
     error_message: str | None
     checked_at: datetime
+    dns_ms: float | None = None
+    connect_ms: float | None = None
+    tls_ms: float | None = None
+    total_ms: float | None = None
+    bytes_received: int | None = None
+    tls_version: str | None = None
+    tls_cipher: str | None = None
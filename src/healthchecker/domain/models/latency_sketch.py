@@ -0,0 +1,106 @@
+import math
+import struct
+from collections.abc import Iterable
+
+# Every quantile is within 1% of the true value.
+RELATIVE_ACCURACY = 0.01
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+# A value lands in bucket ceil(ln(value) / LOG_GAMMA).
+LOG_GAMMA = math.log(_GAMMA)
+# Latencies below this (in ms) are counted as zero.
+MIN_VALUE = 1e-3
+
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BI")
+_BUCKET = struct.Struct("<hI")
+
+
+class LatencySketch:
+    """Mergeable quantile sketch of latencies (a DDSketch).
+
+    Values fall into logarithmic buckets whose bounds grow by ``_GAMMA``,
+    so a bucket's midpoint is within ``RELATIVE_ACCURACY`` of any value in
+    it. Merging two sketches adds their bucket counts, which gives exactly
+    the sketch of all their values: percentiles of a week come from the
+    daily sketches without the raw checks.
+    """
+
+    def __init__(self, buckets: dict[int, int] | None = None, zero_count: int = 0):
+        self._buckets: dict[int, int] = dict(buckets or {})
+        self._zero_count = zero_count
+
+    @classmethod
+    def of(cls, *values: float) -> LatencySketch:
+        sketch = cls()
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    @classmethod
+    def from_counts(cls, counts: Iterable[tuple[int | None, int]]) -> LatencySketch:
+        """Sketch of (bucket index, count) pairs, e.g. grouped by a database.
+
+        A ``None`` index counts values below ``MIN_VALUE``.
+        """
+        sketch = cls()
+        for index, count in counts:
+            if index is None:
+                sketch._zero_count += count
+            else:
+                sketch._buckets[index] = sketch._buckets.get(index, 0) + count
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self._zero_count + sum(self._buckets.values())
+
+    def add(self, value: float) -> None:
+        if value < MIN_VALUE:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / LOG_GAMMA)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def merged(self, other: LatencySketch) -> LatencySketch:
+        buckets = dict(self._buckets)
+        for index, count in other._buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        return LatencySketch(buckets, self._zero_count + other._zero_count)
+
+    def quantile(self, q: float) -> float | None:
+        """Value at quantile ``q`` (0..1), or None for an empty sketch."""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = self._zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                return 2 * _GAMMA**index / (_GAMMA + 1)
+        return 2 * _GAMMA ** max(self._buckets) / (_GAMMA + 1)
+
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(_FORMAT_VERSION, self._zero_count)]
+        parts.extend(
+            _BUCKET.pack(index, count) for index, count in sorted(self._buckets.items())
+        )
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> LatencySketch:
+        version, zero_count = _HEADER.unpack_from(data)
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported latency sketch version {version}")
+        buckets = dict(_BUCKET.iter_unpack(data[_HEADER.size :]))
+        return cls(buckets, zero_count)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LatencySketch):
+            return NotImplemented
+        return self._buckets == other._buckets and self._zero_count == other._zero_count
+
+    def __repr__(self) -> str:
+        return f"LatencySketch(count={self.count})"
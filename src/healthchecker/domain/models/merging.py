@@ -0,0 +1,19 @@
+from healthchecker.domain.models.latency_sketch import LatencySketch
+
+
+def min_of(a, b):
+    """Smaller of two optional values; None only if both are."""
+    return b if a is None else a if b is None else min(a, b)
+
+
+def max_of(a, b):
+    """Larger of two optional values; None only if both are."""
+    return b if a is None else a if b is None else max(a, b)
+
+
+def merge_sketch_pair(
+    a: LatencySketch | None, b: LatencySketch | None
+) -> LatencySketch | None:
+    if a is None or b is None:
+        return a or b
+    return a.merged(b)
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.merging import max_of, merge_sketch_pair, min_of
+
+
+class Resolution(IntEnum):
+    """Bucket width of a rollup tier, in seconds."""
+
+    FIVE_MINUTES = 300
+    HOUR = 3600
+    DAY = 86400
+
+    @property
+    def delta(self) -> timedelta:
+        return timedelta(seconds=self.value)
+
+    def floor(self, moment: datetime) -> datetime:
+        """Start of the bucket containing ``moment``."""
+        ts = int(moment.timestamp())
+        return datetime.fromtimestamp(ts - ts % self.value, timezone.utc)
+
+
+@dataclass
+class Rollup:
+    """Checks of one URL within one time bucket."""
+
+    url_id: int
+    resolution: Resolution
+    bucket_start: datetime
+    checks_count: int
+    healthy_count: int
+    ttfb_count: int
+    avg_ttfb_ms: float | None
+    min_ttfb_ms: float | None
+    max_ttfb_ms: float | None
+    ttfb_sketch: LatencySketch | None = None
+
+    @property
+    def unhealthy_count(self) -> int:
+        return self.checks_count - self.healthy_count
+
+    @classmethod
+    def from_check(cls, check: HealthCheck, resolution: Resolution) -> Rollup:
+        return cls(
+            url_id=check.url_id,
+            resolution=resolution,
+            bucket_start=resolution.floor(check.checked_at),
+            checks_count=1,
+            healthy_count=1 if check.is_healthy else 0,
+            ttfb_count=1 if check.ttfb_ms is not None else 0,
+            avg_ttfb_ms=check.ttfb_ms,
+            min_ttfb_ms=check.ttfb_ms,
+            max_ttfb_ms=check.ttfb_ms,
+            ttfb_sketch=(
+                LatencySketch.of(check.ttfb_ms) if check.ttfb_ms is not None else None
+            ),
+        )
+
+    @classmethod
+    def from_daily_summary(cls, summary: DailySummary) -> Rollup:
+        day = summary.summary_date
+        return cls(
+            url_id=summary.url_id,
+            resolution=Resolution.DAY,
+            bucket_start=datetime(day.year, day.month, day.day, tzinfo=timezone.utc),
+            checks_count=summary.checks_count,
+            healthy_count=summary.healthy_count,
+            ttfb_count=summary.ttfb_count,
+            avg_ttfb_ms=summary.avg_ttfb_ms,
+            min_ttfb_ms=summary.min_ttfb_ms,
+            max_ttfb_ms=summary.max_ttfb_ms,
+            ttfb_sketch=summary.ttfb_sketch,
+        )
+
+    def coarsened(self, resolution: Resolution) -> Rollup:
+        """The same checks, as part of the wider ``resolution`` bucket."""
+        return Rollup(
+            url_id=self.url_id,
+            resolution=resolution,
+            bucket_start=resolution.floor(self.bucket_start),
+            checks_count=self.checks_count,
+            healthy_count=self.healthy_count,
+            ttfb_count=self.ttfb_count,
+            avg_ttfb_ms=self.avg_ttfb_ms,
+            min_ttfb_ms=self.min_ttfb_ms,
+            max_ttfb_ms=self.max_ttfb_ms,
+            ttfb_sketch=self.ttfb_sketch,
+        )
+
+    def merged(self, other: Rollup) -> Rollup:
+        """Rollup of both rollups' checks, for the same URL and bucket."""
+        ttfb_count = self.ttfb_count + other.ttfb_count
+        avg_ttfb_ms = None
+        if ttfb_count:
+            avg_ttfb_ms = (
+                (self.avg_ttfb_ms or 0.0) * self.ttfb_count
+                + (other.avg_ttfb_ms or 0.0) * other.ttfb_count
+            ) / ttfb_count
+        return Rollup(
+            url_id=self.url_id,
+            resolution=self.resolution,
+            bucket_start=self.bucket_start,
+            checks_count=self.checks_count + other.checks_count,
+            healthy_count=self.healthy_count + other.healthy_count,
+            ttfb_count=ttfb_count,
+            avg_ttfb_ms=avg_ttfb_ms,
+            min_ttfb_ms=min_of(self.min_ttfb_ms, other.min_ttfb_ms),
+            max_ttfb_ms=max_of(self.max_ttfb_ms, other.max_ttfb_ms),
+            ttfb_sketch=merge_sketch_pair(self.ttfb_sketch, other.ttfb_sketch),
+        )
+
+
+def roll_up(rollups: list[Rollup], resolution: Resolution) -> list[Rollup]:
+    """Merges finer rollups into buckets of ``resolution``."""
+    buckets: dict[tuple[int, datetime], Rollup] = {}
+    for rollup in rollups:
+        coarse = rollup.coarsened(resolution)
+        key = (coarse.url_id, coarse.bucket_start)
+        buckets[key] = buckets[key].merged(coarse) if key in buckets else coarse
+    return [buckets[key] for key in sorted(buckets)]
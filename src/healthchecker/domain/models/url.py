@@ -1,5 +1,27 @@
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+
+
+class ProbeMode(str, Enum):
+    HEAD = "head"
+    HEADERS = "headers"
+    CAPPED = "capped"
+
+
+DEFAULT_PROBE_MAX_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class BodyAssertion:
+    pattern: str
+    is_regex: bool = False
+    must_match: bool = True
+
+    def describe(self) -> str:
+        target = f"/{self.pattern}/" if self.is_regex else f"'{self.pattern}'"
+        verb = "contains" if self.must_match else "does not contain"
+        return f"body {verb} {target}"
 
 
 @dataclass
@@ -11,10 +33,23 @@ class Url:
     is_active: bool
     created_at: datetime | None
     updated_at: datetime | None
+    fresh_connection: bool = False
+    probe_mode: ProbeMode = ProbeMode.HEAD
+    probe_max_bytes: int = DEFAULT_PROBE_MAX_BYTES
+    body_assertion: BodyAssertion | None = None
+    check_interval_sec: int | None = None
 
     @classmethod
     def create(
-        cls, url: str, name: str | None = None, alert_before_days: int = 30
+        cls,
+        url: str,
+        name: str | None = None,
+        alert_before_days: int = 30,
+        fresh_connection: bool = False,
+        probe_mode: ProbeMode = ProbeMode.HEAD,
+        probe_max_bytes: int = DEFAULT_PROBE_MAX_BYTES,
+        body_assertion: BodyAssertion | None = None,
+        check_interval_sec: int | None = None,
     ) -> "Url":
         now = datetime.utcnow()
         return cls(
@@ -25,4 +60,9 @@ class Url:
             is_active=True,
             created_at=now,
             updated_at=now,
+            fresh_connection=fresh_connection,
+            probe_mode=probe_mode,
+            probe_max_bytes=probe_max_bytes,
+            body_assertion=body_assertion,
+            check_interval_sec=check_interval_sec,
         )
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from healthchecker.domain.models.health_check import HealthCheck
+
+
+@dataclass(frozen=True)
+class UrlStatus:
+    """Current state of one URL, as of its latest check."""
+
+    url_id: int
+    http_status: int | None
+    ttfb_ms: float | None
+    ssl_expiration_date: datetime | None
+    ssl_days_remaining: int | None
+    is_healthy: bool
+    error_message: str | None
+    consecutive_failures: int
+    last_checked_at: datetime
+    # When is_healthy last flipped, or the first check if it never did.
+    state_changed_at: datetime
+
+    @classmethod
+    def from_check(
+        cls, check: HealthCheck, previous: UrlStatus | None = None
+    ) -> UrlStatus:
+        """The state after ``check``, given the state before it."""
+        changed = previous is None or previous.is_healthy != check.is_healthy
+        failures = previous.consecutive_failures if previous else 0
+        return cls(
+            url_id=check.url_id,
+            http_status=check.http_status,
+            ttfb_ms=check.ttfb_ms,
+            ssl_expiration_date=check.ssl_expiration_date,
+            ssl_days_remaining=check.ssl_days_remaining,
+            is_healthy=check.is_healthy,
+            error_message=check.error_message,
+            consecutive_failures=0 if check.is_healthy else failures + 1,
+            last_checked_at=check.checked_at,
+            state_changed_at=(
+                check.checked_at if changed else previous.state_changed_at
+            ),
+        )
@@ -8,6 +8,9 @@ class DailySummaryRepository(ABC):
     @abstractmethod
     async def save(self, summary: DailySummary) -> DailySummary: ...
 
+    @abstractmethod
+    async def save_many(self, summaries: list[DailySummary]) -> None: ...
+
     @abstractmethod
     async def get_by_url_id_and_date(
         self, url_id: int, summary_date: date
@@ -18,5 +21,19 @@ class DailySummaryRepository(ABC):
         self, url_id: int, limit: int = 10, offset: int = 0
     ) -> list[DailySummary]: ...
 
+    @abstractmethod
+    async def get_range_for_url(
+        self, url_id: int, start: date, end: date
+    ) -> list[DailySummary]: ...
+
     @abstractmethod
     async def exists_for_date(self, url_id: int, summary_date: date) -> bool: ...
+
+    @abstractmethod
+    async def get_for_date(self, summary_date: date) -> list[DailySummary]: ...
+
+    @abstractmethod
+    async def get_consolidation_watermark(self) -> date | None: ...
+
+    @abstractmethod
+    async def set_consolidation_watermark(self, day: date) -> None: ...
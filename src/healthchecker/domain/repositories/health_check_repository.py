@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, datetime
 
+from healthchecker.domain.models.daily_summary import DailySummary
 from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.rollup import Resolution, Rollup
 
 
 class HealthCheckRepository(ABC):
     @abstractmethod
     async def save(self, check: HealthCheck) -> HealthCheck: ...
 
+    @abstractmethod
+    async def save_many(self, checks: list[HealthCheck]) -> None: ...
+
     @abstractmethod
     async def get_by_url_id(
         self, url_id: int, limit: int = 10
@@ -17,9 +22,21 @@ class HealthCheckRepository(ABC):
     async def get_latest_by_url_id(self, url_id: int) -> HealthCheck | None: ...
 
     @abstractmethod
-    async def get_dates_needing_consolidation(
-        self, cutoff_date: date
-    ) -> list[tuple[int, date]]: ...
+    async def get_latest_for_all(self) -> list[HealthCheck]: ...
+
+    @abstractmethod
+    async def get_latest_for_urls(self, url_ids: list[int]) -> list[HealthCheck]: ...
+
+    @abstractmethod
+    async def get_first_check_date(self) -> date | None: ...
+
+    @abstractmethod
+    async def aggregate_day(self, day: date) -> list[DailySummary]: ...
+
+    @abstractmethod
+    async def aggregate_rollups(
+        self, resolution: Resolution, start: datetime, end: datetime
+    ) -> list[Rollup]: ...
 
     @abstractmethod
     async def get_raw_for_date(
@@ -27,4 +44,12 @@ class HealthCheckRepository(ABC):
     ) -> list[HealthCheck]: ...
 
     @abstractmethod
-    async def purge_older_than(self, cutoff_date: date) -> int: ...
+    async def get_purge_id_range(self, cutoff_date: date) -> tuple[int, int] | None: ...
+
+    @abstractmethod
+    async def purge_older_than(
+        self,
+        cutoff_date: date,
+        start_id: int | None = None,
+        end_id: int | None = None,
+    ) -> int: ...
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from healthchecker.domain.models.rollup import Resolution, Rollup
+
+
+class RollupRepository(ABC):
+    @abstractmethod
+    async def save_many(self, rollups: list[Rollup]) -> None: ...
+
+    @abstractmethod
+    async def get_range(
+        self, resolution: Resolution, start: datetime, end: datetime
+    ) -> list[Rollup]: ...
+
+    @abstractmethod
+    async def get_range_for_url(
+        self, resolution: Resolution, url_id: int, start: datetime, end: datetime
+    ) -> list[Rollup]: ...
+
+    @abstractmethod
+    async def get_latest_bucket_start(
+        self, resolution: Resolution
+    ) -> datetime | None: ...
+
+    @abstractmethod
+    async def purge_older_than(
+        self, resolution: Resolution, cutoff: datetime
+    ) -> int: ...
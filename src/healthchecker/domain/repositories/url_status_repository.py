@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from healthchecker.domain.models.url_status import UrlStatus
+
+
+class UrlStatusRepository(ABC):
+    @abstractmethod
+    async def save_many(self, statuses: list[UrlStatus]) -> None: ...
+
+    @abstractmethod
+    async def get_for_urls(self, url_ids: list[int]) -> list[UrlStatus]: ...
+
+    @abstractmethod
+    async def get_all(self) -> list[UrlStatus]: ...
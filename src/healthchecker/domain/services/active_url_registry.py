@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from healthchecker.domain.models.url import Url
+from healthchecker.domain.repositories.url_repository import UrlRepository
+
+
+class ActiveUrlRegistry:
+    """In-memory set of active URLs, loaded once from the repository.
+
+    ``ManageUrlsUseCase`` reports every add and delete, so the set stays
+    current without reading ``urls`` on each run. It is still reloaded every
+    ``reconcile_interval_sec`` to pick up changes made by other instances.
+    """
+
+    def __init__(self, url_repo: UrlRepository, reconcile_interval_sec: float = 300):
+        self._url_repo = url_repo
+        self._reconcile_interval = reconcile_interval_sec
+        self._urls: dict[int, Url] = {}
+        self._loaded_at: float | None = None
+        self._reload_lock = asyncio.Lock()
+        # Changes reported while a reload is running, replayed on its result.
+        self._changes_during_load: list[tuple[int, Url | None]] | None = None
+
+    async def get_all(self) -> list[Url]:
+        await self._ensure_fresh()
+        return sorted(self._urls.values(), key=lambda u: u.id)
+
+    async def get(self, url_id: int) -> Url | None:
+        await self._ensure_fresh()
+        return self._urls.get(url_id)
+
+    def url_added(self, url: Url) -> None:
+        self._apply(url.id, url if url.is_active else None)
+
+    def url_removed(self, url_id: int) -> None:
+        self._apply(url_id, None)
+
+    async def reconcile(self) -> None:
+        async with self._reload_lock:
+            await self._reload()
+
+    async def _ensure_fresh(self) -> None:
+        if not self._is_stale():
+            return
+        async with self._reload_lock:
+            if self._is_stale():
+                await self._reload()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self._reconcile_interval
+        )
+
+    async def _reload(self) -> None:
+        self._changes_during_load = []
+        try:
+            urls = await self._url_repo.get_all_active()
+            loaded = {url.id: url for url in urls}
+            for url_id, url in self._changes_during_load:
+                self._set(loaded, url_id, url)
+        finally:
+            self._changes_during_load = None
+        self._urls = loaded
+        self._loaded_at = time.monotonic()
+
+    def _apply(self, url_id: int, url: Url | None) -> None:
+        self._set(self._urls, url_id, url)
+        if self._changes_during_load is not None:
+            self._changes_during_load.append((url_id, url))
+
+    @staticmethod
+    def _set(urls: dict[int, Url], url_id: int, url: Url | None) -> None:
+        if url is None:
+            urls.pop(url_id, None)
+        else:
+            urls[url_id] = url
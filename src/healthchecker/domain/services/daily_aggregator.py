@@ -0,0 +1,65 @@
+from datetime import date
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+
+_Key = tuple[int, date]
+
+
+class DailyAggregator:
+    """Running daily summaries, updated in memory by every saved check.
+
+    Checks for a (URL, day) first collect in a delta. The flush merges that
+    delta into the stored summary once ("seeding"); from then on the running
+    total here is authoritative and is simply written back when it changed.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[_Key, DailySummary] = {}
+        self._unseeded: dict[_Key, DailySummary] = {}
+        self._dirty: set[_Key] = set()
+
+    def record(self, check: HealthCheck) -> None:
+        delta = DailySummary.from_check(check)
+        key = (delta.url_id, delta.summary_date)
+        if key in self._totals:
+            self._totals[key] = self._totals[key].merged(delta)
+            self._dirty.add(key)
+        elif key in self._unseeded:
+            self._unseeded[key] = self._unseeded[key].merged(delta)
+        else:
+            self._unseeded[key] = delta
+
+    def unseeded(self) -> list[_Key]:
+        return list(self._unseeded)
+
+    def seed(self, key: _Key, stored: DailySummary | None) -> None:
+        """Starts the running total of ``key`` from its stored summary."""
+        delta = self._unseeded.pop(key, None)
+        if delta is None:
+            return
+        self._totals[key] = stored.merged(delta) if stored is not None else delta
+        self._dirty.add(key)
+
+    def take_dirty(self) -> list[DailySummary]:
+        dirty = [self._totals[key] for key in sorted(self._dirty)]
+        self._dirty.clear()
+        return dirty
+
+    def mark_dirty(self, summaries: list[DailySummary]) -> None:
+        for summary in summaries:
+            key = (summary.url_id, summary.summary_date)
+            if key in self._totals:
+                self._dirty.add(key)
+
+    def forget(self, url_id: int) -> None:
+        """Drops everything held for a deleted URL."""
+        for store in (self._totals, self._unseeded):
+            for key in [k for k in store if k[0] == url_id]:
+                del store[key]
+        self._dirty = {k for k in self._dirty if k[0] != url_id}
+
+    def evict_before(self, day: date) -> None:
+        """Forgets written totals of days before ``day``."""
+        for key in [k for k in self._totals if k[1] < day and k not in self._dirty]:
+            del self._totals[key]
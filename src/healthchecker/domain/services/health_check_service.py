@@ -45,6 +45,7 @@ class HealthCheckService:
             message=(
                 f"❌ *{url_name}* is DOWN. "
                 + (f"HTTP {status}" if status else f"Error: {error}")
+                + (f" ({error})" if status and error else "")
             ),
             is_sent=False,
             created_at=datetime.now(timezone.utc),
@@ -0,0 +1,207 @@
+import math
+from array import array
+from datetime import datetime, timezone
+
+from healthchecker.domain.models.health_check import HealthCheck
+
+# Sentinels for "no value" in the integer columns.
+_NO_INT = -1
+_NO_DAYS = -(2**31)
+_HEALTHY = 0x01
+
+
+class _Palette:
+    """Small shared table for the few distinct TLS versions and ciphers."""
+
+    def __init__(self) -> None:
+        self._values: list[str | None] = [None]
+        self._index: dict[str, int] = {}
+
+    def encode(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        index = self._index.get(value)
+        if index is None:
+            if len(self._values) > 0xFFFF:
+                return 0
+            index = self._index[value] = len(self._values)
+            self._values.append(value)
+        return index
+
+    def decode(self, index: int) -> str | None:
+        return self._values[index]
+
+
+class _CheckRing:
+    """Fixed-size ring of checks for one URL, one array per field.
+
+    Durations are float32, so they keep about seven significant digits.
+    """
+
+    def __init__(self, url_id: int, capacity: int, palette: _Palette) -> None:
+        self._url_id = url_id
+        self._capacity = capacity
+        self._palette = palette
+        self._next = 0
+        self.size = 0
+        # True while the ring holds every check the URL has.
+        self.complete = False
+        self._id = array("q", [_NO_INT]) * capacity
+        self._checked_at = array("d", [0.0]) * capacity
+        self._http_status = array("h", [_NO_INT]) * capacity
+        self._ttfb_ms = array("f", [0.0]) * capacity
+        self._dns_ms = array("f", [0.0]) * capacity
+        self._connect_ms = array("f", [0.0]) * capacity
+        self._tls_ms = array("f", [0.0]) * capacity
+        self._total_ms = array("f", [0.0]) * capacity
+        self._bytes_received = array("q", [_NO_INT]) * capacity
+        self._ssl_days = array("i", [_NO_DAYS]) * capacity
+        self._ssl_expires_at = array("d", [0.0]) * capacity
+        self._flags = array("B", [0]) * capacity
+        self._tls_version = array("H", [0]) * capacity
+        self._tls_cipher = array("H", [0]) * capacity
+        self._errors: list[str | None] = [None] * capacity
+
+    def append(self, check: HealthCheck) -> None:
+        i = self._next
+        self._id[i] = check.id if check.id is not None else _NO_INT
+        self._checked_at[i] = check.checked_at.timestamp()
+        self._http_status[i] = _int(check.http_status)
+        self._ttfb_ms[i] = _float(check.ttfb_ms)
+        self._dns_ms[i] = _float(check.dns_ms)
+        self._connect_ms[i] = _float(check.connect_ms)
+        self._tls_ms[i] = _float(check.tls_ms)
+        self._total_ms[i] = _float(check.total_ms)
+        self._bytes_received[i] = _int(check.bytes_received)
+        self._ssl_days[i] = (
+            check.ssl_days_remaining
+            if check.ssl_days_remaining is not None
+            else _NO_DAYS
+        )
+        self._ssl_expires_at[i] = (
+            check.ssl_expiration_date.timestamp()
+            if check.ssl_expiration_date is not None
+            else math.nan
+        )
+        self._flags[i] = _HEALTHY if check.is_healthy else 0
+        self._tls_version[i] = self._palette.encode(check.tls_version)
+        self._tls_cipher[i] = self._palette.encode(check.tls_cipher)
+        self._errors[i] = check.error_message
+
+        self._next = (i + 1) % self._capacity
+        if self.size == self._capacity:
+            self.complete = False
+        else:
+            self.size += 1
+
+    def newest(self, limit: int) -> list[HealthCheck]:
+        return [
+            self._read((self._next - 1 - n) % self._capacity)
+            for n in range(min(limit, self.size))
+        ]
+
+    def _read(self, i: int) -> HealthCheck:
+        ssl_days = self._ssl_days[i]
+        ssl_expires_at = self._ssl_expires_at[i]
+        return HealthCheck(
+            id=self._id[i] if self._id[i] != _NO_INT else None,
+            url_id=self._url_id,
+            http_status=(
+                self._http_status[i] if self._http_status[i] != _NO_INT else None
+            ),
+            ttfb_ms=_optional(self._ttfb_ms[i]),
+            ssl_expiration_date=(
+                None
+                if math.isnan(ssl_expires_at)
+                else datetime.fromtimestamp(ssl_expires_at, timezone.utc)
+            ),
+            ssl_days_remaining=ssl_days if ssl_days != _NO_DAYS else None,
+            is_healthy=bool(self._flags[i] & _HEALTHY),
+            error_message=self._errors[i],
+            checked_at=datetime.fromtimestamp(self._checked_at[i], timezone.utc),
+            dns_ms=_optional(self._dns_ms[i]),
+            connect_ms=_optional(self._connect_ms[i]),
+            tls_ms=_optional(self._tls_ms[i]),
+            total_ms=_optional(self._total_ms[i]),
+            bytes_received=(
+                self._bytes_received[i] if self._bytes_received[i] != _NO_INT else None
+            ),
+            tls_version=self._palette.decode(self._tls_version[i]),
+            tls_cipher=self._palette.decode(self._tls_cipher[i]),
+        )
+
+
+class RecentChecks:
+    """The last ``depth`` checks of every URL, kept in memory.
+
+    The checks append to it as they are saved, so recent history is read
+    without a database query. Each check takes a few dozen bytes spread
+    over per-field arrays, instead of one ``HealthCheck`` object.
+    """
+
+    def __init__(self, depth: int = 50) -> None:
+        self.depth = depth
+        self._palette = _Palette()
+        self._rings: dict[int, _CheckRing] = {}
+
+    def record(self, check: HealthCheck) -> None:
+        self._ring(check.url_id).append(check)
+
+    def get(self, url_id: int, limit: int) -> list[HealthCheck] | None:
+        """Newest first, or None when older checks may be in the database."""
+        ring = self._rings.get(url_id)
+        if ring is None or (ring.size < limit and not ring.complete):
+            return None
+        return ring.newest(limit)
+
+    def latest(self, url_id: int) -> HealthCheck | None:
+        ring = self._rings.get(url_id)
+        if ring is None or ring.size == 0:
+            return None
+        return ring.newest(1)[0]
+
+    def prime(self, url_id: int, checks: list[HealthCheck], complete: bool) -> None:
+        """Fills a URL's ring from the database, newest first.
+
+        ``complete`` says the URL has no checks older than these. Checks
+        recorded since the query stay in front of them.
+        """
+        ring = self._rings.get(url_id)
+        newer = []
+        if ring is not None:
+            cutoff = checks[0].checked_at if checks else None
+            newer = [
+                c
+                for c in ring.newest(ring.size)
+                if cutoff is None or c.checked_at > cutoff
+            ]
+        fresh = _CheckRing(url_id, self.depth, self._palette)
+        fresh.complete = complete
+        for check in [*reversed(checks), *reversed(newer)]:
+            fresh.append(check)
+        self._rings[url_id] = fresh
+
+    def track_new(self, url_id: int) -> None:
+        """Starts an empty, complete ring for a URL that has no checks yet."""
+        self.prime(url_id, [], complete=True)
+
+    def forget(self, url_id: int) -> None:
+        self._rings.pop(url_id, None)
+
+    def _ring(self, url_id: int) -> _CheckRing:
+        ring = self._rings.get(url_id)
+        if ring is None:
+            ring = self._rings[url_id] = _CheckRing(url_id, self.depth, self._palette)
+        return ring
+
+
+def _int(value: int | None) -> int:
+    return value if value is not None else _NO_INT
+
+
+def _float(value: float | None) -> float:
+    return value if value is not None else math.nan
+
+
+def _optional(value: float) -> float | None:
+    return None if math.isnan(value) else value
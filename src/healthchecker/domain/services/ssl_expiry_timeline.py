@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from healthchecker.domain.services.health_check_service import HealthCheckService
+
+
+@dataclass
+class _Crossing:
+    expiration_date: datetime
+    threshold_days: int
+    notified: bool
+
+
+class SslExpiryTimeline:
+    """Remembers, per URL and certificate, whether the alert threshold was crossed.
+
+    A certificate alerts once, on the first check at or below its threshold.
+    Renewing the certificate or changing the threshold starts a new entry.
+    """
+
+    def __init__(self) -> None:
+        self._crossings: dict[int, _Crossing] = {}
+
+    def crossed(
+        self,
+        url_id: int,
+        expiration_date: datetime,
+        days_remaining: int,
+        threshold_days: int,
+        was_below_threshold: bool = False,
+    ) -> bool:
+        crossing = self._crossings.get(url_id)
+        if crossing is None:
+            crossing = _Crossing(expiration_date, threshold_days, was_below_threshold)
+        elif (
+            crossing.expiration_date != expiration_date
+            or crossing.threshold_days != threshold_days
+        ):
+            crossing = _Crossing(expiration_date, threshold_days, False)
+        self._crossings[url_id] = crossing
+
+        if crossing.notified or not HealthCheckService.should_alert_ssl(
+            days_remaining, threshold_days
+        ):
+            return False
+        crossing.notified = True
+        return True
+
+    def forget(self, url_id: int) -> None:
+        self._crossings.pop(url_id, None)
@@ -0,0 +1,49 @@
+from collections.abc import Iterable
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.url_status import UrlStatus
+
+
+class UrlStatusStore:
+    """Current state of every URL, kept in memory.
+
+    Filled once from the ``url_status`` table and then kept current by the
+    checks themselves, so comparing a new result with the previous state
+    needs no database read. It is the only copy of that state: the alert
+    transitions read it and the ``url_status`` rows are written from it,
+    in batches of the statuses changed since the last write.
+    """
+
+    def __init__(self) -> None:
+        self._statuses: dict[int, UrlStatus] = {}
+        self._dirty: set[int] = set()
+        self.loaded = False
+
+    def load(self, statuses: Iterable[UrlStatus]) -> None:
+        # Entries recorded while the load query was running are newer.
+        for status in statuses:
+            self._statuses.setdefault(status.url_id, status)
+        self.loaded = True
+
+    def get(self, url_id: int) -> UrlStatus | None:
+        return self._statuses.get(url_id)
+
+    def record(self, check: HealthCheck) -> UrlStatus:
+        status = UrlStatus.from_check(check, self._statuses.get(check.url_id))
+        self._statuses[check.url_id] = status
+        self._dirty.add(check.url_id)
+        return status
+
+    def take_dirty(self) -> list[UrlStatus]:
+        """Statuses changed since the last call, to be written."""
+        dirty = [self._statuses[url_id] for url_id in self._dirty]
+        self._dirty.clear()
+        return dirty
+
+    def mark_dirty(self, statuses: Iterable[UrlStatus]) -> None:
+        """Puts back statuses whose write failed, unless their URL is gone."""
+        self._dirty.update(s.url_id for s in statuses if s.url_id in self._statuses)
+
+    def forget(self, url_id: int) -> None:
+        self._statuses.pop(url_id, None)
+        self._dirty.discard(url_id)
@@ -0,0 +1,36 @@
+import codecs
+import re
+
+# A regular expression is only guaranteed to be found across a chunk
+# boundary if its match is at most this many characters long.
+_REGEX_OVERLAP = 1024
+
+
+class BodyMatcher:
+    """Searches a response body chunk by chunk without buffering it.
+
+    Only the tail of the text seen so far is kept between chunks, long enough
+    for a literal pattern (or a regex match up to ``_REGEX_OVERLAP``
+    characters) that starts in one chunk and ends in the next.
+    """
+
+    def __init__(self, pattern: str, is_regex: bool = False, encoding: str = "utf-8"):
+        self._regex = re.compile(pattern if is_regex else re.escape(pattern))
+        self._keep = _REGEX_OVERLAP if is_regex else max(len(pattern) - 1, 0)
+        try:
+            decoder_factory = codecs.getincrementaldecoder(encoding)
+        except LookupError:
+            decoder_factory = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder_factory(errors="replace")
+        self._tail = ""
+        self.matched = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> bool:
+        if self.matched:
+            return True
+        text = self._tail + self._decoder.decode(chunk, final)
+        if self._regex.search(text):
+            self.matched = True
+            return True
+        self._tail = text[-self._keep :] if self._keep else ""
+        return False
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import socket
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_NEGATIVE_ERRORS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+
+@dataclass
+class DnsCacheStats:
+    requests: int
+    hits: int
+    negative_hits: int
+    coalesced: int
+    lookups: int
+    entries: int
+    avg_lookup_ms: float
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.requests:
+            return 0.0
+        return (self.hits + self.negative_hits + self.coalesced) / self.requests
+
+
+@dataclass
+class _Entry:
+    addresses: list[str] | None
+    error: socket.gaierror | None
+    expires_at: float
+
+
+class CachingResolver:
+    """In-process getaddrinfo cache shared by the HTTP and TLS probes.
+
+    getaddrinfo does not expose record TTLs, so answers are kept for
+    ``ttl_sec`` and NXDOMAIN answers for ``negative_ttl_sec``. Concurrent
+    lookups for the same host share a single executor call.
+    """
+
+    def __init__(
+        self,
+        ttl_sec: float = 300.0,
+        negative_ttl_sec: float = 30.0,
+        max_entries: int = 10_000,
+    ):
+        self._ttl = ttl_sec
+        self._negative_ttl = negative_ttl_sec
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._requests = 0
+        self._hits = 0
+        self._negative_hits = 0
+        self._coalesced = 0
+        self._lookups = 0
+        self._lookup_seconds = 0.0
+
+    async def resolve(self, host: str, port: int | None = None) -> list[str]:
+        self._requests += 1
+        key = host.lower()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            if entry.error is not None:
+                self._negative_hits += 1
+                raise socket.gaierror(*entry.error.args)
+            self._hits += 1
+            return list(entry.addresses)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._lookup(key, host, port))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self._coalesced += 1
+        return list(await asyncio.shield(task))
+
+    def stats(self) -> DnsCacheStats:
+        return DnsCacheStats(
+            requests=self._requests,
+            hits=self._hits,
+            negative_hits=self._negative_hits,
+            coalesced=self._coalesced,
+            lookups=self._lookups,
+            entries=len(self._entries),
+            avg_lookup_ms=(
+                self._lookup_seconds / self._lookups * 1000 if self._lookups else 0.0
+            ),
+        )
+
+    async def _lookup(self, key: str, host: str, port: int | None) -> list[str]:
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        self._lookups += 1
+        try:
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if e.errno in _NEGATIVE_ERRORS:
+                self._store(key, _Entry(None, e, time.monotonic() + self._negative_ttl))
+            raise
+        finally:
+            self._lookup_seconds += time.monotonic() - started
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._store(key, _Entry(addresses, None, time.monotonic() + self._ttl))
+        return addresses
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
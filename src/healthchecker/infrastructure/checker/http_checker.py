@@ -1,26 +1,404 @@
+import asyncio
+import importlib.util
 import logging
+import socket
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
 
+import httpcore
 import httpx
 
+from healthchecker.domain.models.url import (
+    DEFAULT_PROBE_MAX_BYTES,
+    BodyAssertion,
+    ProbeMode,
+)
+from healthchecker.infrastructure.checker.body_matcher import BodyMatcher
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+from healthchecker.infrastructure.checker.ssl_checker import (
+    SslInfo,
+    cert_expiration,
+    ssl_info_for,
+)
+
 logger = logging.getLogger(__name__)
 
+# Servers that reject HEAD are probed again with a GET that stops after
+# the response headers.
+_HEAD_UNSUPPORTED = {405, 501}
+
+
+@dataclass
+class HttpCheckResult:
+    http_status: int | None
+    ttfb_ms: float | None
+    error: str | None
+    dns_ms: float | None = None
+    connect_ms: float | None = None
+    tls_ms: float | None = None
+    total_ms: float | None = None
+    bytes_received: int | None = None
+    ssl_info: SslInfo | None = None
+
+
+class _PhaseTimer:
+    def __init__(self) -> None:
+        self.dns_ms: float | None = None
+        self.connect_ms: float | None = None
+        self.tls_ms: float | None = None
+        self._tls_started: float | None = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        setattr(self, phase, (getattr(self, phase) or 0.0) + seconds * 1000)
+
+    async def trace(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.start_tls.started":
+            self._tls_started = time.perf_counter()
+        elif event_name == "connection.start_tls.complete" and self._tls_started:
+            self.add("tls_ms", time.perf_counter() - self._tls_started)
+            self._tls_started = None
+
+
+_phase_timer: ContextVar[_PhaseTimer | None] = ContextVar("phase_timer", default=None)
+
+
+class _TimedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Resolves hosts itself so DNS and TCP connect can be timed separately."""
+
+    def __init__(
+        self, backend: httpcore.AsyncNetworkBackend, resolver: CachingResolver
+    ):
+        self._backend = backend
+        self._resolver = resolver
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options=None,
+    ) -> httpcore.AsyncNetworkStream:
+        timer = _phase_timer.get()
+        started = time.perf_counter()
+        addresses = await self._resolve(host, port, timeout)
+        resolved = time.perf_counter()
+        if timer:
+            timer.add("dns_ms", resolved - started)
+
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                stream = await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+                continue
+            if timer:
+                timer.add("connect_ms", time.perf_counter() - resolved)
+            return stream
+        raise last_error or httpcore.ConnectError(f"No addresses found for {host}")
+
+    async def connect_unix_socket(
+        self, path: str, timeout: float | None = None, socket_options=None
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int, timeout: float | None) -> list[str]:
+        try:
+            return await asyncio.wait_for(self._resolver.resolve(host, port), timeout)
+        except TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"DNS resolution timed out for {host}") from e
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+
+# httpcore errors and the httpx errors they surface as, most specific first.
+_ERROR_MAP: tuple[tuple[type[Exception], type[httpx.RequestError]], ...] = (
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+def _as_httpx_error(error: Exception, request: httpx.Request) -> Exception:
+    for core_error, httpx_error in _ERROR_MAP:
+        if isinstance(error, core_error):
+            return httpx_error(str(error), request=request)
+    return error
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream, request: httpx.Request):
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as e:
+            mapped = _as_httpx_error(e, self._request)
+            if mapped is e:
+                raise
+            raise mapped from e
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class _TimedTransport(httpx.AsyncBaseTransport):
+    """httpx transport over an httpcore pool that uses ``_TimedNetworkBackend``."""
+
+    def __init__(
+        self,
+        ssl_context,
+        limits: httpx.Limits,
+        http2: bool,
+        resolver: CachingResolver,
+    ):
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=ssl_context,
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_TimedNetworkBackend(httpcore.AnyIOBackend(), resolver),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except Exception as e:
+            mapped = _as_httpx_error(e, request)
+            if mapped is e:
+                raise
+            raise mapped from e
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream, request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def _peer_ssl_info(url: str, response: httpx.Response) -> SslInfo | None:
+    """Certificate of the connection that served ``response``.
+
+    Only used when the final response came from the requested origin, so a
+    redirect to another host never reports that host's certificate.
+    """
+    requested = httpx.URL(url)
+    final = response.url
+    if requested.scheme != "https" or final.scheme != "https":
+        return None
+    if (final.host, final.port) != (requested.host, requested.port):
+        return None
+    stream = response.extensions.get("network_stream")
+    ssl_object = stream.get_extra_info("ssl_object") if stream else None
+    if ssl_object is None:
+        return None
+    try:
+        exp_date = cert_expiration(ssl_object.getpeercert())
+    except ValueError:
+        return None
+    if exp_date is None:
+        return None
+    cipher = ssl_object.cipher()
+    return ssl_info_for(
+        exp_date,
+        tls_version=ssl_object.version(),
+        cipher=cipher[0] if cipher else None,
+    )
+
 
 class HttpHealthChecker:
-    def __init__(self, timeout: float = 10.0):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        resolver: CachingResolver | None = None,
+    ):
         self._timeout = timeout
+        self._resolver = resolver or CachingResolver()
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2 and self._http2_available()
+        self._ssl_context = httpx.create_ssl_context()
+        self._client: httpx.AsyncClient | None = None
 
-    async def check(self, url: str) -> tuple[int | None, float | None, str | None]:
+    async def check(
+        self,
+        url: str,
+        fresh_connection: bool = False,
+        probe_mode: ProbeMode = ProbeMode.HEAD,
+        max_bytes: int = DEFAULT_PROBE_MAX_BYTES,
+        body_assertion: BodyAssertion | None = None,
+    ) -> HttpCheckResult:
+        if body_assertion is not None and probe_mode is ProbeMode.HEAD:
+            probe_mode = ProbeMode.CAPPED
+        timer = _PhaseTimer()
+        token = _phase_timer.set(timer)
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url, follow_redirects=True)
-                ttfb = response.elapsed.total_seconds() * 1000
-                return response.status_code, ttfb, None
+            if fresh_connection:
+                async with self._build_client(
+                    httpx.Limits(max_connections=1, max_keepalive_connections=0)
+                ) as client:
+                    return await self._probe(
+                        client, url, timer, probe_mode, max_bytes, body_assertion
+                    )
+            return await self._probe(
+                self._shared_client(),
+                url,
+                timer,
+                probe_mode,
+                max_bytes,
+                body_assertion,
+            )
         except httpx.TimeoutException:
             logger.warning("Timeout checking %s", url)
-            return None, None, "Timeout"
+            return HttpCheckResult(None, None, "Timeout")
         except httpx.RequestError as e:
             logger.warning("Request error checking %s: %s", url, e)
-            return None, None, str(e)
+            return HttpCheckResult(None, None, str(e))
         except Exception as e:
             logger.error("Unexpected error checking %s: %s", url, e, exc_info=True)
-            return None, None, str(e)
+            return HttpCheckResult(None, None, str(e))
+        finally:
+            _phase_timer.reset(token)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _probe(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timer: _PhaseTimer,
+        probe_mode: ProbeMode,
+        max_bytes: int,
+        body_assertion: BodyAssertion | None = None,
+    ) -> HttpCheckResult:
+        method = "HEAD" if probe_mode is ProbeMode.HEAD else "GET"
+        started = time.perf_counter()
+        async with client.stream(
+            method, url, follow_redirects=True, extensions={"trace": timer.trace}
+        ) as response:
+            ttfb = time.perf_counter() - started
+            if method == "HEAD" and response.status_code in _HEAD_UNSUPPORTED:
+                # Release the connection first: a fresh-connection client
+                # has only one, and the GET would wait for it until timeout.
+                await response.aclose()
+                return await self._probe(
+                    client, url, timer, ProbeMode.HEADERS, max_bytes
+                )
+            ssl_info = _peer_ssl_info(url, response)
+            error = None
+            if body_assertion is not None:
+                error = await self._assert_body(response, body_assertion, max_bytes)
+            elif probe_mode is ProbeMode.CAPPED:
+                async for _ in response.aiter_raw():
+                    if response.num_bytes_downloaded >= max_bytes:
+                        break
+            total = time.perf_counter() - started
+            return HttpCheckResult(
+                http_status=response.status_code,
+                ttfb_ms=ttfb * 1000,
+                error=error,
+                dns_ms=timer.dns_ms,
+                connect_ms=timer.connect_ms,
+                tls_ms=timer.tls_ms,
+                total_ms=total * 1000,
+                bytes_received=response.num_bytes_downloaded,
+                ssl_info=ssl_info,
+            )
+
+    @staticmethod
+    async def _assert_body(
+        response: httpx.Response, assertion: BodyAssertion, max_bytes: int
+    ) -> str | None:
+        matcher = BodyMatcher(
+            assertion.pattern, assertion.is_regex, response.encoding or "utf-8"
+        )
+        scanned = 0
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            chunk = chunk[: max_bytes - scanned]
+            scanned += len(chunk)
+            if matcher.feed(chunk):
+                break
+            if scanned >= max_bytes:
+                truncated = True
+                break
+        else:
+            matcher.feed(b"", final=True)
+
+        if matcher.matched == assertion.must_match:
+            return None
+        scope = f" in the first {max_bytes} bytes" if truncated else ""
+        return f"Assertion failed: expected {assertion.describe()}{scope}"
+
+    def _shared_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client(self._limits)
+        return self._client
+
+    def _build_client(self, limits: httpx.Limits) -> httpx.AsyncClient:
+        transport = _TimedTransport(
+            self._ssl_context, limits, self._http2, self._resolver
+        )
+        return httpx.AsyncClient(timeout=self._timeout, transport=transport)
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            return False
+        return True
@@ -1,7 +1,12 @@
 import logging
 import ssl
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+from healthchecker.infrastructure.checker.tls_probe import TlsProbe
 
 logger = logging.getLogger(__name__)
 
@@ -10,36 +15,118 @@ logger = logging.getLogger(__name__)
 class SslInfo:
     expiration_date: datetime
     days_remaining: int
+    tls_version: str | None = None
+    cipher: str | None = None
+
+
+def cert_expiration(cert: dict | None) -> datetime | None:
+    if not cert:
+        return None
+
+    exp_str = cert.get("notAfter", "")
+    if not exp_str:
+        return None
+
+    return datetime.strptime(exp_str, "%b %d %H:%M:%S %Y %Z").replace(
+        tzinfo=timezone.utc
+    )
+
+
+def ssl_info_for(
+    expiration_date: datetime,
+    tls_version: str | None = None,
+    cipher: str | None = None,
+) -> SslInfo:
+    days_remaining = (expiration_date - datetime.now(timezone.utc)).days
+    return SslInfo(
+        expiration_date=expiration_date,
+        days_remaining=days_remaining,
+        tls_version=tls_version,
+        cipher=cipher,
+    )
+
+
+@dataclass
+class _CachedCert:
+    expiration_date: datetime
+    tls_version: str | None
+    cipher: str | None
+    fetched_at: float
+
+
+# Once a certificate is within a day of its alert threshold it is re-read
+# at least this often, so a renewal is noticed before the alert fires.
+_NEAR_THRESHOLD_REFRESH_SEC = 3600.0
 
 
 class SslChecker:
-    async def check(self, url: str) -> SslInfo | None:
-        try:
-            host = self._extract_host(url)
-            if not host:
-                return None
+    def __init__(
+        self,
+        resolver: CachingResolver | None = None,
+        refresh_interval_sec: float = 0.0,
+        timeout: float = 10.0,
+    ):
+        self._probe = TlsProbe(resolver, timeout)
+        self._refresh_interval = refresh_interval_sec
+        self._cache: dict[tuple[str, int], _CachedCert] = {}
+
+    async def check(
+        self, url: str, alert_before_days: int | None = None
+    ) -> SslInfo | None:
+        key = self._cache_key(url)
+        cached = self._cache.get(key) if key else None
+        if cached and not self._refresh_due(cached, alert_before_days):
+            return ssl_info_for(
+                cached.expiration_date, cached.tls_version, cached.cipher
+            )
+
+        info = await self._fetch(url)
+        if info is not None and key and self._refresh_interval > 0:
+            self._cache[key] = _CachedCert(
+                info.expiration_date, info.tls_version, info.cipher, time.monotonic()
+            )
+        return info
 
-            ctx = ssl.create_default_context()
-            reader, writer = await self._open_tls_connection(host, ctx)
+    def forget(self, url: str) -> None:
+        """Drops the cached certificate of ``url``'s host and port.
 
-            cert = writer.get_extra_info("ssl_object").getpeercert()
-            writer.close()
-            await writer.wait_closed()
+        Another URL on the same address simply reads it again.
+        """
+        key = self._cache_key(url)
+        if key:
+            self._cache.pop(key, None)
 
-            if not cert:
+    def _refresh_due(self, cached: _CachedCert, alert_before_days: int | None) -> bool:
+        interval = self._refresh_interval
+        if alert_before_days is not None:
+            days_remaining = ssl_info_for(cached.expiration_date).days_remaining
+            if days_remaining <= alert_before_days + 1:
+                interval = min(interval, _NEAR_THRESHOLD_REFRESH_SEC)
+        return time.monotonic() - cached.fetched_at >= interval
+
+    @staticmethod
+    def _cache_key(url: str) -> tuple[str, int] | None:
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return None
+        return parsed.hostname.lower(), parsed.port or 443
+
+    async def _fetch(self, url: str) -> SslInfo | None:
+        try:
+            key = self._cache_key(url)
+            if not key:
                 return None
 
-            exp_str = cert.get("notAfter", "")
-            if not exp_str:
+            handshake = await self._probe.handshake(*key)
+            exp_date = cert_expiration(handshake.peer_cert)
+            if exp_date is None:
                 return None
 
-            exp_date = datetime.strptime(exp_str, "%b %d %H:%M:%S %Y %Z").replace(
-                tzinfo=timezone.utc
+            return ssl_info_for(
+                exp_date,
+                tls_version=handshake.tls_version,
+                cipher=handshake.cipher,
             )
-            now = datetime.now(timezone.utc)
-            days_remaining = (exp_date - now).days
-
-            return SslInfo(expiration_date=exp_date, days_remaining=days_remaining)
 
         except ssl.SSLCertVerificationError as e:
             logger.warning("SSL certificate verification failed for %s: %s", url, e)
@@ -53,18 +140,3 @@ class SslChecker:
         except Exception as e:
             logger.error("SSL check error for %s: %s", url, e, exc_info=True)
             return None
-
-    @staticmethod
-    def _extract_host(url: str) -> str | None:
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        host = parsed.hostname
-        if host:
-            return host
-        return None
-
-    async def _open_tls_connection(self, host: str, ctx: ssl.SSLContext):
-        import asyncio
-
-        return await asyncio.open_connection(host, 443, ssl=ctx, server_hostname=host)
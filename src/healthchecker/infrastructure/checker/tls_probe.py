@@ -0,0 +1,166 @@
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass
+
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+
+_READ_SIZE = 65536
+# TLS 1.3 session tickets arrive after the handshake completes. The
+# connection is kept open this long for one, after the probe has returned,
+# so the next probe can resume the session.
+_TICKET_WAIT_SEC = 0.5
+
+
+@dataclass
+class TlsHandshake:
+    peer_cert: dict
+    tls_version: str | None
+    cipher: str | None
+    connect_ms: float
+    handshake_ms: float
+    session_reused: bool
+
+
+class TlsProbe:
+    """Opens short-lived TLS connections to inspect a server's certificate.
+
+    A single SSLContext is shared by every probe, and the last session seen
+    for each host and port is offered on the next handshake. The handshake
+    runs over memory BIOs, which is how the session is passed in.
+    """
+
+    def __init__(self, resolver: CachingResolver | None = None, timeout: float = 10.0):
+        self._resolver = resolver or CachingResolver()
+        self._timeout = timeout
+        self._context = ssl.create_default_context()
+        self._sessions: dict[tuple[str, int], ssl.SSLSession] = {}
+        self._ticket_reads: set[asyncio.Task] = set()
+
+    async def handshake(self, host: str, port: int = 443) -> TlsHandshake:
+        return await asyncio.wait_for(self._handshake(host, port), self._timeout)
+
+    async def wait_idle(self) -> None:
+        """Waits until connections kept open for a session ticket are closed."""
+        if self._ticket_reads:
+            await asyncio.gather(*self._ticket_reads)
+
+    async def _handshake(self, host: str, port: int) -> TlsHandshake:
+        key = (host.lower(), port)
+        started = time.perf_counter()
+        reader, writer = await self._open_connection(host, port)
+        connected = time.perf_counter()
+        incoming, outgoing = ssl.MemoryBIO(), ssl.MemoryBIO()
+        try:
+            ssl_object = self._context.wrap_bio(
+                incoming,
+                outgoing,
+                server_hostname=host,
+                session=self._sessions.get(key),
+            )
+            await self._do_handshake(ssl_object, incoming, outgoing, reader, writer)
+            handshake_done = time.perf_counter()
+            cipher = ssl_object.cipher()
+            result = TlsHandshake(
+                peer_cert=ssl_object.getpeercert(),
+                tls_version=ssl_object.version(),
+                cipher=cipher[0] if cipher else None,
+                connect_ms=(connected - started) * 1000,
+                handshake_ms=(handshake_done - connected) * 1000,
+                session_reused=ssl_object.session_reused,
+            )
+        except BaseException:
+            await self._close(writer)
+            raise
+
+        task = asyncio.create_task(
+            self._keep_session(key, ssl_object, incoming, reader, writer)
+        )
+        self._ticket_reads.add(task)
+        task.add_done_callback(self._ticket_reads.discard)
+        return result
+
+    @staticmethod
+    async def _do_handshake(
+        ssl_object: ssl.SSLObject,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        while True:
+            try:
+                ssl_object.do_handshake()
+                break
+            except ssl.SSLWantReadError:
+                await _send(outgoing, writer)
+                data = await reader.read(_READ_SIZE)
+                if data:
+                    incoming.write(data)
+                else:
+                    incoming.write_eof()
+        await _send(outgoing, writer)
+
+    async def _keep_session(
+        self,
+        key: tuple[str, int],
+        ssl_object: ssl.SSLObject,
+        incoming: ssl.MemoryBIO,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            if ssl_object.version() == "TLSv1.3":
+                await self._read_ticket(ssl_object, incoming, reader)
+        except OSError:
+            pass
+        finally:
+            if ssl_object.session is not None:
+                self._sessions[key] = ssl_object.session
+            await self._close(writer)
+
+    @staticmethod
+    async def _read_ticket(
+        ssl_object: ssl.SSLObject,
+        incoming: ssl.MemoryBIO,
+        reader: asyncio.StreamReader,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _TICKET_WAIT_SEC
+        while not (ssl_object.session and ssl_object.session.has_ticket):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            data = await asyncio.wait_for(reader.read(_READ_SIZE), remaining)
+            if not data:
+                return
+            incoming.write(data)
+            try:
+                # Processes the post-handshake messages, tickets included.
+                ssl_object.read(_READ_SIZE)
+            except ssl.SSLWantReadError:
+                pass
+
+    async def _open_connection(self, host: str, port: int):
+        last_error: OSError | None = None
+        for address in await self._resolver.resolve(host, port):
+            try:
+                return await asyncio.open_connection(address, port)
+            except OSError as e:
+                last_error = e
+        raise last_error or OSError(f"No addresses found for {host}")
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+
+async def _send(outgoing: ssl.MemoryBIO, writer: asyncio.StreamWriter) -> None:
+    data = outgoing.read()
+    if data:
+        writer.write(data)
+        await writer.drain()
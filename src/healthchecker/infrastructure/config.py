@@ -14,13 +14,73 @@ class Settings:
         self.db_password: str = os.getenv("DB_PASSWORD", "healthchecker")
         self.db_name: str = os.getenv("DB_NAME", "healthchecker")
         self.check_interval_sec: int = int(os.getenv("CHECK_INTERVAL_SEC", "60"))
+        self.check_max_concurrency: int = int(os.getenv("CHECK_MAX_CONCURRENCY", "50"))
+        self.check_per_host_concurrency: int = int(
+            os.getenv("CHECK_PER_HOST_CONCURRENCY", "4")
+        )
+        self.url_registry_reconcile_sec: float = float(
+            os.getenv("URL_REGISTRY_RECONCILE_SEC", "300")
+        )
+        self.scheduler_overrun_policy: str = os.getenv(
+            "SCHEDULER_OVERRUN_POLICY", "skip"
+        ).lower()
+        self.health_check_batch_size: int = int(
+            os.getenv("HEALTH_CHECK_BATCH_SIZE", "500")
+        )
+        self.health_check_flush_interval_sec: float = float(
+            os.getenv("HEALTH_CHECK_FLUSH_INTERVAL_SEC", "2")
+        )
+        self.health_check_max_pending: int = int(
+            os.getenv("HEALTH_CHECK_MAX_PENDING", "5000")
+        )
+        self.recent_checks_depth: int = int(os.getenv("RECENT_CHECKS_DEPTH", "50"))
         self.default_alert_days: int = int(os.getenv("DEFAULT_ALERT_DAYS", "7"))
         self.retention_days: int = int(os.getenv("RETENTION_DAYS", "7"))
+        self.daily_aggregate_flush_sec: float = float(
+            os.getenv("DAILY_AGGREGATE_FLUSH_SEC", "60")
+        )
+        self.consolidation_interval_sec: float = float(
+            os.getenv("CONSOLIDATION_INTERVAL_SEC", "3600")
+        )
+        self.consolidation_time_budget_sec: float = float(
+            os.getenv("CONSOLIDATION_TIME_BUDGET_SEC", "120")
+        )
+        self.rollup_interval_sec: float = float(os.getenv("ROLLUP_INTERVAL_SEC", "300"))
+        self.rollup_5m_retention_hours: float = float(
+            os.getenv("ROLLUP_5M_RETENTION_HOURS", "48")
+        )
+        self.rollup_1h_retention_days: float = float(
+            os.getenv("ROLLUP_1H_RETENTION_DAYS", "30")
+        )
+        self.purge_chunk_size: int = int(os.getenv("PURGE_CHUNK_SIZE", "5000"))
+        self.purge_pause_sec: float = float(os.getenv("PURGE_PAUSE_SEC", "0.1"))
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
+        self.http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+        self.http_max_keepalive_connections: int = int(
+            os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+        )
+        self.http_keepalive_expiry_sec: float = float(
+            os.getenv("HTTP_KEEPALIVE_EXPIRY_SEC", "30")
+        )
+        self.http2_enabled: bool = self._parse_bool(os.getenv("HTTP2_ENABLED", ""))
+        self.dns_cache_ttl_sec: float = float(os.getenv("DNS_CACHE_TTL_SEC", "300"))
+        self.dns_negative_ttl_sec: float = float(
+            os.getenv("DNS_NEGATIVE_TTL_SEC", "30")
+        )
+        self.dns_cache_max_entries: int = int(
+            os.getenv("DNS_CACHE_MAX_ENTRIES", "10000")
+        )
+        self.ssl_cache_refresh_sec: float = float(
+            os.getenv("SSL_CACHE_REFRESH_SEC", "21600")
+        )
         self.allowed_chat_ids: frozenset[int] = self._parse_chat_ids(
             os.getenv("ALLOWED_CHAT_IDS", "")
         )
 
+    @staticmethod
+    def _parse_bool(raw: str) -> bool:
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+
     @staticmethod
     def _parse_chat_ids(raw: str) -> frozenset[int]:
         if not raw or not raw.strip():
@@ -0,0 +1,168 @@
+import asyncio
+import contextlib
+import logging
+from datetime import date, datetime
+
+from tortoise.exceptions import IntegrityError
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.rollup import Resolution, Rollup
+from healthchecker.domain.repositories.health_check_repository import (
+    HealthCheckRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedHealthCheckRepository(HealthCheckRepository):
+    """Write-behind wrapper that saves health checks in multi-row inserts.
+
+    ``save`` only queues the check. The queue is written when it reaches
+    ``batch_size`` or every ``flush_interval_sec``, whichever comes first.
+    Once ``max_pending`` checks are waiting, ``save`` writes the queue itself
+    so a slow database slows the checks down instead of growing the buffer.
+    Reads flush first, so they always see every saved check. A batch the
+    database rejects (e.g. a check of a URL deleted meanwhile) is retried row
+    by row and the rows that still fail are dropped, so one bad row cannot
+    hold back the others.
+    """
+
+    def __init__(
+        self,
+        repo: HealthCheckRepository,
+        batch_size: int = 500,
+        flush_interval_sec: float = 2.0,
+        max_pending: int = 5000,
+    ):
+        self._repo = repo
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_sec
+        self._max_pending = max(max_pending, batch_size)
+        self._pending: list[HealthCheck] = []
+        self._flush_lock = asyncio.Lock()
+        self._batch_ready = asyncio.Event()
+        self._stopped = asyncio.Event()
+
+    async def start(self):
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_ready.wait(), self._flush_interval)
+            self._batch_ready.clear()
+            await self.flush()
+
+    async def aclose(self):
+        self._stopped.set()
+        self._batch_ready.set()
+        await self.flush()
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                await self._repo.save_many(batch)
+            except IntegrityError:
+                return await self._write_one_by_one(batch)
+            except Exception as e:
+                self._requeue(batch)
+                logger.error(
+                    "Failed to write %d health checks: %s", len(batch), e, exc_info=True
+                )
+                return 0
+            logger.debug("Wrote %d health checks", len(batch))
+            return len(batch)
+
+    def discard_url(self, url_id: int) -> None:
+        """Drops the queued checks of a deleted URL."""
+        self._pending = [c for c in self._pending if c.url_id != url_id]
+
+    async def save(self, check: HealthCheck) -> HealthCheck:
+        self._pending.append(check)
+        if len(self._pending) >= self._max_pending:
+            await self.flush()
+        elif len(self._pending) >= self._batch_size:
+            self._batch_ready.set()
+        return check
+
+    async def save_many(self, checks: list[HealthCheck]) -> None:
+        for check in checks:
+            await self.save(check)
+
+    async def get_by_url_id(self, url_id: int, limit: int = 10) -> list[HealthCheck]:
+        await self.flush()
+        return await self._repo.get_by_url_id(url_id, limit)
+
+    async def get_latest_by_url_id(self, url_id: int) -> HealthCheck | None:
+        await self.flush()
+        return await self._repo.get_latest_by_url_id(url_id)
+
+    async def get_latest_for_all(self) -> list[HealthCheck]:
+        await self.flush()
+        return await self._repo.get_latest_for_all()
+
+    async def get_latest_for_urls(self, url_ids: list[int]) -> list[HealthCheck]:
+        await self.flush()
+        return await self._repo.get_latest_for_urls(url_ids)
+
+    async def get_first_check_date(self) -> date | None:
+        await self.flush()
+        return await self._repo.get_first_check_date()
+
+    async def aggregate_day(self, day: date) -> list[DailySummary]:
+        await self.flush()
+        return await self._repo.aggregate_day(day)
+
+    async def aggregate_rollups(
+        self, resolution: Resolution, start: datetime, end: datetime
+    ) -> list[Rollup]:
+        await self.flush()
+        return await self._repo.aggregate_rollups(resolution, start, end)
+
+    async def get_raw_for_date(
+        self, url_id: int, target_date: date
+    ) -> list[HealthCheck]:
+        await self.flush()
+        return await self._repo.get_raw_for_date(url_id, target_date)
+
+    async def get_purge_id_range(self, cutoff_date: date) -> tuple[int, int] | None:
+        return await self._repo.get_purge_id_range(cutoff_date)
+
+    async def purge_older_than(
+        self,
+        cutoff_date: date,
+        start_id: int | None = None,
+        end_id: int | None = None,
+    ) -> int:
+        return await self._repo.purge_older_than(cutoff_date, start_id, end_id)
+
+    async def _write_one_by_one(self, batch: list[HealthCheck]) -> int:
+        written = 0
+        for i, check in enumerate(batch):
+            try:
+                await self._repo.save_many([check])
+            except IntegrityError as e:
+                logger.warning("Dropped health check of URL %d: %s", check.url_id, e)
+                continue
+            except Exception as e:
+                self._requeue(batch[i:])
+                logger.error(
+                    "Failed to write %d health checks: %s",
+                    len(batch) - i,
+                    e,
+                    exc_info=True,
+                )
+                break
+            written += 1
+        return written
+
+    def _requeue(self, batch: list[HealthCheck]) -> None:
+        # Keep the failed batch for the next flush, dropping the oldest
+        # checks once the buffer is full.
+        self._pending = batch + self._pending
+        overflow = len(self._pending) - self._max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            logger.warning("Health check buffer full, dropped %d checks", overflow)
@@ -1,54 +1,119 @@
 from datetime import date
 
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
 from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.latency_sketch import LatencySketch
 from healthchecker.domain.repositories.daily_summary_repository import (
     DailySummaryRepository as DailySummaryRepositoryInterface,
 )
-from healthchecker.infrastructure.persistence.tortoise_models import DailySummaryModel
+from healthchecker.infrastructure.persistence.tortoise_models import (
+    ConsolidationWatermarkModel,
+    DailySummaryModel,
+)
+
+_WATERMARK_ID = 1
+_UPSERT_FIELDS = (
+    "checks_count",
+    "avg_ttfb_ms",
+    "min_ttfb_ms",
+    "max_ttfb_ms",
+    "ttfb_count",
+    "min_ssl_days_remaining",
+    "healthy_count",
+    "unhealthy_count",
+    "last_http_status",
+    "last_ssl_expiration_date",
+    "last_checked_at",
+    "ttfb_sketch",
+)
 
 
 class TortoiseDailySummaryRepository(DailySummaryRepositoryInterface):
+    def __init__(self, connection_name: str | None = None):
+        self._connection_name = connection_name
+
     async def save(self, summary: DailySummary) -> DailySummary:
         existing = await self.get_by_url_id_and_date(
             summary.url_id, summary.summary_date
         )
         if existing:
-            await DailySummaryModel.filter(id=existing.id).update(
-                checks_count=summary.checks_count,
-                avg_ttfb_ms=summary.avg_ttfb_ms,
-                min_ttfb_ms=summary.min_ttfb_ms,
-                max_ttfb_ms=summary.max_ttfb_ms,
-                min_ssl_days_remaining=summary.min_ssl_days_remaining,
-                healthy_count=summary.healthy_count,
-                unhealthy_count=summary.unhealthy_count,
-                last_http_status=summary.last_http_status,
-                last_ssl_expiration_date=summary.last_ssl_expiration_date,
-                last_checked_at=summary.last_checked_at,
+            await (
+                DailySummaryModel.filter(id=existing.id)
+                .using_db(self._db())
+                .update(
+                    checks_count=summary.checks_count,
+                    avg_ttfb_ms=summary.avg_ttfb_ms,
+                    min_ttfb_ms=summary.min_ttfb_ms,
+                    max_ttfb_ms=summary.max_ttfb_ms,
+                    ttfb_count=summary.ttfb_count,
+                    min_ssl_days_remaining=summary.min_ssl_days_remaining,
+                    healthy_count=summary.healthy_count,
+                    unhealthy_count=summary.unhealthy_count,
+                    last_http_status=summary.last_http_status,
+                    last_ssl_expiration_date=summary.last_ssl_expiration_date,
+                    last_checked_at=summary.last_checked_at,
+                    ttfb_sketch=_sketch_bytes(summary),
+                )
             )
             summary.id = existing.id
             return summary
 
         row = await DailySummaryModel.create(
+            using_db=self._db(),
             url_id=summary.url_id,
             date=summary.summary_date,
             checks_count=summary.checks_count,
             avg_ttfb_ms=summary.avg_ttfb_ms,
             min_ttfb_ms=summary.min_ttfb_ms,
             max_ttfb_ms=summary.max_ttfb_ms,
+            ttfb_count=summary.ttfb_count,
             min_ssl_days_remaining=summary.min_ssl_days_remaining,
             healthy_count=summary.healthy_count,
             unhealthy_count=summary.unhealthy_count,
             last_http_status=summary.last_http_status,
             last_ssl_expiration_date=summary.last_ssl_expiration_date,
             last_checked_at=summary.last_checked_at,
+            ttfb_sketch=_sketch_bytes(summary),
         )
         summary.id = row.id
         return summary
 
+    async def save_many(self, summaries: list[DailySummary]) -> None:
+        """Upserts all summaries on the (url, date) unique key.
+
+        One ``INSERT ... ON DUPLICATE KEY UPDATE`` per batch, without reading
+        the existing rows first.
+        """
+        if not summaries:
+            return
+        await DailySummaryModel.bulk_create(
+            [
+                DailySummaryModel(
+                    url_id=s.url_id,
+                    date=s.summary_date,
+                    **{
+                        field: getattr(s, field)
+                        for field in _UPSERT_FIELDS
+                        if field != "ttfb_sketch"
+                    },
+                    ttfb_sketch=_sketch_bytes(s),
+                )
+                for s in summaries
+            ],
+            on_conflict=("url_id", "date"),
+            update_fields=_UPSERT_FIELDS,
+            batch_size=1000,
+            using_db=self._db(),
+        )
+
     async def get_by_url_id_and_date(
         self, url_id: int, summary_date: date
     ) -> DailySummary | None:
-        row = await DailySummaryModel.get_or_none(url_id=url_id, date=summary_date)
+        row = await DailySummaryModel.get_or_none(
+            url_id=url_id, date=summary_date, using_db=self._db()
+        )
         return self._to_domain(row) if row else None
 
     async def get_by_url_id(
@@ -56,14 +121,51 @@ class TortoiseDailySummaryRepository(DailySummaryRepositoryInterface):
     ) -> list[DailySummary]:
         rows = (
             await DailySummaryModel.filter(url_id=url_id)
+            .using_db(self._db())
             .order_by("-date")
             .limit(limit)
             .offset(offset)
         )
         return [self._to_domain(r) for r in rows]
 
+    async def get_range_for_url(
+        self, url_id: int, start: date, end: date
+    ) -> list[DailySummary]:
+        rows = (
+            await DailySummaryModel.filter(url_id=url_id, date__gte=start, date__lt=end)
+            .using_db(self._db())
+            .order_by("date")
+        )
+        return [self._to_domain(r) for r in rows]
+
     async def exists_for_date(self, url_id: int, summary_date: date) -> bool:
-        return await DailySummaryModel.filter(url_id=url_id, date=summary_date).exists()
+        return (
+            await DailySummaryModel.filter(url_id=url_id, date=summary_date)
+            .using_db(self._db())
+            .exists()
+        )
+
+    async def get_for_date(self, summary_date: date) -> list[DailySummary]:
+        rows = await DailySummaryModel.filter(date=summary_date).using_db(self._db())
+        return [self._to_domain(r) for r in rows]
+
+    async def get_consolidation_watermark(self) -> date | None:
+        row = await ConsolidationWatermarkModel.get_or_none(
+            id=_WATERMARK_ID, using_db=self._db()
+        )
+        return row.consolidated_through if row else None
+
+    async def set_consolidation_watermark(self, day: date) -> None:
+        await ConsolidationWatermarkModel.update_or_create(
+            id=_WATERMARK_ID,
+            defaults={"consolidated_through": day},
+            using_db=self._db(),
+        )
+
+    def _db(self) -> BaseDBAsyncClient | None:
+        if self._connection_name is None:
+            return None
+        return connections.get(self._connection_name)
 
     @staticmethod
     def _to_domain(row: DailySummaryModel) -> DailySummary:
@@ -82,4 +184,12 @@ class TortoiseDailySummaryRepository(DailySummaryRepositoryInterface):
             last_ssl_expiration_date=row.last_ssl_expiration_date,
             last_checked_at=row.last_checked_at,
             created_at=row.created_at,
+            ttfb_count=row.ttfb_count,
+            ttfb_sketch=(
+                LatencySketch.from_bytes(row.ttfb_sketch) if row.ttfb_sketch else None
+            ),
         )
+
+
+def _sketch_bytes(summary: DailySummary) -> bytes | None:
+    return summary.ttfb_sketch.to_bytes() if summary.ttfb_sketch else None
@@ -1,42 +1,50 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q, RawSQL, Subquery
+from tortoise.functions import Avg, Count, Max, Min
+
+from healthchecker.domain.models.daily_summary import DailySummary
 from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import (
+    LOG_GAMMA,
+    MIN_VALUE,
+    LatencySketch,
+)
+from healthchecker.domain.models.rollup import Resolution, Rollup
 from healthchecker.domain.repositories.health_check_repository import (
     HealthCheckRepository as HealthCheckRepositoryInterface,
 )
-from healthchecker.infrastructure.persistence.tortoise_models import (
-    HealthCheckModel,
-    DailySummaryModel,
+from healthchecker.infrastructure.persistence.tortoise_models import HealthCheckModel
+
+# LatencySketch bucket of a check's TTFB, NULL for the sketch's zero bucket.
+_SKETCH_BUCKET = RawSQL(
+    f"CASE WHEN ttfb_ms < {MIN_VALUE!r} THEN NULL "
+    f"ELSE CEIL(LN(ttfb_ms) / {LOG_GAMMA!r}) END"
 )
 
 
 class TortoiseHealthCheckRepository(HealthCheckRepositoryInterface):
+    def __init__(self, connection_name: str | None = None):
+        self._connection_name = connection_name
+
     async def save(self, check: HealthCheck) -> HealthCheck:
-        row = await HealthCheckModel.create(
-            url_id=check.url_id,
-            http_status=check.http_status,
-            ttfb_ms=check.ttfb_ms,
-            ssl_expiration_date=check.ssl_expiration_date,
-            ssl_days_remaining=check.ssl_days_remaining,
-            is_healthy=check.is_healthy,
-            error_message=check.error_message,
-            checked_at=check.checked_at,
-        )
-        return HealthCheck(
-            id=row.id,
-            url_id=row.url_id,
-            http_status=row.http_status,
-            ttfb_ms=float(row.ttfb_ms) if row.ttfb_ms is not None else None,
-            ssl_expiration_date=row.ssl_expiration_date,
-            ssl_days_remaining=row.ssl_days_remaining,
-            is_healthy=row.is_healthy,
-            error_message=row.error_message,
-            checked_at=row.checked_at,
+        row = self._to_model(check)
+        await row.save(using_db=self._db())
+        return self._to_domain(row)
+
+    async def save_many(self, checks: list[HealthCheck]) -> None:
+        if not checks:
+            return
+        await HealthCheckModel.bulk_create(
+            [self._to_model(c) for c in checks], using_db=self._db()
         )
 
     async def get_by_url_id(self, url_id: int, limit: int = 10) -> list[HealthCheck]:
         rows = (
             await HealthCheckModel.filter(url_id=url_id)
+            .using_db(self._db())
             .order_by("-checked_at")
             .limit(limit)
         )
@@ -44,41 +52,117 @@ class TortoiseHealthCheckRepository(HealthCheckRepositoryInterface):
 
     async def get_latest_by_url_id(self, url_id: int) -> HealthCheck | None:
         row = (
-            await HealthCheckModel.filter(url_id=url_id).order_by("-checked_at").first()
+            await HealthCheckModel.filter(url_id=url_id)
+            .using_db(self._db())
+            .order_by("-checked_at")
+            .first()
         )
         return self._to_domain(row) if row else None
 
-    async def get_dates_needing_consolidation(
-        self, cutoff_date: date
-    ) -> list[tuple[int, date]]:
-        end = datetime(
-            cutoff_date.year,
-            cutoff_date.month,
-            cutoff_date.day,
-            23,
-            59,
-            59,
-            tzinfo=timezone.utc,
+    async def get_latest_for_all(self) -> list[HealthCheck]:
+        # Checks are inserted as they happen, so the highest id per URL is
+        # its latest check.
+        latest_ids = (
+            HealthCheckModel.annotate(latest_id=Max("id"))
+            .group_by("url_id")
+            .values("latest_id")
         )
-        raw: set[tuple[int, date]] = set()
-        rows = await HealthCheckModel.filter(
-            checked_at__lte=end,
-        ).values("url_id", "checked_at")
-        for r in rows:
-            raw.add((r["url_id"], r["checked_at"].date() if r["checked_at"] else None))
+        rows = await HealthCheckModel.filter(id__in=Subquery(latest_ids)).using_db(
+            self._db()
+        )
+        return [self._to_domain(r) for r in rows]
 
-        existing: set[tuple[int, date]] = set()
-        existing_rows = await DailySummaryModel.filter(
-            date__lte=cutoff_date,
-        ).values("url_id", "date")
-        for r in existing_rows:
-            existing.add((r["url_id"], r["date"]))
+    async def get_latest_for_urls(self, url_ids: list[int]) -> list[HealthCheck]:
+        if not url_ids:
+            return []
+        latest_ids = (
+            HealthCheckModel.filter(url_id__in=url_ids)
+            .annotate(latest_id=Max("id"))
+            .group_by("url_id")
+            .values("latest_id")
+        )
+        rows = await HealthCheckModel.filter(id__in=Subquery(latest_ids)).using_db(
+            self._db()
+        )
+        return [self._to_domain(r) for r in rows]
 
-        pending = sorted(
-            [(uid, d) for uid, d in raw if d is not None and (uid, d) not in existing],
-            key=lambda x: x[1],
+    async def get_first_check_date(self) -> date | None:
+        first = (
+            await HealthCheckModel.all()
+            .using_db(self._db())
+            .order_by("checked_at")
+            .first()
+            .values_list("checked_at", flat=True)
         )
-        return pending
+        return first.date() if first else None
+
+    async def aggregate_day(self, day: date) -> list[DailySummary]:
+        start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        groups, sketches = await self._aggregate(start, start + timedelta(days=1))
+        # The highest id of each group is its latest check (see
+        # get_latest_for_all).
+        last_rows = {
+            row.id: row
+            for row in await HealthCheckModel.filter(
+                id__in=[g["last_id"] for g in groups]
+            ).using_db(self._db())
+        }
+        summaries = []
+        for group in groups:
+            last = last_rows[group["last_id"]]
+            summaries.append(
+                DailySummary(
+                    id=None,
+                    url_id=group["url_id"],
+                    summary_date=day,
+                    checks_count=group["checks_count"],
+                    avg_ttfb_ms=_as_float(group["avg_ttfb_ms"]),
+                    min_ttfb_ms=_as_float(group["min_ttfb_ms"]),
+                    max_ttfb_ms=_as_float(group["max_ttfb_ms"]),
+                    min_ssl_days_remaining=group["min_ssl_days_remaining"],
+                    healthy_count=group["healthy_count"],
+                    unhealthy_count=group["checks_count"] - group["healthy_count"],
+                    last_http_status=last.http_status,
+                    last_ssl_expiration_date=last.ssl_expiration_date,
+                    last_checked_at=last.checked_at,
+                    created_at=datetime.now(timezone.utc),
+                    ttfb_count=group["ttfb_count"],
+                    ttfb_sketch=sketches.get(group["url_id"]),
+                )
+            )
+        return summaries
+
+    async def aggregate_rollups(
+        self, resolution: Resolution, start: datetime, end: datetime
+    ) -> list[Rollup]:
+        """Rollups of the buckets between ``start`` and ``end``.
+
+        Each bucket is one GROUP BY url_id in the database, so only one row
+        per URL and bucket is read instead of every check.
+        """
+        rollups = []
+        bucket_start = start
+        while bucket_start < end:
+            groups, sketches = await self._aggregate(
+                bucket_start, bucket_start + resolution.delta
+            )
+            rollups.extend(
+                Rollup(
+                    url_id=group["url_id"],
+                    resolution=resolution,
+                    bucket_start=bucket_start,
+                    checks_count=group["checks_count"],
+                    healthy_count=group["healthy_count"],
+                    ttfb_count=group["ttfb_count"],
+                    avg_ttfb_ms=_as_float(group["avg_ttfb_ms"]),
+                    min_ttfb_ms=_as_float(group["min_ttfb_ms"]),
+                    max_ttfb_ms=_as_float(group["max_ttfb_ms"]),
+                    ttfb_sketch=sketches.get(group["url_id"]),
+                )
+                for group in groups
+            )
+            bucket_start += resolution.delta
+        return rollups
 
     async def get_raw_for_date(
         self, url_id: int, target_date: date
@@ -95,25 +179,132 @@ class TortoiseHealthCheckRepository(HealthCheckRepositoryInterface):
             59,
             tzinfo=timezone.utc,
         )
-        rows = await HealthCheckModel.filter(
-            url_id=url_id,
-            checked_at__gte=start,
-            checked_at__lte=end,
-        ).order_by("checked_at")
+        rows = (
+            await HealthCheckModel.filter(
+                url_id=url_id,
+                checked_at__gte=start,
+                checked_at__lte=end,
+            )
+            .using_db(self._db())
+            .order_by("checked_at")
+        )
         return [self._to_domain(r) for r in rows]
 
-    async def purge_older_than(self, cutoff_date: date) -> int:
-        end = datetime(
-            cutoff_date.year,
-            cutoff_date.month,
-            cutoff_date.day,
-            23,
-            59,
-            59,
-            tzinfo=timezone.utc,
+    async def get_purge_id_range(self, cutoff_date: date) -> tuple[int, int] | None:
+        """First and last id of the checks taken on or before ``cutoff_date``.
+
+        Ids grow with ``checked_at``, so the rows to purge form one primary
+        key range that can be deleted a slice at a time.
+        """
+        first = (
+            await HealthCheckModel.all()
+            .using_db(self._db())
+            .order_by("id")
+            .first()
+            .values_list("id", "checked_at")
+        )
+        if first is None or first[1] > self._end_of_day(cutoff_date):
+            return None
+        last_id = (
+            await HealthCheckModel.filter(checked_at__lte=self._end_of_day(cutoff_date))
+            .using_db(self._db())
+            .order_by("-checked_at")
+            .first()
+            .values_list("id", flat=True)
+        )
+        return first[0], last_id
+
+    async def purge_older_than(
+        self,
+        cutoff_date: date,
+        start_id: int | None = None,
+        end_id: int | None = None,
+    ) -> int:
+        query = HealthCheckModel.filter(checked_at__lte=self._end_of_day(cutoff_date))
+        if start_id is not None:
+            query = query.filter(id__gte=start_id)
+        if end_id is not None:
+            query = query.filter(id__lte=end_id)
+        return await query.using_db(self._db()).delete()
+
+    async def _aggregate(
+        self, start: datetime, end: datetime
+    ) -> tuple[list[dict], dict[int, LatencySketch]]:
+        """Per-URL aggregates and TTFB sketches of the checks in [start, end)."""
+        checks = HealthCheckModel.filter(
+            checked_at__gte=start, checked_at__lt=end
+        ).using_db(self._db())
+        groups = (
+            await checks.annotate(
+                checks_count=Count("id"),
+                healthy_count=Count("id", _filter=Q(is_healthy=True)),
+                ttfb_count=Count("ttfb_ms"),
+                avg_ttfb_ms=Avg("ttfb_ms"),
+                min_ttfb_ms=Min("ttfb_ms"),
+                max_ttfb_ms=Max("ttfb_ms"),
+                min_ssl_days_remaining=Min("ssl_days_remaining"),
+                last_id=Max("id"),
+            )
+            .group_by("url_id")
+            .values(
+                "url_id",
+                "checks_count",
+                "healthy_count",
+                "ttfb_count",
+                "avg_ttfb_ms",
+                "min_ttfb_ms",
+                "max_ttfb_ms",
+                "min_ssl_days_remaining",
+                "last_id",
+            )
+        )
+        # The database counts the TTFBs per sketch bucket, so only one row
+        # per bucket and URL comes back instead of every check.
+        bucket_counts: dict[int, list[tuple[int | None, int]]] = {}
+        for row in (
+            await checks.filter(ttfb_ms__isnull=False)
+            .annotate(bucket=_SKETCH_BUCKET, bucket_count=Count("id"))
+            .group_by("url_id", "bucket")
+            .values("url_id", "bucket", "bucket_count")
+        ):
+            bucket = None if row["bucket"] is None else int(row["bucket"])
+            bucket_counts.setdefault(row["url_id"], []).append(
+                (bucket, row["bucket_count"])
+            )
+        sketches = {
+            url_id: LatencySketch.from_counts(counts)
+            for url_id, counts in bucket_counts.items()
+        }
+        return groups, sketches
+
+    @staticmethod
+    def _end_of_day(day: date) -> datetime:
+        return datetime(day.year, day.month, day.day, 23, 59, 59, tzinfo=timezone.utc)
+
+    def _db(self) -> BaseDBAsyncClient | None:
+        if self._connection_name is None:
+            return None
+        return connections.get(self._connection_name)
+
+    @staticmethod
+    def _to_model(check: HealthCheck) -> HealthCheckModel:
+        return HealthCheckModel(
+            url_id=check.url_id,
+            http_status=check.http_status,
+            ttfb_ms=check.ttfb_ms,
+            ssl_expiration_date=check.ssl_expiration_date,
+            ssl_days_remaining=check.ssl_days_remaining,
+            is_healthy=check.is_healthy,
+            error_message=check.error_message,
+            checked_at=check.checked_at,
+            dns_ms=check.dns_ms,
+            connect_ms=check.connect_ms,
+            tls_ms=check.tls_ms,
+            total_ms=check.total_ms,
+            bytes_received=check.bytes_received,
+            tls_version=check.tls_version,
+            tls_cipher=check.tls_cipher,
         )
-        deleted = await HealthCheckModel.filter(checked_at__lte=end).delete()
-        return deleted
 
     @staticmethod
     def _to_domain(row: HealthCheckModel) -> HealthCheck:
@@ -121,10 +312,21 @@ class TortoiseHealthCheckRepository(HealthCheckRepositoryInterface):
             id=row.id,
             url_id=row.url_id,
             http_status=row.http_status,
-            ttfb_ms=float(row.ttfb_ms) if row.ttfb_ms is not None else None,
+            ttfb_ms=_as_float(row.ttfb_ms),
             ssl_expiration_date=row.ssl_expiration_date,
             ssl_days_remaining=row.ssl_days_remaining,
             is_healthy=row.is_healthy,
             error_message=row.error_message,
             checked_at=row.checked_at,
+            dns_ms=_as_float(row.dns_ms),
+            connect_ms=_as_float(row.connect_ms),
+            tls_ms=_as_float(row.tls_ms),
+            total_ms=_as_float(row.total_ms),
+            bytes_received=row.bytes_received,
+            tls_version=row.tls_version,
+            tls_cipher=row.tls_cipher,
         )
+
+
+def _as_float(value) -> float | None:
+    return float(value) if value is not None else None
@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `daily_health_summaries` ADD `ttfb_sketch` LONGBLOB;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `daily_health_summaries` DROP COLUMN `ttfb_sketch`;"""
+
+
+MODELS_STATE = (
+    "eJztnW1z2jgQgP+Kx596M7lOIEBy9w0Ibbkm0CH0NdPRCFuAJ8amkpyE6eW/nyRs/CY7Ni"
+    "UUfPqUIGmx/FjeXe1K4qe+cE1kk9dtG2F6zf/X/9Z+6g5cIPaPpPZE0+FyGdbxAgontmgO"
+    "eTtRBCeEYmhQVjqFNkGsyETEwNaSWq7DSh3Ptnmha7CGljMLizzH+uEhQN0ZonOEWcXtd1"
+    "ZsOSZ6RIR/vNUtAghyKL+SgRGkyASQ6t95u+UdmFrINmP3YZm8qSgHdLUUZX2HvhENeTcm"
+    "wHBtb+GEjZcrOnedTWtrfbUZchDm12NlFHv8vni3fQDBra5vIWyy7ntExkRT6Nk0wmECwj"
+    "IdgMFwDG56YwD0EuQM1+HUWVeJuPsZ78Kf9VrjvHFx1mpcsCaim5uS86f1pUMwa0GBZzDW"
+    "n0Q9pHDdQsAPoYqnvQaUgtudQyynG5dKUGbdT1IOmOZhDgpCzuGg2wfoBXwENnJmdM7pnu"
+    "ZQ/dQedd+1R6/qp3/wC7rsHVm/OgO/pi6qOPjIW4gIgTMJ5TF6zBjDEZFKIM5BOu59GfNv"
+    "XhDyw46ifHXd/iIoL1Z+zdVw8DZoHkHfvRp2EsgjCiaOvOO6NoJOhuYIpRLUJ0zspbBvSv"
+    "bLvTMcXsW4d/pJsB+vO73Rq5p4CKyRRVFUs4S0Izo8BfyS1VBrgeTE45IJ6KYv+jr45wgH"
+    "vs5u0Bw69so3HnkvQv+6dzNuX3+IPZXL9rjHa+qxNyEofdVK6KHNl2if++N3Gv+ofRsOeg"
+    "KvS+gMiyuG7cbfdN4n6FEXOO4DgGbEzgWlAbXYU/ewDUoZ5lDgeeN8DI92B/aZezzTO6l5"
+    "ZrTSbN+4GFkz5z1aCcR91iHoGDI74bt+H7G9cfyOjO9TMH6C0nBcYviw8RIjw4rdPrtVtF"
+    "ZT3fZNt33Z0wXjCTTuHiA2QQw2r3HrbqJk0zZdtagvkiXQYXba9G+Cd9kH32Xddm2LqS52"
+    "258ZdbyA+C7TRc9rnuuzG1FB8BBIFnLi9RvG30Yadh+0uWub7JPGfHbNhoRqJlxpD3OXII"
+    "14C/aVFiIaxEgz3MWSM36tJ57ir3/b81MHNUPY5wwhHFvMRNM5dr3ZXG7hM6x7hnyenT9e"
+    "RSVjzO10wlnyluaWzlJcUjlLh+IsBYwi3pLofcq4/x5LdAkte3UjtO4q0/6kG+VaHZM3B3"
+    "MEbToHG42++8jRbeAGCdXwXVmD32gNAu1cVPsH7f/X2t6YI+OOMCqeLBqROSaTYmrCJAk7"
+    "wPsZoHQ6AQsimSnZLsyAm5BLsJ1ywQJ0/Vf7UODmDcvhx85VT/sw6nX7N/3hIG4cRWU8wj"
+    "Pqta+SMUzL2Yp1Qk6xLsIaPm7HOi6nWBdgLXiV1c5xof3p5tMjUcyCD7lD1JBMFzuWw3zM"
+    "HLChYDIIv6JrH7MyI7jDMxcnkQnMp/ao0x+0R1/lyY+gfXRy0vk67rUl2poQG5hwRQBGC9"
+    "YX3sPiIzz7C7Ya7Qf2RHY93tfzoFVpPZKSU26ehK7nbMtXIqkISwjzCC2YU7oEhELqSbyO"
+    "TMQyUaUiMhBzjYoelxZeB+uzJ9TZMcC879lBRPDAnsLxBgDT6VLx5MS8fqvgr0RcPe9Dft"
+    "5qUUS2cj3OOL9aFKEWRfxuvse9KOKdcMe73IplZqJSbU7yElF+CmodL999/im1cjnkGrHF"
+    "rNVt7LNKTO0zMbXdzEVNWorF8UoGoVUAulwAegdzQjUdPCw/sdD04JfCsyo0W1SFWcRfpb"
+    "KSZCKe2QsQEVTbAUpsB0AYuxhsseslJbjV3pcDG9H73vqyfYhp59GlA508VcJ+mA4p65qF"
+    "IsozK+CZsas5yKBlKcfFFOkiizDs0mM5FFGEixB2KbRLM44IKcoFKIsFKswnN5B1jySRno"
+    "41y3Tp07IVcuf/qtfPzs7rp2eti2bj/Lx5cbrx69NVeQ5+p/+W+5sxqyuJWzDlcI8w4Z1N"
+    "PYTsre0JsSo4n/Gt7bVWga3ttaRXE25t51Vp0oa15NHSkqBDqepxbjUKcG41MjnzqsQaGJ"
+    "VW0lVaSaWV5GmlDXhJOin6ULLTSOy+Xj57pLJC+8wKib8ljFLQvhLnrSSOtGk2i5xp02xm"
+    "H2rD61ImqQxev3kV6Z42LgodGdS4yDk0iFcmtjeJk5YmaMrskIj2l1ASUtn9eQJnx7JTwS"
+    "KAaXs24yqfHQjl9pgcCBT00eYGphiROfBjZNL5WS53mbjKzZTgv8TuBAHuAZVR3nGp/elw"
+    "vrwn6M1Lz42LHPtWyz72rZY69s2Hxi6y2bhUUHtLJPenu1vN5lnrSNT3xDVXYAkpRbhUpC"
+    "cpV70QRLNWLzCeWavMAS3qJLgtHqWcoceSmjslq9R2CbUt6C08QplWkO+qfJZ9XFr5LCWO"
+    "N+R5ccCuifA9tAFBRgldLheuUGx/Z8pcbZjIRl3hDRPqOKyKPXXJ8pWyx2ElgiAS37njy7"
+    "15P0I2zJgKSo8/P7JBkBWZjy8GEsdxxc7h2h6X9CiwKlJL7R3Znpls00pVkL1k5qaNsGXM"
+    "ddlvFqxrTnJ/ryBso/I2x+X2Zedttli48auLNg7tVdxD9oa/VCUI+80rSLd2Wizwlxf5S4"
+    "X+2BWp9OcH/rkZDjKXjVL5bw+YlkG1fzXbIse4ciMHLocR81dTy9+TK90Tjij/go5sZcc+"
+    "lyE8/QdYGzAG"
+)
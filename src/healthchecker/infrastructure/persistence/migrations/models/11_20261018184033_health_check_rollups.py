@@ -0,0 +1,89 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `health_check_rollups_5m` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `bucket_start` DATETIME(6) NOT NULL,
+    `checks_count` INT NOT NULL,
+    `healthy_count` INT NOT NULL,
+    `ttfb_count` INT NOT NULL,
+    `avg_ttfb_ms` DOUBLE,
+    `min_ttfb_ms` DOUBLE,
+    `max_ttfb_ms` DOUBLE,
+    `ttfb_sketch` LONGBLOB,
+    `url_id` INT NOT NULL,
+    UNIQUE KEY `uid_health_chec_url_id_af7b93` (`url_id`, `bucket_start`),
+    CONSTRAINT `fk_health_c_urls_77b57e8f` FOREIGN KEY (`url_id`) REFERENCES `urls` (`id`) ON DELETE CASCADE,
+    KEY `idx_health_chec_bucket__119980` (`bucket_start`)
+) CHARACTER SET utf8mb4;
+        CREATE TABLE IF NOT EXISTS `health_check_rollups_1h` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `bucket_start` DATETIME(6) NOT NULL,
+    `checks_count` INT NOT NULL,
+    `healthy_count` INT NOT NULL,
+    `ttfb_count` INT NOT NULL,
+    `avg_ttfb_ms` DOUBLE,
+    `min_ttfb_ms` DOUBLE,
+    `max_ttfb_ms` DOUBLE,
+    `ttfb_sketch` LONGBLOB,
+    `url_id` INT NOT NULL,
+    UNIQUE KEY `uid_health_chec_url_id_24ca08` (`url_id`, `bucket_start`),
+    CONSTRAINT `fk_health_c_urls_1a78b943` FOREIGN KEY (`url_id`) REFERENCES `urls` (`id`) ON DELETE CASCADE,
+    KEY `idx_health_chec_bucket__87a3c9` (`bucket_start`)
+) CHARACTER SET utf8mb4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `health_check_rollups_5m`;
+        DROP TABLE IF EXISTS `health_check_rollups_1h`;"""
+
+
+MODELS_STATE = (
+    "eJztnW1z2jgQgP+Kh0+9mVwnkEBy9w0Iabkm0CH0NdPRCFuAJ37hLDkJ08t/P0nY+E12bE"
+    "oc7OpTgrRry4/FarW72D8bpq0hA7/tGsgh1+z/xt/Kz4YFTUT/EfQeKQ24WgV9rIHAmcHF"
+    "IZPjTXCGiQNVQlvn0MCINmkIq46+Irpt0VbLNQzWaKtUULcWQZNr6f+6CBB7gcgSObTj9g"
+    "dt1i0NPSLMPt42dAwwsgg7k+ogSJAGIGn8YHKrOzDXkaFFrkPXmChvB2S94m1Di1xyQTaM"
+    "GVBtwzWtQHi1Jkvb2krrm7MtkIUcdj7aRhyXXRcbtgfAv9TNJQQim7GHdDQ0h65BQhxmIG"
+    "hrADAaT8HNYApAowA51bYYdTpUzK9+wYbwZ6t5enZ6ftI5PacifJjblrOnzakDMBtFjmc0"
+    "bTzxfkjgRoLDD6Dyu70BlIDbX0JHTDeqFaNMhx+n7DPNwuw3BJyDSVcGaBM+AgNZC7JkdI"
+    "8zqH7uTvrvu5M3reM/2Alt+h3ZfHVGXk+LdzHwoW8hwhguBJSn6DFlDodUaoE4A+l08HXK"
+    "jmxi/K8RRvnmuvuVUzbXXs/VePTOFw+h71+NezHkIQMTRd6zbQNBK8VyBFox6jOq9lLYty"
+    "3lcu+Nx1cR7r1hHOyn695g8qbJbwIV0gkKW5aAdsiGJ4Bf0B6im0hMPKoZg655qm/9fyo4"
+    "8Rv0ArWxZay9xSPrizC8HtxMu9cfI3flojsdsJ5W5Jvgt77pxOzQ9iDKl+H0vcI+Kt/How"
+    "HHa2OycPgZA7np9wYbE3SJDSz7AUAttM75rT61yF13HQMUWpgDhecX5yrc2j2sz8zjmd8J"
+    "l2dKK8n20naQvrA+oDVHPKQDgpYqWic81++TY2wdv4rxffLnj98azEsHPmy9xNC0opdPLx"
+    "VtzFS/e9PvXgwanPEMqncP0NFABDbrsVt2rGUrm+wyW2a8BVp0nda8i2BD9sD36bBtQ6em"
+    "i172F0rdMaFzl+qiZ4ln+uxqWBE8+Jq5nPjGDeVvIMWxH5SlbWj0k0J9dsWAmCgaXCsPSx"
+    "sjBbsmPaSOsAIdpKi2uWKM3zZid/HXj/b81kHuEMrcIQRziy7RZOnY7mIpXuFTVvcU/ax1"
+    "vrqGSsSYrdMxZ8ldaTs6S1FN6SwdirPkMwp5S3z0icX9dVaiC6gb6xtuddep609SKHPV0Z"
+    "g4WCJokCXYWvT9R45ufTeIm4YfcjV4xdXAt855rb8v/1tbe3WJ1DtMqbiiaETqnIyryQ2T"
+    "IOwA7xeAkPkMmFiwUzJsmAI3phdjO2eKOeh6X+1DgZs1LcefelcD5eNk0B/eDMej6OLIO6"
+    "MRnsmgexWPYerWTqxjepJ1HtbwcTfWUT3JOgdrzquodY4qlWebjytimDkffIeIKtgu9nSL"
+    "+pgZYAPFeBB+TTY+Zm1mcI9lLo5CG5jP3UlvOOpOvomTH758eHPS+zYddAXWGmMDaHCNgY"
+    "NMOhY2wvwzPP0AO832A7sj+57vm33QurAdSehJN09A17V25SvQlIQFhFmEFiwJWQFMIHEF"
+    "XkcqYpGqNBEpiJlFRY8r3dkE69M31OkxwKzj7CEieGB3oboBwGS6lN85vq/fKfgrUJf3+5"
+    "DvtyyKSDeu1Yzzy6IIWRTx2nyrXRRxqd+ja91yCZrYhuGuUtNRYsGjrJSUl4ziSyRwuBYG"
+    "bfMFc1Izly7GhDm+Dknkpm4F3TJXVVauKsK+4PIb163hAlyRBTefnyUzbDKwVUm6Mvcgk8"
+    "KvZudlUrhirGVSuNyksMxfvl7+UkZRZBRFRlHSoijvuXfdZxuY1ABKQuYob+ykjN9/B1xD"
+    "GQ0qdRv5LEMmZYZMdsv/ytRvvm1eQa9NemzFPLY9ZNZlUr2Cwb9fKnKTBW55TZiOvd/6rA"
+    "X7oWeeqBBSlA9VKPBQBeQ4tgN2eHZIQnGnJ4gc2Iwu+wEiuxfq7L1G50A3T7VYPzQLF3XN"
+    "AhXpmeXwzOjZLKSSopSjapJ0nqilUXguByqScB7CNoFGYcYhJUk5B2UeJqc+uYr0eySI9P"
+    "T0RapLn9StkTv/V6t1cnLWOj7pnLdPz87a58dbvz7ZleXg94bvmL8ZWXUFcQtqHO6Rg9lg"
+    "Ezch/QGBMbU6OJ/RBwQ2OxlofdezGfdqggcEsq4kaVVfsWhpQdCBVv04d05zcO6cpnJmXT"
+    "KtJNNKMq2UM61k03GtnynMTQodFS7KbS73n2KSRbmHYR6OMjJMsij3t4mryKJcWZRbTbqy"
+    "KFcW5b6anZdFuRVjLYtyZVHuocGWRbmHuyjK6Eldoydb8IKgSfimpMdK6HW9fO2tjHiUGf"
+    "HgfxNY00P6vnwt3vkTe61Su50jnE+l0l+sxPoSS1IRvJ54Heken57nwUvFMl5cxTpjGzf+"
+    "tq8ZmtN1iNdKFjASQt3yPIGTqmyOdQyotdfvBZbiudrKQK/E0krfQFe2snJOndwl8CqMhN"
+    "ntTO4idVnZWoD/yrFnCDAPqIjxjmqVZ8NZ3NQfzUtXFuR59WAz/dWDzcSrBz1o9CTbfW5O"
+    "6y3QLM92d9rtk05FzPfM1tZgBQlBTqE6mbhe/Qo42s1WjvlMpVInNO8T4NZZjdcCPRa03A"
+    "ldabYLmG1Oz3QxoVZBHIR7ln1UW/osBV6xySso6DmRcw8NgJFawJaLlWtUGbk3Yy4f2pmO"
+    "usYP7ZSvZKvZXRcUqRR9JVssCCLwnXue3uWHCTJgylbQCwF32THqFpmP/pSKvxIu8i643X"
+    "EJX0dXR2qJJ2/szkz0yI+6IHvJzE0XObq6bAjyNl7PUVbWBgYyMm9TLbcvPW+zw89efvUn"
+    "L4f2VSwhe8O+VAUIe+I1pNs8zhf4y4r8JUJ/9IwEiaoY/7kZj1L2MIFK3JXVVaL8pxg6rm"
+    "LlRgZcBiPiryYeHhB/TkDMEWUH6IkqO8osQ3j6H++yQEQ="
+)
@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `url_status` (
+    `http_status` INT,
+    `ttfb_ms` DOUBLE,
+    `ssl_expiration_date` DATETIME(6),
+    `ssl_days_remaining` INT,
+    `is_healthy` BOOL NOT NULL,
+    `error_message` LONGTEXT,
+    `consecutive_failures` INT NOT NULL,
+    `last_checked_at` DATETIME(6) NOT NULL,
+    `state_changed_at` DATETIME(6) NOT NULL,
+    `url_id` INT NOT NULL PRIMARY KEY,
+    CONSTRAINT `fk_url_stat_urls_8a02b8a2` FOREIGN KEY (`url_id`) REFERENCES `urls` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4 COMMENT='Current state of each URL, upserted after every check.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `url_status`;"""
+
+
+MODELS_STATE = (
+    "eJztXVtz2jgU/isenrozbCeQ6+4bUNqyTUKH0GumoxG2AE+MzUpyEqbb/76SsPFNNjZJDH"
+    "b10gbpHFv+JJ+7pZ+NhWMgi7zuWAjTK/5342/tZ8OGC8T+kPQ2tQZcLoM+3kDhxBLkkNOJ"
+    "JjghFEOdstYptAhiTQYiOjaX1HRs1mq7lsUbHZ0RmvYsaHJt818XAerMEJ0jzDpuf7Bm0z"
+    "bQIyL8523DJIAgm/I76RhBigwAaeMHp1vegamJLCPyHKbBSUU7oKulaBvY9K0g5MOYAN2x"
+    "3IUdEC9XdO7YG2pzfbcZshHm92NtFLv8ufiwPQD8R10/QkCyHnuIx0BT6Fo0hMMEBG0NAK"
+    "6HY3DTHwPQKICc7tgcdTZUIp5+xofwZ7t1cn5ycXx2csFIxDA3Lee/1rcOgFkzCniux41f"
+    "oh9SuKYQ4AegitleA5QAtzeHWI5ulCuGMht+HGUf0yyY/YYA52DRlQH0Aj4CC9kzOufoHm"
+    "Wg+rkz6r3vjF61j/7gN3TYO7J+da69nrbo4sCH3kJECJxJUB6jx5Q1HGKpBcQZkI77X8f8"
+    "ygtC/rXCUL666nwVKC9WXs/l8PqdTx6Cvnc57MYgDwmYKORdx7EQtFMkR8AVQ33C2F4K9k"
+    "1Lubh3h8PLCO7dQRzYT1fd/uhVS0wCIzIpCkuWAO2QDE8A/ob1UHOB5IhHOWOgGx7ra/+P"
+    "Ci78BntAY2hbK095ZL0Ig6v+zbhz9TEyK2864z7vaUfeBL/11VlMDm0uon0ZjN9r/Kf2fX"
+    "jdF/A6hM6wuGNAN/7e4GOCLnWA7TwAaIT0nN/qoxaZdRdboJBiDhi2K+cqTO0z6Gdu8Uzv"
+    "pOqZoZXE9q2DkTmzP6CVgHjABgRtXaYnPNPvE7Y2hl/F8P3lrx+/NViXGD5srMTQsmKPzx"
+    "4VrcVUr3PT67zpNwTGE6jfPUBsgAjYvMdpO7GWDW2ya9FexFugzfS04T0EH7IHfI8N27FM"
+    "JrrYY39hqOMFxHepJnoWeabNrocZwYPPmcuIb9ww/C2kYedBmzuWwX5pzGbXLEioZsCV9j"
+    "B3CNKIu2CXNBHRIEaa7iyWHOPXjdgsPv1q210H5SGU6SEEa4upaDrHjjubyzV8inZP4c/S"
+    "89UVVDKMuZ6OGUvu0tjRWIpyKmPpUIwlH6OQtSRGn1Du+9FEb6BprW6E1F2l6p8kUabWMT"
+    "g5mCNo0TnYSPTnjxzd+maQEA0/lDbYozbwpXNe6e/T/9bSXp8j/Y4wVFxZNCJ1TcbZlMMk"
+    "CTvA+xmgdDoBCyLxlCwHpoAb44thO+WMOdD1Xu1DATdrWQ4/dS/72sdRvze4GQyvo8pRdE"
+    "YjPKN+5zIewzTtnbCO8Sms82ANH3fDOsqnsM6BtcCrqHSOMpUnm48qIpgFPuQOUV3iLnZN"
+    "m9mYGcAGjPEg/IqubczarOAuz1w0Qw7M586oO7jujL7Jkx8+fdg56X4b9zsSaU2IBQy4Ig"
+    "CjBRsLH2H+FZ5+gZ1W+4HNyHOv97UftCosRxJ8ysyToOvau+Ir4VQISxDmEVowp3QJCIXU"
+    "lVgdqRDLWJWISIGYS1T0uDTxOlif7lCnxwCzrvMMEcEDm4XqBgCT6VIxc8Kv3yn4K2FX83"
+    "3I862KItKFazXj/KooQhVF7BvfahdFvDXv0ZVpuxSNHMtyl6npKDlhMysl5SWjhIoEWHAR"
+    "cLp4wZzUxGXKmHLDF9NEbupW0q1yVWXlqiLYF1S/cd4aKuCKKNx8dpbKsKnAViXRVbkHlR"
+    "Tem5xXSeGKYa2SwuUmhVX+cn/5SxVFUVEUFUVJi6K8F9Z1jzswqQGUBE0zb+ykjO+/A1xD"
+    "GQ1GdRv5rUImZYZMdsv/qtRvPjevoNWmLLZiFtszZNZVUr2Cwb8nFbmpAre8Iswk3rc+K4"
+    "k/tGVHhRCj2lShwKYKCGMHgx32Dkkw7rSDyIGt6LI3ENm9UOfZa3QO1Hmqhf4wbFLUNAtY"
+    "lGWWwzJjd7ORTouiHGVTSOeJWlqF13LAohDOg7BDoVUY4xCTQjkHyiJMzmxyHZn3SBLp6Z"
+    "qzVJM+yVsjc/6vdvv4+Lx9dHx2cXpyfn56cbSx65NdWQZ+d/CO25sRrSuJWzDhcI8w4YNN"
+    "TEL6BoExtjoYn9ENAltnGdD6pmcrbtUEGwTyriTSurnk0dKCQAdc9cP57CQHzmcnqTjzLp"
+    "VWUmkllVbKmVZy2LhWWwpzk0TNwkW5rfnzp5hUUe5hiIdmRoZJFeX+NnEVVZSrinKria4q"
+    "ylVFuXuT86oot2JYq6JcVZR7aGCrotzDVYoqelLX6MkGeEnQJDwp6bES9lwvX3urIh5lRj"
+    "zE/wlY00P6Pn0tzvyJHat0epojnM+o0g9W4n0JlVQEXo+8jugenVzkgZeRZRxcxTtjjps4"
+    "7WuCpkwPiVrJAkJCylueJXBcFefYJIBJe/NeIim21VYGfCWWVvoCurKVlVNm5M6BV2EkzW"
+    "5n4i5jV5WtBfBfYmeCALeAigjvKFd5MpzHTf3RvHRlQZ6jB1vpRw+2EkcPeqCxm2z83JzS"
+    "W8JZnuw+Oz09PquI+J44xgosIaUIF6qTifPVr4DjtNXOsZ4ZVeqCFn0SuE1e4zVDjwUld4"
+    "JXie0CYlugt3AJZVJBHoTbin2UW9ksBY7YFBUU7J4I30MLEKQXkOVy5hpVRj6bMFebdqZD"
+    "XeNNO9WRbDWbdUmRStEj2WJBEInt3PX43n4YIQumuIJeCLjDr1G3yHz0UypxJFzkLLjd4Z"
+    "IeR1dH1BI7b+yOmWzLj7pA9sKZmxuxgUVW/iZM0dySxQnth7H9CN6eizGyqcZ5kOZMNQT1"
+    "ufZpdNnU3CVhQgMZGpwyy01D9wivNLFSkmfv7n6ZJ+SM9p4RrnXySG3IojZkqWy1jtqQ5f"
+    "cs/FYbspSVM6zYhix7qoVT+7GUL7NeZD8WdnukuzzdDabMOXRxoWxWGrsq1ZceVHZox1RV"
+    "SOJUT2Nzj5FNGbRnO824jF9N+cFNeYHIZzLYsqXibmijscP+KaFGea8e/4tUKD8pdtVB2N"
+    "TnDUnMyutpZsWqYECjao6r5Qqkh4122LLlqdu1HJqsLqHymL9UBRD2yGuIbusoX9FaVtVa"
+    "omyN3ZEi2Re4/9wMr1MtfJ8lbn2YOtX+0yyTVPGrowxwORjZjlbcp4rZEvwCXdlXSWV+Qv"
+    "Prf499Rj0="
+)
@@ -0,0 +1,46 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` ADD `fresh_connection` BOOL NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` DROP COLUMN `fresh_connection`;"""
+
+
+MODELS_STATE = (
+    "eJztnG9v2jgYwL8Kyque1Jta1m7VvQNKr9xamIBu06bJMomBqInDYqct2vrdz3YSkhg7hR"
+    "xlwPlV6ePnSZyfHT9/Euen5QcO8sibhodCest/W3/VfloY+oj9ULQe1yw4m2VtXEDhyBPq"
+    "kOsJERwRGkKbMukYegQxkYOIHboz6gaYSXHkeVwY2EzRxZNMFGH3R4QADSaITlHIGr59Z2"
+    "IXO+gJkfTf2T0Yu8hzCt11HX5uIQd0PhOyDqZXQpGfbQTswIt8nCnP5nQa4IW2iymXThBG"
+    "IaSIH56GEe8+711ynekVxT3NVOIu5mwcNIaRR3OXOwKZzAKg2xuCQXsIgLUGIDvAHC7rKh"
+    "FXP+Fd+LN+evb+7OLtu7MLpiK6uZC8f45PnYGJDQWe7tB6Fu2QwlhDMM6gikGNAS3BbU1h"
+    "qKZbtJIos+7LlFOmZZhTQcY5m1vbAO3DJ+AhPKFTTvekhOqnRr913egf1U/+4CcM2K0Q3y"
+    "HdpKUumjj43M2GCIETBeUhetLM4ZzJQSAuQTpsfxnyI/uE/PDyKI9uG18EZX+etNz0un+n"
+    "6jn0rZteU0LuEkBQfMsXkTeDwEMQa1aOzEqiPmJmr4V9Idku92avd1Pg3uzIYO9um+3+0a"
+    "kYBKbkUpRfWTLadog4EwAVwC9ZC3V9pCZetJSgO4npm/THHk58i12g08PePHEeZTdC57Y9"
+    "GDZuPxZG5bIxbPOWeuFOSKVH76R1aHGQ2ufO8LrG/6197XXbAm9A6CQUZ8z0hl8t3icY0Q"
+    "Dg4BFAJ+fnUmlKrTDqUeiBtRxzZvCyc96Hod2Af+YRz/he6Z4ZrWW2V0GI3An+gOYCcYd1"
+    "CGJb5SeSCO8u9Bbx3Z7xfU7nTyrN5mUIHxdRYm5asctnl4riZarVGLQal21LMB5B+/4Rhg"
+    "4owOYtQT2QJAvd5Sa/7ssSiJmfdpKL4F1OwF9C15sPIt+H4Vwbfy8rlYbhDlcHUwQ9OgVE"
+    "mLnoFcLyb+nk4wuv9d1E6b8xShdDoPSqaq6pfpkv3d/FQMWQ+0I5IJki+54wKpEqBtTOSd"
+    "nMuClFsAcfJoDS8Qj4ROGfvABq4Ep2EtsxN1yBbnJr7wrcsmnZu2vetGsf++1WZ9DpdYvx"
+    "m2gsxtX9duNGzhxdXIm1ZGdYr8IaPlVjXbQzrFec14R4wIFzAkLks/Py3qy+UusPUGnN3j"
+    "H6m16y44hxvrY/XLIzDlFBN8JV+SosDWEFYQ8SCqaUzgBLd2mkWJ+1iFWmZonQIOYrKnqa"
+    "uQyDy3NpbeqhL+iVHWcD5b0dG4U9qealTErLeWLkRAZUqZKrMDfjvcvjbYr2+sXVFO1N0d"
+    "4U7f9/RftrEY63uBfT1uyXdI7LSvZJsT6uLG6+Um9K87+xNF8tIzHJyIvJSJUynCnBrVeC"
+    "20CuZ9K83Yr/Vgr7/1PZ1ZRcV13CXJI8p58v433pHbScoXkNbY3X0FAYBiGo8LblkmGldy"
+    "53bEZv+5XL6qWjjVeNdjQpOgj/YQoIpoBgCgi6AsICvKJwkB8UfcGAXZepExxWnUD8XcKq"
+    "32KT6h/Ezg9pc835+Sq7a87P9dtreNuz7JLWwZuoHyLdk7OLlTYvnV2UbF/ijdIrf2LP1w"
+    "iNmR8S+d8ai4TSdnuRwNuTnV40CgkjW+3dB8VK8VK+mNltMV1MF+i9zRbHLCie8jgDI1v0"
+    "cD3uKnOTrZtNY+b5c3n6OHMqjnrR0oz6roy6omoger+U5OozMinSUIQXzcTu6kMfeVCz3i"
+    "o/arBnk0CX/hZuongfWGEDWHVcyj1oh0ht6VF8dWaqdwAOBdlrlkcaKHTtqaX6Ekncclz6"
+    "FZJMxxRHtuaVXrk48oBCooy+9Ql8zuQQk/jXKJHwm2oNwon6AdI9PVnl8y5MS0tXtEmpTI"
+    "Cp8msj/wx6XU0Ok5nIoaxr09qvmueSfXw8UgKXwyh/6ig/YJQCUX6ApurxyTZr/c//Akik"
+    "JpQ="
+)
@@ -0,0 +1,55 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `health_checks` ADD `bytes_received` BIGINT;
+        ALTER TABLE `health_checks` ADD `tls_ms` DOUBLE;
+        ALTER TABLE `health_checks` ADD `connect_ms` DOUBLE;
+        ALTER TABLE `health_checks` ADD `total_ms` DOUBLE;
+        ALTER TABLE `health_checks` ADD `dns_ms` DOUBLE;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `health_checks` DROP COLUMN `bytes_received`;
+        ALTER TABLE `health_checks` DROP COLUMN `tls_ms`;
+        ALTER TABLE `health_checks` DROP COLUMN `connect_ms`;
+        ALTER TABLE `health_checks` DROP COLUMN `total_ms`;
+        ALTER TABLE `health_checks` DROP COLUMN `dns_ms`;"""
+
+
+MODELS_STATE = (
+    "eJztnF1z2jgUhv8K46vsTLZDCGnYvQNCGrYJdIDsdtrpaIQtwBPZppachGnz31cSNv6SHd"
+    "tLKLC6CpHOsaVHsnT0WvIPzXIMhMm7NkYuveO/tT9rPzQbWoj9kOSe1jS4XIZ5PIHCKRbm"
+    "kNuJJDgl1IU6ZakziAliSQYiumsuqenYLNX2MOaJjs4MTXseJnm2+d1DgDpzRBfIZRlfv7"
+    "Fk0zbQMyLBv8sHMDMRNmLFNQ1+b5EO6Gop0vo2vRaG/G5ToDvYs+zQeLmiC8feWJs25alz"
+    "ZCMXUsQvT12PF5+Xzq9nUKN1SUOTdREjPgaaQQ/TSHWnIEzTABgMJ2DcmwCglQCkOzaHy4"
+    "pKRO3nvAi/N86al83W+ftmi5mIYm5SLl/Wtw7BrB0FnsFEexH5kMK1hWAcQhWNugaUgttd"
+    "QFdON+6VoMyKn6QcMM3DHCSEnMO+tQvQFnwGGNlzuuB06zlU/26Pujft0Umj/hu/ocMehf"
+    "UTMvBzGiKLg488bIgQOJdQnqDnjD4ccTkKxDlIJ73PE35li5DvOIry5K79WVC2Vn7O7XDw"
+    "ITCPoO/eDjsJ5CYBBK0f+TjyjuNgBO2MkSP0SlCfMre3wr5J2S33znB4G+Pe6SfB3t91eq"
+    "OTM9EIzMikKDqyhLR1F3EmAEqAX7EcalpITjzumYBu+K7vgh8H2PE1VkFjaOOVP3nkPQj9"
+    "u9540r77FGuVq/akx3MasSchSD15nxiHNhep/dOf3NT4v7Uvw0FP4HUInbvijqHd5IvGyw"
+    "Q96gDbeQLQiMxzQWpALdbqnotBqYk5dHh9cj6Ept3C/MwjntmDdHpmtNJsrx0XmXP7I1oJ"
+    "xH1WIGjrsnnCj/DuXbyJ7w6M70vQf4LUsF+68GkTJUa6Fas+qypaD1Pd9rjbvuppgvEU6g"
+    "9P0DVADDbPcRpOImVjm86yGlYyBdpsnjb8SvAi++CvoIlXY8+yoLvKjL/TRrlhuMHNwQJB"
+    "TBeACDcTvUFY/jXofHzg1b6pKP0XRumiCaSzqpxrYJ83lx7uYCBjyOfCZECyQPoDYVQ8WQ"
+    "yY2SeTbmqakgR78HEOKJ1NgUUk8xN2YAbchF+C7Yw7FqDrP9r7AjevWw7vO7e92qdRr9sf"
+    "94eDePwmMuNx9ajXvk2uHE27EuuEn2JdhDV8rsY67qdYF+zXhGBgwBUBLrLYfXlpio/U2R"
+    "eoNGbvGf1tD9nriHFVej5M+akJUULXs6vylXgqwhLCGBIKFpQuAVvuUk8yPmcilrmqISID"
+    "MR9R0fPSZBhMvpbOXHpkC3p519mCvLdnrXAgal7AJFfOEy0nVkCVlFyJu2rvfW5vJdpnD6"
+    "5KtFeivRLt/3+i/Y0Ix7t8FsvU7FM2p3mSvS/Wr5XF7Sv1Spr/hdJ8tRWJWoy8uhipIsMp"
+    "Ca6cBLeFtZ5a5u1X/Fco7P9PsquSXIsOYSbx39Ov0nhf24MWcVTb0EpsQ0Ou67igwm7LlG"
+    "OlPZd71qN3veWyunS0ddVoTxdFRzF/GDYpG5qFLioyKxCZsbvZSKdlKcfdFOkCpCku3ZdD"
+    "F0W4CGGHQlyaccRJUS5AebqiiMfkOjIfkUTp6ZjzzJA+7XtE4fwfjcb5+WWjfv6+ddG8vL"
+    "xo1TdxfTorL8Dv9D/weDM260p2AihxXVPiuhLX5eL6BrxEVI82SraYzuqlNPTj0tDF3xTW"
+    "7OOngf1RnIpMHDy9uChy8vTiIvvoKc9LTUll8Prmx0i33mwVOtjbbOUc7eWZie3w4jz0FM"
+    "3YPCS00RKDhNR3d5HAeX2vB42YmMpGexafltdSQ78dSqnBAH2wSurMRWQBfEWBl7Acd5m7"
+    "UrLVgWq1Nyt/b9bSqNjqcU/V6vvS6hJFXZQ+tcjNXpElIg1JeNHx/a4/jhCGGeOt9IM/B9"
+    "YJspa/8fcT4ox07HB0dVzS89nHSC21Ta06M9n+uGNB9pbySBu5pr7QZF/pWuec5n6hK7RR"
+    "4sjOZqU3FkcekUuk0Xf2Aj7icoyL+LeQSPhDVYKwb36EdM/qRT59xqwy6Yq81NtsKv0S11"
+    "/j4SDzTTaVf4bLMHVa+1nDJjnE1yM5cDmMWLya2pGT3HyTCET5BTqy1ye71Ppf/gXXhmh6"
+)
@@ -0,0 +1,51 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `health_checks` ADD `tls_cipher` VARCHAR(64);
+        ALTER TABLE `health_checks` ADD `tls_version` VARCHAR(16);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `health_checks` DROP COLUMN `tls_cipher`;
+        ALTER TABLE `health_checks` DROP COLUMN `tls_version`;"""
+
+
+MODELS_STATE = (
+    "eJztnG1z2jgQgP8K40+5mVyHECDcfQNCWq4JdIDcddrpaIQtwBO/UEtOwvTy30+SbfwmO7"
+    "ZLKHD6FCLt2vIjWbvalfxDMW0NGfhd10AOuWO/lT9rPxQLmoj+ENSe1xS4Xod1rIDAucHF"
+    "IZPjRXCOiQNVQksX0MCIFmkIq46+Jrpt0VLLNQxWaKtUULeWYZFr6d9dBIi9RGSFHFrx9R"
+    "st1i0NPSMc/Lt+AAsdGVqsubrG7s3LAdmsednQIjdckN1tDlTbcE0rFF5vyMq2ttK6RVjp"
+    "ElnIgQSxyxPHZc1nrfOfM3gir6WhiNfEiI6GFtA1SORx5yAsUwAYjWdgOpgBoJQApNoWg0"
+    "ubivnTL1kTfm9cNK+anct2s0NFeDO3JVcv3q1DMJ4ixzOaKS+8HhLoSXDGIVTeqR6gFNz+"
+    "CjpiunGtBGXa/CTlgGke5qAg5ByOrX2ANuEzMJC1JCtGt55D9e/upP+hOzlr1H9jN7Tpq+"
+    "C9ISO/psGrGPjIy4YwhksB5Rl6zhjDEZWTQJyDdDb4PGNXNjH+bkRRnt11P3PK5savuR2P"
+    "3gfiEfT923EvgVzHACPvlY8j79m2gaCVMXOEWgnqc6r2Vti3Jfvl3huPb2Pce8Mk2Pu73m"
+    "BydsE7gQrpBEVnlpC26iDGBEAB8GtaQ3QTiYnHNRPQNV/1XfDjCAe+Qh9QG1vGxjceeS/C"
+    "8G4wnXXvPsV65bo7G7CaRuxNCErP2ol5aHuR2j/D2Yca+7f2ZTwacLw2JkuH3zGUm31RWJ"
+    "ugS2xg2U8AahE7F5QG1GK97joGKGWYQ4XXjfMxdO0O7DPzeBYPQvNMaaXZ3tgO0pfWR7Th"
+    "iIe0QdBSRXbC9/DuHWPr3x0Z35dg/ASl4bh04NPWS4wMK/r49FGRN031u9N+93qgcMZzqD"
+    "48QUcDMdisxm7YiZKtbLrKbJjJEmhRO635D8Ga7IO/hrqxmbqmCZ1Npv+dFsp1wzUmDlYI"
+    "GmQFMFfT0Ru45V+DwccmXuWb9NJ/oZfOu0BoVcVcA/k8W3q8k4GIIbOFSYdkhdQHTKm4Ih"
+    "8wc0wm1aSZEjh78HEJCFnMgYkF9smwYQbchF6C7YIpFqDrv9qHAjdvWI7ve7eD2qfJoD+c"
+    "DsejuP/GK+N+9WTQvU2uHHWrEuuEnmRdhDV8rsY6ridZFxzXGBtAgxsMHGTS+7LWFJ+psy"
+    "9Qac4+MPq7nrI9j3FT2h6m9KRBFNB1rap8BZqSsICwATEBK0LWgC53iSuYnzMRi1TlFJGB"
+    "mM2o6HmtUww6W0tnLj2yA3p519lBeO/AeuFIonkBk9xwHu85vgKqFMkVqMv+PuT+lkH77M"
+    "lVBu1l0F4G7f9/QfsP3B3vMyuWGbNPyZznhez9YL0XWdx9pF6G5n9haL7aikQuRl5djFQJ"
+    "w8kQXLkQ3A7WenKZd1j+XyG3/6fCrjLkWnQK07Gfp9+k8b62By2iKLehldiGhhzHdkCF3Z"
+    "YpxUp7Lg9sRO97y2X10NHOo0YHuig6CfuhWbisaxaqSM+sgGdG72YhlZSlHFeTpAuQJkbp"
+    "sRyqSMJFCNsEGqUZR5Qk5QKU5xuCmE+uIv0RCSI9PX2Z6dKndU/Inf+j0bi8vGrUL9udVv"
+    "PqqtWpb/36dFWeg98bvmf+ZszqCuIWdHJ4RA5mjU11QvaRqoTaKTif8SNVF+0CR6oukl5N"
+    "eKSKVaVJq/qaRUFLgg61To9zu1mAc7uZyZlVJfa2yHSRItNFMl0kThdtwQvSRNFOyU4P0e"
+    "eSWaHTygrxvyWMUiB/Eud8E0epW60iZ6lbrezD1KwuZZLK4PXFT5FuvdkpdFS92ck5rM4q"
+    "Ewc8+An/OVpQO8Sj/SUmCaHu/jyBy/pBTxqx9ACd7emKq3x2INTbY3IgmKCPNjewcBBeAT"
+    "9GJlyf5XIXqcvcjPxEgNxtmL/bcK1V7PW4puz1Q+l1QY6Itz61yM1ekSU8DYF70fP1bj5O"
+    "kAEz5lvhJ6yObBBkLX/jGTd+6j923L86LuEXB06RWmrjZXVmoh2fp4LsLcMjXeTo6koRfX"
+    "fOqznP/eZcKCODI3uzSm8cHKmQHfnZzMihvYp7CJGwl6oEYV/8BOle1It8zI9KZaee6qnP"
+    "+dE7EuG35f6ajkeZezOI+MNymq6S2r81Q8fHmB7JgctgxPzV1B6z5HayhCPKLtATpU/2Ge"
+    "t/+Q/SOE/k"
+)
@@ -0,0 +1,57 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # URLs that existed before probe modes were checked with a GET that read
+    # the body; they move to `capped`, which still does for bodies up to
+    # probe_max_bytes and so keeps reusing the keep-alive connection.
+    # Only URLs added from now on default to HEAD.
+    return """
+        ALTER TABLE `urls` ADD `probe_mode` VARCHAR(10) NOT NULL DEFAULT 'head';
+        ALTER TABLE `urls` ADD `probe_max_bytes` INT NOT NULL DEFAULT 65536;
+        UPDATE `urls` SET `probe_mode` = 'capped';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` DROP COLUMN `probe_mode`;
+        ALTER TABLE `urls` DROP COLUMN `probe_max_bytes`;"""
+
+
+MODELS_STATE = (
+    "eJztnFtz2jgUgP8K46fsTLbDPey+ASEt2wQ6QHY77XQ0whbgiS/UEkmYbv77SrKNb7Jju4"
+    "QCq6cQ6Rxb/iSfc3Qk+Ydi2hoy8LuugRxyx34rf1Z+KBY0Ef0hqL2sKHC9DupYAYFzg4tD"
+    "JseL4BwTB6qEli6ggREt0hBWHX1NdNuipdbGMFihrVJB3VoGRRtL/75BgNhLRFbIoRVfv9"
+    "Fi3dLQM8L+v+sHsNCRoUWaq2vs3rwckO2alw0tcsMF2d3mQLWNjWkFwustWdnWTlq3CCtd"
+    "Igs5kCB2eeJsWPNZ67zn9J/IbWkg4jYxpKOhBdwYJPS4cxCUKQCMxjMwHcwAUAoAUm2Lwa"
+    "VNxfzpl6wJv9drzatmp9FudqgIb+au5OrFvXUAxlXkeEYz5YXXQwJdCc44gMo71QWUgNtf"
+    "QUdMN6oVo0ybH6fsM83C7BcEnIOxdQjQJnwGBrKWZMXoVjOo/t2d9D90Jxf16m/shjZ9Fd"
+    "w3ZOTV1HkVAx962RDGcCmgPEPPKWM4pHIWiDOQzgafZ+zKJsbfjTDKi7vuZ07Z3Ho1t+PR"
+    "e188hL5/O+7FkOsYYOS+8lHkPds2ELRSLEegFaM+p2pvhX1XcljuvfH4NsK9N4yDvb/rDS"
+    "YXNd4JVEgnKGxZAtqqgxgTAAXAr2kN0U0kJh7VjEHXPNV3/o8THPgKfUBtbBlbz3lkvQjD"
+    "u8F01r37FOmV6+5swGrqkTfBL71ox+zQ7iKVf4azDxX2b+XLeDTgeG1Mlg6/YyA3+6KwNs"
+    "ENsYFlPwGohfycX+pTi/T6xjFAIcccKLzunE+ha/fgn1nEs3gQumdKK8n2xnaQvrQ+oi1H"
+    "PKQNgpYq8hNehHfvGLv47sT4vvjjxy8NxqUDn3ZRYmhY0cenj4pcM9XvTvvd64HCGc+h+v"
+    "AEHQ1EYLMau27HSnayySqzbsZLoEX9tOY9BGuyB/4a6sZ2ujFN6GxT4++kUGYYrjFxsELQ"
+    "ICuAuZqO3iAs/+oPPmZ4lW8ySv+FUTrvAqFXFXP15bN86ekaAxFD5gvjAckKqQ+YUtmIYs"
+    "DUMRlXk25KEOzBxyUgZDEHJhb4J8OGKXBjejG2C6aYg673ah8L3KxhOb7v3Q4qnyaD/nA6"
+    "HI+i8RuvjMbVk0H3Nj5z1K1SrGN6knUe1vC5HOuonmSdc1xjbAANbjFwkEnvy1qT31KnX6"
+    "CUzT4y+vs22W7EuC3sDxN60iEK6G6ssnwFmpKwgLABMQErQtaATnfJRmCfUxGLVKWJSEHM"
+    "LCp6XusUg87m0qlTj/SEXtZ19pDeO7JeOJFsns8kM53He47PgEplcgXqsr+Pub9l0j7duM"
+    "qkvUzay6T9/y9p/4GH433mxVJz9gmZy6yUvZesdzOL+8/Uy9T8L0zNl5uRyMnIq5ORMmk4"
+    "mYIrloLbw1xPTvOOK/7LFfb/VNpVplzzmjAde+v02yTe1/aghRTlNrQC29CQ49gOKLHbMq"
+    "FYas/lkY3oQ2+5LJ862nvW6EgnRWfhPzQLFw3NAhUZmeWIzOjdLKSSopSjapJ0DtLEKDyW"
+    "AxVJOA9hm0CjMOOQkqScg/J8SxCLyVWkPyJBpqenL1ND+qTuGYXzf9TrjcZVvdpod1rNq6"
+    "tWp7qL65NVWQF+b/iexZsRryvIW1Dj8IgczBqb6IT0I1UxtXMIPqNHqmrtHEeqavGoJjhS"
+    "xaqSpFV9zbKgBUEHWufHud3MwbndTOXMqmJ7W+RykSKXi+RykXi5aAdesEwU7pT05SH6XH"
+    "JV6LxWhfjfAk7Jlz+Lc76xo9StVp6z1K1W+mFqVpdwSUXweuLnSLfa7OQ6qt7sZBxWZ5Wx"
+    "Ax78hP8cLagf4tn+AkZCqHu4SKBRPWqjEVkeoNaezriKrw4EegdcHPAN9MmuDSwchFfAy5"
+    "EJ52eZ3EXqcm2mAP+1Y88RYBFQEeMd1TqcDWfbdvzWvPXcOM/nRmrpnxupJT434kGjN+G5"
+    "nQLWW6B5ONvdbrUa7RMx33LvbDrqM947u9ZK9npUU/b6sfS6YMWTtz6RsknPL8TiZoG57X"
+    "l6Nx8nyIAp0YPwg2wnNgjSkjnR9WP+DYvIxyvK4xJ+P+McqSW2EZdnJtq/fC7I3jLZ10WO"
+    "rq4U0VcU3ZrLzC8oBjIy1Xcwr/TGqb4Sa30/u853bK/iARJ+7KUqQNgTP0O6tWq+uWLWZD"
+    "ExW6R3JMIvJf41HY9SdxoR8WcSNV0llX8rho5PcbEvAy6DEYlXEzsm45sjY4Eou0BPtBh4"
+    "yJWrl/8AGJ4zUQ=="
+)
@@ -0,0 +1,55 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` ADD `body_pattern` VARCHAR(512);
+        ALTER TABLE `urls` ADD `body_must_match` BOOL NOT NULL DEFAULT 1;
+        ALTER TABLE `urls` ADD `body_is_regex` BOOL NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` DROP COLUMN `body_pattern`;
+        ALTER TABLE `urls` DROP COLUMN `body_must_match`;
+        ALTER TABLE `urls` DROP COLUMN `body_is_regex`;"""
+
+
+MODELS_STATE = (
+    "eJztnF9z2jgQwL8K46fcTK4DBAh3b0BIyzWBTiB3nXY6GmEL0MR/qCUnYXr57icJG2Nbdm"
+    "yXUOD0FCLt2vJP8u5qJfmHZjkGMsm7jolcest/a39Wfmg2tBD7Iak9r2hwuQzreAGFU1OI"
+    "Qy4niuCUUBfqlJXOoEkQKzIQ0V28pNixWantmSYvdHQmiO15WOTZ+LuHAHXmiC6Qyyq+fm"
+    "PF2DbQMyLBv8sHMMPINCLNxQa/tygHdLUUZQObXgtBfrcp0B3Ts+xQeLmiC8feSGOb8tI5"
+    "spELKeKXp67Hm89b5z9n8ETrloYi6yZu6RhoBj2Tbj3uFIRlGgDD0QSM+xMAtAKAdMfmcF"
+    "lTiXj6OW/C7/Va47LRvmg12kxENHNTcvmyvnUIZq0o8Awn2ouohxSuJQTjEKro1DWgBNze"
+    "ArpyulGtGGXW/DjlgGkW5qAg5ByOrX2AtuAzMJE9pwtOt5pB9e/OXe9D5+6sXv2N39Bhr8"
+    "L6DRn6NXVRxcFvvWyIEDiXUJ6g55QxvKVyEogzkE76nyf8yhYh381tlGe3nc+CsrXya25G"
+    "w/eB+Bb63s2oG0OOCSBo/cpHkXcdx0TQTrEcoVaM+pSpvRX2Tcl+uXdHo5sI9+4gDvb+tt"
+    "u/O6uJTmBCmKJtyxLS1l3EmQAoAX7Faii2kJx4VDMG3fBV3wU/jnDga+wBjZFtrnznkfUi"
+    "DG7740nn9lOkV646kz6vqUfehKD0rBWzQ5uLVP4ZTD5U+L+VL6NhX+B1CJ274o6h3OSLxt"
+    "sEPeoA23kC0Njyc0FpQC3S655rgkKOOVR43TkfQ9fuwD/ziGf2IHXPjFaS7bXjIjy3P6KV"
+    "QDxgDYK2LvMTfoR375qb+O7I+L4E4ycoDcelC582UeLWsGKPzx4Vrc1UrzPuda76mmA8hf"
+    "rDE3QNEIHNa5y6EyvZyCarrLoVL4E289OG/xC8yT74K4jN1dizLOiuUuPvpFBmGG5wcbBA"
+    "0KQLQIQaRm8Qln8NBh83vNo3FaX/wihddIHUq8q5BvJZvvR4jYGMIfeF8YBkgfQHwqh4sh"
+    "gwdUzG1ZSbkgR78HEOKJ1NgUUk/sl0YArcmF6M7Ywr5qDrv9qHAjdrWI7uuzf9yqe7fm8w"
+    "HoyG0fhNVEbj6rt+5yY+c8R2KdYxPcU6D2v4XI51VE+xzjmuCTGBAVcEuMhi9+WtyW+p0y"
+    "9QymYfGP1dm+x1xLgq7A8TesohSuh6dlm+Ek1FWELYhISCBaVLwKa71JPY51TEMlVlIlIQ"
+    "c4uKnpeYYcB8Lp069UhP6GVdZwfpvQPrhSPJ5gVMMtN5oufEDKhUJleirvr7kPtbJe3Tja"
+    "tK2qukvUra//+S9h9EON7jXiw1Z5+QOc9K2fvJ+nVmcfeZepWa/4Wp+XIzEjUZeXUyUiYN"
+    "p1JwxVJwO5jrqWneYcV/ucL+n0q7qpRrXhOGib9Ov0rifW0P2pai2oZWYBsacl3HBSV2Wy"
+    "YUS+25PLARve8tl+VTRzvPGh3opOgk/Idhk6KhWaiiIrMckRm7m410WpRyVE2RzkGamoXH"
+    "cqiiCOch7FBoFma8paQo56A8XVHEY3Id4UckyfR08Tw1pE/qnlA4/0e9fnFxWa9etNrNxu"
+    "Vls13dxPXJqqwAvzt4z+PNiNeV5C2YcXhELuGNTXRC+pGqmNopBJ/RI1W1Vo4jVbV4VBMe"
+    "qeJVSdI6XvIsaEHQodbpcW41cnBuNVI586rY3ha1XKSp5SK1XCRfLtqAlywTbXdK+vIQey"
+    "61KnRaq0LibwGnFMifxDnf2FHqZjPPWepmM/0wNa9LuKQieH3xU6RbbbRzHVVvtDMOq/PK"
+    "2AEPccJ/imbMD4lsfwEjIdXdXyRwUT1ooxFZHmDWns24iq8OhHp7XBwIDPTRrg3MXEQWwM"
+    "+RSednmdxl6mptpgD/petMEeARUBHjHdXanw3n23aC1rz13DjP50Zq6Z8bqSU+N+JDYzcR"
+    "uZ0C1luiuT/b3Wo2L1pHYr6njrECS0gpcgtleuJ6p5eCaNbqOcYzk0od0KJOghvzLOUcPR"
+    "e03AldZbYLmG1Bz/IIZVaB6osy7KPaKmZRn9VRO/Qzd+gvjZK9HtVUvX4ovS7ZVyFan0gM"
+    "p2cxY7NzSVDX9fWuP94hE6bMUaSffTyyQZCWMo7uUhFfyol8Iqc8LulXek6RWuKwQnlmsl"
+    "MSp4LsLZcUOsjF+kKTfat1XXOe+Z3WUEYtKOzNK73xgkKJHQU/u5vg0F7FPSwr8JeqAGFf"
+    "/ATp1qr5MlJZKalETordkUq/x/rXeDRM3c9I5R9jNbBOK/9WTEyOcUtBBlwOIxKvJvZlx7"
+    "dgxwJRfoGubMvBPtfHX/4DNo6cHg=="
+)
@@ -0,0 +1,51 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` ADD `check_interval_sec` INT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `urls` DROP COLUMN `check_interval_sec`;"""
+
+
+MODELS_STATE = (
+    "eJztnFtz2jgUgP8K46fsTLYDBEh234CQlm0CnYTsdtrpaIQtwBNfqCQnYbr57ysJG2Nbdm"
+    "yXUPDqKUQ6x5I/yUdHR5cfmu0ayCLvuhbC9Ib/1v6s/dAcaCP2Q5J7WtPgchnm8QQKp5YQ"
+    "h1xOJMEpoRjqlKXOoEUQSzIQ0bG5pKbrsFTHsyye6OpM0HTmYZLnmN89BKg7R3SBMMv4+o"
+    "0lm46BnhEJ/l0+gJmJLCNSXdPgZYt0QFdLkTZ06JUQ5KVNge5anu2EwssVXbjORtp0KE+d"
+    "IwdhSBF/PMUerz6vnf+ewRutaxqKrKu4pWOgGfQsuvW6UxCmaQCMxhNwN5gAoBUApLsOh8"
+    "uqSsTbz3kVfm82Wueti7NO64KJiGpuUs5f1kWHYNaKAs9oor2IfEjhWkIwDqGKRl0DSsDt"
+    "LyCW041qxSiz6scpB0yzMAcJIeewb+0DtA2fgYWcOV1wuvUMqn93b/sfurcnzfpvvECXfQ"
+    "rrL2Tk5zRFFge/9bEhQuBcQnmCnlP68JZKJRBnIJ0MPk/4k21CvlvbKE9uup8FZXvl51yP"
+    "R+8D8S30/etxL4bcJICg9ScfRd5zXQtBJ8VyhFox6lOm9lbYNyn75d4bj68j3HvDONj7m9"
+    "7g9qQhGoEJmRRtW5aQto4RZwKgBPgly6GmjeTEo5ox6Iav+i74cYQdX2MvaIwda+UPHlkf"
+    "wvBmcDfp3nyKtMpldzLgOc3IlxCknnRidmjzkNo/w8mHGv+39mU8Ggi8LqFzLEoM5SZfNF"
+    "4n6FEXOO4TgMbWOBekBtQire5hCxQamEOF1wfnY2jaHYzP3OOZPUiHZ0YryfbKxcicOx/R"
+    "SiAesgpBR5eNE76Hd4+tjX93ZHxfgv4TpIb9EsOnjZe41a3Y67NXRWsz1e/e9buXA00wnk"
+    "L94QliA0Rg8xy36cZSNrLJLLtpx1Ogw8Zpw38JXmUf/CU0rdWdZ9sQr1L976RQphtucHGw"
+    "QNCiC0CEmonewC3/GnQ+bni1b8pL/4VeumgC6agq5xrIZ42lx2sMZAz5WBh3SBZIfyCMii"
+    "fzAVP7ZFxNDVMSZw8+zgGlsymwiWR8slyYAjemF2M744o56Pqf9qHAzeqW4/ve9aD26XbQ"
+    "H94Nx6Oo/yYyo3717aB7HZ85mk4p1jE9xToPa/hcjnVUT7HO2a8JsYABVwRgZLNyeW3yW+"
+    "r0B5Sy2QdGf9cme+0xrgqPhwk9NSBK6HpOWb4STUVYQtiChIIFpUvAprvUk9jnVMQyVWUi"
+    "UhBzi4qelybDYPK5dOrUIz2gl/WcHYT3DqwVjiSaFzDJDOeJlhMzoFKRXIm6au9Dbm8VtE"
+    "83ripor4L2Kmj//wvafxDueJ+PYqkx+4TMaVbI3g/WryOLu4/Uq9D8LwzNl5uRqMnIq5OR"
+    "MmE4FYIrFoLbwVxPTfMOy//L5fb/VNhVhVzzmjCT+Ov0qyTe1/agbSmqbWgFtqEhjF0MSu"
+    "y2TCiW2nN5YD1631suy4eOdh41OtBJUSXGD8MhRV2zUEV5Zjk8M1aag3RalHJUTZHOQZpa"
+    "hftyqKII5yHsUmgVZrylpCjnoDxdUcR9ch2Zj0gS6emZ81SXPqlbIXf+j2bz7Oy8WT/rXL"
+    "Rb5+fti/rGr09mZTn4veF77m9GRl1J3IIZh0eECa9sohHSj1TF1KrgfEaPVDU6OY5UNeJe"
+    "TXikimclSevmkkdBC4IOtarHudPKwbnTSuXMs2J7W9RykaaWi9RykXy5aANesky03Sjpy0"
+    "PsvdSqULVWhcTfAoNSIF+Jc76xo9Ttdp6z1O12+mFqnpcYkorg9cWrSLfeush1VL11kXFY"
+    "nWfGDniIE/5TNGPjkIj2FzASUt39eQJn9YM2GpHlAWbt2Yyr+OpAqLfHxYHAQB/t2sAMI7"
+    "IAfoxMOj/L5C5TV2szBfgvsTtFgHtARYx3VGt/Npxv2wlq89Zz4zzXjTTSrxtpJK4b8aGx"
+    "QkRsp4D1lmjuz3Z32u2zzpGY76lrrMASUopwoUhPXK96IYh2o5mjPzOp1A4t8iS4TR6lnK"
+    "PngpY7oavMdgGzLejZHqHMKlB9UYZ9VFv5LAWu1eHr4oCVifAjtABBegFbLleuUGx/Z8Zc"
+    "HYRIR13hgxBLo2SrRzVVqx9Kq0u2r4jaJ+Lv6cHiWBBE4jv3fL2rj7fIgilTQentmkfWCd"
+    "Ii89HNQOJCoshNROVxSS9DqiK1xJmQ8sxkh1GqguwtV266CJv6QpNdibvOOc28DjeUUes2"
+    "x+X2pa/blNi48bObNg7tU9zD6g3/qAoQ9sUrSLdRzxf4y4r8JUJ/rEQqvfb2r7vxKHXbKJ"
+    "XfeWuYOq39W7NMcow7NzLgchgRfzWx/T2+0z3miPIH9GQ7O/a5DeHlP7xSDtQ="
+)
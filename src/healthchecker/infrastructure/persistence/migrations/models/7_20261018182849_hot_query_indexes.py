@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `alerts` ADD INDEX `idx_alerts_is_sent_ae8579` (`is_sent`, `created_at`);
+        ALTER TABLE `health_checks` ADD INDEX `idx_health_chec_url_id_7ef23b` (`url_id`, `checked_at`);
+        ALTER TABLE `health_checks` ADD INDEX `idx_health_chec_checked_df15d9` (`checked_at`);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `health_checks` DROP INDEX `idx_health_chec_checked_df15d9`;
+        ALTER TABLE `health_checks` DROP INDEX `idx_health_chec_url_id_7ef23b`;
+        ALTER TABLE `alerts` DROP INDEX `idx_alerts_is_sent_ae8579`;"""
+
+
+MODELS_STATE = (
+    "eJztnFtv4jgUgP8KylNX6o6AAu3uG1A6w04Lo5bujqYaWSYxEDUXJnbaotn+97WdhNycNM"
+    "lQBFk/ldrnxM5n5/j4+PJTMW0NGfhD30AOuWG/lT8bPxULmoj+EOSeNhS4Xod5LIHAucHF"
+    "IZPjSXCOiQNVQlMX0MCIJmkIq46+Jrpt0VTLNQyWaKtUULeWYZJr6T9cBIi9RGSFHJrx8J"
+    "0m65aGXhBm/z4oOgYYWYSVpDoIEqQBSJTvTG79CBY6MrTYe+gaE+XpgGzWPG1skSsuyKox"
+    "B6ptuKYVCq83ZGVbW2ndK22JLOSw8mgacVz2XqzaPoDgVb1XCEW8ukd0NLSArkEiHOYgTF"
+    "MAmExn4G40A0ApQU61LUadVhXzt1+yKvzebnXOOxdnvc4FFeHV3Kacv3pFh2A8RY5nMlNe"
+    "eT4k0JPg8EOovLU9QCm4wxV0xHTjWgnKtPpJygHTPMxBQsg57HT7AG3CF2Aga0lWjG4zh+"
+    "rf/dvhp/7tSbv5GyvQpt+I9+lM/Jw2z2LgI18hwhguBZRn6CWjD0dUaoE4B+ls9HXGnmxi"
+    "/MOIojy56X/llM2Nn3M9nXwMxCPoh9fTQQJ5xMDEkQ9s20DQyrAcoVaC+pyqvRf2bcp+uQ"
+    "+m0+sY98E4Cfb+ZjC6PWnxRqBCOkFRyxLSjtjwFPBLmkN0E4mJxzUT0DVf9UPw4wg7vkJf"
+    "UJtaxsYfPPI+hPHN6G7Wv/kSa5XL/mzEctqxLyFIPekl7ND2IY1/xrNPDfZv49t0MuJ4bU"
+    "yWDi8xlJt9U1idoEtsYNnPAGqRcS5IDajFWt11DFBqYA4V3h6cj6FpdzA+M49n8Sgcnimt"
+    "NNsr20H60vqMNhzxmFYIWqponPBdv3vH2Dp+R8b3Neg/QWrYLx34vPUSI92Kvj59VeSZqW"
+    "H/bti/HCmc8Ryqj8/Q0UAMNsux23YiZSubzjLbZjIFWnSc1vyXYFX2wV9C3djcuaYJnU2m"
+    "Y54WyvXPNSYOVggaZAUwV9PRO/jrD0HnY4bXc8sj7rv00vfppfMmEI6qYq6BfN5YerzGQM"
+    "SQjYVJh2SF1EdMqbgiHzCzTybV5DAlcPbg0xIQspgDEwvGJ8OGGXATegm2C6ZYgK7/aR8K"
+    "3LxuOb0fXI8aX25Hw/HdeDqJ+288M+5X347618mZo25VYp3Qk6yLsIYv1VjH9STrgv0aYw"
+    "NocIOBg0xaLqtNcUud/YBKNvvA6O/aZHse46b0eJjSkwOigK5rVeUr0JSEBYQNiAlYEbIG"
+    "dLpLXIF9zkQsUpUmIgMxs6joZa1TDDqbS2dOPbIDennP2UF478Ba4UiieQGT3HAebzk+A6"
+    "oUyRWoy/Y+5PaWQfts4yqD9jJoL4P2/7+g/Sfujg/ZKJYZs0/JnOaF7P1gvRdZ3H2kPrWz"
+    "JuQaGYup1EPsfxnC32cIv9rMRU5a3py0VAnXyVBduVDdDuaEcjp4WH5ioenBL4VnZWi2qA"
+    "nTsb+ev0njfWuvWkRRblcrsV0NOY7tgAq7MlOKlfZmHliP3vfWzOohpp1Hlw508lSL8UOz"
+    "cFnXLFSRnlkBz4yWZiGVlKUcV5OkC5AmRum+HKpIwkUI2wQapRlHlCTlApTnG4KYT64i/Q"
+    "kJIj0DfZnp0qd1a+TO/9Fun52dt5tnvYtu5/y8e9Hc+vXprDwHfzD+yPzN2KgriFtQ4/CE"
+    "HMwqm2qE7KNXCbU6OJ/xo1etXoGjV62kVxMevWJZadKqvmbR0pKgQ636ce51CnDudTI5s6"
+    "zEHhi5rKTIZSW5rCReVtqCFywnRRslexmJvtf7rx7JVaF9rgrxvyUGpUC+FueBE0euu90i"
+    "Z6673exD1ywvNSSVweuL15Fus3NR6Eh75yLnUDvLTBwE4TcBzNGCjkM82l/CSAh19+cJnD"
+    "UP2mjElgeotaczrvKrA6HeHhcHAgN9tGsDCwfhFfBjZML5WS53kbpcmynBf+3YcwSYB1TG"
+    "eMe19mfD2faeoDbvPTcuci1JK/taklbqWhIfGi2Ex3ZKWG+B5v5sd6/bPesdifme29oGrC"
+    "EhyCkV6Unq1S8E0W21C/RnKpXZoXmeALfOopRL9FLScqd0pdkuYbY5PdPFhFoFoq6qsI9r"
+    "S5+lxPU7bF0c0DKR8wQNgJFawpaLlWsU29+ZMZcHJrJR1/jAxFqr2OpxTdnqh9Lqgu0rvP"
+    "ap+Ht2sDgRBBH4zgNf7+rzLTJgxlRQeD3nkXWCrMh8fDMQv7godmNRdVzCS5PqSC11dqQ6"
+    "M9Ghlboge8+Vmz5ydHWliO7U9XJOc+/TDWXkus1xuX3Z6zYVNm786qaNQ/sU97B6wz6qEo"
+    "R98RrSbTWLBf7yIn+p0B8tkQivx/3rbjrJ3DZKxHfjarpKGv82DB0f486NHLgMRsxfTW1/"
+    "T+50Tzii7AED0c6OfW5DeP0PpuQkqg=="
+)
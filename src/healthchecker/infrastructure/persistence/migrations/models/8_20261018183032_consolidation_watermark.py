@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `consolidation_watermark` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `consolidated_through` DATE NOT NULL,
+    `updated_at` DATETIME(6) NOT NULL
+) CHARACTER SET utf8mb4 COMMENT='Single row holding the last day whose summaries are complete.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS `consolidation_watermark`;"""
+
+
+MODELS_STATE = (
+    "eJztnG1z2jgQgP+Kx59yM70OECC5+waEtlwT6AR67TTT0QhbgCd+4SQ5CdPLfz9J2PhNdm"
+    "xKKHD6lCDt2vIjeXe1kvVDdzwT2eRtx0aY3vD/9T+1H7oLHcT+kdS+0XS4XEZ1vIDCqS3E"
+    "IZcTRXBKKIYGZaUzaBPEikxEDGwtqeW5rNT1bZsXegYTtNx5VOS71j8+AtSbI7pAmFXcfW"
+    "fFlmuiJ0T4zzvdIoAgl/I7GRhBikwAqf6dyy3vwcxCtpl4DsvkoqIc0NVSlA1c+k4I8mZM"
+    "geHZvuNGwssVXXjuRtpa322OXIT5/VgZxT5/Lt7sAED4qOtHiETWbY/pmGgGfZvGOExBVK"
+    "YDMBxNwLg/AUCvQM7wXE6dNZWIp5/zJvzeqDcvmpfn7eYlExHN3JRcPK9vHYFZKwo8w4n+"
+    "LOohhWsJAT+CKnp7DSgDt7eAWE43qZWizJqfphwyLcIcFkSco0G3D9AOfAI2cud0wenWCq"
+    "j+3bntfejcnjVqv/EbeuwdWb86w6CmIao4+NhbiAiBcwnlCXrKGcMxlZNAXIB00v864Vd2"
+    "CPnHjqM8u+l8FZSdVVBzPRq+D8Vj6HvXo24KeczAJJF3Pc9G0M2xHJFWivqUqb0W9k3Jfr"
+    "l3R6PrBPfuIA328023f3tWF53AhCyK4pYloh2z4RngV6yGWg6SE09qpqCbgerb8J8jHPg6"
+    "e0Bz5NqrwHkUvQiDm/540rn5lOiVq86kz2saiTchLD1rp+zQ5iLal8Hkg8Z/at9Gw77A6x"
+    "E6x+KOkdzkm87bBH3qAdd7BNCM+bmwNKSW6HUf26CSY44UXnbOx9C1O/DPPOKZ3UvdM6OV"
+    "ZfvOw8iaux/RSiAesAZB15D5iSD0+4ztTeB3ZHyfw/ETlkbjEsPHTZQYG1bs8dmjorWZ6n"
+    "XGvc5VXxeMp9C4f4TYBAnYvMZreKmSjWy2ymk46RLoMj9tBg/BmxyA77Fme7bFTBd77C+M"
+    "OnYgvs8N0YvEC2N2I64IHkPNUkG8Pmb8baRh71FbeLbJfmksZtdsSKhmwpX2uPAI0ojvsE"
+    "taiGgQI83wnCVn/FZP9eLPX+3lqYOaIexzhhCNLeai6QJ7/nwh9/A53j1Hv8jPH6+hkjHm"
+    "fjoVLPlLc8tgKampgqVDCZZCRrFoSbQ+49x/jSe6gpa9Gguru8r1P1mhQq9jcnGwQNCmC7"
+    "Cx6LvPHN2FYZAwDd+VN/iF3iC0zmWtfyj/v7b2xgIZ94RR8WXZiNwxmVZTEyZJ2gE+zAGl"
+    "sylwiGSmZHswB25KL8V2xhVL0A1e7UOBWzQsR5+7133t022/NxgPRsOkcxSVyQzPbb9znc"
+    "5hWu5WrFN6inUZ1vBpO9ZJPcW65LgmxAZsfkoARg67L29NeUudf4GtbPaB0d+1yV5HjKvK"
+    "/jCjpxyihK7vbstXoqkISwjzXBZYULoEhELqS+xzLmKZqjIROYi5RUVPSwuv05r5U4/8bE"
+    "nRdXaQOzmwXjjeVEl2YUn0nJgBbZUmk6ir/j7k/lbLx/nG9Tgzomr5WC0f/2q+x718/EGE"
+    "4z3uxXJz9hmZN0Up+yBZv84s7j5Tn9njGXGN+WImdZf4rVL4+0zhbzdzUZOWFyct26TrVK"
+    "quWqpuB3NCNR08rDix1PTgp9KzKjVb1oRZJFjPX2XxvrRrOqaoNk5X2DiNMPYw2OL7gIzi"
+    "Vl8JHNiI3vdHAtunmHaeXTrQydNJ+A/TJVVDs0hFRWYlIjN2NxcZtCrlpJoiXYI0tSuP5U"
+    "hFES5D2KPQrsw4pqQol6A8XVHEY3IDWQ9IkunpWvPckD6re0Lh/B+Nxvn5RaN23r5sNS8u"
+    "Wpe1TVyfrSoK8LuD9zzeTHhdSd6CGYcHhAlvbKYT8j8CTqmdQvCZ/Ai43i7xEXA9HdVEHw"
+    "Hzqixpw1rybGlF0JHW6XFuN0twbjdzOfOq1B4Ytaykq2UltawkX1bagJcsJ8U7JX8ZiT3X"
+    "668eqVWhfa4Kib8VnFIofxInU6QO/2i1ypz+0WrlH//B6zIuqQreQPwU6daal6UOV2leFh"
+    "yvwitTH4KIM2mmaMb8kMj2VzASUt39RQLntYM2GonlAWbt2Yyr+upApLfHxYHQQB/t2sAM"
+    "I7IAQY5MOj8r5C5TV2szFfgvsTdFgEdAVYx3Umt/Npxv7wlb89pz4zIHZNXzD8iqZw7ICq"
+    "Cxm4jcTgXrLdHcn+1ut1rn7SMx31PPXIElpBThSpmetN7ppSBa9UaJ8cykcge0qJPgtniW"
+    "co6eKlrujK4y2xXMtqDn+IQyq0ANyXElL7NPaquYpcJBcHxdHLB7IvwAbUCQUcGWy5VPKL"
+    "e/M2OuPpjIR33CH0yog4NOrNcl21eqHhyUSoJIYuduoPfu4y2yYc5UUHpQ9JENgrzMfHIz"
+    "kDi4KHFi0fa4pIcmnSK1zLcj2zOTfbRyKshec+Wmg7BlLHTZ6e7rmjeFJ7tHMmrd5rjCvv"
+    "x1my02bvzspo1DexX3sHrDX6oKhAPxE6Rbr5VL/BVl/jKpP3ZHKj2o/a/xaJi7bZTKT2k3"
+    "LYNq/2q2RY5x50YBXA4jEa9mtr+nd7qnAlF+ga5sZ8c+tyE8/weocUnc"
+)
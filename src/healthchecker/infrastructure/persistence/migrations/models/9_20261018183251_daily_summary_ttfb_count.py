@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # Older summaries do not record how many checks measured a TTFB. Their
+    # checks_count is the closest weight; 0 would drop their average when
+    # merged with a running summary.
+    return """
+        ALTER TABLE `daily_health_summaries` ADD `ttfb_count` INT NOT NULL DEFAULT 0;
+        UPDATE `daily_health_summaries` SET `ttfb_count` = `checks_count`
+            WHERE `avg_ttfb_ms` IS NOT NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE `daily_health_summaries` DROP COLUMN `ttfb_count`;"""
+
+
+MODELS_STATE = (
+    "eJztnG1z2jgQgP+Kx59yM70OECC5+waEtlwT6AR67TTT0QhbgCd+4SQ5CdPLfz9J2PhNdm"
+    "xKKHD6lCBpbfmRvLvalfVDdzwT2eRtx0aY3vD/9T+1H7oLHcT+kdS+0XS4XEZ1vIDCqS2a"
+    "Q95OFMEpoRgalJXOoE0QKzIRMbC1pJbnslLXt21e6BmsoeXOoyLftf7xEaDeHNEFwqzi7j"
+    "srtlwTPSHCf97pFgEEuZTfycAIUmQCSPXvvN3yHswsZJuJ57BM3lSUA7pairKBS9+Jhrwb"
+    "U2B4tu+4UePlii48d9PaWt9tjlyE+f1YGcU+fy7e7QBA+KjrR4iarPsekzHRDPo2jXGYgq"
+    "hMB2A4moBxfwKAXoGc4bmcOusqEU8/5134vVFvXjQvz9vNS9ZEdHNTcvG8vnUEZi0o8Awn"
+    "+rOohxSuWwj4EVQx2mtAGbi9BcRyukmpFGXW/TTlkGkR5rAg4hxNun2AduATsJE7pwtOt1"
+    "ZA9e/Obe9D5/asUfuN39Bj78j61RkGNQ1RxcHH3kJECJxLKE/QU84cjomcBOICpJP+1wm/"
+    "skPIP3Yc5dlN56ug7KyCmuvR8H3YPIa+dz3qppDHFEwSedfzbATdHM0RSaWoT5nYa2HflO"
+    "yXe3c0uk5w7w7SYD/fdPu3Z3UxCKyRRVFcs0S0Yzo8A/yK1VDLQXLiSckUdDMQfRv+c4QT"
+    "X2cPaI5cexUYj6IXYXDTH086N58So3LVmfR5TSPxJoSlZ+2UHtpcRPsymHzQ+E/t22jYF3"
+    "g9QudY3DFqN/mm8z5Bn3rA9R4BNGN2LiwNqSVG3cc2qGSYI4GXjfMxDO0O7DP3eGb3UvPM"
+    "aGXZvvMwsubuR7QSiAesQ9A1ZHYicP0+Y3vj+B0Z3+dw/oSl0bzE8HHjJcamFXt89qhora"
+    "Z6nXGvc9XXBeMpNO4fITZBAjav8RpeqmTTNlvlNJx0CXSZnTaDh+BdDsD3WLc922Kqiz32"
+    "F0YdOxDf57roRc0LfXYjLggeQ8lSTrw+ZvxtpGHvUVt4tsl+acxn12xIqGbClfa48AjSiO"
+    "+wS1qIaBAjzfCcJWf8Vk+N4s9f7eWlg1oh7HOFEM0tZqLpAnv+fCG38DnWPUe+yM4fr6KS"
+    "MeZ2OuUs+UtzS2cpKamcpUNxlkJGMW9J9D5j3H+NJbqClr0aC627yrU/2UaFVsfkzcECQZ"
+    "suwEaj7z5ydBe6QUI1fFfW4Bdag1A7l9X+Yfv/tbY3Fsi4J4yKL4tG5M7JtJhaMEnCDvBh"
+    "DiidTYFDJCsl24M5cFNyKbYzLliCbvBqHwrcomk5+ty97mufbvu9wXgwGiaNo6hMRnhu+5"
+    "3rdAzTcrdinZJTrMuwhk/bsU7KKdYlWAteVbVzUmh/url2JIqZv/SE2IAt+gnAyGE34rcv"
+    "Dzj/AlvBPrApvWvcazd8VXkaZ+SUlyGh67vb8pVIKsISwjxACBaULgGhkPoSo5eLWCaqVE"
+    "QOYq5R0dPSwutYcf56Lj8EVXSdHQSkDmwUjjf+lM3WiZETy8qtYo8ScTXehzzeKiefr1yP"
+    "M8yscvIqJ/+r+R53Tv6DcMd73IrlJkIybd4U5UGCDMg6XLv79Edm42zENWaLWau7xG+VF9"
+    "lnXmS7lYtatLy4aNkmBqrin9XinztYE6rl4GH5iaWWBz8VnlWh2bIqzCLBJolVFu9LW9Fj"
+    "gmo3eoXd6AhjD4MtPrrICG716cWBzeh9f3mxfYhp59GlA108nYT9MF1S1TWLRJRnVsIzY3"
+    "dzkUGrUk6KKdJl9gDYledyJKIIlyHsUWhXZhwTUpRLUJ6uKOI+uYGsBySJ9HStea5Ln5U9"
+    "IXf+j0bj/PyiUTtvX7aaFxety9rGr89WFTn43cF77m8mrK4kbsGUwwPChHc2Mwj5X1anxE"
+    "7B+Ux+WV1vl/iyup72aqIvq3lVlrRhLXm0tCLoSOr0OLebJTi3m7mceVVqD4xKK+kqraTS"
+    "SvK00ga8JJ0UH5T8NBJ7rtfPHqms0D6zQuJvBaMUtj+J4z5SJ6q0WmWOVGm18s9U4XUZk1"
+    "QFb9D8FOnWmpelTqxpXhacWcMrU1/XiIN+pmjG7JCI9ldQElLZ/XkC58eyUd4igGl7tuKq"
+    "nh2I5PaYHAgV9NHmBmYYkQUIYmTS9Vkhd5m4ys1U4L/E3hQB7gFVUd5Jqf3pcL69J+zNa6"
+    "+Ny5w6Vs8/dayeOXUsgMZuImI7FbS3RHJ/urvdap23j0R9Tz1zBZaQUoQrRXrScqcXgmjV"
+    "GyXmM2uVO6FFnQS3xaOUc/RUUXNnZJXarqC2BT3HJ5RpBWpIzoB5mX1SWvksFU7X43lxwO"
+    "6J8AO0AUFGBV0uFz6h2P7OlLn6YCIf9Ql/MKFOYzqxUZdsX6l6GlMqCCLxnbuB3LuPt8iG"
+    "OUtB6enbRzYJ8iLzyc1A4jSoxDFQ2+OSnkR1itQy345sz0z20cqpIHvNzE0HYctY6LIj89"
+    "c1bwqPy4/aqLzNcbl9+XmbLTZu/OymjUN7FfeQveEvVQXCQfMTpFuvlQv8FUX+MqE/dkcq"
+    "Pf3+r/FomLttlMqPvjctg2r/arZFjnHnRgFcDiPhr2a2v6d3uqccUX6Brmxnxz63ITz/B1"
+    "8EtPs="
+)
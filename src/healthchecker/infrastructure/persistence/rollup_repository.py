@@ -0,0 +1,124 @@
+from datetime import datetime
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.rollup import Resolution, Rollup
+from healthchecker.domain.repositories.rollup_repository import (
+    RollupRepository as RollupRepositoryInterface,
+)
+from healthchecker.infrastructure.persistence.tortoise_models import (
+    FiveMinuteRollupModel,
+    HourlyRollupModel,
+    RollupModel,
+)
+
+_MODELS: dict[Resolution, type[RollupModel]] = {
+    Resolution.FIVE_MINUTES: FiveMinuteRollupModel,
+    Resolution.HOUR: HourlyRollupModel,
+}
+_UPSERT_FIELDS = (
+    "checks_count",
+    "healthy_count",
+    "ttfb_count",
+    "avg_ttfb_ms",
+    "min_ttfb_ms",
+    "max_ttfb_ms",
+    "ttfb_sketch",
+)
+
+
+class TortoiseRollupRepository(RollupRepositoryInterface):
+    """5-minute and hourly rollups, one table per resolution."""
+
+    def __init__(self, connection_name: str | None = None):
+        self._connection_name = connection_name
+
+    async def save_many(self, rollups: list[Rollup]) -> None:
+        for resolution, model in _MODELS.items():
+            rows = [
+                model(
+                    url_id=r.url_id,
+                    bucket_start=r.bucket_start,
+                    checks_count=r.checks_count,
+                    healthy_count=r.healthy_count,
+                    ttfb_count=r.ttfb_count,
+                    avg_ttfb_ms=r.avg_ttfb_ms,
+                    min_ttfb_ms=r.min_ttfb_ms,
+                    max_ttfb_ms=r.max_ttfb_ms,
+                    ttfb_sketch=r.ttfb_sketch.to_bytes() if r.ttfb_sketch else None,
+                )
+                for r in rollups
+                if r.resolution is resolution
+            ]
+            if rows:
+                await model.bulk_create(
+                    rows,
+                    on_conflict=("url_id", "bucket_start"),
+                    update_fields=_UPSERT_FIELDS,
+                    batch_size=1000,
+                    using_db=self._db(),
+                )
+
+    async def get_range(
+        self, resolution: Resolution, start: datetime, end: datetime
+    ) -> list[Rollup]:
+        rows = (
+            await _MODELS[resolution]
+            .filter(bucket_start__gte=start, bucket_start__lt=end)
+            .using_db(self._db())
+            .order_by("bucket_start")
+        )
+        return [self._to_domain(r, resolution) for r in rows]
+
+    async def get_range_for_url(
+        self, resolution: Resolution, url_id: int, start: datetime, end: datetime
+    ) -> list[Rollup]:
+        rows = (
+            await _MODELS[resolution]
+            .filter(url_id=url_id, bucket_start__gte=start, bucket_start__lt=end)
+            .using_db(self._db())
+            .order_by("bucket_start")
+        )
+        return [self._to_domain(r, resolution) for r in rows]
+
+    async def get_latest_bucket_start(self, resolution: Resolution) -> datetime | None:
+        return (
+            await _MODELS[resolution]
+            .all()
+            .using_db(self._db())
+            .order_by("-bucket_start")
+            .first()
+            .values_list("bucket_start", flat=True)
+        )
+
+    async def purge_older_than(self, resolution: Resolution, cutoff: datetime) -> int:
+        return (
+            await _MODELS[resolution]
+            .filter(bucket_start__lt=cutoff)
+            .using_db(self._db())
+            .delete()
+        )
+
+    def _db(self) -> BaseDBAsyncClient | None:
+        if self._connection_name is None:
+            return None
+        return connections.get(self._connection_name)
+
+    @staticmethod
+    def _to_domain(row: RollupModel, resolution: Resolution) -> Rollup:
+        return Rollup(
+            url_id=row.url_id,
+            resolution=resolution,
+            bucket_start=row.bucket_start,
+            checks_count=row.checks_count,
+            healthy_count=row.healthy_count,
+            ttfb_count=row.ttfb_count,
+            avg_ttfb_ms=row.avg_ttfb_ms,
+            min_ttfb_ms=row.min_ttfb_ms,
+            max_ttfb_ms=row.max_ttfb_ms,
+            ttfb_sketch=(
+                LatencySketch.from_bytes(row.ttfb_sketch) if row.ttfb_sketch else None
+            ),
+        )
@@ -4,20 +4,32 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+HOUSEKEEPING_CONNECTION = "housekeeping"
+
+
+def _mysql_connection(maxsize: int) -> dict:
+    return {
+        "engine": "tortoise.backends.mysql",
+        "credentials": {
+            "host": os.getenv("DB_HOST", "localhost"),
+            "port": int(os.getenv("DB_PORT", "3306")),
+            "user": os.getenv("DB_USER", "healthchecker"),
+            "password": os.getenv("DB_PASSWORD", "healthchecker"),
+            "database": os.getenv("DB_NAME", "healthchecker"),
+            "minsize": 1,
+            "maxsize": maxsize,
+        },
+    }
+
+
 TORTOISE_CONFIG = {
     "connections": {
-        "default": {
-            "engine": "tortoise.backends.mysql",
-            "credentials": {
-                "host": os.getenv("DB_HOST", "localhost"),
-                "port": int(os.getenv("DB_PORT", "3306")),
-                "user": os.getenv("DB_USER", "healthchecker"),
-                "password": os.getenv("DB_PASSWORD", "healthchecker"),
-                "database": os.getenv("DB_NAME", "healthchecker"),
-                "minsize": 1,
-                "maxsize": 5,
-            },
-        },
+        "default": _mysql_connection(5),
+        # Consolidation and purging get their own small pool so long
+        # housekeeping queries never hold connections the checks need.
+        HOUSEKEEPING_CONNECTION: _mysql_connection(
+            int(os.getenv("DB_HOUSEKEEPING_POOL_SIZE", "2"))
+        ),
     },
     "apps": {
         "models": {
@@ -7,6 +7,13 @@ class UrlModel(models.Model):
     url = fields.CharField(max_length=2048)
     alert_before_days = fields.IntField(default=30)
     is_active = fields.BooleanField(default=True)
+    fresh_connection = fields.BooleanField(default=False)
+    probe_mode = fields.CharField(max_length=10, default="head")
+    probe_max_bytes = fields.IntField(default=65536)
+    body_pattern = fields.CharField(max_length=512, null=True)
+    body_is_regex = fields.BooleanField(default=False)
+    body_must_match = fields.BooleanField(default=True)
+    check_interval_sec = fields.IntField(null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
@@ -24,9 +31,17 @@ class HealthCheckModel(models.Model):
     is_healthy = fields.BooleanField(default=False)
     error_message = fields.TextField(null=True)
     checked_at = fields.DatetimeField()
+    dns_ms = fields.FloatField(null=True)
+    connect_ms = fields.FloatField(null=True)
+    tls_ms = fields.FloatField(null=True)
+    total_ms = fields.FloatField(null=True)
+    bytes_received = fields.BigIntField(null=True)
+    tls_version = fields.CharField(max_length=16, null=True)
+    tls_cipher = fields.CharField(max_length=64, null=True)
 
     class Meta:
         table = "health_checks"
+        indexes = (("url_id", "checked_at"), ("checked_at",))
 
     class PydanticMeta:
         exclude = ("url",)
@@ -42,6 +57,7 @@ class AlertModel(models.Model):
 
     class Meta:
         table = "alerts"
+        indexes = (("is_sent", "created_at"),)
 
     class PydanticMeta:
         exclude = ("url",)
@@ -55,6 +71,9 @@ class DailySummaryModel(models.Model):
     avg_ttfb_ms = fields.FloatField(null=True)
     min_ttfb_ms = fields.FloatField(null=True)
     max_ttfb_ms = fields.FloatField(null=True)
+    ttfb_count = fields.IntField(default=0)
+    # Serialized LatencySketch of the day's TTFBs.
+    ttfb_sketch = fields.BinaryField(null=True)
     min_ssl_days_remaining = fields.IntField(null=True)
     healthy_count = fields.IntField()
     unhealthy_count = fields.IntField()
@@ -69,3 +88,70 @@ class DailySummaryModel(models.Model):
 
     class PydanticMeta:
         exclude = ("url",)
+
+
+class ConsolidationWatermarkModel(models.Model):
+    """Single row holding the last day whose summaries are complete."""
+
+    id = fields.IntField(pk=True)
+    consolidated_through = fields.DateField()
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "consolidation_watermark"
+
+
+class RollupModel(models.Model):
+    """Checks of one URL within one time bucket, see the rollup tiers below."""
+
+    id = fields.IntField(pk=True)
+    url = fields.ForeignKeyField("models.UrlModel", related_name=False)
+    bucket_start = fields.DatetimeField()
+    checks_count = fields.IntField()
+    healthy_count = fields.IntField()
+    ttfb_count = fields.IntField(default=0)
+    avg_ttfb_ms = fields.FloatField(null=True)
+    min_ttfb_ms = fields.FloatField(null=True)
+    max_ttfb_ms = fields.FloatField(null=True)
+    ttfb_sketch = fields.BinaryField(null=True)
+
+    class Meta:
+        abstract = True
+
+    class PydanticMeta:
+        exclude = ("url",)
+
+
+class FiveMinuteRollupModel(RollupModel):
+    class Meta:
+        table = "health_check_rollups_5m"
+        unique_together = (("url", "bucket_start"),)
+        indexes = (("bucket_start",),)
+
+
+class HourlyRollupModel(RollupModel):
+    class Meta:
+        table = "health_check_rollups_1h"
+        unique_together = (("url", "bucket_start"),)
+        indexes = (("bucket_start",),)
+
+
+class UrlStatusModel(models.Model):
+    """Current state of each URL, upserted after every check."""
+
+    url = fields.OneToOneField("models.UrlModel", related_name=False, pk=True)
+    http_status = fields.IntField(null=True)
+    ttfb_ms = fields.FloatField(null=True)
+    ssl_expiration_date = fields.DatetimeField(null=True)
+    ssl_days_remaining = fields.IntField(null=True)
+    is_healthy = fields.BooleanField()
+    error_message = fields.TextField(null=True)
+    consecutive_failures = fields.IntField(default=0)
+    last_checked_at = fields.DatetimeField()
+    state_changed_at = fields.DatetimeField()
+
+    class Meta:
+        table = "url_status"
+
+    class PydanticMeta:
+        exclude = ("url",)
@@ -1,4 +1,4 @@
-from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url import BodyAssertion, ProbeMode, Url
 from healthchecker.domain.repositories.url_repository import (
     UrlRepository as UrlRepositoryInterface,
 )
@@ -20,6 +20,11 @@ class TortoiseUrlRepository(UrlRepositoryInterface):
             url=url.url,
             alert_before_days=url.alert_before_days,
             is_active=url.is_active,
+            fresh_connection=url.fresh_connection,
+            probe_mode=url.probe_mode.value,
+            probe_max_bytes=url.probe_max_bytes,
+            **self._body_assertion_fields(url.body_assertion),
+            check_interval_sec=url.check_interval_sec,
         )
         return self._to_domain(row)
 
@@ -29,6 +34,11 @@ class TortoiseUrlRepository(UrlRepositoryInterface):
             url=url.url,
             alert_before_days=url.alert_before_days,
             is_active=url.is_active,
+            fresh_connection=url.fresh_connection,
+            probe_mode=url.probe_mode.value,
+            probe_max_bytes=url.probe_max_bytes,
+            **self._body_assertion_fields(url.body_assertion),
+            check_interval_sec=url.check_interval_sec,
         )
         return url
 
@@ -45,4 +55,27 @@ class TortoiseUrlRepository(UrlRepositoryInterface):
             is_active=row.is_active,
             created_at=row.created_at,
             updated_at=row.updated_at,
+            fresh_connection=row.fresh_connection,
+            probe_mode=ProbeMode(row.probe_mode),
+            probe_max_bytes=row.probe_max_bytes,
+            body_assertion=(
+                BodyAssertion(row.body_pattern, row.body_is_regex, row.body_must_match)
+                if row.body_pattern is not None
+                else None
+            ),
+            check_interval_sec=row.check_interval_sec,
         )
+
+    @staticmethod
+    def _body_assertion_fields(assertion: BodyAssertion | None) -> dict:
+        if assertion is None:
+            return {
+                "body_pattern": None,
+                "body_is_regex": False,
+                "body_must_match": True,
+            }
+        return {
+            "body_pattern": assertion.pattern,
+            "body_is_regex": assertion.is_regex,
+            "body_must_match": assertion.must_match,
+        }
@@ -0,0 +1,73 @@
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from healthchecker.domain.models.url_status import UrlStatus
+from healthchecker.domain.repositories.url_status_repository import (
+    UrlStatusRepository as UrlStatusRepositoryInterface,
+)
+from healthchecker.infrastructure.persistence.tortoise_models import UrlStatusModel
+
+_UPSERT_FIELDS = (
+    "http_status",
+    "ttfb_ms",
+    "ssl_expiration_date",
+    "ssl_days_remaining",
+    "is_healthy",
+    "error_message",
+    "consecutive_failures",
+    "last_checked_at",
+    "state_changed_at",
+)
+
+
+class TortoiseUrlStatusRepository(UrlStatusRepositoryInterface):
+    def __init__(self, connection_name: str | None = None):
+        self._connection_name = connection_name
+
+    async def save_many(self, statuses: list[UrlStatus]) -> None:
+        """Upserts one row per URL on its primary key."""
+        if not statuses:
+            return
+        await UrlStatusModel.bulk_create(
+            [
+                UrlStatusModel(
+                    url_id=s.url_id,
+                    **{field: getattr(s, field) for field in _UPSERT_FIELDS},
+                )
+                for s in statuses
+            ],
+            on_conflict=("url_id",),
+            update_fields=_UPSERT_FIELDS,
+            batch_size=1000,
+            using_db=self._db(),
+        )
+
+    async def get_for_urls(self, url_ids: list[int]) -> list[UrlStatus]:
+        if not url_ids:
+            return []
+        rows = await UrlStatusModel.filter(url_id__in=url_ids).using_db(self._db())
+        return [self._to_domain(r) for r in rows]
+
+    async def get_all(self) -> list[UrlStatus]:
+        rows = await UrlStatusModel.all().using_db(self._db())
+        return [self._to_domain(r) for r in rows]
+
+    def _db(self) -> BaseDBAsyncClient | None:
+        if self._connection_name is None:
+            return None
+        return connections.get(self._connection_name)
+
+    @staticmethod
+    def _to_domain(row: UrlStatusModel) -> UrlStatus:
+        return UrlStatus(
+            url_id=row.url_id,
+            http_status=row.http_status,
+            ttfb_ms=row.ttfb_ms,
+            ssl_expiration_date=row.ssl_expiration_date,
+            ssl_days_remaining=row.ssl_days_remaining,
+            is_healthy=row.is_healthy,
+            error_message=row.error_message,
+            consecutive_failures=row.consecutive_failures,
+            last_checked_at=row.last_checked_at,
+            state_changed_at=row.state_changed_at,
+        )
@@ -0,0 +1,156 @@
+import asyncio
+import contextlib
+import logging
+from datetime import date
+
+from healthchecker.application.use_cases.consolidate_rollups import (
+    ConsolidateRollupsUseCase,
+)
+from healthchecker.application.use_cases.consolidate_summaries import (
+    ConsolidateDailySummariesUseCase,
+)
+from healthchecker.application.use_cases.flush_daily_aggregates import (
+    FlushDailyAggregatesUseCase,
+)
+from healthchecker.application.use_cases.flush_url_statuses import (
+    FlushUrlStatusesUseCase,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HousekeepingJob:
+    """Runs daily consolidation and purging next to the check scheduler.
+
+    Every ``interval_sec`` it consolidates if today's run has not completed
+    yet. A run stops once ``time_budget_sec`` is used up and the rest is
+    picked up on the next wake-up, so housekeeping never holds the event
+    loop or the database for long.
+    """
+
+    def __init__(
+        self,
+        consolidate_use_case: ConsolidateDailySummariesUseCase,
+        interval_sec: float = 3600,
+        time_budget_sec: float | None = 120,
+    ):
+        self._consolidate = consolidate_use_case
+        self._interval = interval_sec
+        self._time_budget = time_budget_sec
+        self._stopped = asyncio.Event()
+        self._last_consolidation_date: date | None = None
+
+    async def start(self):
+        self._stopped.clear()
+        logger.info(
+            "Housekeeping started (interval: %ds, budget: %ss)",
+            self._interval,
+            self._time_budget,
+        )
+        while not self._stopped.is_set():
+            if self._should_consolidate():
+                await self._try_consolidation()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+
+    async def stop(self):
+        self._stopped.set()
+        logger.info("Housekeeping stopped")
+
+    def _should_consolidate(self) -> bool:
+        return self._last_consolidation_date != date.today()
+
+    async def _try_consolidation(self):
+        try:
+            count = await self._consolidate.execute(self._time_budget)
+            if self._consolidate.last_run_complete:
+                self._last_consolidation_date = date.today()
+            if count:
+                logger.info("Consolidation complete: %d summaries created", count)
+        except Exception as e:
+            logger.error("Consolidation error: %s", e, exc_info=True)
+
+
+class AggregateFlushJob:
+    """Writes the running daily summaries every ``interval_sec`` and on stop."""
+
+    def __init__(
+        self, flush_use_case: FlushDailyAggregatesUseCase, interval_sec: float = 60
+    ):
+        self._flush = flush_use_case
+        self._interval = interval_sec
+        self._stopped = asyncio.Event()
+
+    async def start(self):
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+            if not self._stopped.is_set():
+                await self._try_flush()
+
+    async def stop(self):
+        self._stopped.set()
+        await self._try_flush()
+
+    async def _try_flush(self):
+        try:
+            await self._flush.execute()
+        except Exception as e:
+            logger.error("Daily summary flush error: %s", e, exc_info=True)
+
+
+class UrlStatusFlushJob:
+    """Writes the changed URL statuses every ``interval_sec`` and on stop."""
+
+    def __init__(
+        self, flush_use_case: FlushUrlStatusesUseCase, interval_sec: float = 2
+    ):
+        self._flush = flush_use_case
+        self._interval = interval_sec
+        self._stopped = asyncio.Event()
+
+    async def start(self):
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+            if not self._stopped.is_set():
+                await self._try_flush()
+
+    async def stop(self):
+        self._stopped.set()
+        await self._try_flush()
+
+    async def _try_flush(self):
+        try:
+            await self._flush.execute()
+        except Exception as e:
+            logger.error("URL status flush error: %s", e, exc_info=True)
+
+
+class RollupJob:
+    """Fills the 5-minute and hourly rollup tiers every ``interval_sec``."""
+
+    def __init__(
+        self, rollup_use_case: ConsolidateRollupsUseCase, interval_sec: float = 300
+    ):
+        self._rollup = rollup_use_case
+        self._interval = interval_sec
+        self._stopped = asyncio.Event()
+
+    async def start(self):
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            await self._try_rollup()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopped.wait(), self._interval)
+
+    async def stop(self):
+        self._stopped.set()
+
+    async def _try_rollup(self):
+        try:
+            await self._rollup.execute()
+        except Exception as e:
+            logger.error("Rollup error: %s", e, exc_info=True)
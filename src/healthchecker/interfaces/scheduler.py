@@ -1,60 +1,319 @@
 import asyncio
+import contextlib
+import heapq
 import logging
+import random
+import time
 from collections.abc import Awaitable, Callable
-from datetime import date
+from dataclasses import dataclass, field
 
-from healthchecker.application.use_cases.check_all_urls import CheckAllUrlsUseCase
-from healthchecker.application.use_cases.consolidate_summaries import (
-    ConsolidateDailySummariesUseCase,
+from healthchecker.application.use_cases.check_all_urls import (
+    CheckAllUrlsUseCase,
+    host_of,
 )
+from healthchecker.domain.models.url import Url
 from healthchecker.domain.repositories.alert_repository import AlertRepository
 from healthchecker.infrastructure.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single sleep, so stop() and new URLs are noticed quickly.
+_MAX_SLEEP_SEC = 1.0
+
+OVERRUN_SKIP = "skip"
+OVERRUN_COALESCE = "coalesce"
+
+
+@dataclass
+class SchedulerStats:
+    checks_dispatched: int = 0
+    overruns: int = 0
+    skipped_ticks: int = 0
+    coalesced_ticks: int = 0
+    total_lag_sec: float = 0.0
+    max_lag_sec: float = 0.0
+    periods_measured: int = 0
+    total_period_ratio: float = 0.0
+    checks_completed: int = 0
+    total_check_sec: float = 0.0
+    max_check_sec: float = 0.0
+    # Checks due but still waiting for a global or per-host slot.
+    waiting: int = 0
+    running_by_host: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def running(self) -> int:
+        return sum(self.running_by_host.values())
+
+    @property
+    def avg_check_ms(self) -> float:
+        if not self.checks_completed:
+            return 0.0
+        return self.total_check_sec / self.checks_completed * 1000
+
+    @property
+    def avg_lag_ms(self) -> float:
+        if not self.checks_dispatched:
+            return 0.0
+        return self.total_lag_sec / self.checks_dispatched * 1000
+
+    @property
+    def avg_period_ratio(self) -> float | None:
+        if not self.periods_measured:
+            return None
+        return self.total_period_ratio / self.periods_measured
+
+
+class DueQueue:
+    """Min-heap of active URLs keyed by the monotonic time they are next due.
+
+    New URLs get a random first slot within their interval, so checks are
+    spread out instead of all firing at once. Later slots stay on that
+    fixed-rate grid. When a check finishes after its next slot, the missed
+    slots are either skipped (next run on the grid) or coalesced into one
+    immediate catch-up run. Entries for removed URLs are left in the heap
+    and skipped when popped.
+    """
+
+    def __init__(self, default_interval_sec: float, coalesce: bool = False):
+        self._default_interval = default_interval_sec
+        self._coalesce = coalesce
+        self._heap: list[tuple[float, int]] = []
+        self._urls: dict[int, Url] = {}
+        self._due: dict[int, float] = {}
+        self._last_started: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    @property
+    def coalesces(self) -> bool:
+        return self._coalesce
+
+    def interval_of(self, url: Url) -> float:
+        return url.check_interval_sec or self._default_interval
+
+    def sync(self, urls: list[Url], now: float) -> None:
+        active = {url.id: url for url in urls}
+        for url_id in self._urls.keys() - active.keys():
+            del self._urls[url_id]
+            self._due.pop(url_id, None)
+            self._last_started.pop(url_id, None)
+        for url_id, url in active.items():
+            if url_id not in self._urls:
+                self._schedule(url_id, now + random.uniform(0, self.interval_of(url)))
+            self._urls[url_id] = url
+
+    def pop_due(self, now: float) -> list[tuple[Url, float]]:
+        due: list[tuple[Url, float]] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, url_id = heapq.heappop(self._heap)
+            if self._due.get(url_id) == due_at:
+                del self._due[url_id]
+                due.append((self._urls[url_id], due_at))
+        return due
+
+    def record_start(self, url: Url, now: float) -> float | None:
+        """Returns the achieved period as a fraction of the URL's interval."""
+        previous = self._last_started.get(url.id)
+        self._last_started[url.id] = now
+        if previous is None:
+            return None
+        return (now - previous) / self.interval_of(url)
+
+    def reschedule(self, url: Url, due_at: float, now: float) -> int:
+        """Queues the URL's next slot and returns how many slots were missed."""
+        if url.id not in self._urls or url.id in self._due:
+            return 0
+        interval = self.interval_of(self._urls[url.id])
+        next_due = due_at + interval
+        missed = 0
+        if next_due <= now:
+            missed = int((now - next_due) // interval) + 1
+            next_due = now if self._coalesce else next_due + missed * interval
+        self._schedule(url.id, next_due)
+        return missed
+
+    def next_due(self) -> float | None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _schedule(self, url_id: int, due_at: float) -> None:
+        self._due[url_id] = due_at
+        heapq.heappush(self._heap, (due_at, url_id))
+
 
 class Scheduler:
     def __init__(
         self,
         check_all_urls: CheckAllUrlsUseCase,
-        consolidate_use_case: ConsolidateDailySummariesUseCase | None = None,
         alert_repo: AlertRepository | None = None,
         send_alert: Callable[[str], Awaitable[None]] | None = None,
+        stats: SchedulerStats | None = None,
     ):
         self._check_all_urls = check_all_urls
-        self._consolidate = consolidate_use_case
         self._alert_repo = alert_repo
         self._send_alert = send_alert
         self._running = False
-        self._last_consolidation_date: date | None = None
+        policy = settings.scheduler_overrun_policy
+        if policy not in (OVERRUN_SKIP, OVERRUN_COALESCE):
+            logger.warning("Unknown overrun policy %r, using %r", policy, OVERRUN_SKIP)
+        self._queue = DueQueue(
+            settings.check_interval_sec, coalesce=policy == OVERRUN_COALESCE
+        )
+        self.stats = stats or SchedulerStats()
+        self._slots = (
+            asyncio.Semaphore(settings.check_max_concurrency)
+            if settings.check_max_concurrency > 0
+            else None
+        )
+        # host -> [semaphore, tasks holding or waiting on it]
+        self._host_slots: dict[str, list] = {}
+        self._in_flight: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
 
     async def start(self):
         self._running = True
-        logger.info("Scheduler started (interval: %ds)", settings.check_interval_sec)
-
-        await self._try_consolidation()
+        logger.info(
+            "Scheduler started (default interval: %ds)", settings.check_interval_sec
+        )
 
+        next_sync = time.monotonic()
         while self._running:
-            try:
-                alerts = await self._check_all_urls.execute()
-                if alerts:
-                    logger.info("%d alerts generated", len(alerts))
-                    await self._dispatch_alerts(alerts)
-            except Exception as e:
-                logger.error("Scheduler error: %s", e, exc_info=True)
+            now = time.monotonic()
+            if now >= next_sync:
+                await self._sync_urls(now)
+                next_sync = now + settings.check_interval_sec
+
+            # Every due URL runs as its own task and is rescheduled when its
+            # own check finishes, so a slow URL never holds up the others.
+            for url, due_at in self._queue.pop_due(now):
+                task = asyncio.create_task(self._check(url, due_at))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
 
-            if self._should_consolidate():
-                await self._try_consolidation()
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._sleep_time(next_sync))
 
-            await asyncio.sleep(settings.check_interval_sec)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
 
     async def stop(self):
         self._running = False
+        self._wakeup.set()
         logger.info("Scheduler stopped")
 
-    def _should_consolidate(self) -> bool:
-        today = date.today()
-        return self._last_consolidation_date != today
+    async def _sync_urls(self, now: float) -> None:
+        try:
+            urls = await self._check_all_urls.list_active()
+        except Exception as e:
+            logger.error("Failed to load URLs: %s", e, exc_info=True)
+            return
+        self._queue.sync(urls, now)
+
+    async def _check(self, url: Url, due_at: float) -> None:
+        host = host_of(url)
+        self.stats.waiting += 1
+        dispatched = False
+        try:
+            async with self._host_slot(url), self._slots or contextlib.nullcontext():
+                self.stats.waiting -= 1
+                dispatched = True
+                started = time.monotonic()
+                self._record_dispatch(url, due_at, started)
+                self._count_running(host, 1)
+                try:
+                    await self._run_checks([url])
+                finally:
+                    self._count_running(host, -1)
+                    self._record_check_time(time.monotonic() - started)
+        finally:
+            if not dispatched:
+                self.stats.waiting -= 1
+            self._reschedule(url, due_at, time.monotonic())
+            self._wakeup.set()
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, url: Url):
+        """Holds one of the URL's host slots, capped by CHECK_PER_HOST_CONCURRENCY.
+
+        It is taken before the global slot, so URLs waiting on a busy host
+        do not hold up other hosts.
+        """
+        if settings.check_per_host_concurrency <= 0:
+            yield
+            return
+        host = host_of(url)
+        entry = self._host_slots.get(host)
+        if entry is None:
+            entry = self._host_slots[host] = [
+                asyncio.Semaphore(settings.check_per_host_concurrency),
+                0,
+            ]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._host_slots[host]
+
+    async def _run_checks(self, urls: list[Url]) -> None:
+        try:
+            alerts = await self._check_all_urls.check_urls(urls)
+            if alerts:
+                logger.info("%d alerts generated", len(alerts))
+                await self._dispatch_alerts(alerts)
+        except Exception as e:
+            logger.error("Scheduler error: %s", e, exc_info=True)
+
+    def _record_dispatch(self, url: Url, due_at: float, now: float) -> None:
+        # Lag runs until the check actually starts, waits for a slot included.
+        lag = now - due_at
+        self.stats.checks_dispatched += 1
+        self.stats.total_lag_sec += lag
+        self.stats.max_lag_sec = max(self.stats.max_lag_sec, lag)
+        ratio = self._queue.record_start(url, now)
+        if ratio is not None:
+            self.stats.periods_measured += 1
+            self.stats.total_period_ratio += ratio
+
+    def _count_running(self, host: str, delta: int) -> None:
+        running = self.stats.running_by_host
+        running[host] = running.get(host, 0) + delta
+        if not running[host]:
+            del running[host]
+
+    def _record_check_time(self, duration: float) -> None:
+        self.stats.checks_completed += 1
+        self.stats.total_check_sec += duration
+        self.stats.max_check_sec = max(self.stats.max_check_sec, duration)
+
+    def _reschedule(self, url: Url, due_at: float, now: float) -> None:
+        missed = self._queue.reschedule(url, due_at, now)
+        if not missed:
+            return
+        self.stats.overruns += 1
+        if self._queue.coalesces:
+            self.stats.coalesced_ticks += missed
+        else:
+            self.stats.skipped_ticks += missed
+        logger.warning(
+            "Check of %s overran its slot; %d ticks %s",
+            url.url,
+            missed,
+            "coalesced" if self._queue.coalesces else "skipped",
+        )
+
+    def _sleep_time(self, next_sync: float) -> float:
+        wake_at = next_sync
+        next_due = self._queue.next_due()
+        if next_due is not None:
+            wake_at = min(wake_at, next_due)
+        return min(max(wake_at - time.monotonic(), 0.0), _MAX_SLEEP_SEC)
 
     async def _dispatch_alerts(self, alerts):
         for alert in alerts:
@@ -65,14 +324,3 @@ class Scheduler:
                     logger.error("Failed to send alert: %s", e, exc_info=True)
             if self._alert_repo and alert.id is not None:
                 await self._alert_repo.mark_as_sent(alert.id)
-
-    async def _try_consolidation(self):
-        if not self._consolidate:
-            return
-        try:
-            count = await self._consolidate.execute()
-            self._last_consolidation_date = date.today()
-            if count:
-                logger.info("Consolidation complete: %d summaries created", count)
-        except Exception as e:
-            logger.error("Consolidation error: %s", e, exc_info=True)
@@ -15,6 +15,7 @@ from healthchecker.interfaces.telegram.handlers.list_urls import ListUrlsHandler
 from healthchecker.interfaces.telegram.handlers.delete_url import DeleteUrlHandler
 from healthchecker.interfaces.telegram.handlers.check_now import CheckNowHandler
 from healthchecker.interfaces.telegram.handlers.results import ResultsHandler
+from healthchecker.interfaces.telegram.handlers.stats import StatsHandler
 from healthchecker.application.use_cases.manage_urls import ManageUrlsUseCase
 from healthchecker.application.use_cases.get_results import GetResultsUseCase
 from healthchecker.application.use_cases.check_all_urls import CheckAllUrlsUseCase
@@ -22,6 +23,8 @@ from healthchecker.domain.repositories.alert_repository import AlertRepository
 from healthchecker.domain.repositories.daily_summary_repository import (
     DailySummaryRepository,
 )
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+from healthchecker.interfaces.scheduler import SchedulerStats
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +37,16 @@ class TelegramBot:
         check_all_urls: CheckAllUrlsUseCase,
         summary_repo: DailySummaryRepository | None = None,
         alert_repo: AlertRepository | None = None,
+        resolver: CachingResolver | None = None,
+        scheduler_stats: SchedulerStats | None = None,
     ):
         self._manage_urls = manage_urls
         self._get_results = get_results
         self._check_all_urls = check_all_urls
         self._summary_repo = summary_repo
         self._alert_repo = alert_repo
+        self._resolver = resolver
+        self._scheduler_stats = scheduler_stats
         self._app: Application | None = None
 
     async def start(self):
@@ -84,6 +91,15 @@ class TelegramBot:
             )
         )
 
+        self._app.add_handler(
+            CommandHandler(
+                "stats",
+                StatsHandler(
+                    self._check_all_urls, self._resolver, self._scheduler_stats
+                ).handle,
+            )
+        )
+
         await self._app.initialize()
         await self._app.start()
         await self._app.updater.start_polling()
@@ -132,10 +148,14 @@ class TelegramBot:
             "🤖 *Health Checker Bot*\n\n"
             "Monitor your URLs with HTTP status, TTFB, and SSL certificate tracking.\n\n"
             "*Commands:*\n"
-            "/add `<url>` `[name]` `[--alert-days N]` — Add a URL to monitor\n"
+            "/add `<url>` `[name]` `[--alert-days N]` `[--fresh]` "
+            "`[--mode head|headers|capped]` `[--max-bytes N]` "
+            "`[--expect TEXT | --reject TEXT]` `[--regex]` `[--interval SEC]` "
+            "— Add a URL to monitor\n"
             "/list — Show all monitored URLs\n"
             "/delete `<id>` — Remove a URL\n"
             "/check `[id]` — Run health check now\n"
-            "/results `<id>` `[--limit N]` — Show check history\n"
+            "/results `<id>` `[--limit N]` `[--last 24h|7d]` — Show check history\n"
+            "/stats — Show checker performance stats\n"
         )
         await update.message.reply_text(text, parse_mode="Markdown")
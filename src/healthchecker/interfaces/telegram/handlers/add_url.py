@@ -4,6 +4,12 @@ from telegram import Update
 from telegram.ext import CommandHandler, ContextTypes
 
 from healthchecker.application.use_cases.manage_urls import ManageUrlsUseCase
+from healthchecker.domain.models.url import (
+    DEFAULT_PROBE_MAX_BYTES,
+    BodyAssertion,
+    ProbeMode,
+    Url,
+)
 from healthchecker.interfaces.telegram.markdown import markdown_escape
 
 
@@ -17,7 +23,9 @@ class AddUrlHandler:
     async def handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not context.args:
             await update.message.reply_text(
-                "Usage: /add <url> [name] [--alert-days N]\n"
+                "Usage: /add <url> [name] [--alert-days N] [--fresh] "
+                "[--mode head|headers|capped] [--max-bytes N] "
+                "[--expect TEXT | --reject TEXT] [--regex] [--interval SEC]\n"
                 "Example: /add https://example.com MySite --alert-days 14"
             )
             return
@@ -26,6 +34,11 @@ class AddUrlHandler:
         alert_days = 30
         name = None
         url = None
+        fresh_connection = False
+        probe_mode = ProbeMode.HEAD
+        max_bytes = DEFAULT_PROBE_MAX_BYTES
+        body_assertion = None
+        interval = None
 
         if "--alert-days" in args:
             idx = args.index("--alert-days")
@@ -35,6 +48,67 @@ class AddUrlHandler:
             else:
                 args.remove("--alert-days")
 
+        if "--fresh" in args:
+            fresh_connection = True
+            args.remove("--fresh")
+
+        if "--max-bytes" in args:
+            idx = args.index("--max-bytes")
+            if idx + 1 < len(args):
+                max_bytes = int(args[idx + 1])
+                probe_mode = ProbeMode.CAPPED
+                args = args[:idx] + args[idx + 2 :]
+            else:
+                args.remove("--max-bytes")
+            if max_bytes < 1:
+                await update.message.reply_text("Max bytes must be at least 1.")
+                return
+
+        if "--mode" in args:
+            idx = args.index("--mode")
+            if idx + 1 < len(args):
+                try:
+                    probe_mode = ProbeMode(args[idx + 1].lower())
+                except ValueError:
+                    await update.message.reply_text(
+                        "Invalid mode. Use one of: head, headers, capped."
+                    )
+                    return
+                args = args[:idx] + args[idx + 2 :]
+            else:
+                args.remove("--mode")
+
+        if "--interval" in args:
+            idx = args.index("--interval")
+            if idx + 1 < len(args):
+                interval = int(args[idx + 1])
+                args = args[:idx] + args[idx + 2 :]
+            else:
+                args.remove("--interval")
+            if interval is not None and interval < 1:
+                await update.message.reply_text("Interval must be at least 1 second.")
+                return
+
+        is_regex = "--regex" in args
+        if is_regex:
+            args.remove("--regex")
+
+        for flag, must_match in (("--expect", True), ("--reject", False)):
+            if flag in args:
+                idx = args.index(flag)
+                if idx + 1 < len(args):
+                    body_assertion = BodyAssertion(args[idx + 1], is_regex, must_match)
+                    args = args[:idx] + args[idx + 2 :]
+                else:
+                    args.remove(flag)
+
+        if body_assertion and is_regex:
+            try:
+                re.compile(body_assertion.pattern)
+            except re.error as e:
+                await update.message.reply_text(f"Invalid regex: {e}")
+                return
+
         if args:
             url = args[0]
             if len(args) > 1:
@@ -48,17 +122,47 @@ class AddUrlHandler:
 
         try:
             created = await self._manage_urls.add(
-                url=url, name=name, alert_before_days=alert_days
+                url=url,
+                name=name,
+                alert_before_days=alert_days,
+                fresh_connection=fresh_connection,
+                probe_mode=probe_mode,
+                probe_max_bytes=max_bytes,
+                body_assertion=body_assertion,
+                check_interval_sec=interval,
             )
             await update.message.reply_text(
                 f"✅ Added URL *{markdown_escape(created.name)}* (ID: {created.id})\n"
                 f"URL: `{markdown_escape(created.url)}`\n"
-                f"SSL alert threshold: {alert_days} days",
+                f"SSL alert threshold: {alert_days} days\n"
+                f"Check interval: {self._describe_interval(created)}\n"
+                f"Probe: {self._describe_probe(created)}"
+                + (
+                    f"\nAssertion: {markdown_escape(body_assertion.describe())}"
+                    if body_assertion
+                    else ""
+                ),
                 parse_mode="Markdown",
             )
         except Exception as e:
             await update.message.reply_text(f"Error adding URL: {e}")
 
+    @staticmethod
+    def _describe_interval(url: Url) -> str:
+        if url.check_interval_sec is None:
+            return "default"
+        return f"{url.check_interval_sec}s"
+
+    @staticmethod
+    def _describe_probe(url: Url) -> str:
+        if url.body_assertion is not None:
+            return f"GET, scanning up to {url.probe_max_bytes} bytes"
+        if url.probe_mode is ProbeMode.HEAD:
+            return "HEAD"
+        if url.probe_mode is ProbeMode.HEADERS:
+            return "GET, headers only"
+        return f"GET, first {url.probe_max_bytes} bytes"
+
     @staticmethod
     def _is_valid_url(url: str) -> bool:
         pattern = r"^https?://[^\s/$.?#].[^\s]*$"
@@ -3,6 +3,7 @@ from telegram.ext import ContextTypes
 
 from healthchecker.application.use_cases.manage_urls import ManageUrlsUseCase
 from healthchecker.application.use_cases.get_results import GetResultsUseCase
+from healthchecker.domain.models.url_status import UrlStatus
 from healthchecker.interfaces.telegram.markdown import markdown_escape
 
 
@@ -20,12 +21,14 @@ class ListUrlsHandler:
             )
             return
 
+        statuses = await self._get_results.get_statuses([url.id for url in urls])
         lines = [f"📋 *Monitored URLs ({len(urls)}):*\n"]
         for url in urls:
-            latest = await self._get_results.get_latest(url.id)
+            status = statuses.get(url.id)
             status_line = (
-                self._format_status(latest, url.alert_before_days)
-                if latest
+                self._format_status(status, url.alert_before_days)
+                + self._format_streak(status)
+                if status
                 else "⏳ Not checked yet"
             )
             lines.append(
@@ -66,3 +69,10 @@ class ListUrlsHandler:
             status_icon = "✅"
 
         return f"{status_icon} {' | '.join(parts)}"
+
+    @staticmethod
+    def _format_streak(status: UrlStatus) -> str:
+        if status.consecutive_failures < 2:
+            return ""
+        since = status.state_changed_at.strftime("%Y-%m-%d %H:%M")
+        return f"\n   Failing for {status.consecutive_failures} checks, since {since}"
@@ -1,13 +1,30 @@
+import re
+from datetime import datetime, timedelta, timezone
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from healthchecker.application.use_cases.get_results import GetResultsUseCase
 from healthchecker.application.use_cases.manage_urls import ManageUrlsUseCase
+from healthchecker.domain.models.daily_summary import merge_sketches
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.rollup import Resolution, Rollup
 from healthchecker.domain.repositories.daily_summary_repository import (
     DailySummaryRepository,
 )
 from healthchecker.interfaces.telegram.markdown import markdown_escape
 
+# A --last series is shown at the finest resolution that fits in this many
+# lines.
+_SERIES_MAX_POINTS = 48
+_SPAN_PATTERN = re.compile(r"^(\d+)([hd])$")
+_SPAN_UNITS = {"h": timedelta(hours=1), "d": timedelta(days=1)}
+_RESOLUTION_LABELS = {
+    Resolution.FIVE_MINUTES: "5-minute",
+    Resolution.HOUR: "hourly",
+    Resolution.DAY: "daily",
+}
+
 
 class ResultsHandler:
     def __init__(
@@ -23,7 +40,8 @@ class ResultsHandler:
     async def handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         if not context.args or not context.args[0].isdigit():
             await update.message.reply_text(
-                "Usage: /results <id> [--limit N]\nExample: /results 1 --limit 10"
+                "Usage: /results <id> [--limit N] [--last 24h|7d]\n"
+                "Example: /results 1 --limit 10"
             )
             return
 
@@ -40,6 +58,20 @@ class ResultsHandler:
             await update.message.reply_text(f"URL with ID {url_id} not found.")
             return
 
+        if "--last" in context.args:
+            idx = context.args.index("--last")
+            span = None
+            if idx + 1 < len(context.args):
+                span = self._parse_span(context.args[idx + 1])
+            if span is None:
+                await update.message.reply_text(
+                    "Usage: /results <id> --last <N>h|<N>d\n"
+                    "Example: /results 1 --last 24h"
+                )
+                return
+            await self._reply_series(update, url, context.args[idx + 1], span)
+            return
+
         checks = await self._get_results.get_history(url_id, limit=limit)
         lines = []
 
@@ -61,6 +93,9 @@ class ResultsHandler:
                     lines.append("📋 *Daily summaries:*\n")
                 for s in summaries:
                     lines.append(self._format_summary(s))
+                percentiles = self._format_percentiles(merge_sketches(summaries))
+                if len(summaries) > 1 and percentiles:
+                    lines.append(f"\n📈 *{len(summaries)} days:* TTFB {percentiles}")
 
         if len(lines) <= 1:
             await update.message.reply_text(
@@ -71,12 +106,58 @@ class ResultsHandler:
 
         await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
 
+    async def _reply_series(self, update: Update, url, label: str, span: timedelta):
+        end = datetime.now(timezone.utc)
+        resolution = next(
+            (r for r in Resolution if span / r.delta <= _SERIES_MAX_POINTS),
+            Resolution.DAY,
+        )
+        buckets = await self._get_results.get_series(
+            url.id, end - span, end, resolution
+        )
+        if not buckets:
+            await update.message.reply_text(
+                f"No data for *{markdown_escape(url.name)}* in the last {label}.",
+                parse_mode="Markdown",
+            )
+            return
+        resolution_label = _RESOLUTION_LABELS[buckets[0].resolution]
+        lines = [
+            f"📈 *{markdown_escape(url.name)}* — last {label}, {resolution_label}\n"
+        ]
+        lines.extend(self._format_rollup(b) for b in buckets)
+        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+
+    @staticmethod
+    def _parse_span(raw: str) -> timedelta | None:
+        match = _SPAN_PATTERN.match(raw.lower())
+        if not match or int(match.group(1)) == 0:
+            return None
+        return int(match.group(1)) * _SPAN_UNITS[match.group(2)]
+
+    @staticmethod
+    def _format_rollup(r: Rollup) -> str:
+        icon = "✅" if r.unhealthy_count == 0 else "❌"
+        parts = [icon, f"{r.healthy_count}/{r.checks_count} ok"]
+        if r.avg_ttfb_ms is not None:
+            parts.append(f"avg {r.avg_ttfb_ms:.0f}ms")
+        p95 = r.ttfb_sketch.quantile(0.95) if r.ttfb_sketch else None
+        if p95 is not None:
+            parts.append(f"p95 {p95:.0f}ms")
+        timestamp = r.bucket_start.strftime(
+            "%Y-%m-%d" if r.resolution is Resolution.DAY else "%m-%d %H:%M"
+        )
+        return f"`{timestamp}` — {' | '.join(parts)}"
+
     @staticmethod
     def _format_raw_check(c) -> str:
         icon = "✅" if c.is_healthy else "❌"
         parts = [icon, f"HTTP {c.http_status}" if c.http_status else "N/A"]
         if c.ttfb_ms is not None:
             parts.append(f"{c.ttfb_ms:.0f}ms")
+        phases = ResultsHandler._format_phases(c)
+        if phases:
+            parts.append(phases)
         if c.ssl_days_remaining is not None:
             parts.append(f"SSL: {c.ssl_days_remaining}d")
         if c.ssl_expiration_date:
@@ -86,15 +167,45 @@ class ResultsHandler:
         timestamp = c.checked_at.strftime("%Y-%m-%d %H:%M:%S") if c.checked_at else "?"
         return f"`{timestamp}` — {' | '.join(parts)}"
 
+    @staticmethod
+    def _format_phases(c) -> str:
+        download_ms = (
+            c.total_ms - c.ttfb_ms
+            if c.total_ms is not None and c.ttfb_ms is not None
+            else None
+        )
+        phases = [
+            ("dns", c.dns_ms),
+            ("tcp", c.connect_ms),
+            ("tls", c.tls_ms),
+            ("dl", download_ms),
+        ]
+        parts = [f"{name} {value:.0f}" for name, value in phases if value is not None]
+        text = f"{' / '.join(parts)}ms" if parts else ""
+        if c.bytes_received is not None:
+            size = f"{c.bytes_received / 1024:.1f}KB"
+            text = f"{text}, {size}" if text else size
+        return text
+
     @staticmethod
     def _format_summary(s) -> str:
         icon = "✅" if s.healthy_count > s.unhealthy_count else "❌"
         parts = [icon, f"HTTP {s.last_http_status}" if s.last_http_status else "N/A"]
         if s.avg_ttfb_ms is not None:
             parts.append(f"avg {s.avg_ttfb_ms:.0f}ms")
+        percentiles = ResultsHandler._format_percentiles(s.ttfb_sketch)
+        if percentiles:
+            parts.append(percentiles)
         if s.min_ssl_days_remaining is not None:
             parts.append(f"SSL min: {s.min_ssl_days_remaining}d")
         if s.last_ssl_expiration_date:
             parts.append(f"Expires: {s.last_ssl_expiration_date.strftime('%Y-%m-%d')}")
         parts.append(f"{s.healthy_count}/{s.checks_count} ok")
         return f"`{s.summary_date}` — {' | '.join(parts)}"
+
+    @staticmethod
+    def _format_percentiles(sketch: LatencySketch | None) -> str:
+        if sketch is None or sketch.count == 0:
+            return ""
+        values = "/".join(f"{sketch.quantile(q):.0f}" for q in (0.5, 0.95, 0.99))
+        return f"p50/95/99 {values}ms"
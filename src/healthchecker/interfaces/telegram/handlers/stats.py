@@ -0,0 +1,82 @@
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from healthchecker.application.use_cases.check_all_urls import CheckAllUrlsUseCase
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+from healthchecker.interfaces.scheduler import SchedulerStats
+
+
+class StatsHandler:
+    def __init__(
+        self,
+        check_all_urls: CheckAllUrlsUseCase,
+        resolver: CachingResolver | None = None,
+        scheduler_stats: SchedulerStats | None = None,
+    ):
+        self._check_all_urls = check_all_urls
+        self._resolver = resolver
+        self._scheduler_stats = scheduler_stats
+
+    async def handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await update.message.reply_text(
+            "\n".join(self._format_lines()), parse_mode="Markdown"
+        )
+
+    def _format_lines(self) -> list[str]:
+        lines = ["📈 *Checker stats*\n"]
+        lines.extend(self._format_last_cycle())
+        if self._scheduler_stats:
+            lines.extend(self._format_scheduler(self._scheduler_stats))
+        if self._resolver:
+            dns = self._resolver.stats()
+            lines.append("\n*DNS cache:*")
+            lines.append(
+                f"Hit rate: {dns.hit_rate:.0%} ({dns.requests} requests, "
+                f"{dns.entries} entries)"
+            )
+            lines.append(
+                f"Lookups: {dns.lookups} | avg {dns.avg_lookup_ms:.1f}ms"
+                f" | negative hits: {dns.negative_hits}"
+            )
+        return lines
+
+    @staticmethod
+    def _format_scheduler(stats: SchedulerStats) -> list[str]:
+        lines = ["\n*Scheduler:*"]
+        lines.append(
+            f"Checks dispatched: {stats.checks_dispatched}"
+            f" | lag avg {stats.avg_lag_ms:.0f}ms"
+            f" | max {stats.max_lag_sec * 1000:.0f}ms"
+        )
+        lines.append(
+            f"Overruns: {stats.overruns} | skipped ticks: {stats.skipped_ticks}"
+            f" | coalesced ticks: {stats.coalesced_ticks}"
+        )
+        if stats.avg_period_ratio is not None:
+            lines.append(f"Achieved period: {stats.avg_period_ratio:.2f}x interval")
+        lines.append(
+            f"Check time: avg {stats.avg_check_ms:.0f}ms"
+            f" | max {stats.max_check_sec * 1000:.0f}ms"
+        )
+        lines.append(
+            f"In flight: {stats.running} | waiting for a slot: {stats.waiting}"
+        )
+        if stats.running_by_host:
+            host, count = max(stats.running_by_host.items(), key=lambda item: item[1])
+            lines.append(f"Busiest host: {host} ({count} in flight)")
+        return lines
+
+    def _format_last_cycle(self) -> list[str]:
+        run = self._check_all_urls.last_stats
+        if run is None:
+            return ["No /check run has completed yet."]
+        lines = ["*Last /check run:*"]
+        lines.append(f"URLs: {run.urls_count} in {run.duration_ms:.0f}ms")
+        lines.append(
+            f"Queue wait: avg {run.avg_queue_wait_ms:.0f}ms"
+            f" | max {run.max_queue_wait_ms:.0f}ms"
+        )
+        lines.append(
+            f"Probe: avg {run.avg_probe_ms:.0f}ms | max {run.max_probe_ms:.0f}ms"
+        )
+        return lines
@@ -1,7 +1,11 @@
 import asyncio
 import logging
+from datetime import timedelta
 
 from healthchecker.infrastructure.config import settings
+from healthchecker.infrastructure.persistence.tortoise_config import (
+    HOUSEKEEPING_CONNECTION,
+)
 from healthchecker.infrastructure.persistence.database import (
     connect_database,
     close_database,
@@ -12,12 +16,28 @@ from healthchecker.infrastructure.persistence.url_repository import (
 from healthchecker.infrastructure.persistence.health_check_repository import (
     TortoiseHealthCheckRepository,
 )
+from healthchecker.infrastructure.persistence.buffered_health_check_repository import (
+    BufferedHealthCheckRepository,
+)
 from healthchecker.infrastructure.persistence.alert_repository import (
     TortoiseAlertRepository,
 )
+from healthchecker.infrastructure.persistence.rollup_repository import (
+    TortoiseRollupRepository,
+)
 from healthchecker.infrastructure.persistence.daily_summary_repository import (
     TortoiseDailySummaryRepository,
 )
+from healthchecker.infrastructure.persistence.url_status_repository import (
+    TortoiseUrlStatusRepository,
+)
+from healthchecker.domain.models.rollup import Resolution
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.ssl_expiry_timeline import SslExpiryTimeline
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
 from healthchecker.infrastructure.checker.http_checker import HttpHealthChecker
 from healthchecker.infrastructure.checker.ssl_checker import SslChecker
 
@@ -27,9 +47,27 @@ from healthchecker.application.use_cases.check_all_urls import CheckAllUrlsUseCa
 from healthchecker.application.use_cases.consolidate_summaries import (
     ConsolidateDailySummariesUseCase,
 )
+from healthchecker.application.use_cases.consolidate_rollups import (
+    ConsolidateRollupsUseCase,
+)
+from healthchecker.application.use_cases.purge_health_checks import (
+    PurgeHealthChecksUseCase,
+)
+from healthchecker.application.use_cases.flush_daily_aggregates import (
+    FlushDailyAggregatesUseCase,
+)
+from healthchecker.application.use_cases.flush_url_statuses import (
+    FlushUrlStatusesUseCase,
+)
 
 from healthchecker.interfaces.telegram.bot import TelegramBot
-from healthchecker.interfaces.scheduler import Scheduler
+from healthchecker.interfaces.housekeeping import (
+    AggregateFlushJob,
+    HousekeepingJob,
+    RollupJob,
+    UrlStatusFlushJob,
+)
+from healthchecker.interfaces.scheduler import Scheduler, SchedulerStats
 
 logging.basicConfig(
     level=logging.WARNING,
@@ -46,43 +84,153 @@ async def main():
     await connect_database()
 
     url_repo = TortoiseUrlRepository()
-    health_check_repo = TortoiseHealthCheckRepository()
+    health_check_repo = BufferedHealthCheckRepository(
+        TortoiseHealthCheckRepository(),
+        batch_size=settings.health_check_batch_size,
+        flush_interval_sec=settings.health_check_flush_interval_sec,
+        max_pending=settings.health_check_max_pending,
+    )
     alert_repo = TortoiseAlertRepository()
     summary_repo = TortoiseDailySummaryRepository()
+    url_status_repo = TortoiseUrlStatusRepository()
 
-    http_checker = HttpHealthChecker()
-    ssl_checker = SslChecker()
+    resolver = CachingResolver(
+        ttl_sec=settings.dns_cache_ttl_sec,
+        negative_ttl_sec=settings.dns_negative_ttl_sec,
+        max_entries=settings.dns_cache_max_entries,
+    )
+    http_checker = HttpHealthChecker(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_sec,
+        http2=settings.http2_enabled,
+        resolver=resolver,
+    )
+    ssl_checker = SslChecker(
+        resolver=resolver, refresh_interval_sec=settings.ssl_cache_refresh_sec
+    )
 
-    manage_urls = ManageUrlsUseCase(url_repo)
-    get_results = GetResultsUseCase(health_check_repo)
+    url_statuses = UrlStatusStore()
+    url_registry = ActiveUrlRegistry(
+        url_repo, reconcile_interval_sec=settings.url_registry_reconcile_sec
+    )
+    recent_checks = (
+        RecentChecks(settings.recent_checks_depth)
+        if settings.recent_checks_depth > 0
+        else None
+    )
+    ssl_timeline = SslExpiryTimeline()
+    daily_aggregator = DailyAggregator()
+    manage_urls = ManageUrlsUseCase(
+        url_repo,
+        url_statuses,
+        url_registry,
+        recent_checks,
+        ssl_timeline,
+        ssl_checker,
+        health_check_repo,
+        daily_aggregator,
+    )
+    rollup_retention = {
+        Resolution.FIVE_MINUTES: timedelta(hours=settings.rollup_5m_retention_hours),
+        Resolution.HOUR: timedelta(days=settings.rollup_1h_retention_days),
+    }
+    get_results = GetResultsUseCase(
+        health_check_repo,
+        TortoiseRollupRepository(),
+        summary_repo,
+        rollup_retention,
+        recent_checks,
+        url_status_repo,
+        url_statuses,
+    )
     check_all_urls = CheckAllUrlsUseCase(
         url_repo,
         health_check_repo,
         alert_repo,
         http_checker,
         ssl_checker,
+        max_concurrency=settings.check_max_concurrency,
+        per_host_concurrency=settings.check_per_host_concurrency,
+        url_statuses=url_statuses,
+        url_registry=url_registry,
+        daily_aggregator=daily_aggregator,
+        recent_checks=recent_checks,
+        url_status_repo=url_status_repo,
+        ssl_timeline=ssl_timeline,
+    )
+    housekeeping_summary_repo = TortoiseDailySummaryRepository(HOUSEKEEPING_CONNECTION)
+    housekeeping_health_check_repo = TortoiseHealthCheckRepository(
+        HOUSEKEEPING_CONNECTION
     )
     consolidate = ConsolidateDailySummariesUseCase(
-        health_check_repo,
-        summary_repo,
+        housekeeping_health_check_repo,
+        housekeeping_summary_repo,
         settings.retention_days,
+        incremental=True,
+        purge=PurgeHealthChecksUseCase(
+            housekeeping_health_check_repo,
+            chunk_size=settings.purge_chunk_size,
+            pause_sec=settings.purge_pause_sec,
+        ),
+    )
+    consolidate_rollups = ConsolidateRollupsUseCase(
+        housekeeping_health_check_repo,
+        TortoiseRollupRepository(HOUSEKEEPING_CONNECTION),
+        five_minute_retention=rollup_retention[Resolution.FIVE_MINUTES],
+        hourly_retention=rollup_retention[Resolution.HOUR],
+        flush_interval=timedelta(seconds=settings.health_check_flush_interval_sec),
     )
+    flush_aggregates = FlushDailyAggregatesUseCase(
+        daily_aggregator, housekeeping_summary_repo
+    )
+    flush_statuses = FlushUrlStatusesUseCase(url_statuses, url_status_repo)
 
+    scheduler_stats = SchedulerStats()
     bot = TelegramBot(
-        manage_urls, get_results, check_all_urls, summary_repo, alert_repo
+        manage_urls,
+        get_results,
+        check_all_urls,
+        summary_repo,
+        alert_repo,
+        resolver,
+        scheduler_stats,
+    )
+    scheduler = Scheduler(check_all_urls, alert_repo, bot.send_alert, scheduler_stats)
+    housekeeping = HousekeepingJob(
+        consolidate,
+        interval_sec=settings.consolidation_interval_sec,
+        time_budget_sec=settings.consolidation_time_budget_sec,
+    )
+    aggregate_flush = AggregateFlushJob(
+        flush_aggregates, interval_sec=settings.daily_aggregate_flush_sec
+    )
+    status_flush = UrlStatusFlushJob(
+        flush_statuses, interval_sec=settings.health_check_flush_interval_sec
     )
-    scheduler = Scheduler(check_all_urls, consolidate, alert_repo, bot.send_alert)
+    rollups = RollupJob(consolidate_rollups, interval_sec=settings.rollup_interval_sec)
 
     try:
         await asyncio.gather(
             bot.start(),
             scheduler.start(),
+            housekeeping.start(),
+            health_check_repo.start(),
+            aggregate_flush.start(),
+            status_flush.start(),
+            rollups.start(),
         )
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     finally:
         await scheduler.stop()
+        await housekeeping.stop()
+        await aggregate_flush.stop()
+        await status_flush.stop()
+        await rollups.stop()
+        await health_check_repo.aclose()
         await bot.stop()
+        await http_checker.aclose()
         await close_database()
 
 
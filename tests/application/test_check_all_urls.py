@@ -1,17 +1,25 @@
+import asyncio
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
 
 from healthchecker.application.use_cases.check_all_urls import CheckAllUrlsUseCase
 from healthchecker.domain.models.health_check import HealthCheck
-from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url import ProbeMode, Url
+from healthchecker.domain.models.url_status import UrlStatus
 from healthchecker.domain.models.alert import AlertType
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+from healthchecker.infrastructure.checker.http_checker import HttpCheckResult
 from healthchecker.infrastructure.checker.ssl_checker import SslInfo
 
 
-HTTP_OK = (200, 100.0, None)
-HTTP_503 = (503, 50.0, None)
-TIMEOUT = (None, None, "Timeout")
+HTTP_OK = HttpCheckResult(200, 100.0, None)
+HTTP_503 = HttpCheckResult(503, 50.0, None)
+TIMEOUT = HttpCheckResult(None, None, "Timeout")
 
 
 class TestCheckAllUrlsUseCase:
@@ -50,7 +58,7 @@ class TestCheckAllUrlsUseCase:
         url_repo = mocker.AsyncMock()
         url_repo.get_all_active.return_value = active_urls
         health_repo = mocker.AsyncMock()
-        health_repo.get_latest_by_url_id.return_value = None
+        health_repo.get_latest_for_all.return_value = []
         alert_repo = mocker.AsyncMock()
         http_checker = mocker.AsyncMock()
         ssl_checker = mocker.AsyncMock()
@@ -78,7 +86,7 @@ class TestCheckAllUrlsUseCase:
 
     async def test_unhealthy_url(self, use_case, mocks, ssl_valid):
         _, _, alert_repo, http_checker, ssl_checker = mocks
-        http_checker.check.side_effect = lambda url: (
+        http_checker.check.side_effect = lambda url, **kwargs: (
             HTTP_503 if "example.com" in url else HTTP_OK
         )
         ssl_checker.check.return_value = ssl_valid
@@ -90,7 +98,7 @@ class TestCheckAllUrlsUseCase:
 
     async def test_url_with_timeout(self, use_case, mocks, ssl_valid):
         _, _, alert_repo, http_checker, ssl_checker = mocks
-        http_checker.check.side_effect = lambda url: (
+        http_checker.check.side_effect = lambda url, **kwargs: (
             TIMEOUT if "example.com" in url else HTTP_OK
         )
         ssl_checker.check.return_value = ssl_valid
@@ -132,17 +140,30 @@ class TestCheckAllUrlsUseCase:
 
     async def test_no_alert_when_already_unhealthy(self, use_case, mocks, ssl_valid):
         _, health_repo, alert_repo, http_checker, ssl_checker = mocks
-        health_repo.get_latest_by_url_id.return_value = HealthCheck(
-            id=99,
-            url_id=1,
-            http_status=503,
-            ttfb_ms=None,
-            ssl_days_remaining=200,
-            ssl_expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
-            is_healthy=False,
-            error_message="Previous error",
-            checked_at=datetime.now(timezone.utc),
-        )
+        health_repo.get_latest_for_all.return_value = [
+            HealthCheck(
+                id=99,
+                url_id=1,
+                http_status=503,
+                ttfb_ms=None,
+                ssl_days_remaining=200,
+                ssl_expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+                is_healthy=False,
+                error_message="Previous error",
+                checked_at=datetime.now(timezone.utc),
+            ),
+            HealthCheck(
+                id=100,
+                url_id=2,
+                http_status=503,
+                ttfb_ms=None,
+                ssl_days_remaining=None,
+                ssl_expiration_date=None,
+                is_healthy=False,
+                error_message="Previous error",
+                checked_at=datetime.now(timezone.utc),
+            ),
+        ]
         http_checker.check.return_value = HTTP_503
         ssl_checker.check.return_value = ssl_valid
 
@@ -163,10 +184,8 @@ class TestCheckAllUrlsUseCase:
             error_message=None,
             checked_at=datetime.now(timezone.utc),
         )
-        health_repo.get_latest_by_url_id.side_effect = lambda url_id: (
-            previous if url_id == 1 else None
-        )
-        http_checker.check.side_effect = lambda url: (
+        health_repo.get_latest_for_all.return_value = [previous]
+        http_checker.check.side_effect = lambda url, **kwargs: (
             HTTP_503 if "example.com" in url else HTTP_OK
         )
         ssl_checker.check.return_value = ssl_valid
@@ -177,17 +196,19 @@ class TestCheckAllUrlsUseCase:
 
     async def test_no_ssl_alert_when_already_expired(self, use_case, mocks):
         _, health_repo, _, http_checker, ssl_checker = mocks
-        health_repo.get_latest_by_url_id.return_value = HealthCheck(
-            id=97,
-            url_id=1,
-            http_status=200,
-            ttfb_ms=100.0,
-            ssl_days_remaining=10,
-            ssl_expiration_date=datetime(2026, 6, 20, tzinfo=timezone.utc),
-            is_healthy=True,
-            error_message=None,
-            checked_at=datetime.now(timezone.utc),
-        )
+        health_repo.get_latest_for_all.return_value = [
+            HealthCheck(
+                id=97,
+                url_id=1,
+                http_status=200,
+                ttfb_ms=100.0,
+                ssl_days_remaining=10,
+                ssl_expiration_date=datetime(2026, 6, 20, tzinfo=timezone.utc),
+                is_healthy=True,
+                error_message=None,
+                checked_at=datetime.now(timezone.utc),
+            )
+        ]
         http_checker.check.return_value = HTTP_OK
         ssl_checker.check.return_value = SslInfo(
             expiration_date=datetime(2026, 6, 20, tzinfo=timezone.utc),
@@ -197,19 +218,37 @@ class TestCheckAllUrlsUseCase:
         alerts = await use_case.execute()
         assert alerts == []
 
+    async def test_ssl_alert_not_repeated_after_failed_ssl_check(self, use_case, mocks):
+        _, _, _, http_checker, ssl_checker = mocks
+        expiring = SslInfo(
+            expiration_date=datetime(2026, 6, 20, tzinfo=timezone.utc),
+            days_remaining=10,
+        )
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = expiring
+        assert len(await use_case.execute()) == 1
+
+        ssl_checker.check.return_value = None
+        assert await use_case.execute() == []
+
+        ssl_checker.check.return_value = expiring
+        assert await use_case.execute() == []
+
     async def test_ssl_alert_when_newly_expired(self, use_case, mocks):
         _, health_repo, alert_repo, http_checker, ssl_checker = mocks
-        health_repo.get_latest_by_url_id.return_value = HealthCheck(
-            id=96,
-            url_id=1,
-            http_status=200,
-            ttfb_ms=100.0,
-            ssl_days_remaining=31,
-            ssl_expiration_date=datetime(2026, 7, 18, tzinfo=timezone.utc),
-            is_healthy=True,
-            error_message=None,
-            checked_at=datetime.now(timezone.utc),
-        )
+        health_repo.get_latest_for_all.return_value = [
+            HealthCheck(
+                id=96,
+                url_id=1,
+                http_status=200,
+                ttfb_ms=100.0,
+                ssl_days_remaining=31,
+                ssl_expiration_date=datetime(2026, 7, 18, tzinfo=timezone.utc),
+                is_healthy=True,
+                error_message=None,
+                checked_at=datetime.now(timezone.utc),
+            )
+        ]
         http_checker.check.return_value = HTTP_OK
         ssl_checker.check.return_value = SslInfo(
             expiration_date=datetime(2026, 6, 20, tzinfo=timezone.utc),
@@ -233,9 +272,7 @@ class TestCheckAllUrlsUseCase:
             error_message="Previous error",
             checked_at=datetime.now(timezone.utc),
         )
-        health_repo.get_latest_by_url_id.side_effect = lambda url_id: (
-            previous if url_id == 1 else None
-        )
+        health_repo.get_latest_for_all.return_value = [previous]
         http_checker.check.return_value = HTTP_OK
         ssl_checker.check.return_value = ssl_valid
 
@@ -246,20 +283,353 @@ class TestCheckAllUrlsUseCase:
 
     async def test_no_alert_when_already_healthy(self, use_case, mocks, ssl_valid):
         _, health_repo, alert_repo, http_checker, ssl_checker = mocks
-        health_repo.get_latest_by_url_id.return_value = HealthCheck(
-            id=94,
+        health_repo.get_latest_for_all.return_value = [
+            HealthCheck(
+                id=94,
+                url_id=1,
+                http_status=200,
+                ttfb_ms=100.0,
+                ssl_days_remaining=200,
+                ssl_expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+                is_healthy=True,
+                error_message=None,
+                checked_at=datetime.now(timezone.utc),
+            )
+        ]
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+
+        alerts = await use_case.execute()
+        assert alerts == []
+        alert_repo.save.assert_not_called()
+
+    async def test_loads_previous_checks_once(self, use_case, mocks, ssl_valid):
+        _, health_repo, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.execute()
+        await use_case.execute()
+
+        health_repo.get_latest_for_all.assert_awaited_once()
+        health_repo.get_latest_by_url_id.assert_not_called()
+
+    async def test_previous_state_comes_from_last_saved_check(
+        self, use_case, mocks, ssl_valid
+    ):
+        _, _, _, http_checker, ssl_checker = mocks
+        http_checker.check.side_effect = lambda url, **kwargs: (
+            HTTP_503 if "example.com" in url else HTTP_OK
+        )
+        ssl_checker.check.return_value = ssl_valid
+        assert len(await use_case.execute()) == 1
+        assert await use_case.execute() == []
+
+        http_checker.check.side_effect = None
+        http_checker.check.return_value = HTTP_OK
+        alerts = await use_case.execute()
+        assert [a.alert_type for a in alerts] == [AlertType.HTTP_UP]
+
+    async def test_saves_phase_timings(self, use_case, mocks, ssl_valid):
+        _, health_repo, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HttpCheckResult(
+            200,
+            80.0,
+            None,
+            dns_ms=2.0,
+            connect_ms=10.0,
+            tls_ms=25.0,
+            total_ms=95.0,
+            bytes_received=512,
+        )
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.execute()
+        saved = health_repo.save.call_args_list[0].args[0]
+        assert saved.ttfb_ms == 80.0
+        assert saved.tls_ms == 25.0
+        assert saved.total_ms == 95.0
+        assert saved.bytes_received == 512
+
+    async def test_passes_probe_mode(self, use_case, mocks, active_urls, ssl_valid):
+        _, _, _, http_checker, ssl_checker = mocks
+        active_urls[0].probe_mode = ProbeMode.CAPPED
+        active_urls[0].probe_max_bytes = 2048
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.execute()
+        http_checker.check.assert_any_await(
+            "https://example.com",
+            fresh_connection=False,
+            probe_mode=ProbeMode.CAPPED,
+            max_bytes=2048,
+            body_assertion=None,
+        )
+
+    async def test_uses_certificate_from_http_connection(
+        self, use_case, mocks, ssl_valid
+    ):
+        _, health_repo, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HttpCheckResult(
+            200, 80.0, None, ssl_info=ssl_valid
+        )
+
+        await use_case.execute()
+        ssl_checker.check.assert_not_called()
+        saved = health_repo.save.call_args_list[0].args[0]
+        assert saved.ssl_days_remaining == 200
+
+    async def test_records_tls_details_from_ssl_checker(self, use_case, mocks):
+        _, health_repo, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = SslInfo(
+            expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
+            days_remaining=200,
+            tls_version="TLSv1.3",
+            cipher="TLS_AES_128_GCM_SHA256",
+        )
+
+        await use_case.execute()
+        saved = health_repo.save.call_args_list[0].args[0]
+        # The separate probe's handshake (maybe resumed) is not this request's.
+        assert saved.tls_ms is None
+        assert saved.tls_version == "TLSv1.3"
+        assert saved.tls_cipher == "TLS_AES_128_GCM_SHA256"
+
+    async def test_falls_back_to_ssl_checker_without_certificate(
+        self, use_case, mocks, ssl_valid
+    ):
+        _, _, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = TIMEOUT
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.execute()
+        ssl_checker.check.assert_called_once_with(
+            "https://example.com", alert_before_days=30
+        )
+
+    async def test_reads_active_urls_from_registry(self, mocks, ssl_valid):
+        url_repo, health_repo, alert_repo, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+        use_case = CheckAllUrlsUseCase(
+            url_repo=url_repo,
+            health_check_repo=health_repo,
+            alert_repo=alert_repo,
+            http_checker=http_checker,
+            ssl_checker=ssl_checker,
+            url_registry=ActiveUrlRegistry(url_repo),
+        )
+
+        await use_case.execute()
+        await use_case.execute()
+
+        url_repo.get_all_active.assert_awaited_once()
+        assert http_checker.check.await_count == 4
+
+    async def test_records_checks_in_daily_aggregator(self, mocks, ssl_valid):
+        url_repo, health_repo, alert_repo, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+        aggregator = DailyAggregator()
+        use_case = CheckAllUrlsUseCase(
+            url_repo=url_repo,
+            health_check_repo=health_repo,
+            alert_repo=alert_repo,
+            http_checker=http_checker,
+            ssl_checker=ssl_checker,
+            daily_aggregator=aggregator,
+        )
+
+        await use_case.execute()
+
+        assert sorted(url_id for url_id, _ in aggregator.unseeded()) == [1, 2]
+
+    async def test_records_checks_in_recent_checks(self, mocks, ssl_valid):
+        url_repo, health_repo, alert_repo, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+        recent = RecentChecks()
+        use_case = CheckAllUrlsUseCase(
+            url_repo=url_repo,
+            health_check_repo=health_repo,
+            alert_repo=alert_repo,
+            http_checker=http_checker,
+            ssl_checker=ssl_checker,
+            recent_checks=recent,
+        )
+
+        await use_case.execute()
+
+        assert recent.latest(1).http_status == 200
+        assert recent.latest(2).http_status == 200
+
+    async def test_leaves_url_status_writes_to_the_flush(
+        self, mocker, mocks, ssl_valid
+    ):
+        url_repo, health_repo, alert_repo, http_checker, ssl_checker = mocks
+        http_checker.check.side_effect = [HTTP_503, HTTP_OK, HTTP_503, HTTP_OK]
+        ssl_checker.check.return_value = ssl_valid
+        status_repo = mocker.AsyncMock()
+        status_repo.get_all.return_value = []
+        store = UrlStatusStore()
+        use_case = CheckAllUrlsUseCase(
+            url_repo=url_repo,
+            health_check_repo=health_repo,
+            alert_repo=alert_repo,
+            http_checker=http_checker,
+            ssl_checker=ssl_checker,
+            max_concurrency=1,
+            url_statuses=store,
+            url_status_repo=status_repo,
+        )
+
+        await use_case.execute()
+        await use_case.execute()
+
+        status_repo.get_all.assert_awaited_once()
+        status_repo.save_many.assert_not_called()
+        statuses = {s.url_id: s for s in store.take_dirty()}
+        assert statuses[1].consecutive_failures == 2
+        assert statuses[1].http_status == 503
+        assert statuses[2].consecutive_failures == 0
+
+    async def test_transitions_compare_with_stored_status(
+        self, mocker, mocks, ssl_valid
+    ):
+        url_repo, health_repo, alert_repo, http_checker, ssl_checker = mocks
+        down = HealthCheck(
+            id=None,
             url_id=1,
-            http_status=200,
-            ttfb_ms=100.0,
-            ssl_days_remaining=200,
-            ssl_expiration_date=datetime(2026, 12, 31, tzinfo=timezone.utc),
-            is_healthy=True,
+            http_status=503,
+            ttfb_ms=None,
+            ssl_expiration_date=None,
+            ssl_days_remaining=None,
+            is_healthy=False,
             error_message=None,
             checked_at=datetime.now(timezone.utc),
         )
+        status_repo = mocker.AsyncMock()
+        status_repo.get_all.return_value = [UrlStatus.from_check(down)]
+        # A stale latest check must not override the status row.
+        health_repo.get_latest_for_all.return_value = [
+            replace(down, http_status=200, is_healthy=True)
+        ]
         http_checker.check.return_value = HTTP_OK
         ssl_checker.check.return_value = ssl_valid
+        use_case = CheckAllUrlsUseCase(
+            url_repo=url_repo,
+            health_check_repo=health_repo,
+            alert_repo=alert_repo,
+            http_checker=http_checker,
+            ssl_checker=ssl_checker,
+            url_status_repo=status_repo,
+        )
 
         alerts = await use_case.execute()
-        assert alerts == []
-        alert_repo.save.assert_not_called()
+
+        assert [(a.url_id, a.alert_type) for a in alerts] == [(1, AlertType.HTTP_UP)]
+
+    async def test_records_run_stats(self, use_case, mocks, ssl_valid):
+        _, _, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.execute()
+        assert use_case.last_stats is not None
+        assert use_case.last_stats.urls_count == 2
+        assert use_case.last_stats.max_probe_ms >= use_case.last_stats.avg_probe_ms
+
+    async def test_scheduled_checks_leave_run_stats_alone(
+        self, use_case, mocks, ssl_valid
+    ):
+        url_repo, _, _, http_checker, ssl_checker = mocks
+        http_checker.check.return_value = HTTP_OK
+        ssl_checker.check.return_value = ssl_valid
+
+        await use_case.check_urls(await url_repo.get_all_active())
+
+        assert use_case.last_stats is None
+
+
+class TestCheckAllUrlsWorkerPool:
+    @staticmethod
+    def make_urls(hosts: list[str]) -> list[Url]:
+        return [
+            Url(
+                id=i,
+                name=f"url-{i}",
+                url=f"http://{host}/{i}",
+                alert_before_days=30,
+                is_active=True,
+                created_at=None,
+                updated_at=None,
+            )
+            for i, host in enumerate(hosts, start=1)
+        ]
+
+    @pytest.fixture
+    def tracker(self):
+        return {"global": 0, "max_global": 0, "hosts": {}, "max_hosts": {}}
+
+    @pytest.fixture
+    def make_use_case(self, mocker, tracker):
+        def factory(urls, max_concurrency, per_host_concurrency):
+            async def slow_check(url, **kwargs):
+                host = url.split("/")[2]
+                tracker["global"] += 1
+                tracker["hosts"][host] = tracker["hosts"].get(host, 0) + 1
+                tracker["max_global"] = max(tracker["max_global"], tracker["global"])
+                tracker["max_hosts"][host] = max(
+                    tracker["max_hosts"].get(host, 0), tracker["hosts"][host]
+                )
+                await asyncio.sleep(0.01)
+                tracker["global"] -= 1
+                tracker["hosts"][host] -= 1
+                return HTTP_OK
+
+            url_repo = mocker.AsyncMock()
+            url_repo.get_all_active.return_value = urls
+            health_repo = mocker.AsyncMock()
+            health_repo.get_latest_for_all.return_value = []
+            http_checker = mocker.AsyncMock()
+            http_checker.check.side_effect = slow_check
+            return CheckAllUrlsUseCase(
+                url_repo=url_repo,
+                health_check_repo=health_repo,
+                alert_repo=mocker.AsyncMock(),
+                http_checker=http_checker,
+                ssl_checker=mocker.AsyncMock(),
+                max_concurrency=max_concurrency,
+                per_host_concurrency=per_host_concurrency,
+            ), http_checker
+
+        return factory
+
+    async def test_respects_global_limit(self, make_use_case, tracker):
+        urls = self.make_urls([f"host{i}.com" for i in range(10)])
+        use_case, http_checker = make_use_case(urls, 3, 0)
+
+        await use_case.execute()
+        assert http_checker.check.await_count == 10
+        assert tracker["max_global"] == 3
+
+    async def test_respects_per_host_limit(self, make_use_case, tracker):
+        urls = self.make_urls(["busy.com"] * 6 + ["other.com"] * 2)
+        use_case, http_checker = make_use_case(urls, 5, 2)
+
+        await use_case.execute()
+        assert http_checker.check.await_count == 8
+        assert tracker["max_hosts"]["busy.com"] == 2
+        assert tracker["max_global"] <= 4
+
+    async def test_reports_queue_wait_separately(self, make_use_case):
+        urls = self.make_urls(["same.com"] * 3)
+        use_case, _ = make_use_case(urls, 5, 1)
+
+        await use_case.execute()
+        stats = use_case.last_stats
+        assert stats.urls_count == 3
+        assert stats.max_queue_wait_ms >= 15
+        assert stats.max_probe_ms < stats.max_queue_wait_ms
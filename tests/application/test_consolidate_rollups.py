@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from healthchecker.application.use_cases.consolidate_rollups import (
+    SETTLE_DELAY,
+    ConsolidateRollupsUseCase,
+)
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.rollup import Resolution, Rollup
+
+NOW = datetime(2026, 6, 10, 12, 7, tzinfo=timezone.utc) + SETTLE_DELAY
+
+
+def make_check(checked_at: datetime) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=1,
+        http_status=200,
+        ttfb_ms=100.0,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=True,
+        error_message=None,
+        checked_at=checked_at,
+    )
+
+
+class TestConsolidateRollupsUseCase:
+    @pytest.fixture
+    def health_repo(self, mocker):
+        repo = mocker.AsyncMock()
+        repo.aggregate_rollups.side_effect = lambda resolution, start, end: [
+            Rollup.from_check(make_check(start + timedelta(seconds=30)), resolution)
+        ]
+        return repo
+
+    @pytest.fixture
+    def rollup_repo(self, mocker):
+        repo = mocker.AsyncMock()
+        repo.get_latest_bucket_start.side_effect = lambda resolution: {
+            Resolution.FIVE_MINUTES: datetime(2026, 6, 10, 11, 50, tzinfo=timezone.utc),
+            Resolution.HOUR: datetime(2026, 6, 10, 10, tzinfo=timezone.utc),
+        }[resolution]
+        repo.get_range.side_effect = lambda resolution, start, end: [
+            Rollup.from_check(make_check(start), Resolution.FIVE_MINUTES)
+        ]
+        repo.purge_older_than.return_value = 0
+        return repo
+
+    @pytest.fixture
+    def use_case(self, health_repo, rollup_repo):
+        return ConsolidateRollupsUseCase(health_repo, rollup_repo)
+
+    async def test_rolls_up_complete_buckets_after_watermark(
+        self, use_case, health_repo, rollup_repo
+    ):
+        await use_case.execute(NOW)
+
+        # 11:55 and 12:00 are complete; 12:05 is still open.
+        health_repo.aggregate_rollups.assert_awaited_once_with(
+            Resolution.FIVE_MINUTES,
+            datetime(2026, 6, 10, 11, 55, tzinfo=timezone.utc),
+            datetime(2026, 6, 10, 12, 5, tzinfo=timezone.utc),
+        )
+        rollup_repo.get_range.assert_awaited_once_with(
+            Resolution.FIVE_MINUTES,
+            datetime(2026, 6, 10, 11, tzinfo=timezone.utc),
+            datetime(2026, 6, 10, 12, tzinfo=timezone.utc),
+        )
+        five_minutes, hourly = [
+            c.args[0] for c in rollup_repo.save_many.await_args_list
+        ]
+        assert [r.resolution for r in five_minutes] == [Resolution.FIVE_MINUTES]
+        assert [(r.resolution, r.bucket_start.hour) for r in hourly] == [
+            (Resolution.HOUR, 11)
+        ]
+
+    async def test_first_run_starts_at_retention(
+        self, use_case, health_repo, rollup_repo
+    ):
+        rollup_repo.get_latest_bucket_start.side_effect = None
+        rollup_repo.get_latest_bucket_start.return_value = None
+
+        await use_case.execute(NOW)
+
+        windows = [c.args[1:] for c in health_repo.aggregate_rollups.await_args_list]
+        assert windows[0][0] == datetime(2026, 6, 8, 12, 5, tzinfo=timezone.utc)
+        assert windows[-1][1] == datetime(2026, 6, 10, 12, 5, tzinfo=timezone.utc)
+        assert all(end - start <= timedelta(hours=1) for start, end in windows)
+
+    async def test_waits_a_flush_interval_longer(self, health_repo, rollup_repo):
+        use_case = ConsolidateRollupsUseCase(
+            health_repo, rollup_repo, flush_interval=timedelta(minutes=3)
+        )
+
+        await use_case.execute(NOW)
+
+        # 12:00 ended less than SETTLE_DELAY + 3 minutes ago.
+        health_repo.aggregate_rollups.assert_awaited_once_with(
+            Resolution.FIVE_MINUTES,
+            datetime(2026, 6, 10, 11, 55, tzinfo=timezone.utc),
+            datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc),
+        )
+
+    async def test_purges_each_tier_by_its_retention(self, use_case, rollup_repo):
+        await use_case.execute(NOW)
+
+        settled = NOW - SETTLE_DELAY
+        assert [c.args for c in rollup_repo.purge_older_than.await_args_list] == [
+            (Resolution.FIVE_MINUTES, settled - timedelta(days=2)),
+            (Resolution.HOUR, settled - timedelta(days=30)),
+        ]
@@ -1,67 +1,48 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
 from healthchecker.application.use_cases.consolidate_summaries import (
     ConsolidateDailySummariesUseCase,
 )
-from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.daily_summary import DailySummary
 
 
-class TestConsolidateDailySummariesUseCase:
-    @pytest.fixture
-    def now(self):
-        return datetime(2026, 6, 10, 12, 0, 0, tzinfo=timezone.utc)
+def make_summary(url_id: int, day: date) -> DailySummary:
+    return DailySummary(
+        id=None,
+        url_id=url_id,
+        summary_date=day,
+        checks_count=3,
+        avg_ttfb_ms=125.0,
+        min_ttfb_ms=100.0,
+        max_ttfb_ms=150.0,
+        min_ssl_days_remaining=50,
+        healthy_count=2,
+        unhealthy_count=1,
+        last_http_status=503,
+        last_ssl_expiration_date=None,
+        last_checked_at=datetime.now(timezone.utc),
+        created_at=datetime.now(timezone.utc),
+    )
+
 
+class TestConsolidateDailySummariesUseCase:
     @pytest.fixture
-    def raw_checks(self, now):
-        return [
-            HealthCheck(
-                id=1,
-                url_id=1,
-                http_status=200,
-                ttfb_ms=100.0,
-                ssl_expiration_date=now,
-                ssl_days_remaining=50,
-                is_healthy=True,
-                error_message=None,
-                checked_at=now,
-            ),
-            HealthCheck(
-                id=2,
-                url_id=1,
-                http_status=200,
-                ttfb_ms=150.0,
-                ssl_expiration_date=now,
-                ssl_days_remaining=50,
-                is_healthy=True,
-                error_message=None,
-                checked_at=datetime(2026, 6, 10, 12, 1, 0, tzinfo=timezone.utc),
-            ),
-            HealthCheck(
-                id=3,
-                url_id=1,
-                http_status=503,
-                ttfb_ms=None,
-                ssl_expiration_date=None,
-                ssl_days_remaining=None,
-                is_healthy=False,
-                error_message="Timeout",
-                checked_at=datetime(2026, 6, 10, 12, 2, 0, tzinfo=timezone.utc),
-            ),
-        ]
+    def today(self):
+        return date.today()
 
     @pytest.fixture
-    def mocks(self, mocker, raw_checks):
+    def mocks(self, mocker, today):
         health_repo = mocker.AsyncMock()
-        health_repo.get_dates_needing_consolidation.return_value = [
-            (1, date(2026, 6, 10))
-        ]
-        health_repo.get_raw_for_date.return_value = raw_checks
+        health_repo.aggregate_day.side_effect = lambda day: [make_summary(1, day)]
+        health_repo.get_purge_id_range.return_value = (1, 3)
         health_repo.purge_older_than.return_value = 3
 
         summary_repo = mocker.AsyncMock()
-        summary_repo.get_by_url_id_and_date.return_value = None
+        summary_repo.get_consolidation_watermark.return_value = today - timedelta(
+            days=3
+        )
         return health_repo, summary_repo
 
     @pytest.fixture
@@ -73,39 +54,114 @@ class TestConsolidateDailySummariesUseCase:
             retention_days=7,
         )
 
-    async def test_consolidates_and_purges(self, use_case, mocks):
+    async def test_consolidates_days_after_watermark(self, use_case, mocks, today):
         health_repo, summary_repo = mocks
         count = await use_case.execute()
 
-        assert count == 1
-        health_repo.get_dates_needing_consolidation.assert_awaited_once()
-        health_repo.get_raw_for_date.assert_awaited_once_with(1, date(2026, 6, 10))
-        summary_repo.save.assert_awaited_once()
-        health_repo.purge_older_than.assert_awaited_once()
+        assert count == 2
+        assert [c.args[0] for c in health_repo.aggregate_day.await_args_list] == [
+            today - timedelta(days=2),
+            today - timedelta(days=1),
+        ]
+        assert summary_repo.save_many.await_count == 2
+        (saved,) = summary_repo.save_many.call_args[0][0]
+        assert saved.summary_date == today - timedelta(days=1)
+        summary_repo.set_consolidation_watermark.assert_awaited_with(
+            today - timedelta(days=1)
+        )
+        health_repo.purge_older_than.assert_awaited_once_with(
+            today - timedelta(days=7), 1, 3
+        )
+        health_repo.get_first_check_date.assert_not_called()
+
+    async def test_starts_at_first_check_without_watermark(
+        self, use_case, mocks, today
+    ):
+        health_repo, summary_repo = mocks
+        summary_repo.get_consolidation_watermark.return_value = None
+        health_repo.get_first_check_date.return_value = today - timedelta(days=1)
+
+        assert await use_case.execute() == 1
+        health_repo.aggregate_day.assert_awaited_once_with(today - timedelta(days=1))
+
+    async def test_today_is_not_consolidated(self, use_case, mocks, today):
+        health_repo, summary_repo = mocks
+        summary_repo.get_consolidation_watermark.return_value = today - timedelta(
+            days=1
+        )
+
+        assert await use_case.execute() == 0
+        assert use_case.last_run_complete is True
+        health_repo.aggregate_day.assert_not_called()
+
+    async def test_no_checks_yet(self, use_case, mocks):
+        health_repo, summary_repo = mocks
+        summary_repo.get_consolidation_watermark.return_value = None
+        health_repo.get_first_check_date.return_value = None
+
+        assert await use_case.execute() == 0
+        health_repo.aggregate_day.assert_not_called()
+        summary_repo.save_many.assert_not_called()
+
+    async def test_failed_day_keeps_watermark(self, use_case, mocks):
+        health_repo, summary_repo = mocks
+        health_repo.aggregate_day.side_effect = RuntimeError("db gone")
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute()
+
+        summary_repo.set_consolidation_watermark.assert_not_called()
+        health_repo.purge_older_than.assert_not_called()
+        assert use_case.last_run_complete is False
+
+    async def test_retention_zero_keeps_today(self, mocks, today):
+        health_repo, summary_repo = mocks
+        use_case = ConsolidateDailySummariesUseCase(health_repo, summary_repo, 0)
 
-    async def test_saved_summary_values(self, use_case, mocks, raw_checks):
-        _, summary_repo = mocks
         await use_case.execute()
-        saved = summary_repo.save.call_args[0][0]
-
-        assert saved.url_id == 1
-        assert saved.summary_date == date(2026, 6, 10)
-        assert saved.checks_count == 3
-        assert saved.avg_ttfb_ms == 125.0
-        assert saved.min_ttfb_ms == 100.0
-        assert saved.max_ttfb_ms == 150.0
-        assert saved.min_ssl_days_remaining == 50
-        assert saved.healthy_count == 2
-        assert saved.unhealthy_count == 1
-        assert saved.last_http_status == 503
-
-    async def test_no_pending_consolidation(self, mocker):
-        health_repo = mocker.AsyncMock()
-        health_repo.get_dates_needing_consolidation.return_value = []
-        summary_repo = mocker.AsyncMock()
-        uc = ConsolidateDailySummariesUseCase(health_repo, summary_repo)
 
-        count = await uc.execute()
+        health_repo.purge_older_than.assert_awaited_once_with(
+            today - timedelta(days=1), 1, 3
+        )
+
+    async def test_incremental_rewrites_only_partial_summaries(self, mocks, today):
+        health_repo, summary_repo = mocks
+        complete = today - timedelta(days=2)
+        health_repo.aggregate_day.side_effect = lambda day: [
+            make_summary(1, day),
+            make_summary(2, day),
+        ]
+        partial = make_summary(2, complete)
+        partial.checks_count = 1
+        partial.healthy_count = 1
+        summary_repo.get_for_date.side_effect = lambda day: (
+            [make_summary(1, day), partial] if day == complete else []
+        )
+        use_case = ConsolidateDailySummariesUseCase(
+            health_repo, summary_repo, incremental=True
+        )
+
+        assert await use_case.execute() == 3
+        first_day, second_day = (
+            c.args[0] for c in summary_repo.save_many.await_args_list
+        )
+        assert [(s.url_id, s.checks_count) for s in first_day] == [(2, 3)]
+        assert [s.url_id for s in second_day] == [1, 2]
+        summary_repo.set_consolidation_watermark.assert_awaited_with(
+            today - timedelta(days=1)
+        )
+
+    async def test_stops_when_time_budget_is_used_up(self, use_case, mocks):
+        health_repo, summary_repo = mocks
+
+        count = await use_case.execute(time_budget_sec=0)
+
         assert count == 0
-        health_repo.get_raw_for_date.assert_not_called()
-        summary_repo.save.assert_not_called()
+        assert use_case.last_run_complete is False
+        summary_repo.save_many.assert_not_called()
+        health_repo.purge_older_than.assert_not_called()
+
+    async def test_complete_run_is_recorded(self, use_case):
+        await use_case.execute(time_budget_sec=60)
+
+        assert use_case.last_run_complete is True
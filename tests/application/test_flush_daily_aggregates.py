@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from healthchecker.application.use_cases.flush_daily_aggregates import (
+    FlushDailyAggregatesUseCase,
+)
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+
+
+def make_check(url_id: int, ttfb: float) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200,
+        ttfb_ms=ttfb,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=True,
+        error_message=None,
+        checked_at=datetime.now(timezone.utc),
+    )
+
+
+class TestFlushDailyAggregatesUseCase:
+    @pytest.fixture
+    def summary_repo(self, mocker):
+        repo = mocker.AsyncMock()
+        repo.get_for_date.return_value = []
+        return repo
+
+    @pytest.fixture
+    def aggregator(self):
+        return DailyAggregator()
+
+    @pytest.fixture
+    def use_case(self, aggregator, summary_repo):
+        return FlushDailyAggregatesUseCase(aggregator, summary_repo)
+
+    async def test_seeds_from_stored_summary_once(
+        self, use_case, aggregator, summary_repo
+    ):
+        stored = DailySummary.from_check(make_check(1, 100.0))
+        stored.id = 5
+        summary_repo.get_for_date.return_value = [stored]
+        aggregator.record(make_check(1, 300.0))
+
+        assert await use_case.execute() == 1
+        (saved,) = summary_repo.save_many.call_args[0][0]
+        assert saved.id == 5
+        assert saved.checks_count == 2
+        assert saved.avg_ttfb_ms == 200.0
+
+        aggregator.record(make_check(1, 200.0))
+        assert await use_case.execute() == 1
+        assert summary_repo.save_many.call_args[0][0][0].checks_count == 3
+        summary_repo.get_for_date.assert_awaited_once_with(stored.summary_date)
+
+    async def test_seeds_a_day_with_one_query(self, use_case, aggregator, summary_repo):
+        stored = DailySummary.from_check(make_check(1, 100.0))
+        summary_repo.get_for_date.return_value = [stored]
+        for url_id in (1, 2, 3):
+            aggregator.record(make_check(url_id, 300.0))
+
+        assert await use_case.execute() == 3
+        summary_repo.get_for_date.assert_awaited_once_with(stored.summary_date)
+        written = {s.url_id: s for s in summary_repo.save_many.call_args[0][0]}
+        assert written[1].checks_count == 2
+        assert written[2].checks_count == 1
+
+    async def test_nothing_to_write(self, use_case, summary_repo):
+        assert await use_case.execute() == 0
+        summary_repo.get_for_date.assert_not_called()
+
+    async def test_failed_write_is_retried(self, use_case, aggregator, summary_repo):
+        aggregator.record(make_check(1, 100.0))
+        aggregator.record(make_check(2, 100.0))
+        summary_repo.save_many.side_effect = RuntimeError("db gone")
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute()
+
+        summary_repo.save_many.side_effect = None
+        assert await use_case.execute() == 2
+        written = summary_repo.save_many.call_args[0][0]
+        assert sorted(s.url_id for s in written) == [1, 2]
+
+    async def test_unwritable_summary_does_not_block_others(
+        self, use_case, aggregator, summary_repo
+    ):
+        async def save_many(summaries):
+            if any(s.url_id == 1 for s in summaries):
+                raise RuntimeError("FOREIGN KEY constraint failed")
+
+        summary_repo.save_many.side_effect = save_many
+        aggregator.record(make_check(1, 100.0))
+        aggregator.record(make_check(2, 100.0))
+
+        assert await use_case.execute() == 1
+
+        aggregator.record(make_check(2, 300.0))
+        assert await use_case.execute() == 1
+        (written,) = summary_repo.save_many.call_args[0][0]
+        assert written.url_id == 2
+        assert written.checks_count == 2
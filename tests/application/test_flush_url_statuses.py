@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from healthchecker.application.use_cases.flush_url_statuses import (
+    FlushUrlStatusesUseCase,
+)
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+
+
+def make_check(url_id: int) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200,
+        ttfb_ms=100.0,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=True,
+        error_message=None,
+        checked_at=datetime.now(timezone.utc),
+    )
+
+
+class TestFlushUrlStatusesUseCase:
+    @pytest.fixture
+    def status_repo(self, mocker):
+        return mocker.AsyncMock()
+
+    @pytest.fixture
+    def store(self):
+        return UrlStatusStore()
+
+    @pytest.fixture
+    def use_case(self, store, status_repo):
+        return FlushUrlStatusesUseCase(store, status_repo)
+
+    async def test_writes_changed_statuses_in_one_statement(
+        self, use_case, store, status_repo
+    ):
+        for url_id in (1, 2, 1):
+            store.record(make_check(url_id))
+
+        assert await use_case.execute() == 2
+        status_repo.save_many.assert_awaited_once()
+        assert sorted(s.url_id for s in status_repo.save_many.call_args[0][0]) == [1, 2]
+
+        assert await use_case.execute() == 0
+        status_repo.save_many.assert_awaited_once()
+
+    async def test_failed_write_is_retried(self, use_case, store, status_repo):
+        store.record(make_check(1))
+        status_repo.save_many.side_effect = RuntimeError("db gone")
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute()
+
+        status_repo.save_many.side_effect = None
+        assert await use_case.execute() == 1
+
+    async def test_unwritable_status_does_not_block_others(
+        self, use_case, store, status_repo
+    ):
+        async def save_many(statuses):
+            if any(s.url_id == 1 for s in statuses):
+                raise RuntimeError("FOREIGN KEY constraint failed")
+
+        status_repo.save_many.side_effect = save_many
+        store.record(make_check(1))
+        store.record(make_check(2))
+
+        assert await use_case.execute() == 1
+        assert await use_case.execute() == 0
@@ -1,9 +1,15 @@
-from datetime import datetime, timezone
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+from typing import ClassVar
 
 import pytest
 
 from healthchecker.application.use_cases.get_results import GetResultsUseCase
 from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.rollup import Resolution
+from healthchecker.domain.models.url_status import UrlStatus
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.url_status_store import UrlStatusStore
 
 
 class TestGetResultsUseCase:
@@ -63,3 +69,143 @@ class TestGetResultsUseCase:
         uc = GetResultsUseCase(repo)
         result = await uc.get_latest(999)
         assert result is None
+
+    async def test_history_served_from_recent_checks(self, mock_repo):
+        recent = RecentChecks(depth=10)
+        uc = GetResultsUseCase(mock_repo, recent_checks=recent)
+
+        first = await uc.get_history(1, limit=5)
+        recent.record(mock_repo.get_latest_by_url_id.return_value)
+        again = await uc.get_history(1, limit=5)
+        latest = await uc.get_latest(1)
+
+        mock_repo.get_by_url_id.assert_awaited_once_with(1, limit=5)
+        assert len(first) == 1
+        assert len(again) == 2
+        assert latest.ttfb_ms == 50.0
+        mock_repo.get_latest_by_url_id.assert_not_called()
+
+    async def test_history_past_depth_reads_database(self, mock_repo):
+        uc = GetResultsUseCase(mock_repo, recent_checks=RecentChecks(depth=3))
+
+        await uc.get_history(1, limit=20)
+        await uc.get_history(1, limit=20)
+
+        assert mock_repo.get_by_url_id.await_count == 2
+
+    async def test_latest_for_urls_queries_only_missing_urls(self, mock_repo):
+        recent = RecentChecks(depth=10)
+        recent.record(mock_repo.get_latest_by_url_id.return_value)
+        other = replace(mock_repo.get_latest_by_url_id.return_value, id=11, url_id=2)
+        mock_repo.get_latest_for_urls.return_value = [other]
+        uc = GetResultsUseCase(mock_repo, recent_checks=recent)
+
+        latest = await uc.get_latest_for_urls([1, 2, 3])
+
+        mock_repo.get_latest_for_urls.assert_awaited_once_with([2, 3])
+        assert {url_id: c.id for url_id, c in latest.items()} == {1: 10, 2: 11}
+
+    async def test_statuses_read_from_status_table(self, mocker, mock_repo):
+        status_repo = mocker.AsyncMock()
+        status = UrlStatus.from_check(mock_repo.get_latest_by_url_id.return_value)
+        status_repo.get_for_urls.return_value = [status]
+        mock_repo.get_latest_for_urls.return_value = []
+        uc = GetResultsUseCase(mock_repo, url_status_repo=status_repo)
+
+        statuses = await uc.get_statuses([1, 2])
+
+        status_repo.get_for_urls.assert_awaited_once_with([1, 2])
+        mock_repo.get_latest_for_urls.assert_awaited_once_with([2])
+        assert statuses == {1: status}
+
+    async def test_statuses_read_from_memory_first(self, mocker, mock_repo):
+        status_repo = mocker.AsyncMock()
+        status_repo.get_for_urls.return_value = []
+        mock_repo.get_latest_for_urls.return_value = []
+        store = UrlStatusStore()
+        status = store.record(mock_repo.get_latest_by_url_id.return_value)
+        uc = GetResultsUseCase(
+            mock_repo, url_status_repo=status_repo, url_statuses=store
+        )
+
+        statuses = await uc.get_statuses([1, 2])
+
+        status_repo.get_for_urls.assert_awaited_once_with([2])
+        assert statuses == {1: status}
+
+    async def test_statuses_fall_back_to_latest_checks(self, mock_repo):
+        check = mock_repo.get_latest_by_url_id.return_value
+        mock_repo.get_latest_for_urls.return_value = [check]
+        uc = GetResultsUseCase(mock_repo)
+
+        statuses = await uc.get_statuses([1])
+
+        assert statuses[1].last_checked_at == check.checked_at
+        assert statuses[1].consecutive_failures == 0
+
+    async def test_latest_for_urls_all_in_memory(self, mock_repo):
+        recent = RecentChecks(depth=10)
+        recent.record(mock_repo.get_latest_by_url_id.return_value)
+        uc = GetResultsUseCase(mock_repo, recent_checks=recent)
+
+        latest = await uc.get_latest_for_urls([1])
+
+        assert latest[1].id == 10
+        mock_repo.get_latest_for_urls.assert_not_called()
+
+
+class TestGetSeries:
+    RETENTION: ClassVar[dict[Resolution, timedelta]] = {
+        Resolution.FIVE_MINUTES: timedelta(hours=48),
+        Resolution.HOUR: timedelta(days=30),
+    }
+
+    @pytest.fixture
+    def repos(self, mocker):
+        rollup_repo = mocker.AsyncMock()
+        rollup_repo.get_range_for_url.return_value = []
+        summary_repo = mocker.AsyncMock()
+        summary_repo.get_range_for_url.return_value = []
+        return rollup_repo, summary_repo
+
+    @pytest.fixture
+    def use_case(self, mocker, repos):
+        rollup_repo, summary_repo = repos
+        return GetResultsUseCase(
+            mocker.AsyncMock(), rollup_repo, summary_repo, self.RETENTION
+        )
+
+    async def test_reads_tier_of_requested_resolution(self, use_case, repos):
+        rollup_repo, summary_repo = repos
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(hours=24)
+
+        await use_case.get_series(1, start, end, Resolution.HOUR)
+
+        rollup_repo.get_range_for_url.assert_awaited_once_with(
+            Resolution.HOUR, 1, Resolution.HOUR.floor(start), end
+        )
+        summary_repo.get_range_for_url.assert_not_called()
+
+    async def test_falls_back_to_coarser_tier_past_retention(self, use_case, repos):
+        rollup_repo, _ = repos
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(days=5)
+
+        await use_case.get_series(1, start, end, Resolution.FIVE_MINUTES)
+
+        rollup_repo.get_range_for_url.assert_awaited_once_with(
+            Resolution.HOUR, 1, Resolution.HOUR.floor(start), end
+        )
+
+    async def test_daily_summaries_answer_long_ranges(self, use_case, repos):
+        rollup_repo, summary_repo = repos
+        end = datetime(2026, 6, 10, tzinfo=timezone.utc)
+        start = end - timedelta(days=90)
+
+        await use_case.get_series(1, start, end, Resolution.HOUR)
+
+        rollup_repo.get_range_for_url.assert_not_called()
+        summary_repo.get_range_for_url.assert_awaited_once_with(
+            1, date(2026, 3, 12), date(2026, 6, 10)
+        )
@@ -2,6 +2,10 @@ import pytest
 
 from healthchecker.application.use_cases.manage_urls import ManageUrlsUseCase
 from healthchecker.domain.models.url import Url
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+from healthchecker.domain.services.recent_checks import RecentChecks
+from healthchecker.domain.services.ssl_expiry_timeline import SslExpiryTimeline
+from healthchecker.domain.services.url_status_store import UrlStatusStore
 
 
 class TestManageUrlsUseCase:
@@ -60,6 +64,80 @@ class TestManageUrlsUseCase:
         await use_case.delete(1)
         mock_repo.delete.assert_awaited_once_with(1)
 
+    async def test_delete_forgets_url_status(self, mock_repo, mocker):
+        url_statuses = UrlStatusStore()
+        url_statuses.load([mocker.Mock(url_id=1)])
+        use_case = ManageUrlsUseCase(mock_repo, url_statuses)
+
+        await use_case.delete(1)
+
+        assert url_statuses.get(1) is None
+
+    async def test_delete_forgets_ssl_state(self, mock_repo, mocker):
+        timeline = mocker.Mock(spec=SslExpiryTimeline)
+        ssl_checker = mocker.Mock()
+        use_case = ManageUrlsUseCase(
+            mock_repo, ssl_timeline=timeline, ssl_checker=ssl_checker
+        )
+
+        await use_case.delete(1)
+
+        timeline.forget.assert_called_once_with(1)
+        ssl_checker.forget.assert_called_once_with("https://example.com")
+
+    async def test_recent_checks_follow_add_and_delete(self, mock_repo):
+        recent = RecentChecks()
+        use_case = ManageUrlsUseCase(mock_repo, recent_checks=recent)
+
+        await use_case.add("https://new.example.com")
+        assert recent.get(1, 5) == []
+
+        await use_case.delete(1)
+        assert recent.get(1, 5) is None
+
+    async def test_registry_follows_add_and_delete(self, mock_repo):
+        async def add_side_effect(url: Url) -> Url:
+            url.id = 2
+            return url
+
+        mock_repo.add.side_effect = add_side_effect
+        registry = ActiveUrlRegistry(mock_repo)
+        use_case = ManageUrlsUseCase(mock_repo, url_registry=registry)
+        assert [u.id for u in await use_case.list_all()] == [1]
+
+        await use_case.add("https://new.example.com")
+        assert [u.id for u in await use_case.list_all()] == [1, 2]
+
+        await use_case.delete(1)
+        assert [u.id for u in await use_case.list_all()] == [2]
+        mock_repo.get_all_active.assert_awaited_once()
+
+    async def test_delete_discards_buffered_checks(self, mock_repo, mocker):
+        buffer = mocker.Mock()
+        use_case = ManageUrlsUseCase(mock_repo, health_check_buffer=buffer)
+
+        await use_case.delete(1)
+
+        buffer.discard_url.assert_called_once_with(1)
+
+    async def test_delete_forgets_daily_aggregates(self, mock_repo, mocker):
+        aggregator = mocker.Mock()
+        use_case = ManageUrlsUseCase(mock_repo, daily_aggregator=aggregator)
+
+        await use_case.delete(1)
+
+        aggregator.forget.assert_called_once_with(1)
+
+    async def test_get_by_id_from_registry(self, mock_repo):
+        use_case = ManageUrlsUseCase(
+            mock_repo, url_registry=ActiveUrlRegistry(mock_repo)
+        )
+
+        assert (await use_case.get_by_id(1)).id == 1
+        assert await use_case.get_by_id(99) is not None
+
+        mock_repo.get_by_id.assert_awaited_once_with(99)
+
     async def test_get_by_id(self, use_case, mock_repo):
         result = await use_case.get_by_id(1)
         mock_repo.get_by_id.assert_awaited_once_with(1)
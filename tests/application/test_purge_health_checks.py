@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+
+from healthchecker.application.use_cases.purge_health_checks import (
+    PurgeHealthChecksUseCase,
+)
+
+CUTOFF = date(2026, 6, 10)
+
+
+class TestPurgeHealthChecksUseCase:
+    @pytest.fixture
+    def health_repo(self, mocker):
+        repo = mocker.AsyncMock()
+        repo.get_purge_id_range.return_value = (101, 350)
+        repo.purge_older_than.side_effect = lambda day, start, end: end - start + 1
+        return repo
+
+    @pytest.fixture
+    def sleep(self, mocker):
+        return mocker.patch(
+            "healthchecker.application.use_cases.purge_health_checks.asyncio.sleep"
+        )
+
+    async def test_deletes_in_primary_key_slices(self, health_repo, sleep):
+        use_case = PurgeHealthChecksUseCase(health_repo, chunk_size=100, pause_sec=0.5)
+
+        assert await use_case.execute(CUTOFF) == 250
+        assert [c.args for c in health_repo.purge_older_than.await_args_list] == [
+            (CUTOFF, 101, 200),
+            (CUTOFF, 201, 300),
+            (CUTOFF, 301, 350),
+        ]
+        assert [c.args for c in sleep.await_args_list] == [(0.5,), (0.5,)]
+
+    async def test_nothing_to_purge(self, health_repo, sleep):
+        health_repo.get_purge_id_range.return_value = None
+        use_case = PurgeHealthChecksUseCase(health_repo)
+
+        assert await use_case.execute(CUTOFF) == 0
+        health_repo.purge_older_than.assert_not_called()
+        sleep.assert_not_called()
+
+    async def test_failed_slice_stops_the_purge(self, health_repo, sleep):
+        health_repo.purge_older_than.side_effect = [100, RuntimeError("lock wait")]
+        use_case = PurgeHealthChecksUseCase(health_repo, chunk_size=100)
+
+        with pytest.raises(RuntimeError):
+            await use_case.execute(CUTOFF)
+        assert health_repo.purge_older_than.await_count == 2
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from healthchecker.domain.models.url import Url
+from healthchecker.domain.services.active_url_registry import ActiveUrlRegistry
+
+
+def make_url(url_id: int) -> Url:
+    url = Url.create(f"https://{url_id}.example.com")
+    url.id = url_id
+    return url
+
+
+class TestActiveUrlRegistry:
+    @pytest.fixture
+    def url_repo(self, mocker):
+        repo = mocker.AsyncMock()
+        repo.get_all_active.return_value = [make_url(1), make_url(2)]
+        return repo
+
+    async def test_loads_once(self, url_repo):
+        registry = ActiveUrlRegistry(url_repo)
+
+        assert [u.id for u in await registry.get_all()] == [1, 2]
+        assert (await registry.get(2)).id == 2
+        assert await registry.get(3) is None
+
+        url_repo.get_all_active.assert_awaited_once()
+
+    async def test_applies_change_notifications(self, url_repo):
+        registry = ActiveUrlRegistry(url_repo)
+        await registry.get_all()
+
+        registry.url_added(make_url(3))
+        registry.url_removed(1)
+
+        assert [u.id for u in await registry.get_all()] == [2, 3]
+        url_repo.get_all_active.assert_awaited_once()
+
+    async def test_reconciles_after_interval(self, url_repo):
+        registry = ActiveUrlRegistry(url_repo, reconcile_interval_sec=0)
+        await registry.get_all()
+
+        url_repo.get_all_active.return_value = [make_url(5)]
+
+        assert [u.id for u in await registry.get_all()] == [5]
+        assert url_repo.get_all_active.await_count == 2
+
+    async def test_change_during_reload_is_kept(self, url_repo):
+        registry = ActiveUrlRegistry(url_repo)
+        release = asyncio.Event()
+
+        async def slow_load():
+            await release.wait()
+            return [make_url(1), make_url(2)]
+
+        url_repo.get_all_active.side_effect = slow_load
+        load = asyncio.create_task(registry.get_all())
+        await asyncio.sleep(0)
+        registry.url_added(make_url(3))
+        registry.url_removed(2)
+        release.set()
+
+        assert [u.id for u in await load] == [1, 3]
+
+    async def test_concurrent_readers_share_one_load(self, url_repo):
+        registry = ActiveUrlRegistry(url_repo)
+
+        await asyncio.gather(registry.get_all(), registry.get_all())
+
+        url_repo.get_all_active.assert_awaited_once()
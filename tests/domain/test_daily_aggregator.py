@@ -0,0 +1,102 @@
+from datetime import date, datetime, timezone
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.services.daily_aggregator import DailyAggregator
+
+DAY = date(2026, 6, 10)
+
+
+def make_check(
+    url_id: int = 1, hour: int = 12, ttfb: float = 100.0, day: int = 10
+) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200,
+        ttfb_ms=ttfb,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=True,
+        error_message=None,
+        checked_at=datetime(2026, 6, day, hour, tzinfo=timezone.utc),
+    )
+
+
+class TestDailyAggregator:
+    def test_collects_deltas_until_seeded(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check(ttfb=100.0))
+        aggregator.record(make_check(ttfb=300.0))
+
+        assert aggregator.unseeded() == [(1, DAY)]
+        assert aggregator.take_dirty() == []
+
+        aggregator.seed((1, DAY), None)
+
+        (summary,) = aggregator.take_dirty()
+        assert summary.checks_count == 2
+        assert summary.avg_ttfb_ms == 200.0
+        assert aggregator.unseeded() == []
+
+    def test_seed_merges_stored_summary(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check(ttfb=400.0))
+        stored = DailySummary.from_check(make_check(hour=1, ttfb=100.0))
+
+        aggregator.seed((1, DAY), stored)
+
+        (summary,) = aggregator.take_dirty()
+        assert summary.checks_count == 2
+        assert summary.avg_ttfb_ms == 250.0
+
+    def test_seeded_totals_update_in_place(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check())
+        aggregator.seed((1, DAY), None)
+        aggregator.take_dirty()
+
+        assert aggregator.take_dirty() == []
+        aggregator.record(make_check(hour=13))
+
+        (summary,) = aggregator.take_dirty()
+        assert summary.checks_count == 2
+        assert aggregator.unseeded() == []
+
+    def test_mark_dirty_after_failed_write(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check())
+        aggregator.seed((1, DAY), None)
+        dirty = aggregator.take_dirty()
+
+        aggregator.mark_dirty(dirty)
+
+        assert aggregator.take_dirty() == dirty
+
+    def test_evicts_written_past_days(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check(day=9))
+        aggregator.record(make_check(day=10))
+        aggregator.seed((1, date(2026, 6, 9)), None)
+        aggregator.seed((1, DAY), None)
+        aggregator.take_dirty()
+
+        aggregator.evict_before(DAY)
+        aggregator.record(make_check(day=9, hour=23))
+        aggregator.record(make_check(day=10, hour=13))
+
+        assert aggregator.unseeded() == [(1, date(2026, 6, 9))]
+        assert [s.summary_date for s in aggregator.take_dirty()] == [DAY]
+
+    def test_forget_drops_a_url(self):
+        aggregator = DailyAggregator()
+        aggregator.record(make_check(url_id=1))
+        aggregator.record(make_check(url_id=2))
+        aggregator.seed((1, DAY), None)
+        aggregator.seed((2, DAY), None)
+
+        aggregator.forget(1)
+        aggregator.record(make_check(url_id=3))
+
+        assert aggregator.unseeded() == [(3, DAY)]
+        assert [s.url_id for s in aggregator.take_dirty()] == [2]
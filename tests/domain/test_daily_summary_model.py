@@ -1,6 +1,8 @@
 from datetime import date, datetime, timezone
 
-from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.daily_summary import DailySummary, merge_sketches
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import LatencySketch
 
 
 class TestDailySummaryModel:
@@ -50,3 +52,83 @@ class TestDailySummaryModel:
         assert s.healthy_count == 80
         assert s.unhealthy_count == 20
         assert s.avg_ttfb_ms is None
+
+    def test_from_check(self):
+        checked_at = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        s = DailySummary.from_check(
+            HealthCheck(
+                id=None,
+                url_id=1,
+                http_status=503,
+                ttfb_ms=None,
+                ssl_expiration_date=None,
+                ssl_days_remaining=20,
+                is_healthy=False,
+                error_message="boom",
+                checked_at=checked_at,
+            )
+        )
+        assert s.summary_date == date(2026, 6, 10)
+        assert s.checks_count == 1
+        assert s.ttfb_count == 0
+        assert s.avg_ttfb_ms is None
+        assert s.ttfb_sketch is None
+        assert s.unhealthy_count == 1
+        assert s.min_ssl_days_remaining == 20
+        assert s.last_checked_at == checked_at
+
+    def test_merged(self):
+        early = datetime(2026, 6, 10, 1, tzinfo=timezone.utc)
+        late = datetime(2026, 6, 10, 2, tzinfo=timezone.utc)
+        a = DailySummary(
+            id=7,
+            url_id=1,
+            summary_date=date(2026, 6, 10),
+            checks_count=3,
+            avg_ttfb_ms=100.0,
+            min_ttfb_ms=50.0,
+            max_ttfb_ms=150.0,
+            min_ssl_days_remaining=None,
+            healthy_count=3,
+            unhealthy_count=0,
+            last_http_status=200,
+            last_ssl_expiration_date=None,
+            last_checked_at=early,
+            created_at=early,
+            ttfb_count=2,
+            ttfb_sketch=LatencySketch.of(50.0, 150.0),
+        )
+        b = DailySummary(
+            id=None,
+            url_id=1,
+            summary_date=date(2026, 6, 10),
+            checks_count=1,
+            avg_ttfb_ms=400.0,
+            min_ttfb_ms=400.0,
+            max_ttfb_ms=400.0,
+            min_ssl_days_remaining=30,
+            healthy_count=0,
+            unhealthy_count=1,
+            last_http_status=503,
+            last_ssl_expiration_date=None,
+            last_checked_at=late,
+            created_at=None,
+            ttfb_count=1,
+            ttfb_sketch=LatencySketch.of(400.0),
+        )
+
+        for merged in (a.merged(b), b.merged(a)):
+            assert merged.id == 7
+            assert merged.checks_count == 4
+            assert merged.ttfb_count == 3
+            assert merged.avg_ttfb_ms == 200.0
+            assert merged.min_ttfb_ms == 50.0
+            assert merged.max_ttfb_ms == 400.0
+            assert merged.min_ssl_days_remaining == 30
+            assert merged.healthy_count == 3
+            assert merged.unhealthy_count == 1
+            assert merged.last_http_status == 503
+            assert merged.last_checked_at == late
+            assert merged.ttfb_sketch == LatencySketch.of(50.0, 150.0, 400.0)
+        assert merge_sketches([a, b]) == LatencySketch.of(50.0, 150.0, 400.0)
+        assert a.ttfb_sketch.count == 2
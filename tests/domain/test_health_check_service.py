@@ -55,3 +55,10 @@ class TestHealthCheckService:
         )
         assert alert.alert_type == AlertType.HTTP_DOWN
         assert "Connection refused" in alert.message
+
+    def test_build_http_down_alert_with_status_and_error(self):
+        alert = HealthCheckService.build_http_down_alert(
+            1, "Example", 200, "Assertion failed: expected body contains 'OK'"
+        )
+        assert "HTTP 200" in alert.message
+        assert "Assertion failed" in alert.message
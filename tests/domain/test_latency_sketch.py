@@ -0,0 +1,66 @@
+import math
+import random
+
+import pytest
+
+from healthchecker.domain.models.latency_sketch import (
+    LOG_GAMMA,
+    RELATIVE_ACCURACY,
+    LatencySketch,
+)
+
+
+class TestLatencySketch:
+    def test_empty_sketch(self):
+        sketch = LatencySketch()
+
+        assert sketch.count == 0
+        assert sketch.quantile(0.5) is None
+
+    @pytest.mark.parametrize("q", [0.0, 0.5, 0.95, 0.99, 1.0])
+    def test_quantiles_within_relative_accuracy(self, q):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(5, 1) for _ in range(5000))
+        sketch = LatencySketch.of(*values)
+
+        expected = values[round(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(expected, rel=RELATIVE_ACCURACY)
+
+    def test_merge_equals_sketch_of_all_values(self):
+        week = [LatencySketch.of(day * 10.0, day * 100.0) for day in range(1, 8)]
+
+        merged = week[0]
+        for sketch in week[1:]:
+            merged = merged.merged(sketch)
+
+        assert merged == LatencySketch.of(
+            *[d * 10.0 for d in range(1, 8)], *[d * 100.0 for d in range(1, 8)]
+        )
+        assert week[0].count == 2
+
+    def test_zero_latencies(self):
+        sketch = LatencySketch.of(0.0, 0.0, 50.0)
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(50.0, rel=RELATIVE_ACCURACY)
+
+    def test_from_counts_equals_sketch_of_values(self):
+        values = [0.0, 1.5, 120.0, 120.0, 9000.0]
+        counts: dict[int | None, int] = {}
+        for value in values:
+            index = math.ceil(math.log(value) / LOG_GAMMA) if value else None
+            counts[index] = counts.get(index, 0) + 1
+
+        assert LatencySketch.from_counts(counts.items()) == LatencySketch.of(*values)
+
+    def test_round_trips_through_bytes(self):
+        sketch = LatencySketch.of(0.0, 1.5, 120.0, 120.0, 9000.0)
+
+        data = sketch.to_bytes()
+
+        assert LatencySketch.from_bytes(data) == sketch
+        assert len(data) == 5 + 6 * 3
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            LatencySketch.from_bytes(b"\x09\x00\x00\x00\x00")
@@ -0,0 +1,19 @@
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.merging import max_of, merge_sketch_pair, min_of
+
+
+class TestMerging:
+    def test_min_and_max_skip_missing_values(self):
+        assert min_of(None, 3) == 3
+        assert min_of(2, 3) == 2
+        assert max_of(4, None) == 4
+        assert max_of(2, 3) == 3
+        assert min_of(None, None) is None
+
+    def test_merge_sketch_pair(self):
+        a = LatencySketch.of(10.0)
+        b = LatencySketch.of(20.0)
+
+        assert merge_sketch_pair(a, None) is a
+        assert merge_sketch_pair(None, None) is None
+        assert merge_sketch_pair(a, b) == LatencySketch.of(10.0, 20.0)
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.services.recent_checks import RecentChecks
+
+T0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+
+
+def make_check(url_id: int, minute: int, **kwargs) -> HealthCheck:
+    fields = {
+        "id": None,
+        "url_id": url_id,
+        "http_status": 200,
+        "ttfb_ms": 100.0 + minute,
+        "ssl_expiration_date": None,
+        "ssl_days_remaining": None,
+        "is_healthy": True,
+        "error_message": None,
+        "checked_at": T0 + timedelta(minutes=minute),
+    }
+    return HealthCheck(**{**fields, **kwargs})
+
+
+class TestRecentChecks:
+    def test_round_trips_every_field(self):
+        recent = RecentChecks(depth=3)
+        full = make_check(
+            1,
+            0,
+            id=42,
+            http_status=503,
+            ttfb_ms=120.5,
+            ssl_expiration_date=T0 + timedelta(days=30),
+            ssl_days_remaining=-2,
+            is_healthy=False,
+            error_message="Timeout",
+            dns_ms=3.25,
+            connect_ms=12.0,
+            tls_ms=30.5,
+            total_ms=250.0,
+            bytes_received=5120,
+            tls_version="TLSv1.3",
+            tls_cipher="TLS_AES_256_GCM_SHA384",
+        )
+        empty = make_check(1, 1, http_status=None, ttfb_ms=None)
+
+        recent.record(full)
+        recent.record(empty)
+
+        assert recent.latest(1) == empty
+        assert recent.get(1, 2) == [empty, full]
+        assert recent.get(1, 3) is None  # older checks may exist
+        recent.track_new(2)
+        recent.record(make_check(2, 0))
+        assert len(recent.get(2, 5)) == 1
+
+        recent.prime(1, [full], complete=True)
+        assert recent.get(1, 5) == [empty, full]
+
+    def test_keeps_only_depth_newest(self):
+        recent = RecentChecks(depth=3)
+        recent.track_new(1)
+        for minute in range(5):
+            recent.record(make_check(1, minute))
+
+        assert [c.checked_at.minute for c in recent.get(1, 3)] == [4, 3, 2]
+        assert recent.get(1, 4) is None
+
+    def test_prime_keeps_checks_recorded_since_the_query(self):
+        recent = RecentChecks(depth=5)
+        recent.record(make_check(1, 2))
+        recent.record(make_check(1, 3))
+
+        recent.prime(1, [make_check(1, 2), make_check(1, 1)], complete=False)
+
+        assert [c.checked_at.minute for c in recent.get(1, 3)] == [3, 2, 1]
+        assert recent.get(1, 4) is None
+
+    def test_forget(self):
+        recent = RecentChecks()
+        recent.record(make_check(1, 0))
+
+        recent.forget(1)
+
+        assert recent.latest(1) is None
+        assert recent.get(1, 1) is None
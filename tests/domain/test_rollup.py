@@ -0,0 +1,102 @@
+from datetime import date, datetime, timedelta, timezone
+
+from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.rollup import Resolution, Rollup, roll_up
+
+T0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+
+
+def make_check(url_id: int, minute: int, ttfb: float | None, healthy=True):
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200 if healthy else 503,
+        ttfb_ms=ttfb,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=healthy,
+        error_message=None,
+        checked_at=T0 + timedelta(minutes=minute, seconds=30),
+    )
+
+
+class TestResolution:
+    def test_floor(self):
+        moment = datetime(2026, 6, 10, 12, 34, 56, tzinfo=timezone.utc)
+
+        assert Resolution.FIVE_MINUTES.floor(moment) == T0.replace(minute=30)
+        assert Resolution.HOUR.floor(moment) == T0
+        assert Resolution.DAY.floor(moment) == T0.replace(hour=0)
+        assert Resolution.HOUR.delta == timedelta(hours=1)
+
+
+class TestRollup:
+    def test_from_check(self):
+        rollup = Rollup.from_check(make_check(1, 7, 120.0), Resolution.FIVE_MINUTES)
+
+        assert rollup.bucket_start == T0.replace(minute=5)
+        assert rollup.checks_count == 1
+        assert rollup.healthy_count == 1
+        assert rollup.avg_ttfb_ms == 120.0
+        assert rollup.ttfb_sketch == LatencySketch.of(120.0)
+
+    def test_roll_up_into_buckets(self):
+        checks = [
+            make_check(1, 0, 100.0),
+            make_check(1, 3, 300.0, healthy=False),
+            make_check(1, 5, None, healthy=False),
+            make_check(2, 1, 50.0),
+        ]
+
+        rollups = roll_up(
+            [Rollup.from_check(c, Resolution.FIVE_MINUTES) for c in checks],
+            Resolution.FIVE_MINUTES,
+        )
+
+        assert [(r.url_id, r.bucket_start.minute) for r in rollups] == [
+            (1, 0),
+            (1, 5),
+            (2, 0),
+        ]
+        first = rollups[0]
+        assert first.checks_count == 2
+        assert first.unhealthy_count == 1
+        assert first.ttfb_count == 2
+        assert first.avg_ttfb_ms == 200.0
+        assert (first.min_ttfb_ms, first.max_ttfb_ms) == (100.0, 300.0)
+        assert first.ttfb_sketch == LatencySketch.of(100.0, 300.0)
+        assert rollups[1].avg_ttfb_ms is None
+
+        (hour,) = roll_up(rollups[:2], Resolution.HOUR)
+        assert hour.resolution is Resolution.HOUR
+        assert hour.bucket_start == T0
+        assert hour.checks_count == 3
+        assert hour.avg_ttfb_ms == 200.0
+
+    def test_from_daily_summary(self):
+        summary = DailySummary(
+            id=1,
+            url_id=3,
+            summary_date=date(2026, 6, 10),
+            checks_count=10,
+            avg_ttfb_ms=80.0,
+            min_ttfb_ms=20.0,
+            max_ttfb_ms=200.0,
+            min_ssl_days_remaining=None,
+            healthy_count=9,
+            unhealthy_count=1,
+            last_http_status=200,
+            last_ssl_expiration_date=None,
+            last_checked_at=None,
+            created_at=None,
+            ttfb_count=10,
+        )
+
+        rollup = Rollup.from_daily_summary(summary)
+
+        assert rollup.resolution is Resolution.DAY
+        assert rollup.bucket_start == T0.replace(hour=0)
+        assert rollup.unhealthy_count == 1
+        assert rollup.avg_ttfb_ms == 80.0
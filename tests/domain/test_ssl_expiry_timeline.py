@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+
+from healthchecker.domain.services.ssl_expiry_timeline import SslExpiryTimeline
+
+EXPIRY = datetime(2026, 12, 31, tzinfo=timezone.utc)
+RENEWED = datetime(2027, 3, 31, tzinfo=timezone.utc)
+
+
+class TestSslExpiryTimeline:
+    def test_alerts_once_when_crossing_threshold(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 31, 30) is False
+        assert timeline.crossed(1, EXPIRY, 30, 30) is True
+        assert timeline.crossed(1, EXPIRY, 29, 30) is False
+
+    def test_already_below_threshold_on_first_sight(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 10, 30, was_below_threshold=True) is False
+        assert timeline.crossed(1, EXPIRY, 9, 30) is False
+
+    def test_renewed_certificate_alerts_again(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 10, 30) is True
+        assert timeline.crossed(1, RENEWED, 90, 30) is False
+        assert timeline.crossed(1, RENEWED, 30, 30) is True
+
+    def test_threshold_change_resets_crossing(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 20, 14) is False
+        assert timeline.crossed(1, EXPIRY, 20, 30) is True
+
+    def test_urls_are_tracked_independently(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 5, 30) is True
+        assert timeline.crossed(2, EXPIRY, 5, 30) is True
+
+    def test_forget_starts_over(self):
+        timeline = SslExpiryTimeline()
+        assert timeline.crossed(1, EXPIRY, 5, 30) is True
+        timeline.forget(1)
+        assert timeline.crossed(1, EXPIRY, 5, 30) is True
@@ -1,4 +1,4 @@
-from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url import DEFAULT_PROBE_MAX_BYTES, ProbeMode, Url
 
 
 class TestUrlModel:
@@ -9,6 +9,8 @@ class TestUrlModel:
         assert url.alert_before_days == 30
         assert url.is_active is True
         assert url.id is None
+        assert url.probe_mode is ProbeMode.HEAD
+        assert url.probe_max_bytes == DEFAULT_PROBE_MAX_BYTES
 
     def test_create_url_with_custom_name(self):
         url = Url.create("https://example.com", name="Example", alert_before_days=14)
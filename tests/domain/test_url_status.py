@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.url_status import UrlStatus
+
+T0 = datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def make_check(minute: int, is_healthy: bool) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=1,
+        http_status=200 if is_healthy else 503,
+        ttfb_ms=100.0,
+        ssl_expiration_date=None,
+        ssl_days_remaining=40,
+        is_healthy=is_healthy,
+        error_message=None,
+        checked_at=T0 + timedelta(minutes=minute),
+    )
+
+
+class TestUrlStatus:
+    def test_first_check(self):
+        status = UrlStatus.from_check(make_check(0, False))
+        assert status.consecutive_failures == 1
+        assert status.state_changed_at == T0
+        assert status.last_checked_at == T0
+        assert status.http_status == 503
+        assert status.ssl_days_remaining == 40
+
+    def test_counts_failures_in_a_row(self):
+        status = None
+        for minute, healthy in enumerate([True, False, False, False]):
+            status = UrlStatus.from_check(make_check(minute, healthy), status)
+        assert status.consecutive_failures == 3
+        assert status.state_changed_at == T0 + timedelta(minutes=1)
+        assert status.last_checked_at == T0 + timedelta(minutes=3)
+
+    def test_recovery_resets_failures(self):
+        status = None
+        for minute, healthy in enumerate([False, False, True, True]):
+            status = UrlStatus.from_check(make_check(minute, healthy), status)
+        assert status.is_healthy
+        assert status.consecutive_failures == 0
+        assert status.state_changed_at == T0 + timedelta(minutes=2)
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.url_status import UrlStatus
+from healthchecker.domain.services.url_status_store import UrlStatusStore
+
+
+def make_check(url_id: int, is_healthy: bool = True) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200 if is_healthy else 503,
+        ttfb_ms=None,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=is_healthy,
+        error_message=None,
+        checked_at=datetime.now(timezone.utc),
+    )
+
+
+class TestUrlStatusStore:
+    def test_load_and_get(self):
+        store = UrlStatusStore()
+        assert store.loaded is False
+
+        store.load(
+            [
+                UrlStatus.from_check(make_check(1)),
+                UrlStatus.from_check(make_check(2, is_healthy=False)),
+            ]
+        )
+
+        assert store.loaded is True
+        assert store.get(1).is_healthy is True
+        assert store.get(2).is_healthy is False
+        assert store.get(3) is None
+
+    def test_load_keeps_newer_records(self):
+        store = UrlStatusStore()
+        store.record(make_check(1, is_healthy=False))
+
+        store.load([UrlStatus.from_check(make_check(1, is_healthy=True))])
+
+        assert store.get(1).is_healthy is False
+
+    def test_record_builds_on_previous_status(self):
+        store = UrlStatusStore()
+        first = store.record(make_check(1, is_healthy=False))
+        second = store.record(make_check(1, is_healthy=False))
+
+        assert store.get(1) is second
+        assert second.consecutive_failures == 2
+        assert second.state_changed_at == first.state_changed_at
+
+    def test_forget(self):
+        store = UrlStatusStore()
+        store.record(make_check(1))
+
+        store.forget(1)
+        store.forget(2)
+
+        assert store.get(1) is None
+
+    def test_take_dirty_returns_changed_statuses_once(self):
+        store = UrlStatusStore()
+        store.load([UrlStatus.from_check(make_check(1))])
+        store.record(make_check(2))
+        store.record(make_check(2, is_healthy=False))
+
+        (dirty,) = store.take_dirty()
+
+        assert dirty.url_id == 2
+        assert dirty.consecutive_failures == 1
+        assert store.take_dirty() == []
+
+    def test_mark_dirty_skips_forgotten_urls(self):
+        store = UrlStatusStore()
+        store.record(make_check(1))
+        store.record(make_check(2))
+        dirty = store.take_dirty()
+
+        store.forget(2)
+        store.mark_dirty(dirty)
+
+        assert [s.url_id for s in store.take_dirty()] == [1]
@@ -0,0 +1,46 @@
+from healthchecker.infrastructure.checker.body_matcher import BodyMatcher
+
+
+class TestBodyMatcher:
+    def test_literal_in_single_chunk(self):
+        matcher = BodyMatcher("OK")
+        assert matcher.feed(b"status: OK") is True
+        assert matcher.matched is True
+
+    def test_literal_spanning_chunks(self):
+        matcher = BodyMatcher("maintenance")
+        assert matcher.feed(b"<p>Down for maint") is False
+        assert matcher.feed(b"enance</p>") is True
+
+    def test_literal_spanning_many_small_chunks(self):
+        matcher = BodyMatcher("healthy")
+        for byte in b"xx healthy xx":
+            if matcher.feed(bytes([byte])):
+                break
+        assert matcher.matched is True
+
+    def test_regex_spanning_chunks(self):
+        matcher = BodyMatcher(r"version: \d+\.\d+", is_regex=True)
+        assert matcher.feed(b"app version: 1") is False
+        assert matcher.feed(b"2.3 running") is True
+
+    def test_no_match(self):
+        matcher = BodyMatcher("OK")
+        assert matcher.feed(b"ERROR") is False
+        assert matcher.feed(b"", final=True) is False
+        assert matcher.matched is False
+
+    def test_multibyte_character_split_across_chunks(self):
+        matcher = BodyMatcher("café")
+        encoded = "menu: café".encode()
+        assert matcher.feed(encoded[:-1]) is False
+        assert matcher.feed(encoded[-1:]) is True
+
+    def test_keeps_bounded_tail(self):
+        matcher = BodyMatcher("needle")
+        matcher.feed(b"x" * 100_000)
+        assert len(matcher._tail) == 5
+
+    def test_unknown_encoding_falls_back_to_utf8(self):
+        matcher = BodyMatcher("OK", encoding="not-a-charset")
+        assert matcher.feed(b"OK") is True
@@ -0,0 +1,147 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from tortoise.exceptions import IntegrityError
+
+from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.infrastructure.persistence.buffered_health_check_repository import (
+    BufferedHealthCheckRepository,
+)
+
+
+def make_check(url_id: int = 1) -> HealthCheck:
+    return HealthCheck(
+        id=None,
+        url_id=url_id,
+        http_status=200,
+        ttfb_ms=10.0,
+        ssl_expiration_date=None,
+        ssl_days_remaining=None,
+        is_healthy=True,
+        error_message=None,
+        checked_at=datetime.now(timezone.utc),
+    )
+
+
+class TestBufferedHealthCheckRepository:
+    @pytest.fixture
+    def inner(self, mocker):
+        return mocker.AsyncMock()
+
+    async def test_save_only_queues(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+
+        await repo.save(make_check())
+
+        inner.save.assert_not_called()
+        inner.save_many.assert_not_called()
+
+    async def test_flush_writes_one_batch(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        checks = [make_check(i) for i in range(3)]
+        for check in checks:
+            await repo.save(check)
+
+        assert await repo.flush() == 3
+        assert await repo.flush() == 0
+        inner.save_many.assert_awaited_once_with(checks)
+
+    async def test_background_flush_on_batch_size(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=2, flush_interval_sec=60)
+        task = asyncio.create_task(repo.start())
+        await asyncio.sleep(0)
+
+        await repo.save(make_check(1))
+        await repo.save(make_check(2))
+        await asyncio.sleep(0.01)
+
+        inner.save_many.assert_awaited_once()
+        await repo.aclose()
+        await asyncio.wait_for(task, timeout=1)
+
+    async def test_background_flush_on_interval(self, inner):
+        repo = BufferedHealthCheckRepository(
+            inner, batch_size=100, flush_interval_sec=0.01
+        )
+        task = asyncio.create_task(repo.start())
+
+        await repo.save(make_check())
+        await asyncio.sleep(0.05)
+
+        inner.save_many.assert_awaited_once()
+        await repo.aclose()
+        await asyncio.wait_for(task, timeout=1)
+
+    async def test_save_writes_itself_when_buffer_is_full(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=2, max_pending=3)
+
+        for i in range(3):
+            await repo.save(make_check(i))
+
+        inner.save_many.assert_awaited_once()
+        assert len(inner.save_many.call_args[0][0]) == 3
+
+    async def test_failed_batch_is_retried(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        inner.save_many.side_effect = [RuntimeError("db gone"), None]
+        await repo.save(make_check(1))
+
+        assert await repo.flush() == 0
+        await repo.save(make_check(2))
+        assert await repo.flush() == 2
+
+        written = inner.save_many.call_args[0][0]
+        assert [c.url_id for c in written] == [1, 2]
+
+    async def test_rejected_rows_are_dropped_not_requeued(self, inner):
+        async def save_many(checks):
+            if any(c.url_id == 2 for c in checks):
+                raise IntegrityError("FOREIGN KEY constraint failed")
+
+        inner.save_many.side_effect = save_many
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        for url_id in (1, 2, 3):
+            await repo.save(make_check(url_id))
+
+        assert await repo.flush() == 2
+        assert repo._pending == []
+        written = [c.args[0] for c in inner.save_many.await_args_list[1:]]
+        assert [[c.url_id for c in batch] for batch in written] == [[1], [2], [3]]
+
+    async def test_discard_url_drops_its_queued_checks(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        for url_id in (1, 2, 1):
+            await repo.save(make_check(url_id))
+
+        repo.discard_url(1)
+
+        assert await repo.flush() == 1
+        assert [c.url_id for c in inner.save_many.call_args[0][0]] == [2]
+
+    async def test_oldest_checks_dropped_when_full_and_failing(self, inner):
+        inner.save_many.side_effect = RuntimeError("db gone")
+        repo = BufferedHealthCheckRepository(inner, batch_size=2, max_pending=2)
+
+        for i in range(4):
+            await repo.save(make_check(i))
+
+        assert [c.url_id for c in repo._pending] == [2, 3]
+
+    async def test_reads_flush_first(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        await repo.save(make_check())
+
+        await repo.get_by_url_id(1, 5)
+        await repo.get_raw_for_date(1, date(2026, 6, 10))
+
+        inner.save_many.assert_awaited_once()
+        inner.get_by_url_id.assert_awaited_once_with(1, 5)
+
+    async def test_close_flushes_pending(self, inner):
+        repo = BufferedHealthCheckRepository(inner, batch_size=10)
+        await repo.save(make_check())
+
+        await repo.aclose()
+
+        inner.save_many.assert_awaited_once()
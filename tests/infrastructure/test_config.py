@@ -16,6 +16,11 @@ class TestSettings:
         assert s.check_interval_sec == 60
         assert s.default_alert_days == 7
         assert s.log_level == "INFO"
+        assert s.http_max_connections == 100
+        assert s.http_max_keepalive_connections == 20
+        assert s.http2_enabled is False
+        assert s.dns_cache_ttl_sec == 300
+        assert s.ssl_cache_refresh_sec == 21600
 
     def test_env_overrides(self, monkeypatch):
         monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test_token")
@@ -27,6 +32,8 @@ class TestSettings:
         monkeypatch.setenv("CHECK_INTERVAL_SEC", "120")
         monkeypatch.setenv("DEFAULT_ALERT_DAYS", "14")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "500")
+        monkeypatch.setenv("HTTP2_ENABLED", "true")
 
         s = Settings()
         assert s.telegram_bot_token == "test_token"
@@ -38,6 +45,8 @@ class TestSettings:
         assert s.check_interval_sec == 120
         assert s.default_alert_days == 14
         assert s.log_level == "DEBUG"
+        assert s.http_max_connections == 500
+        assert s.http2_enabled is True
 
     def test_allowed_chat_ids_default_empty(self, monkeypatch):
         monkeypatch.delenv("ALLOWED_CHAT_IDS", raising=False)
@@ -0,0 +1,95 @@
+import asyncio
+import socket
+
+import pytest
+
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+
+
+def addrinfo(*addresses):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (a, 443)) for a in addresses]
+
+
+class TestCachingResolver:
+    @pytest.fixture
+    async def getaddrinfo(self, mocker):
+        loop = asyncio.get_running_loop()
+        return mocker.patch.object(
+            loop, "getaddrinfo", return_value=addrinfo("10.0.0.1", "10.0.0.1")
+        )
+
+    @pytest.fixture
+    def clock(self, mocker):
+        now = {"t": 1000.0}
+        mocker.patch(
+            "healthchecker.infrastructure.checker.dns_resolver.time.monotonic",
+            side_effect=lambda: now["t"],
+        )
+        return now
+
+    async def test_caches_answers(self, getaddrinfo):
+        resolver = CachingResolver()
+        assert await resolver.resolve("Example.com", 443) == ["10.0.0.1"]
+        assert await resolver.resolve("example.com", 443) == ["10.0.0.1"]
+        assert getaddrinfo.await_count == 1
+        stats = resolver.stats()
+        assert stats.requests == 2
+        assert stats.hits == 1
+        assert stats.lookups == 1
+        assert stats.hit_rate == 0.5
+
+    async def test_expires_after_ttl(self, getaddrinfo, clock):
+        resolver = CachingResolver(ttl_sec=60)
+        await resolver.resolve("example.com")
+        clock["t"] += 61
+        await resolver.resolve("example.com")
+        assert getaddrinfo.await_count == 2
+
+    async def test_negative_caching_for_nxdomain(self, getaddrinfo, clock):
+        getaddrinfo.side_effect = socket.gaierror(socket.EAI_NONAME, "not known")
+        resolver = CachingResolver(negative_ttl_sec=30)
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await resolver.resolve("missing.example")
+        assert getaddrinfo.await_count == 1
+        assert resolver.stats().negative_hits == 1
+
+        clock["t"] += 31
+        with pytest.raises(socket.gaierror):
+            await resolver.resolve("missing.example")
+        assert getaddrinfo.await_count == 2
+
+    async def test_transient_failures_are_not_cached(self, getaddrinfo):
+        getaddrinfo.side_effect = socket.gaierror(socket.EAI_AGAIN, "try again")
+        resolver = CachingResolver()
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await resolver.resolve("flaky.example")
+        assert getaddrinfo.await_count == 2
+
+    async def test_evicts_least_recently_used(self, getaddrinfo):
+        resolver = CachingResolver(max_entries=2)
+        await resolver.resolve("a.com")
+        await resolver.resolve("b.com")
+        await resolver.resolve("a.com")
+        await resolver.resolve("c.com")
+        assert resolver.stats().entries == 2
+
+        await resolver.resolve("a.com")
+        assert getaddrinfo.await_count == 3
+        await resolver.resolve("b.com")
+        assert getaddrinfo.await_count == 4
+
+    async def test_coalesces_concurrent_lookups(self, getaddrinfo):
+        async def slow_lookup(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return addrinfo("10.0.0.2")
+
+        getaddrinfo.side_effect = slow_lookup
+        resolver = CachingResolver()
+        results = await asyncio.gather(
+            *[resolver.resolve("busy.com") for _ in range(5)]
+        )
+        assert results == [["10.0.0.2"]] * 5
+        assert getaddrinfo.await_count == 1
+        assert resolver.stats().coalesced == 4
@@ -1,7 +1,20 @@
+import asyncio
+import socket
+
+import httpcore
 import httpx
 import pytest
 
-from healthchecker.infrastructure.checker.http_checker import HttpHealthChecker
+from healthchecker.domain.models.url import BodyAssertion, ProbeMode
+from healthchecker.infrastructure.checker.dns_resolver import CachingResolver
+from healthchecker.infrastructure.checker.http_checker import (
+    HttpHealthChecker,
+    _peer_ssl_info,
+    _phase_timer,
+    _PhaseTimer,
+    _TimedNetworkBackend,
+    _TimedTransport,
+)
 
 
 class TestHttpHealthChecker:
@@ -13,41 +26,321 @@ class TestHttpHealthChecker:
         route = respx_mock.get("https://example.com").mock(
             return_value=httpx.Response(200, content="ok"),
         )
-        status, ttfb, error = await checker.check("https://example.com")
-        assert status == 200
-        assert ttfb is not None and ttfb >= 0
-        assert error is None
+        result = await checker.check("https://example.com", probe_mode=ProbeMode.CAPPED)
+        assert result.http_status == 200
+        assert result.ttfb_ms is not None and result.ttfb_ms >= 0
+        assert result.error is None
+        assert result.total_ms >= result.ttfb_ms
+        assert result.bytes_received == 2
         assert route.called
 
     async def test_not_found(self, checker, respx_mock):
-        respx_mock.get("https://example.com/404").mock(
+        respx_mock.head("https://example.com/404").mock(
             return_value=httpx.Response(404),
         )
-        status, ttfb, error = await checker.check("https://example.com/404")
-        assert status == 404
-        assert error is None
+        result = await checker.check("https://example.com/404")
+        assert result.http_status == 404
+        assert result.error is None
 
     async def test_timeout(self, checker, respx_mock):
-        respx_mock.get("https://example.com").mock(
+        respx_mock.head("https://example.com").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        status, ttfb, error = await checker.check("https://example.com")
-        assert status is None
-        assert ttfb is None
-        assert error == "Timeout"
+        result = await checker.check("https://example.com")
+        assert result.http_status is None
+        assert result.ttfb_ms is None
+        assert result.error == "Timeout"
 
     async def test_request_error(self, checker, respx_mock):
-        respx_mock.get("https://example.com").mock(
+        respx_mock.head("https://example.com").mock(
             side_effect=httpx.RequestError("DNS failure")
         )
-        status, ttfb, error = await checker.check("https://example.com")
-        assert status is None
-        assert ttfb is None
-        assert error == "DNS failure"
+        result = await checker.check("https://example.com")
+        assert result.http_status is None
+        assert result.ttfb_ms is None
+        assert result.error == "DNS failure"
 
     async def test_unexpected_error(self, checker, respx_mock):
-        respx_mock.get("https://example.com").mock(side_effect=RuntimeError("weird"))
-        status, ttfb, error = await checker.check("https://example.com")
-        assert status is None
-        assert ttfb is None
-        assert error == "weird"
+        respx_mock.head("https://example.com").mock(side_effect=RuntimeError("weird"))
+        result = await checker.check("https://example.com")
+        assert result.http_status is None
+        assert result.ttfb_ms is None
+        assert result.error == "weird"
+
+    async def test_reuses_shared_client(self, checker, respx_mock):
+        respx_mock.head("https://example.com").mock(return_value=httpx.Response(200))
+        await checker.check("https://example.com")
+        client = checker._client
+        await checker.check("https://example.com")
+        assert client is not None
+        assert checker._client is client
+        await checker.aclose()
+        assert client.is_closed
+
+    async def test_fresh_connection_bypasses_shared_client(self, checker, respx_mock):
+        route = respx_mock.head("https://example.com").mock(
+            return_value=httpx.Response(200),
+        )
+        result = await checker.check("https://example.com", fresh_connection=True)
+        assert result.http_status == 200
+        assert result.error is None
+        assert route.called
+        assert checker._client is None
+
+    async def test_head_probe_by_default(self, checker, respx_mock):
+        route = respx_mock.head("https://example.com").mock(
+            return_value=httpx.Response(200)
+        )
+        result = await checker.check("https://example.com")
+        assert result.http_status == 200
+        assert result.bytes_received == 0
+        assert route.called
+
+    async def test_head_falls_back_to_get(self, checker, respx_mock):
+        respx_mock.head("https://example.com").mock(return_value=httpx.Response(405))
+        get = respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=b"x" * 1000)
+        )
+        result = await checker.check("https://example.com")
+        assert result.http_status == 200
+        assert get.called
+
+    async def test_head_fallback_on_fresh_connection(self):
+        async def handle(reader, writer):
+            try:
+                while request := await reader.readuntil(b"\r\n\r\n"):
+                    status = b"405" if request.startswith(b"HEAD") else b"200"
+                    writer.write(
+                        b"HTTP/1.1 " + status + b" X\r\nContent-Length: 0\r\n\r\n"
+                    )
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            result = await HttpHealthChecker(timeout=2.0).check(
+                f"http://127.0.0.1:{port}/", fresh_connection=True
+            )
+        finally:
+            server.close()
+
+        assert result.error is None
+        assert result.http_status == 200
+
+    async def test_headers_mode_skips_body(self, checker, respx_mock):
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=b"x" * 100_000)
+        )
+        result = await checker.check(
+            "https://example.com", probe_mode=ProbeMode.HEADERS
+        )
+        assert result.http_status == 200
+        assert result.bytes_received == 0
+
+    async def test_capped_mode_stops_reading(self, checker, respx_mock):
+        async def body():
+            for _ in range(100):
+                yield b"x" * 1000
+
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=body())
+        )
+        result = await checker.check(
+            "https://example.com", probe_mode=ProbeMode.CAPPED, max_bytes=5000
+        )
+        assert result.http_status == 200
+        assert 5000 <= result.bytes_received < 100_000
+
+    async def test_body_assertion_passes(self, checker, respx_mock):
+        get = respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=b'{"status": "OK"}')
+        )
+        result = await checker.check(
+            "https://example.com", body_assertion=BodyAssertion("OK")
+        )
+        assert result.error is None
+        assert get.called
+
+    async def test_body_assertion_fails(self, checker, respx_mock):
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=b"Service degraded")
+        )
+        result = await checker.check(
+            "https://example.com", body_assertion=BodyAssertion("OK")
+        )
+        assert result.http_status == 200
+        assert result.error == "Assertion failed: expected body contains 'OK'"
+
+    async def test_negative_body_assertion_stops_at_match(self, checker, respx_mock):
+        chunks_read = 0
+
+        async def body():
+            nonlocal chunks_read
+            for i in range(100):
+                chunks_read += 1
+                yield b"maintenance" if i == 2 else b"x" * 1000
+
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=body())
+        )
+        result = await checker.check(
+            "https://example.com",
+            body_assertion=BodyAssertion("maint.nance", True, must_match=False),
+        )
+        assert result.error == (
+            "Assertion failed: expected body does not contain /maint.nance/"
+        )
+        assert chunks_read < 10
+
+    async def test_body_assertion_respects_max_scan(self, checker, respx_mock):
+        async def body():
+            for _ in range(100):
+                yield b"x" * 1000
+            yield b"OK"
+
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=body())
+        )
+        result = await checker.check(
+            "https://example.com",
+            max_bytes=10_000,
+            body_assertion=BodyAssertion("OK"),
+        )
+        assert result.error == (
+            "Assertion failed: expected body contains 'OK' in the first 10000 bytes"
+        )
+        assert result.bytes_received < 100_000
+
+    async def test_body_assertion_ignores_match_past_cap_in_one_chunk(
+        self, checker, respx_mock
+    ):
+        respx_mock.get("https://example.com").mock(
+            return_value=httpx.Response(200, content=b"x" * 20_000 + b"OK")
+        )
+        result = await checker.check(
+            "https://example.com",
+            max_bytes=10_000,
+            body_assertion=BodyAssertion("OK"),
+        )
+        assert result.error == (
+            "Assertion failed: expected body contains 'OK' in the first 10000 bytes"
+        )
+
+    async def test_http2_disabled_when_h2_missing(self, mocker):
+        mocker.patch("importlib.util.find_spec", return_value=None)
+        checker = HttpHealthChecker(http2=True)
+        assert checker._http2 is False
+
+
+class TestPhaseTiming:
+    async def test_trace_records_tls_handshake(self):
+        timer = _PhaseTimer()
+        await timer.trace("connection.start_tls.started", {})
+        await timer.trace("connection.start_tls.complete", {})
+        assert timer.tls_ms is not None and timer.tls_ms >= 0
+
+    async def test_backend_times_dns_and_connect(self, mocker):
+        inner = mocker.AsyncMock()
+        inner.connect_tcp.return_value = mocker.sentinel.stream
+        loop = asyncio.get_running_loop()
+        mocker.patch.object(
+            loop,
+            "getaddrinfo",
+            return_value=[(None, None, None, "", ("93.184.216.34", 443))],
+        )
+        timer = _PhaseTimer()
+        token = _phase_timer.set(timer)
+        try:
+            stream = await _TimedNetworkBackend(inner, CachingResolver()).connect_tcp(
+                "example.com", 443
+            )
+        finally:
+            _phase_timer.reset(token)
+
+        assert stream is mocker.sentinel.stream
+        assert inner.connect_tcp.await_args.args[:2] == ("93.184.216.34", 443)
+        assert timer.dns_ms is not None
+        assert timer.connect_ms is not None
+
+    async def test_backend_tries_next_address(self, mocker):
+        inner = mocker.AsyncMock()
+        inner.connect_tcp.side_effect = [
+            httpcore.ConnectError("refused"),
+            mocker.sentinel.stream,
+        ]
+        loop = asyncio.get_running_loop()
+        mocker.patch.object(
+            loop,
+            "getaddrinfo",
+            return_value=[
+                (None, None, None, "", ("::1", 80, 0, 0)),
+                (None, None, None, "", ("127.0.0.1", 80)),
+            ],
+        )
+        stream = await _TimedNetworkBackend(inner, CachingResolver()).connect_tcp(
+            "localhost", 80
+        )
+        assert stream is mocker.sentinel.stream
+        assert inner.connect_tcp.await_args.args[0] == "127.0.0.1"
+
+    async def test_backend_maps_resolution_failure(self, mocker):
+        loop = asyncio.get_running_loop()
+        mocker.patch.object(
+            loop, "getaddrinfo", side_effect=socket.gaierror("Name not known")
+        )
+        with pytest.raises(httpcore.ConnectError):
+            await _TimedNetworkBackend(
+                mocker.AsyncMock(), CachingResolver()
+            ).connect_tcp("nope", 80)
+
+    async def test_transport_maps_pool_errors(self, mocker):
+        transport = _TimedTransport(
+            None, httpx.Limits(), http2=False, resolver=CachingResolver()
+        )
+        mocker.patch.object(
+            transport._pool,
+            "handle_async_request",
+            side_effect=httpcore.ConnectTimeout("timed out"),
+        )
+        with pytest.raises(httpx.ConnectTimeout):
+            await transport.handle_async_request(
+                httpx.Request("GET", "http://example.com/")
+            )
+
+
+class TestPeerCertificate:
+    def _response(self, mocker, url):
+        ssl_object = mocker.Mock()
+        ssl_object.getpeercert.return_value = {"notAfter": "Dec 31 23:59:59 2099 GMT"}
+        ssl_object.version.return_value = "TLSv1.3"
+        ssl_object.cipher.return_value = ("TLS_AES_128_GCM_SHA256", "TLSv1.3", 128)
+        stream = mocker.Mock()
+        stream.get_extra_info.return_value = ssl_object
+        return httpx.Response(
+            200,
+            request=httpx.Request("GET", url),
+            extensions={"network_stream": stream},
+        )
+
+    def test_reads_certificate_from_connection(self, mocker):
+        response = self._response(mocker, "https://example.com/health")
+        info = _peer_ssl_info("https://example.com/health", response)
+        assert info.expiration_date.year == 2099
+        assert info.tls_version == "TLSv1.3"
+        assert info.cipher == "TLS_AES_128_GCM_SHA256"
+
+    def test_ignores_redirect_to_other_host(self, mocker):
+        response = self._response(mocker, "https://other.example.com/")
+        assert _peer_ssl_info("https://example.com/", response) is None
+
+    def test_ignores_plain_http(self, mocker):
+        response = self._response(mocker, "http://example.com/")
+        assert _peer_ssl_info("http://example.com/", response) is None
+
+    def test_missing_network_stream(self):
+        response = httpx.Response(
+            200, request=httpx.Request("GET", "https://example.com/")
+        )
+        assert _peer_ssl_info("https://example.com/", response) is None
@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from tortoise import connections
+from tortoise.contrib.test import tortoise_test_context
+
+from healthchecker.infrastructure.persistence.alert_repository import (
+    TortoiseAlertRepository,
+)
+from healthchecker.infrastructure.persistence.health_check_repository import (
+    TortoiseHealthCheckRepository,
+)
+
+URL_TIME_INDEX = "idx_health_chec_url_id"
+TIME_INDEX = "idx_health_chec_checked"
+UNSENT_INDEX = "idx_alerts_is_sent"
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def init_tortoise():
+    async with tortoise_test_context(
+        ["healthchecker.infrastructure.persistence.tortoise_models"]
+    ):
+        yield
+
+
+@pytest.fixture
+def query_plans(monkeypatch):
+    """Runs the block's queries and returns the EXPLAIN QUERY PLAN of each."""
+    conn = connections.get("default")
+    queries: list[tuple[str, list]] = []
+
+    def recording(method):
+        original = getattr(conn, method)
+
+        async def record(query, values=None):
+            queries.append((query, values))
+            return await original(query, values)
+
+        monkeypatch.setattr(conn, method, record)
+
+    recording("execute_query")
+    recording("execute_query_dict")
+
+    async def explain(call) -> list[str]:
+        queries.clear()
+        await call
+        assert len(queries) == 1
+        query, values = queries[0]
+        rows = await conn.execute_query_dict(f"EXPLAIN QUERY PLAN {query}", values)
+        return [row["detail"] for row in rows]
+
+    return explain
+
+
+class TestQueryIndexes:
+    async def test_latest_by_url_uses_url_time_index(self, query_plans):
+        plan = await query_plans(
+            TortoiseHealthCheckRepository().get_latest_by_url_id(1)
+        )
+        assert any(URL_TIME_INDEX in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    async def test_latest_for_urls_is_one_indexed_query(self, query_plans):
+        plan = await query_plans(
+            TortoiseHealthCheckRepository().get_latest_for_urls([1, 2, 3])
+        )
+        assert any(URL_TIME_INDEX in step for step in plan), plan
+        assert any("PRIMARY KEY" in step for step in plan), plan
+
+    async def test_history_uses_url_time_index(self, query_plans):
+        plan = await query_plans(TortoiseHealthCheckRepository().get_by_url_id(1, 10))
+        assert any(URL_TIME_INDEX in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    async def test_raw_for_date_uses_url_time_index(self, query_plans):
+        plan = await query_plans(
+            TortoiseHealthCheckRepository().get_raw_for_date(1, date(2026, 6, 10))
+        )
+        assert any(URL_TIME_INDEX in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+    async def test_purge_uses_time_index(self, query_plans):
+        plan = await query_plans(
+            TortoiseHealthCheckRepository().purge_older_than(date(2026, 6, 10))
+        )
+        assert any(TIME_INDEX in step for step in plan), plan
+
+    async def test_purge_slice_uses_primary_key(self, query_plans):
+        plan = await query_plans(
+            TortoiseHealthCheckRepository().purge_older_than(date(2026, 6, 10), 1, 5000)
+        )
+        assert any("PRIMARY KEY" in step for step in plan), plan
+
+    async def test_unsent_alerts_use_unsent_index(self, query_plans):
+        plan = await query_plans(TortoiseAlertRepository().get_unsent())
+        assert any(UNSENT_INDEX in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
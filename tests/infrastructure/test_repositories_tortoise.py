@@ -1,25 +1,37 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 import pytest_asyncio
 from tortoise.contrib.test import tortoise_test_context
 
-from healthchecker.domain.models.url import Url
+from healthchecker.domain.models.url import BodyAssertion, ProbeMode, Url
 from healthchecker.domain.models.health_check import HealthCheck
 from healthchecker.domain.models.alert import Alert, AlertType
 from healthchecker.domain.models.daily_summary import DailySummary
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.rollup import Resolution, Rollup
+from healthchecker.domain.models.url_status import UrlStatus
 from healthchecker.infrastructure.persistence.url_repository import (
     TortoiseUrlRepository,
 )
 from healthchecker.infrastructure.persistence.health_check_repository import (
     TortoiseHealthCheckRepository,
 )
+from healthchecker.infrastructure.persistence.buffered_health_check_repository import (
+    BufferedHealthCheckRepository,
+)
 from healthchecker.infrastructure.persistence.alert_repository import (
     TortoiseAlertRepository,
 )
 from healthchecker.infrastructure.persistence.daily_summary_repository import (
     TortoiseDailySummaryRepository,
 )
+from healthchecker.infrastructure.persistence.rollup_repository import (
+    TortoiseRollupRepository,
+)
+from healthchecker.infrastructure.persistence.url_status_repository import (
+    TortoiseUrlStatusRepository,
+)
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -66,6 +78,34 @@ class TestTortoiseUrlRepository:
         assert fetched.name == "Test"
         assert fetched.url == "https://test.com"
 
+    async def test_probe_mode_round_trip(self, url_repo):
+        url = await url_repo.add(
+            Url.create(
+                "https://big.com", probe_mode=ProbeMode.CAPPED, probe_max_bytes=1024
+            )
+        )
+        fetched = await url_repo.get_by_id(url.id)
+        assert fetched.check_interval_sec is None
+        assert fetched.probe_mode is ProbeMode.CAPPED
+        assert fetched.probe_max_bytes == 1024
+
+    async def test_body_assertion_round_trip(self, url_repo):
+        url = await url_repo.add(
+            Url.create(
+                "https://status.com",
+                body_assertion=BodyAssertion("maint", is_regex=True, must_match=False),
+            )
+        )
+        fetched = await url_repo.get_by_id(url.id)
+        assert fetched.body_assertion == BodyAssertion("maint", True, False)
+
+        plain = await url_repo.add(Url.create("https://plain.com"))
+        assert (await url_repo.get_by_id(plain.id)).body_assertion is None
+
+    async def test_check_interval_round_trip(self, url_repo):
+        url = await url_repo.add(Url.create("https://slow.com", check_interval_sec=600))
+        assert (await url_repo.get_by_id(url.id)).check_interval_sec == 600
+
     async def test_get_all_active(self, url_repo):
         await url_repo.add(Url.create("https://a.com", name="A"))
         await url_repo.add(Url.create("https://b.com", name="B"))
@@ -119,6 +159,37 @@ class TestTortoiseHealthCheckRepository:
         results = await hc_repo.get_by_url_id(sample_url.id, limit=3)
         assert len(results) == 3
 
+    async def test_save_phase_timings(self, hc_repo, sample_url):
+        now = datetime.now(timezone.utc)
+        await hc_repo.save(
+            HealthCheck(
+                id=None,
+                url_id=sample_url.id,
+                http_status=200,
+                ttfb_ms=90.0,
+                ssl_expiration_date=None,
+                ssl_days_remaining=None,
+                is_healthy=True,
+                error_message=None,
+                checked_at=now,
+                dns_ms=3.0,
+                connect_ms=12.0,
+                tls_ms=30.0,
+                total_ms=120.0,
+                bytes_received=5120,
+                tls_version="TLSv1.3",
+                tls_cipher="TLS_AES_256_GCM_SHA384",
+            )
+        )
+        latest = await hc_repo.get_latest_by_url_id(sample_url.id)
+        assert latest.dns_ms == 3.0
+        assert latest.connect_ms == 12.0
+        assert latest.tls_ms == 30.0
+        assert latest.total_ms == 120.0
+        assert latest.bytes_received == 5120
+        assert latest.tls_version == "TLSv1.3"
+        assert latest.tls_cipher == "TLS_AES_256_GCM_SHA384"
+
     async def test_purge_older_than(self, hc_repo, sample_url):
         old = datetime(2025, 1, 1, tzinfo=timezone.utc)
         now = datetime.now(timezone.utc)
@@ -138,24 +209,240 @@ class TestTortoiseHealthCheckRepository:
         deleted = await hc_repo.purge_older_than(date(2025, 6, 1))
         assert deleted >= 1
 
-    async def test_get_dates_needing_consolidation(self, hc_repo, sample_url):
+    async def test_purge_id_range_and_slice(self, hc_repo, sample_url):
+        def check(day: int) -> HealthCheck:
+            return HealthCheck(
+                id=None,
+                url_id=sample_url.id,
+                http_status=200,
+                ttfb_ms=10.0,
+                ssl_expiration_date=None,
+                ssl_days_remaining=None,
+                is_healthy=True,
+                error_message=None,
+                checked_at=datetime(2025, 1, day, 12, tzinfo=timezone.utc),
+            )
+
+        saved = [await hc_repo.save(check(day)) for day in (1, 2, 3, 4)]
+        ids = [c.id for c in saved]
+
+        assert await hc_repo.get_purge_id_range(date(2024, 12, 31)) is None
+        assert await hc_repo.get_purge_id_range(date(2025, 1, 3)) == (ids[0], ids[2])
+
+        assert await hc_repo.purge_older_than(date(2025, 1, 3), ids[1], ids[3]) == 2
+        remaining = await hc_repo.get_by_url_id(sample_url.id)
+        assert sorted(c.id for c in remaining) == [ids[0], ids[3]]
+
+    async def test_aggregate_rollups(self, hc_repo, url_repo, sample_url):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        start = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        rows = [
+            (sample_url.id, 0, 10.0, True),
+            (sample_url.id, 4, 30.0, False),
+            (other.id, 4, None, True),
+            (sample_url.id, 5, 50.0, True),
+            (sample_url.id, 10, 70.0, True),
+        ]
+        for url_id, minute, ttfb, healthy in rows:
+            await hc_repo.save(
+                HealthCheck(
+                    id=None,
+                    url_id=url_id,
+                    http_status=200,
+                    ttfb_ms=ttfb,
+                    ssl_expiration_date=None,
+                    ssl_days_remaining=None,
+                    is_healthy=healthy,
+                    error_message=None,
+                    checked_at=start + timedelta(minutes=minute),
+                )
+            )
+
+        rollups = await hc_repo.aggregate_rollups(
+            Resolution.FIVE_MINUTES, start, start + timedelta(minutes=10)
+        )
+
+        by_key = {(r.url_id, r.bucket_start.minute): r for r in rollups}
+        assert set(by_key) == {(sample_url.id, 0), (other.id, 0), (sample_url.id, 5)}
+        first = by_key[(sample_url.id, 0)]
+        assert first.resolution is Resolution.FIVE_MINUTES
+        assert (first.checks_count, first.healthy_count, first.ttfb_count) == (2, 1, 2)
+        assert first.avg_ttfb_ms == 20.0
+        assert (first.min_ttfb_ms, first.max_ttfb_ms) == (10.0, 30.0)
+        assert first.ttfb_sketch == LatencySketch.of(10.0, 30.0)
+        assert by_key[(other.id, 0)].ttfb_count == 0
+        assert by_key[(other.id, 0)].ttfb_sketch is None
+        assert by_key[(sample_url.id, 5)].checks_count == 1
+
+    async def test_save_many(self, hc_repo, sample_url):
         now = datetime.now(timezone.utc)
-        await hc_repo.save(
+        await hc_repo.save_many(
+            [
+                HealthCheck(
+                    id=None,
+                    url_id=sample_url.id,
+                    http_status=status,
+                    ttfb_ms=10.0,
+                    ssl_expiration_date=None,
+                    ssl_days_remaining=None,
+                    is_healthy=status < 400,
+                    error_message=None,
+                    checked_at=now,
+                    tls_version="TLSv1.3",
+                )
+                for status in (200, 503)
+            ]
+        )
+
+        checks = await hc_repo.get_by_url_id(sample_url.id)
+        assert sorted(c.http_status for c in checks) == [200, 503]
+        assert all(c.tls_version == "TLSv1.3" for c in checks)
+
+    async def test_get_latest_for_all(self, hc_repo, url_repo, sample_url):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        base = datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc)
+        for url_id, minute, status in [
+            (sample_url.id, 0, 200),
+            (other.id, 0, 500),
+            (sample_url.id, 1, 503),
+            (other.id, 1, 204),
+        ]:
+            await hc_repo.save(
+                HealthCheck(
+                    id=None,
+                    url_id=url_id,
+                    http_status=status,
+                    ttfb_ms=None,
+                    ssl_expiration_date=None,
+                    ssl_days_remaining=None,
+                    is_healthy=status < 400,
+                    error_message=None,
+                    checked_at=base.replace(minute=minute),
+                )
+            )
+
+        latest = await hc_repo.get_latest_for_all()
+
+        assert {c.url_id: c.http_status for c in latest} == {
+            sample_url.id: 503,
+            other.id: 204,
+        }
+        latest = await hc_repo.get_latest_for_urls([other.id, other.id + 100])
+        assert [(c.url_id, c.http_status) for c in latest] == [(other.id, 204)]
+        assert await hc_repo.get_latest_for_urls([]) == []
+
+    async def test_named_connection(self, sample_url):
+        repo = TortoiseHealthCheckRepository(connection_name="default")
+        now = datetime.now(timezone.utc)
+        await repo.save(
             HealthCheck(
                 id=None,
                 url_id=sample_url.id,
                 http_status=200,
                 ttfb_ms=10.0,
-                ssl_expiration_date=now,
-                ssl_days_remaining=50,
+                ssl_expiration_date=None,
+                ssl_days_remaining=None,
                 is_healthy=True,
                 error_message=None,
                 checked_at=now,
             )
         )
-        pending = await hc_repo.get_dates_needing_consolidation(date(2099, 12, 31))
-        filtered = [(uid, d) for uid, d in pending if uid == sample_url.id]
-        assert len(filtered) >= 1
+        latest = await repo.get_latest_by_url_id(sample_url.id)
+        assert latest is not None
+        assert latest.http_status == 200
+
+    async def test_get_first_check_date(self, hc_repo, sample_url):
+        assert await hc_repo.get_first_check_date() is None
+        for day in (12, 10, 11):
+            await hc_repo.save(
+                HealthCheck(
+                    id=None,
+                    url_id=sample_url.id,
+                    http_status=200,
+                    ttfb_ms=None,
+                    ssl_expiration_date=None,
+                    ssl_days_remaining=None,
+                    is_healthy=True,
+                    error_message=None,
+                    checked_at=datetime(2026, 6, day, 12, tzinfo=timezone.utc),
+                )
+            )
+
+        assert await hc_repo.get_first_check_date() == date(2026, 6, 10)
+
+    async def test_aggregate_day(self, hc_repo, url_repo, sample_url):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        expiry = datetime(2026, 12, 31, tzinfo=timezone.utc)
+        rows = [
+            (sample_url.id, 9, 23, 200, 80.0, 51, True),
+            (sample_url.id, 10, 0, 200, 100.0, 50, True),
+            (sample_url.id, 10, 12, 200, 150.0, 50, True),
+            (sample_url.id, 10, 23, 503, None, None, False),
+            (other.id, 10, 8, 204, 20.0, None, True),
+            (other.id, 10, 9, 204, 0.0, None, True),
+            (sample_url.id, 11, 0, 200, 10.0, 49, True),
+        ]
+        for url_id, day, hour, status, ttfb, ssl_days, healthy in rows:
+            await hc_repo.save(
+                HealthCheck(
+                    id=None,
+                    url_id=url_id,
+                    http_status=status,
+                    ttfb_ms=ttfb,
+                    ssl_expiration_date=expiry if ssl_days else None,
+                    ssl_days_remaining=ssl_days,
+                    is_healthy=healthy,
+                    error_message=None,
+                    checked_at=datetime(2026, 6, day, hour, tzinfo=timezone.utc),
+                )
+            )
+
+        summaries = {
+            s.url_id: s for s in await hc_repo.aggregate_day(date(2026, 6, 10))
+        }
+
+        assert set(summaries) == {sample_url.id, other.id}
+        summary = summaries[sample_url.id]
+        assert summary.summary_date == date(2026, 6, 10)
+        assert summary.checks_count == 3
+        assert summary.avg_ttfb_ms == 125.0
+        assert summary.min_ttfb_ms == 100.0
+        assert summary.max_ttfb_ms == 150.0
+        assert summary.ttfb_count == 2
+        assert summary.min_ssl_days_remaining == 50
+        assert summary.healthy_count == 2
+        assert summary.unhealthy_count == 1
+        assert summary.last_http_status == 503
+        assert summary.last_ssl_expiration_date is None
+        assert summary.last_checked_at == datetime(2026, 6, 10, 23, tzinfo=timezone.utc)
+        assert summary.ttfb_sketch == LatencySketch.of(100.0, 150.0)
+        assert summaries[other.id].checks_count == 2
+        assert summaries[other.id].ttfb_sketch == LatencySketch.of(20.0, 0.0)
+        assert summaries[other.id].last_http_status == 204
+
+    async def test_buffer_drops_checks_of_deleted_url(
+        self, hc_repo, url_repo, sample_url
+    ):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        buffer = BufferedHealthCheckRepository(hc_repo, batch_size=10)
+        for url_id in (sample_url.id, other.id):
+            await buffer.save(
+                HealthCheck(
+                    id=None,
+                    url_id=url_id,
+                    http_status=200,
+                    ttfb_ms=10.0,
+                    ssl_expiration_date=None,
+                    ssl_days_remaining=None,
+                    is_healthy=True,
+                    error_message=None,
+                    checked_at=datetime.now(timezone.utc),
+                )
+            )
+        await url_repo.delete(sample_url.id)
+
+        assert await buffer.flush() == 1
+        assert len(await hc_repo.get_by_url_id(other.id)) == 1
 
 
 class TestTortoiseAlertRepository:
@@ -215,6 +502,107 @@ class TestTortoiseDailySummaryRepository:
         fetched = await summary_repo.get_by_url_id(sample_url.id, limit=1)
         assert len(fetched) == 1
         assert fetched[0].checks_count == 100
+        assert fetched[0].ttfb_sketch is None
+
+        s.ttfb_sketch = LatencySketch.of(50.0, 120.0, 500.0)
+        await summary_repo.save(s)
+        fetched = await summary_repo.get_by_url_id(sample_url.id, limit=1)
+        assert fetched[0].ttfb_sketch == s.ttfb_sketch
+
+    async def test_save_many_upserts(self, summary_repo, url_repo, sample_url):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        day = date(2026, 6, 10)
+        now = datetime.now(timezone.utc)
+
+        def summary(url_id: int, checks: int) -> DailySummary:
+            return DailySummary(
+                id=None,
+                url_id=url_id,
+                summary_date=day,
+                checks_count=checks,
+                avg_ttfb_ms=100.0,
+                min_ttfb_ms=50.0,
+                max_ttfb_ms=150.0,
+                min_ssl_days_remaining=None,
+                healthy_count=checks,
+                unhealthy_count=0,
+                last_http_status=200,
+                last_ssl_expiration_date=None,
+                last_checked_at=now,
+                created_at=None,
+                ttfb_count=checks,
+                ttfb_sketch=LatencySketch.of(*[100.0] * checks),
+            )
+
+        await summary_repo.save_many([summary(sample_url.id, 1)])
+        first = await summary_repo.get_by_url_id_and_date(sample_url.id, day)
+        await summary_repo.save_many([summary(sample_url.id, 5), summary(other.id, 2)])
+
+        updated = await summary_repo.get_by_url_id_and_date(sample_url.id, day)
+        assert updated.id == first.id
+        assert updated.checks_count == 5
+        assert updated.ttfb_count == 5
+        assert updated.ttfb_sketch == LatencySketch.of(*[100.0] * 5)
+        assert (
+            await summary_repo.get_by_url_id_and_date(other.id, day)
+        ).checks_count == 2
+
+    async def test_get_range_for_url(self, summary_repo, sample_url):
+        for day in (9, 10, 11):
+            await summary_repo.save(
+                DailySummary(
+                    id=None,
+                    url_id=sample_url.id,
+                    summary_date=date(2026, 6, day),
+                    checks_count=day,
+                    avg_ttfb_ms=None,
+                    min_ttfb_ms=None,
+                    max_ttfb_ms=None,
+                    min_ssl_days_remaining=None,
+                    healthy_count=day,
+                    unhealthy_count=0,
+                    last_http_status=200,
+                    last_ssl_expiration_date=None,
+                    last_checked_at=None,
+                    created_at=None,
+                )
+            )
+
+        summaries = await summary_repo.get_range_for_url(
+            sample_url.id, date(2026, 6, 10), date(2026, 6, 12)
+        )
+
+        assert [s.summary_date.day for s in summaries] == [10, 11]
+
+    async def test_get_for_date(self, summary_repo, sample_url):
+        assert await summary_repo.get_for_date(date(2026, 6, 10)) == []
+        summary = DailySummary.from_check(
+            HealthCheck(
+                id=None,
+                url_id=sample_url.id,
+                http_status=200,
+                ttfb_ms=50.0,
+                ssl_expiration_date=None,
+                ssl_days_remaining=None,
+                is_healthy=True,
+                error_message=None,
+                checked_at=datetime(2026, 6, 10, 12, tzinfo=timezone.utc),
+            )
+        )
+        await summary_repo.save(summary)
+
+        (stored,) = await summary_repo.get_for_date(date(2026, 6, 10))
+        assert stored.url_id == sample_url.id
+        assert stored.ttfb_count == 1
+        assert await summary_repo.get_for_date(date(2026, 6, 11)) == []
+
+    async def test_consolidation_watermark(self, summary_repo):
+        assert await summary_repo.get_consolidation_watermark() is None
+
+        await summary_repo.set_consolidation_watermark(date(2026, 6, 10))
+        await summary_repo.set_consolidation_watermark(date(2026, 6, 11))
+
+        assert await summary_repo.get_consolidation_watermark() == date(2026, 6, 11)
 
     async def test_upsert(self, summary_repo, sample_url):
         s = DailySummary(
@@ -241,3 +629,111 @@ class TestTortoiseDailySummaryRepository:
             sample_url.id, date(2026, 6, 11)
         )
         assert fetched.checks_count == 60
+
+
+class TestTortoiseRollupRepository:
+    @pytest.fixture
+    def rollup_repo(self):
+        return TortoiseRollupRepository()
+
+    @staticmethod
+    def rollup(url_id, resolution, bucket_start, checks=1) -> Rollup:
+        return Rollup(
+            url_id=url_id,
+            resolution=resolution,
+            bucket_start=bucket_start,
+            checks_count=checks,
+            healthy_count=checks,
+            ttfb_count=checks,
+            avg_ttfb_ms=100.0,
+            min_ttfb_ms=100.0,
+            max_ttfb_ms=100.0,
+            ttfb_sketch=LatencySketch.of(*[100.0] * checks),
+        )
+
+    async def test_save_many_upserts_per_tier(self, rollup_repo, sample_url):
+        t0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        five = Resolution.FIVE_MINUTES
+        await rollup_repo.save_many([self.rollup(sample_url.id, five, t0)])
+        await rollup_repo.save_many(
+            [
+                self.rollup(sample_url.id, five, t0, checks=3),
+                self.rollup(sample_url.id, five, t0 + five.delta),
+                self.rollup(sample_url.id, Resolution.HOUR, t0, checks=12),
+            ]
+        )
+
+        rollups = await rollup_repo.get_range_for_url(
+            five, sample_url.id, t0, t0 + timedelta(hours=1)
+        )
+        assert [(r.bucket_start, r.checks_count) for r in rollups] == [
+            (t0, 3),
+            (t0 + five.delta, 1),
+        ]
+        assert rollups[0].ttfb_sketch == LatencySketch.of(100.0, 100.0, 100.0)
+        (hourly,) = await rollup_repo.get_range(
+            Resolution.HOUR, t0, t0 + timedelta(hours=1)
+        )
+        assert hourly.resolution is Resolution.HOUR
+        assert hourly.checks_count == 12
+
+    async def test_latest_bucket_and_purge(self, rollup_repo, sample_url):
+        five = Resolution.FIVE_MINUTES
+        t0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        assert await rollup_repo.get_latest_bucket_start(five) is None
+
+        await rollup_repo.save_many(
+            [self.rollup(sample_url.id, five, t0 + five.delta * i) for i in range(3)]
+        )
+
+        assert await rollup_repo.get_latest_bucket_start(five) == t0 + five.delta * 2
+        assert await rollup_repo.get_latest_bucket_start(Resolution.HOUR) is None
+        assert await rollup_repo.purge_older_than(five, t0 + five.delta) == 1
+
+
+class TestTortoiseUrlStatusRepository:
+    @pytest.fixture
+    def status_repo(self):
+        return TortoiseUrlStatusRepository()
+
+    @staticmethod
+    def status(url_id, failures, checked_at) -> UrlStatus:
+        return UrlStatus(
+            url_id=url_id,
+            http_status=503 if failures else 200,
+            ttfb_ms=80.0,
+            ssl_expiration_date=None,
+            ssl_days_remaining=None,
+            is_healthy=not failures,
+            error_message=None,
+            consecutive_failures=failures,
+            last_checked_at=checked_at,
+            state_changed_at=checked_at,
+        )
+
+    async def test_save_many_upserts_one_row_per_url(
+        self, status_repo, url_repo, sample_url
+    ):
+        other = await url_repo.add(Url.create("https://other.example.com"))
+        t0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        await status_repo.save_many(
+            [self.status(sample_url.id, 0, t0), self.status(other.id, 1, t0)]
+        )
+        await status_repo.save_many(
+            [self.status(other.id, 2, t0 + timedelta(minutes=1))]
+        )
+
+        (status,) = await status_repo.get_for_urls([other.id])
+        assert status.consecutive_failures == 2
+        assert status.http_status == 503
+        assert status.last_checked_at == t0 + timedelta(minutes=1)
+        assert len(await status_repo.get_all()) == 2
+        assert await status_repo.get_for_urls([]) == []
+
+    async def test_deleted_with_its_url(self, status_repo, url_repo, sample_url):
+        t0 = datetime(2026, 6, 10, 12, tzinfo=timezone.utc)
+        await status_repo.save_many([self.status(sample_url.id, 0, t0)])
+
+        await url_repo.delete(sample_url.id)
+
+        assert await status_repo.get_all() == []
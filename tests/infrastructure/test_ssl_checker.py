@@ -1,9 +1,10 @@
 import logging
 import ssl
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from healthchecker.infrastructure.checker.ssl_checker import SslChecker
+from healthchecker.infrastructure.checker.ssl_checker import SslChecker, ssl_info_for
 
 
 class TestSslChecker:
@@ -11,28 +12,25 @@ class TestSslChecker:
     def checker(self):
         return SslChecker()
 
-    def test_extract_host_https(self, checker):
-        host = checker._extract_host("https://example.com/path")
-        assert host == "example.com"
+    def test_cache_key_https(self, checker):
+        assert checker._cache_key("https://Example.com/path") == ("example.com", 443)
 
-    def test_extract_host_http(self, checker):
-        host = checker._extract_host("http://sub.example.com:8080/page")
-        assert host == "sub.example.com"
+    def test_cache_key_explicit_port(self, checker):
+        key = checker._cache_key("https://sub.example.com:8443/page")
+        assert key == ("sub.example.com", 8443)
 
-    def test_extract_host_invalid(self, checker):
-        host = checker._extract_host("not-a-url")
-        assert host is None
+    def test_cache_key_invalid(self, checker):
+        assert checker._cache_key("not-a-url") is None
 
-    def test_extract_host_empty(self, checker):
-        host = checker._extract_host("")
-        assert host is None
+    def test_cache_key_empty(self, checker):
+        assert checker._cache_key("") is None
 
     async def test_certificate_verification_failure_logs_warning_without_traceback(
         self, checker, mocker, caplog
     ):
         mocker.patch.object(
-            checker,
-            "_open_tls_connection",
+            checker._probe,
+            "handshake",
             side_effect=ssl.SSLCertVerificationError("self-signed certificate"),
         )
 
@@ -52,8 +50,8 @@ class TestSslChecker:
         import socket
 
         mocker.patch.object(
-            checker,
-            "_open_tls_connection",
+            checker._probe,
+            "handshake",
             side_effect=socket.gaierror("Name or service not known"),
         )
 
@@ -66,3 +64,72 @@ class TestSslChecker:
         assert record.levelno == logging.WARNING
         assert record.exc_info is None
         assert "Network error checking SSL" in record.message
+
+
+class TestSslCertificateCache:
+    @pytest.fixture
+    def expiring(self):
+        return ssl_info_for(datetime.now(timezone.utc) + timedelta(days=90, hours=1))
+
+    async def test_reuses_cached_expiry(self, mocker, expiring):
+        checker = SslChecker(refresh_interval_sec=3600)
+        fetch = mocker.patch.object(checker, "_fetch", return_value=expiring)
+
+        first = await checker.check("https://example.com/a")
+        second = await checker.check("https://EXAMPLE.com/b")
+
+        assert fetch.await_count == 1
+        assert second.expiration_date == first.expiration_date
+        assert second.days_remaining == 90
+
+    async def test_cache_is_keyed_by_port(self, mocker, expiring):
+        checker = SslChecker(refresh_interval_sec=3600)
+        fetch = mocker.patch.object(checker, "_fetch", return_value=expiring)
+
+        await checker.check("https://example.com")
+        await checker.check("https://example.com:8443")
+
+        assert fetch.await_count == 2
+
+    async def test_disabled_by_default(self, mocker, expiring):
+        checker = SslChecker()
+        fetch = mocker.patch.object(checker, "_fetch", return_value=expiring)
+
+        await checker.check("https://example.com")
+        await checker.check("https://example.com")
+
+        assert fetch.await_count == 2
+
+    async def test_refreshes_sooner_near_threshold(self, mocker, expiring):
+        checker = SslChecker(refresh_interval_sec=6 * 3600)
+        fetch = mocker.patch.object(checker, "_fetch", return_value=expiring)
+        clock = mocker.patch(
+            "healthchecker.infrastructure.checker.ssl_checker.time.monotonic",
+            return_value=1000.0,
+        )
+
+        await checker.check("https://example.com", alert_before_days=30)
+        clock.return_value = 1000.0 + 2 * 3600
+        await checker.check("https://example.com", alert_before_days=30)
+        assert fetch.await_count == 1
+
+        await checker.check("https://example.com", alert_before_days=89)
+        assert fetch.await_count == 2
+
+    async def test_forget_drops_cached_certificate(self, mocker, expiring):
+        checker = SslChecker(refresh_interval_sec=3600)
+        fetch = mocker.patch.object(checker, "_fetch", return_value=expiring)
+
+        await checker.check("https://example.com/a")
+        checker.forget("https://example.com/b")
+        await checker.check("https://example.com/a")
+
+        assert fetch.await_count == 2
+
+    async def test_failed_fetch_is_not_cached(self, mocker, expiring):
+        checker = SslChecker(refresh_interval_sec=3600)
+        fetch = mocker.patch.object(checker, "_fetch", side_effect=[None, expiring])
+
+        assert await checker.check("https://example.com") is None
+        assert await checker.check("https://example.com") == expiring
+        assert fetch.await_count == 2
@@ -0,0 +1,130 @@
+import asyncio
+import ssl
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from healthchecker.infrastructure.checker.tls_probe import _TICKET_WAIT_SEC, TlsProbe
+
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=30))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    directory = tmp_path_factory.mktemp("tls")
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+@pytest.fixture
+async def server_port(certificate):
+    cert_path, key_path = certificate
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+
+    async def handle(reader, writer):
+        try:
+            await reader.read(1)
+        except OSError:
+            pass
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=context)
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+def probe(certificate, mocker):
+    resolver = mocker.AsyncMock()
+    resolver.resolve.return_value = ["127.0.0.1"]
+    probe = TlsProbe(resolver=resolver, timeout=5.0)
+    probe._context.load_verify_locations(cafile=certificate[0])
+    return probe
+
+
+class TestTlsProbe:
+    async def test_reads_certificate_on_explicit_port(self, probe, server_port):
+        handshake = await probe.handshake("localhost", server_port)
+
+        assert handshake.peer_cert["subject"] == ((("commonName", "localhost"),),)
+        assert handshake.tls_version == "TLSv1.3"
+        assert handshake.cipher
+        assert handshake.handshake_ms > 0
+        assert handshake.session_reused is False
+        probe._resolver.resolve.assert_awaited_with("localhost", server_port)
+
+    async def test_resumes_session_on_next_probe(self, probe, server_port):
+        first = await probe.handshake("localhost", server_port)
+        await probe.wait_idle()
+        handshake = await probe.handshake("localhost", server_port)
+
+        assert first.session_reused is False
+        assert handshake.session_reused is True
+        assert handshake.peer_cert
+
+    async def test_does_not_wait_for_a_ticket(self, probe, certificate):
+        cert_path, key_path = certificate
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+        context.num_tickets = 0
+
+        async def handle(reader, writer):
+            try:
+                await reader.read(1)
+            except OSError:
+                pass
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=context)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            started = time.perf_counter()
+            await probe.handshake("localhost", port)
+            assert time.perf_counter() - started < _TICKET_WAIT_SEC
+            await probe.wait_idle()
+        finally:
+            server.close()
+
+    async def test_shares_context_between_probes(self, probe, server_port, mocker):
+        create = mocker.spy(ssl, "create_default_context")
+
+        await probe.handshake("localhost", server_port)
+        await probe.handshake("localhost", server_port)
+
+        create.assert_not_called()
+
+    async def test_verification_failure(self, mocker, server_port):
+        resolver = mocker.AsyncMock()
+        resolver.resolve.return_value = ["127.0.0.1"]
+        probe = TlsProbe(resolver=resolver)
+
+        with pytest.raises(ssl.SSLCertVerificationError):
+            await probe.handshake("localhost", server_port)
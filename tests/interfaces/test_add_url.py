@@ -0,0 +1,98 @@
+import pytest
+
+from healthchecker.domain.models.url import BodyAssertion, ProbeMode, Url
+from healthchecker.interfaces.telegram.handlers.add_url import AddUrlHandler
+
+
+class TestAddUrlHandler:
+    @pytest.fixture
+    def manage_urls(self, mocker):
+        manage_urls = mocker.AsyncMock()
+
+        async def add(url, **kwargs):
+            created = Url.create(url, **kwargs)
+            created.id = 1
+            return created
+
+        manage_urls.add.side_effect = add
+        return manage_urls
+
+    @pytest.fixture
+    def update(self, mocker):
+        update = mocker.Mock()
+        update.message.reply_text = mocker.AsyncMock()
+        return update
+
+    async def _handle(self, manage_urls, update, mocker, *args):
+        context = mocker.Mock()
+        context.args = list(args)
+        await AddUrlHandler(manage_urls).handle(update, context)
+        return manage_urls.add.call_args.kwargs if manage_urls.add.called else None
+
+    async def test_defaults_to_head_probe(self, manage_urls, update, mocker):
+        kwargs = await self._handle(manage_urls, update, mocker, "https://a.com")
+        assert kwargs["probe_mode"] is ProbeMode.HEAD
+        assert kwargs["body_assertion"] is None
+
+    async def test_max_bytes_implies_capped_mode(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--max-bytes", "1024"
+        )
+        assert kwargs["probe_mode"] is ProbeMode.CAPPED
+        assert kwargs["probe_max_bytes"] == 1024
+
+    async def test_invalid_mode(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--mode", "body"
+        )
+        assert kwargs is None
+        assert "Invalid mode" in update.message.reply_text.call_args.args[0]
+
+    async def test_expect_and_reject(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "Site", "--expect", "OK"
+        )
+        assert kwargs["name"] == "Site"
+        assert kwargs["body_assertion"] == BodyAssertion("OK")
+
+        kwargs = await self._handle(
+            manage_urls,
+            update,
+            mocker,
+            "https://a.com",
+            "--reject",
+            "maint.*",
+            "--regex",
+        )
+        assert kwargs["body_assertion"] == BodyAssertion("maint.*", True, False)
+
+    async def test_invalid_regex(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--expect", "(", "--regex"
+        )
+        assert kwargs is None
+        assert "Invalid regex" in update.message.reply_text.call_args.args[0]
+
+    async def test_interval(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--interval", "300"
+        )
+        assert kwargs["check_interval_sec"] == 300
+
+        kwargs = await self._handle(manage_urls, update, mocker, "https://b.com")
+        assert kwargs["check_interval_sec"] is None
+
+    async def test_invalid_interval(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--interval", "0"
+        )
+        assert kwargs is None
+
+    async def test_invalid_max_bytes(self, manage_urls, update, mocker):
+        kwargs = await self._handle(
+            manage_urls, update, mocker, "https://a.com", "--max-bytes", "0"
+        )
+        assert kwargs is None
+        update.message.reply_text.assert_awaited_once_with(
+            "Max bytes must be at least 1."
+        )
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from healthchecker.interfaces.housekeeping import (
+    AggregateFlushJob,
+    HousekeepingJob,
+    RollupJob,
+    UrlStatusFlushJob,
+)
+
+
+class TestHousekeepingJob:
+    @pytest.fixture
+    def consolidate(self, mocker):
+        uc = mocker.AsyncMock()
+        uc.execute.return_value = 1
+        uc.last_run_complete = True
+        return uc
+
+    async def test_consolidates_once_per_day(self, consolidate):
+        job = HousekeepingJob(consolidate, interval_sec=0.01, time_budget_sec=5)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.1)
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        consolidate.execute.assert_awaited_once_with(5)
+
+    async def test_retries_until_run_completes(self, consolidate):
+        consolidate.last_run_complete = False
+        job = HousekeepingJob(consolidate, interval_sec=0.01, time_budget_sec=5)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.1)
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert consolidate.execute.await_count > 1
+
+    async def test_survives_consolidation_error(self, consolidate):
+        consolidate.execute.side_effect = RuntimeError("db gone")
+        job = HousekeepingJob(consolidate, interval_sec=0.01)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.05)
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert consolidate.execute.await_count > 1
+        assert not task.exception()
+
+    async def test_stop_wakes_sleeping_job(self, consolidate):
+        job = HousekeepingJob(consolidate, interval_sec=3600)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.01)
+        await job.stop()
+
+        await asyncio.wait_for(task, timeout=1)
+
+
+class TestAggregateFlushJob:
+    async def test_flushes_periodically_and_on_stop(self, mocker):
+        flush = mocker.AsyncMock()
+        job = AggregateFlushJob(flush, interval_sec=0.01)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.05)
+        periodic = flush.execute.await_count
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert periodic >= 1
+        assert flush.execute.await_count == periodic + 1
+
+    async def test_survives_flush_error(self, mocker):
+        flush = mocker.AsyncMock()
+        flush.execute.side_effect = RuntimeError("db gone")
+        job = AggregateFlushJob(flush, interval_sec=0.01)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.05)
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert flush.execute.await_count > 1
+
+
+class TestUrlStatusFlushJob:
+    async def test_flushes_periodically_and_on_stop(self, mocker):
+        flush = mocker.AsyncMock()
+        flush.execute.side_effect = [RuntimeError("db gone")] + [0] * 100
+        job = UrlStatusFlushJob(flush, interval_sec=0.01)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.05)
+        periodic = flush.execute.await_count
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert periodic > 1
+        assert flush.execute.await_count == periodic + 1
+
+
+class TestRollupJob:
+    async def test_rolls_up_at_start_and_periodically(self, mocker):
+        rollup = mocker.AsyncMock()
+        rollup.execute.side_effect = [RuntimeError("db gone"), 1, 1, 1, 1, 1]
+        job = RollupJob(rollup, interval_sec=0.01)
+
+        task = asyncio.create_task(job.start())
+        await asyncio.sleep(0.05)
+        await job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert rollup.execute.await_count > 1
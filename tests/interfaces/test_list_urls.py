@@ -1,8 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.url_status import UrlStatus
 from healthchecker.interfaces.telegram.handlers.list_urls import ListUrlsHandler
 
 
@@ -159,13 +160,14 @@ class TestListUrlsHandler:
         manage_urls = mocker.AsyncMock()
         manage_urls.list_all.return_value = [url]
         get_results = mocker.AsyncMock()
-        get_results.get_latest.return_value = mock_check
+        get_results.get_statuses.return_value = {1: UrlStatus.from_check(mock_check)}
         handler = ListUrlsHandler(manage_urls, get_results)
 
         update = mocker.AsyncMock()
         context = mocker.AsyncMock()
         await handler.handle(update, context)
 
+        get_results.get_statuses.assert_awaited_once_with([1])
         update.message.reply_text.assert_awaited_once()
         text = update.message.reply_text.call_args[0][0]
         assert "Example" in text
@@ -197,7 +199,7 @@ class TestListUrlsHandler:
         manage_urls = mocker.AsyncMock()
         manage_urls.list_all.return_value = [url]
         get_results = mocker.AsyncMock()
-        get_results.get_latest.return_value = check
+        get_results.get_statuses.return_value = {1: UrlStatus.from_check(check)}
         handler = ListUrlsHandler(manage_urls, get_results)
 
         update = mocker.AsyncMock()
@@ -220,7 +222,7 @@ class TestListUrlsHandler:
         manage_urls = mocker.AsyncMock()
         manage_urls.list_all.return_value = [url]
         get_results = mocker.AsyncMock()
-        get_results.get_latest.return_value = None
+        get_results.get_statuses.return_value = {}
         handler = ListUrlsHandler(manage_urls, get_results)
 
         update = mocker.AsyncMock()
@@ -252,7 +254,7 @@ class TestListUrlsHandler:
         manage_urls = mocker.AsyncMock()
         manage_urls.list_all.return_value = [url]
         get_results = mocker.AsyncMock()
-        get_results.get_latest.return_value = check
+        get_results.get_statuses.return_value = {1: UrlStatus.from_check(check)}
         handler = ListUrlsHandler(manage_urls, get_results)
 
         update = mocker.AsyncMock()
@@ -261,3 +263,38 @@ class TestListUrlsHandler:
 
         text = update.message.reply_text.call_args[0][0]
         assert "⚠️" in text
+
+    async def test_handler_shows_failure_streak(self, mocker):
+        url = mocker.Mock()
+        url.id = 1
+        url.name = "Example"
+        url.url = "https://example.com"
+        url.alert_before_days = 30
+
+        down_since = datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc)
+        status = UrlStatus(
+            url_id=1,
+            http_status=503,
+            ttfb_ms=None,
+            ssl_expiration_date=None,
+            ssl_days_remaining=None,
+            is_healthy=False,
+            error_message=None,
+            consecutive_failures=4,
+            last_checked_at=down_since + timedelta(minutes=3),
+            state_changed_at=down_since,
+        )
+
+        manage_urls = mocker.AsyncMock()
+        manage_urls.list_all.return_value = [url]
+        get_results = mocker.AsyncMock()
+        get_results.get_statuses.return_value = {1: status}
+        handler = ListUrlsHandler(manage_urls, get_results)
+
+        update = mocker.AsyncMock()
+        context = mocker.AsyncMock()
+        await handler.handle(update, context)
+
+        text = update.message.reply_text.call_args[0][0]
+        assert "❌ HTTP 503" in text
+        assert "Failing for 4 checks, since 2026-06-10 12:00" in text
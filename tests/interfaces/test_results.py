@@ -1,6 +1,9 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
+from healthchecker.domain.models.daily_summary import DailySummary
 from healthchecker.domain.models.health_check import HealthCheck
+from healthchecker.domain.models.latency_sketch import LatencySketch
+from healthchecker.domain.models.rollup import Resolution, Rollup
 from healthchecker.interfaces.telegram.handlers.results import ResultsHandler
 
 
@@ -24,3 +27,73 @@ class TestResultsHandler:
         result = ResultsHandler._format_raw_check(check)
 
         assert "\\_ssl.c" in result
+
+    def test_format_raw_check_includes_phase_breakdown(self):
+        check = HealthCheck(
+            id=1,
+            url_id=1,
+            http_status=200,
+            ttfb_ms=180.0,
+            ssl_days_remaining=None,
+            ssl_expiration_date=None,
+            is_healthy=True,
+            error_message=None,
+            checked_at=datetime(2026, 7, 13, 21, 0, tzinfo=timezone.utc),
+            dns_ms=4.0,
+            connect_ms=20.0,
+            tls_ms=45.0,
+            total_ms=230.0,
+            bytes_received=2048,
+        )
+
+        result = ResultsHandler._format_raw_check(check)
+
+        assert "dns 4 / tcp 20 / tls 45 / dl 50ms, 2.0KB" in result
+
+    def test_format_summary_includes_ttfb_percentiles(self):
+        summary = DailySummary(
+            id=1,
+            url_id=1,
+            summary_date=date(2026, 7, 13),
+            checks_count=100,
+            avg_ttfb_ms=300.0,
+            min_ttfb_ms=100.0,
+            max_ttfb_ms=8000.0,
+            min_ssl_days_remaining=None,
+            healthy_count=100,
+            unhealthy_count=0,
+            last_http_status=200,
+            last_ssl_expiration_date=None,
+            last_checked_at=None,
+            created_at=None,
+            ttfb_count=100,
+            ttfb_sketch=LatencySketch.of(*[100.0] * 90, *[2000.0] * 8, 8000.0, 8000.0),
+        )
+
+        result = ResultsHandler._format_summary(summary)
+
+        assert "avg 300ms | p50/95/99 100/2019/8024ms" in result
+
+    def test_parse_span(self):
+        assert ResultsHandler._parse_span("24h") == timedelta(hours=24)
+        assert ResultsHandler._parse_span("7D") == timedelta(days=7)
+        assert ResultsHandler._parse_span("0h") is None
+        assert ResultsHandler._parse_span("soon") is None
+
+    def test_format_rollup(self):
+        rollup = Rollup(
+            url_id=1,
+            resolution=Resolution.HOUR,
+            bucket_start=datetime(2026, 7, 13, 21, tzinfo=timezone.utc),
+            checks_count=12,
+            healthy_count=11,
+            ttfb_count=11,
+            avg_ttfb_ms=150.0,
+            min_ttfb_ms=100.0,
+            max_ttfb_ms=400.0,
+            ttfb_sketch=LatencySketch.of(*[100.0] * 10, 400.0),
+        )
+
+        result = ResultsHandler._format_rollup(rollup)
+
+        assert result.startswith("`07-13 21:00` — ❌ | 11/12 ok | avg 150ms | p95")
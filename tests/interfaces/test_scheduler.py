@@ -2,14 +2,22 @@ import asyncio
 
 import pytest
 
-from healthchecker.interfaces.scheduler import Scheduler
+from healthchecker.domain.models.url import Url
+from healthchecker.interfaces.scheduler import DueQueue, Scheduler, SchedulerStats
+
+
+def make_url(url_id: int, interval: int | None = None) -> Url:
+    url = Url.create(f"https://{url_id}.example.com", check_interval_sec=interval)
+    url.id = url_id
+    return url
 
 
 class TestScheduler:
     @pytest.fixture
     def mock_use_case(self, mocker):
         uc = mocker.AsyncMock()
-        uc.execute.return_value = []
+        uc.list_active.return_value = [make_url(1)]
+        uc.check_urls.return_value = []
         return uc
 
     async def test_start_stop(self, mock_use_case, mocker):
@@ -26,7 +34,7 @@ class TestScheduler:
             await task
 
         await run()
-        mock_use_case.execute.assert_awaited()
+        mock_use_case.check_urls.assert_awaited()
 
     async def test_start_with_alerts(self, mock_use_case, mocker):
         mocker.patch(
@@ -35,7 +43,7 @@ class TestScheduler:
         alert = mocker.Mock()
         alert.message = "Test alert"
         alert.id = 1
-        mock_use_case.execute.return_value = [alert]
+        mock_use_case.check_urls.return_value = [alert]
 
         alert_repo = mocker.AsyncMock()
         send_alert = mocker.AsyncMock()
@@ -50,6 +58,199 @@ class TestScheduler:
             await task
 
         await run()
-        assert mock_use_case.execute.await_count >= 1
+        assert mock_use_case.check_urls.await_count >= 1
         send_alert.assert_awaited_with("Test alert")
         alert_repo.mark_as_sent.assert_awaited_with(1)
+
+    async def test_checks_each_url_on_its_own_interval(self, mock_use_case, mocker):
+        mocker.patch(
+            "healthchecker.interfaces.scheduler.settings.check_interval_sec", 0.02
+        )
+        mock_use_case.list_active.return_value = [make_url(1), make_url(2, 1000)]
+        checked: list[int] = []
+
+        async def check_urls(urls):
+            checked.extend(url.id for url in urls)
+            return []
+
+        mock_use_case.check_urls.side_effect = check_urls
+        scheduler = Scheduler(mock_use_case)
+
+        task = asyncio.create_task(scheduler.start())
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+        await task
+
+        assert checked.count(1) >= 3
+        assert checked.count(2) <= 1
+
+    async def test_counts_overruns(self, mock_use_case, mocker):
+        mocker.patch(
+            "healthchecker.interfaces.scheduler.settings.check_interval_sec", 0.02
+        )
+
+        async def slow_check(urls):
+            await asyncio.sleep(0.07)
+            return []
+
+        mock_use_case.check_urls.side_effect = slow_check
+        stats = SchedulerStats()
+        scheduler = Scheduler(mock_use_case, stats=stats)
+
+        task = asyncio.create_task(scheduler.start())
+        await asyncio.sleep(0.3)
+        await scheduler.stop()
+        await task
+
+        assert stats.checks_dispatched >= 2
+        assert stats.overruns >= 1
+        assert stats.skipped_ticks >= stats.overruns
+        assert stats.coalesced_ticks == 0
+        assert stats.avg_period_ratio > 2
+
+    async def test_slow_url_does_not_block_others(self, mock_use_case, mocker):
+        mocker.patch(
+            "healthchecker.interfaces.scheduler.settings.check_interval_sec", 0.02
+        )
+        mock_use_case.list_active.return_value = [make_url(1), make_url(2)]
+        checked: list[int] = []
+
+        async def check_urls(urls):
+            if urls[0].id == 1:
+                await asyncio.sleep(1)
+            checked.extend(url.id for url in urls)
+            return []
+
+        mock_use_case.check_urls.side_effect = check_urls
+        scheduler = Scheduler(mock_use_case)
+
+        task = asyncio.create_task(scheduler.start())
+        await asyncio.sleep(0.3)
+        assert checked.count(2) >= 5
+        assert 1 not in checked
+        await scheduler.stop()
+        await task
+
+    async def test_caps_concurrent_checks_per_host(self, mock_use_case, mocker):
+        mocker.patch(
+            "healthchecker.interfaces.scheduler.settings.check_interval_sec", 0.01
+        )
+        mocker.patch(
+            "healthchecker.interfaces.scheduler.settings.check_per_host_concurrency",
+            1,
+        )
+        urls = [make_url(i) for i in range(1, 4)]
+        for url in urls:
+            url.url = "https://same.example.com/" + str(url.id)
+        mock_use_case.list_active.return_value = urls
+        running = 0
+        peak = 0
+        seen_by_host = []
+        seen_waiting = []
+
+        async def check_urls(urls):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            seen_by_host.append(dict(scheduler.stats.running_by_host))
+            seen_waiting.append(scheduler.stats.waiting)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return []
+
+        mock_use_case.check_urls.side_effect = check_urls
+        scheduler = Scheduler(mock_use_case)
+
+        task = asyncio.create_task(scheduler.start())
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+        await task
+
+        assert mock_use_case.check_urls.await_count >= 3
+        assert peak == 1
+        assert scheduler._host_slots == {}
+        assert all(seen == {"same.example.com": 1} for seen in seen_by_host)
+        assert max(seen_waiting) >= 1
+        assert scheduler.stats.running == 0
+        assert scheduler.stats.waiting == 0
+        assert scheduler.stats.checks_completed == len(seen_by_host)
+        assert scheduler.stats.max_check_sec >= 0.02
+
+
+class TestDueQueue:
+    def test_spreads_first_checks_across_interval(self):
+        queue = DueQueue(60)
+        queue.sync([make_url(i) for i in range(1, 101)], now=0.0)
+
+        first_due = [due for _, due in queue.pop_due(now=60.0)]
+        assert len(first_due) == 100
+        assert min(first_due) < 15
+        assert max(first_due) > 45
+
+    def test_pops_only_due_urls_in_order(self, mocker):
+        mocker.patch("random.uniform", side_effect=[30.0, 10.0, 50.0])
+        queue = DueQueue(60)
+        queue.sync([make_url(1), make_url(2), make_url(3)], now=0.0)
+
+        assert [url.id for url, _ in queue.pop_due(now=35.0)] == [2, 1]
+        assert queue.next_due() == 50.0
+
+    def test_reschedules_on_url_interval(self, mocker):
+        mocker.patch("random.uniform", return_value=5.0)
+        queue = DueQueue(60)
+        queue.sync([make_url(1, interval=10)], now=0.0)
+
+        [(url, due_at)] = queue.pop_due(now=5.0)
+        queue.reschedule(url, due_at, now=6.0)
+        assert queue.next_due() == 15.0
+
+    def test_reschedule_skips_missed_slots(self, mocker):
+        mocker.patch("random.uniform", return_value=0.0)
+        queue = DueQueue(10)
+        queue.sync([make_url(1)], now=0.0)
+
+        [(url, due_at)] = queue.pop_due(now=0.0)
+        assert queue.reschedule(url, due_at, now=35.0) == 3
+        assert queue.next_due() == 40.0
+
+    def test_reschedule_coalesces_missed_slots(self, mocker):
+        mocker.patch("random.uniform", return_value=0.0)
+        queue = DueQueue(10, coalesce=True)
+        queue.sync([make_url(1)], now=0.0)
+
+        [(url, due_at)] = queue.pop_due(now=0.0)
+        assert queue.reschedule(url, due_at, now=35.0) == 3
+        assert queue.next_due() == 35.0
+
+    def test_on_time_check_misses_nothing(self, mocker):
+        mocker.patch("random.uniform", return_value=0.0)
+        queue = DueQueue(10)
+        queue.sync([make_url(1)], now=0.0)
+
+        [(url, due_at)] = queue.pop_due(now=0.5)
+        assert queue.reschedule(url, due_at, now=2.0) == 0
+        assert queue.next_due() == 10.0
+
+    def test_record_start_reports_period_ratio(self):
+        queue = DueQueue(10)
+        url = make_url(1)
+        queue.sync([url], now=0.0)
+
+        assert queue.record_start(url, 3.0) is None
+        assert queue.record_start(url, 15.0) == 1.2
+
+    def test_removed_urls_are_dropped(self):
+        queue = DueQueue(60)
+        queue.sync([make_url(1), make_url(2)], now=0.0)
+        queue.sync([make_url(2)], now=1.0)
+
+        assert len(queue) == 1
+        assert [url.id for url, _ in queue.pop_due(now=120.0)] == [2]
+
+    def test_sync_keeps_existing_due_time(self, mocker):
+        mocker.patch("random.uniform", side_effect=[20.0, 5.0])
+        queue = DueQueue(60)
+        queue.sync([make_url(1)], now=0.0)
+        queue.sync([make_url(1)], now=10.0)
+
+        assert queue.next_due() == 20.0
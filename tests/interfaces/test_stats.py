@@ -0,0 +1,69 @@
+from healthchecker.application.use_cases.check_all_urls import CheckRunStats
+from healthchecker.infrastructure.checker.dns_resolver import DnsCacheStats
+from healthchecker.interfaces.scheduler import SchedulerStats
+from healthchecker.interfaces.telegram.handlers.stats import StatsHandler
+
+
+class TestStatsHandler:
+    def test_no_check_run_yet(self, mocker):
+        use_case = mocker.Mock()
+        use_case.last_stats = None
+        lines = StatsHandler(use_case)._format_lines()
+        assert "No /check run has completed yet." in lines
+
+    def test_formats_last_cycle(self, mocker):
+        use_case = mocker.Mock()
+        use_case.last_stats = CheckRunStats(
+            urls_count=120,
+            duration_ms=4200.0,
+            avg_queue_wait_ms=800.0,
+            max_queue_wait_ms=2100.0,
+            avg_probe_ms=150.0,
+            max_probe_ms=900.0,
+        )
+        text = "\n".join(StatsHandler(use_case)._format_lines())
+        assert "URLs: 120 in 4200ms" in text
+        assert "Queue wait: avg 800ms | max 2100ms" in text
+        assert "Probe: avg 150ms | max 900ms" in text
+
+    def test_formats_dns_cache(self, mocker):
+        use_case = mocker.Mock()
+        use_case.last_stats = None
+        resolver = mocker.Mock()
+        resolver.stats.return_value = DnsCacheStats(
+            requests=200,
+            hits=150,
+            negative_hits=10,
+            coalesced=20,
+            lookups=20,
+            entries=25,
+            avg_lookup_ms=12.5,
+        )
+        text = "\n".join(StatsHandler(use_case, resolver)._format_lines())
+        assert "Hit rate: 90% (200 requests, 25 entries)" in text
+        assert "Lookups: 20 | avg 12.5ms | negative hits: 10" in text
+
+    def test_formats_scheduler(self, mocker):
+        use_case = mocker.Mock()
+        use_case.last_stats = None
+        stats = SchedulerStats(
+            checks_dispatched=10,
+            overruns=2,
+            skipped_ticks=3,
+            total_lag_sec=0.5,
+            max_lag_sec=0.2,
+            periods_measured=4,
+            total_period_ratio=4.4,
+            checks_completed=10,
+            total_check_sec=1.5,
+            max_check_sec=0.4,
+            waiting=5,
+            running_by_host={"a.com": 1, "b.com": 3},
+        )
+        text = "\n".join(StatsHandler(use_case, scheduler_stats=stats)._format_lines())
+        assert "Checks dispatched: 10 | lag avg 50ms | max 200ms" in text
+        assert "Overruns: 2 | skipped ticks: 3 | coalesced ticks: 0" in text
+        assert "Achieved period: 1.10x interval" in text
+        assert "Check time: avg 150ms | max 400ms" in text
+        assert "In flight: 4 | waiting for a slot: 5" in text
+        assert "Busiest host: b.com (3 in flight)" in text